@@ -1,8 +1,12 @@
 """Base scraper class for all adapters with improved error handling."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator
+from urllib.parse import urlparse
 import logging
 
+from core.job_record import JobRecord
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,26 +39,117 @@ class BaseScraper(ABC):
         self.max_pages = max_pages
         self.current_page = 0
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Set by the concurrent runner; shared across adapters
+        self.throttle: Optional[Any] = None
+        self.crawl_delay: float = 0.0
     
     def run(self) -> List[Dict[str, Any]]:
         """
         Main execution method.
         
+        Thin wrapper around :meth:`iter_jobs` that collects every page.
+        
         Returns:
             List of scraped job dictionaries
             
         Raises:
             ScraperError: If scraping fails
         """
+        results = list(self.iter_jobs())
+        self.logger.info(f"Successfully scraped {len(results)} items")
+        return results
+    
+    def iter_jobs(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield jobs page by page, following :meth:`handle_pagination`.
+        
+        Only the current page is held in memory, so consumers (dedup,
+        matching, export) can process results as they arrive.
+        
+        Yields:
+            Job dictionaries
+            
+        Raises:
+            ScraperError: If scraping fails
+        """
+        self.logger.info(f"Starting scraper for {self.__class__.__name__}")
+        self.current_page = 0
+        try:
+            while True:
+                page_jobs = self._fetch_page()
+                yield from page_jobs
+                if not self._next_page():
+                    break
+        except ScraperError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Scraper failed: {e}")
+            raise ScraperError(f"Failed to scrape: {e}") from e
+    
+    @property
+    def source_name(self) -> str:
+        """Source recorded on this adapter's jobs (e.g. "linkedin")."""
+        name = self.__class__.__name__
+        return (name[:-len("Scraper")] if name.endswith("Scraper") else name).lower()
+    
+    def iter_records(self) -> Iterator[JobRecord]:
+        """
+        Yield jobs as normalized :class:`JobRecord` objects.
+        
+        Salary parsing, remote detection and fingerprinting happen here,
+        once per job, instead of in every downstream consumer.
+        
+        Yields:
+            JobRecords, page by page as in :meth:`iter_jobs`
+            
+        Raises:
+            ScraperError: If scraping fails
+        """
+        source = self.source_name
+        for job in self.iter_jobs():
+            yield JobRecord.from_dict(job, source)
+    
+    async def aiter_jobs(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async variant of :meth:`iter_jobs`.
+        
+        Page fetches and pagination run in a worker thread so the event
+        loop stays free while an adapter waits on the network.
+        
+        Yields:
+            Job dictionaries
+            
+        Raises:
+            ScraperError: If scraping fails
+        """
+        self.logger.info(f"Starting scraper for {self.__class__.__name__}")
+        self.current_page = 0
         try:
-            self.logger.info(f"Starting scraper for {self.__class__.__name__}")
-            results = self.extract_fields()
-            self.logger.info(f"Successfully scraped {len(results)} items")
-            return results
+            while True:
+                page_jobs = await asyncio.to_thread(self._fetch_page)
+                for job in page_jobs:
+                    yield job
+                if not await asyncio.to_thread(self._next_page):
+                    break
+        except ScraperError:
+            raise
         except Exception as e:
             self.logger.error(f"Scraper failed: {e}")
             raise ScraperError(f"Failed to scrape: {e}") from e
     
+    def _fetch_page(self) -> List[Dict[str, Any]]:
+        """Wait for the host's crawl delay and extract the current page."""
+        self.wait_for_host()
+        page_jobs = list(self.extract_fields())
+        self.current_page += 1
+        self.logger.debug(f"Page {self.current_page}: {len(page_jobs)} items")
+        return page_jobs
+    
+    def _next_page(self) -> bool:
+        """Advance to the next page if the page budget and site allow it."""
+        return self.current_page < self.max_pages and self.handle_pagination()
+    
     @abstractmethod
     def start_url(self) -> str:
         """
@@ -68,17 +163,32 @@ class BaseScraper(ABC):
     @abstractmethod
     def extract_fields(self) -> List[Dict[str, Any]]:
         """
-        Extract job fields from the page.
+        Extract job fields from the current page.
         
         Returns:
             List of job dictionaries with extracted fields
         """
         pass
     
+    def wait_for_host(self) -> float:
+        """
+        Wait until the crawl delay for this adapter's host has elapsed.
+        
+        Returns:
+            Seconds spent waiting (0 when no throttle is attached)
+        """
+        if self.throttle is None:
+            return 0.0
+        host = urlparse(self.start_url()).netloc.lower()
+        return self.throttle.wait(host, self.crawl_delay)
+    
     def handle_pagination(self) -> bool:
         """
         Handle pagination if supported.
         
+        Called after each page while ``current_page < max_pages``;
+        implementations should navigate to the next page here.
+        
         Returns:
             True if more pages exist, False otherwise
         """
@@ -4,10 +4,10 @@ Application Submitter - Main orchestrator for automated application submission
 This module coordinates the submission of job applications across different platforms.
 """
 
-import time
-from typing import Dict, Any, Optional, List
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.async_api import Page, Browser
 from automation.models import SubmissionResult, SubmissionStatus, SubmissionConfig, ApplicationData
 from automation.handlers import (
     LinkedInHandler,
@@ -15,7 +15,10 @@ from automation.handlers import (
     GreenhouseHandler,
     GenericHandler
 )
+from automation.form_cache import FormSignatureCache
 from automation.rate_limiter import AdaptiveRateLimiter
+from automation.waits import PageWaiter
+from core.browser import BrowserPool
 from core.logger import setup_logger
 
 logger = setup_logger("application_submitter")
@@ -43,19 +46,28 @@ class ApplicationSubmitter:
         ...     print(f"Applied successfully! Confirmation: {result.confirmation_number}")
     """
     
-    def __init__(self, config: Optional[SubmissionConfig] = None):
+    def __init__(
+        self,
+        config: Optional[SubmissionConfig] = None,
+        browser_pool: Optional[BrowserPool] = None
+    ):
         """
         Initialize the application submitter with platform handlers
         
         Args:
             config: Configuration for submission behavior
+            browser_pool: Shared pool to lease the browser context from
+                (default: a private single-browser pool)
         """
         self.config = config or SubmissionConfig()
         self.handlers = {}
-        self.playwright = None
+        self.browser_pool = browser_pool
+        self._owns_pool = browser_pool is None
+        self.lease = None
         self.browser = None
         self.context = None
         self.page = None
+        self.waiter = None
         
         # Use adaptive rate limiter
         self.rate_limiter = AdaptiveRateLimiter(
@@ -63,40 +75,43 @@ class ApplicationSubmitter:
             min_delay=self.config.delay_between_submissions,
             max_delay=300
         )
+        
+        # Field purposes resolved per form layout, shared by all handlers
+        self.form_cache = None
+        if self.config.form_cache_path:
+            self.form_cache = FormSignatureCache(
+                self.config.form_cache_path,
+                max_entries=self.config.form_cache_size
+            )
     
-    def __enter__(self):
-        """Context manager entry"""
-        self._setup_browser()
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self._setup_browser()
         self._load_handlers()
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        self._cleanup()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self._cleanup()
     
-    def _setup_browser(self):
-        """Initialize Playwright browser"""
+    async def _setup_browser(self):
+        """Lease a browser context from the pool, starting the pool if needed"""
         try:
             logger.info("Setting up browser")
-            self.playwright = sync_playwright().start()
-            
-            self.browser = self.playwright.chromium.launch(
-                headless=self.config.headless,
-                slow_mo=self.config.slow_mo
-            )
-            
-            self.context = self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+            if self.browser_pool is None:
+                # One browser of its own; max_uses comes from automation.yaml
+                self.browser_pool = BrowserPool.from_config(
+                    size=1,
+                    headless=self.config.headless,
+                    slow_mo=self.config.slow_mo
+                )
+            await self.browser_pool.start()
             
-            # Apply stealth patches
-            self.page = self.context.new_page()
-            self.page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            """)
+            # Fresh context with stealth patches, from a warm browser
+            self.lease = await self.browser_pool.acquire()
+            self.browser = self.lease.browser
+            self.context = self.lease.context
+            self.page = self.lease.page
             
             logger.info("Browser setup complete")
             
@@ -112,12 +127,23 @@ class ApplicationSubmitter:
             # Create screenshot directory
             Path(self.config.screenshot_dir).mkdir(parents=True, exist_ok=True)
             
+            # Page waits shared by all handlers, with timeouts from the config
+            self.waiter = PageWaiter(self.page, self.config)
+            
             # Initialize handlers with the page
             self.handlers = {
-                'linkedin': LinkedInHandler(self.page, self.config.screenshot_dir),
-                'indeed': IndeedHandler(self.page, self.config.screenshot_dir),
-                'greenhouse': GreenhouseHandler(self.page, self.config.screenshot_dir),
-                'generic': GenericHandler(self.page, self.config.screenshot_dir)
+                'linkedin': LinkedInHandler(
+                    self.page, self.config.screenshot_dir, self.form_cache, self.waiter
+                ),
+                'indeed': IndeedHandler(
+                    self.page, self.config.screenshot_dir, self.form_cache, self.waiter
+                ),
+                'greenhouse': GreenhouseHandler(
+                    self.page, self.config.screenshot_dir, self.form_cache, self.waiter
+                ),
+                'generic': GenericHandler(
+                    self.page, self.config.screenshot_dir, self.form_cache, self.waiter
+                )
             }
             
             logger.info(f"Loaded {len(self.handlers)} platform handlers")
@@ -126,17 +152,21 @@ class ApplicationSubmitter:
             logger.error(f"Error loading handlers: {e}")
             raise
     
-    def _cleanup(self):
+    async def _cleanup(self):
         """Clean up browser resources"""
+        if self.form_cache:
+            try:
+                self.form_cache.save()
+            except OSError as e:
+                logger.error(f"Error saving form cache: {e}")
         try:
-            if self.page:
-                self.page.close()
-            if self.context:
-                self.context.close()
-            if self.browser:
-                self.browser.close()
-            if self.playwright:
-                self.playwright.stop()
+            if self._owns_pool:
+                if self.browser_pool:
+                    await self.browser_pool.close()
+                self.browser_pool = None
+            elif self.lease:
+                await self.browser_pool.release(self.lease)
+            self.lease = None
             logger.info("Browser cleanup complete")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -195,19 +225,86 @@ class ApplicationSubmitter:
             cover_letter: Optional path to cover letter file
             user_profile: User profile information
             
+        Returns:
+            SubmissionResult with submission details
+        """
+        return await self._submit_prepared(
+            job, resume, cover_letter, user_profile,
+            self._prepare_application(job, resume, cover_letter)
+        )
+    
+    async def _prepare_application(
+        self,
+        job: Dict[str, Any],
+        resume: str,
+        cover_letter: Optional[str]
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Do the part of a submission that does not need the browser
+        
+        Document checks run in a worker thread, so a batch can prepare the
+        next application while the browser waits on the current one.
+        
+        Args:
+            job: Job details including application_url
+            resume: Path to resume file
+            cover_letter: Optional path to cover letter file
+            
+        Returns:
+            Tuple of (platform, error message if the documents are unusable)
+        """
+        platform = self.detect_platform(job.get('application_url', ''))
+        error = await asyncio.to_thread(self._check_documents, resume, cover_letter)
+        return platform, error
+    
+    @staticmethod
+    def _check_documents(resume: str, cover_letter: Optional[str]) -> Optional[str]:
+        """Error message if the resume is missing; a missing cover letter is only logged"""
+        if resume and not Path(resume).exists():
+            return f"Resume file not found: {resume}"
+        if cover_letter and not Path(cover_letter).exists():
+            logger.warning(f"Cover letter file not found: {cover_letter}")
+        return None
+    
+    async def _submit_prepared(
+        self,
+        job: Dict[str, Any],
+        resume: str,
+        cover_letter: Optional[str],
+        user_profile: Dict[str, Any],
+        preparation: Awaitable[Tuple[str, Optional[str]]]
+    ) -> SubmissionResult:
+        """
+        Submit an application once its preparation finishes
+        
+        Args:
+            job: Job details including application_url
+            resume: Path to resume file
+            cover_letter: Optional path to cover letter file
+            user_profile: User profile information
+            preparation: Coroutine or task from _prepare_application
+            
         Returns:
             SubmissionResult with submission details
         """
         job_id = job.get('id', 'unknown')
-        application_url = job.get('application_url', '')
         
         logger.info(f"Starting application submission for job {job_id}")
         
         try:
-            # Detect platform
-            platform = self.detect_platform(application_url)
+            platform, document_error = await preparation
             logger.info(f"Detected platform: {platform}")
             
+            # Validate files exist
+            if document_error:
+                return SubmissionResult(
+                    success=False,
+                    job_id=job_id,
+                    platform=platform,
+                    status=SubmissionStatus.FAILED,
+                    error_message=document_error
+                )
+            
             # Check rate limiting for this platform
             if not self.rate_limiter.check_rate_limit(platform):
                 stats = self.rate_limiter.get_platform_stats(platform)
@@ -221,7 +318,7 @@ class ApplicationSubmitter:
                 )
             
             # Wait if needed based on adaptive rate limiting
-            self.rate_limiter.wait_if_needed(platform)
+            await self.rate_limiter.wait_if_needed(platform)
             
             # Get appropriate handler
             handler = self.handlers.get(platform)
@@ -230,18 +327,9 @@ class ApplicationSubmitter:
                 logger.warning(f"No specific handler for {platform}, using generic")
                 handler = self.handlers['generic']
             
-            # Validate files exist
-            if resume and not Path(resume).exists():
-                return SubmissionResult(
-                    success=False,
-                    job_id=job_id,
-                    platform=platform,
-                    status=SubmissionStatus.FAILED,
-                    error_message=f"Resume file not found: {resume}"
-                )
-            
             # Execute submission with retries
             result = None
+            saved_before = self.waiter.total_saved() if self.waiter else 0.0
             for attempt in range(self.config.max_retries):
                 try:
                     logger.info(f"Submission attempt {attempt + 1}/{self.config.max_retries}")
@@ -257,7 +345,7 @@ class ApplicationSubmitter:
                     # Wait before retry
                     if attempt < self.config.max_retries - 1:
                         logger.info(f"Waiting {self.config.retry_delay}s before retry")
-                        time.sleep(self.config.retry_delay)
+                        await asyncio.sleep(self.config.retry_delay)
                         
                 except Exception as e:
                     logger.error(f"Attempt {attempt + 1} failed: {e}")
@@ -274,6 +362,12 @@ class ApplicationSubmitter:
             
             self.rate_limiter.record_submission(platform, result.success, error_type)
             
+            # Record how much waiting the event-driven waits saved on this application
+            if self.waiter:
+                saved = self.waiter.total_saved() - saved_before
+                result.metadata['wait_seconds_saved'] = round(saved, 3)
+                logger.info(f"Event-driven waits saved {saved:.1f}s on job {job_id}")
+            
             # Log result
             if result.success:
                 logger.info(f"Application submitted successfully: {job_id}")
@@ -301,6 +395,41 @@ class ApplicationSubmitter:
         """
         return self.rate_limiter.get_all_stats()
     
+    def get_wait_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get page wait statistics.
+        
+        Returns:
+            Dictionary mapping wait kind to count, timeouts, waited, budget
+            and saved seconds
+        """
+        if self.waiter is None:
+            return {}
+        return self.waiter.get_stats()
+    
+    def get_form_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get form signature cache statistics.
+        
+        Returns:
+            Dictionary with hits, misses, entries and hit_rate
+        """
+        if self.form_cache is None:
+            return {}
+        return self.form_cache.stats
+    
+    def get_browser_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics of the browser pool the page is leased from.
+        
+        Returns:
+            Dictionary with launches, recycles, unhealthy replacements,
+            leases, average lease wait and idle browsers
+        """
+        if self.browser_pool is None:
+            return {}
+        return self.browser_pool.get_stats()
+    
     def reset_rate_limiter(self, platform: Optional[str] = None):
         """
         Reset rate limiter for a specific platform or all platforms.
@@ -325,6 +454,9 @@ class ApplicationSubmitter:
         """
         Submit multiple applications in batch
         
+        Applications go through the browser one at a time, in order; the
+        next one is prepared while the current one is being submitted.
+        
         Args:
             jobs: List of job dictionaries
             resume: Path to resume file
@@ -338,18 +470,23 @@ class ApplicationSubmitter:
         
         logger.info(f"Starting batch submission for {len(jobs)} jobs")
         
+        # Each job's browser-free preparation runs while the previous job is
+        # in the browser; the per-platform rate limiter spaces the submissions
+        preparation = None
         for i, job in enumerate(jobs):
             logger.info(f"Processing job {i + 1}/{len(jobs)}")
             
-            result = await self.submit_application(
-                job, resume, cover_letter, user_profile
+            current = preparation or self._prepare_application(job, resume, cover_letter)
+            preparation = None
+            if i < len(jobs) - 1:
+                preparation = asyncio.create_task(
+                    self._prepare_application(jobs[i + 1], resume, cover_letter)
+                )
+            
+            result = await self._submit_prepared(
+                job, resume, cover_letter, user_profile, current
             )
             results.append(result)
-            
-            # Delay between submissions
-            if i < len(jobs) - 1:
-                logger.info(f"Waiting {self.config.delay_between_submissions}s before next submission")
-                time.sleep(self.config.delay_between_submissions)
         
         # Summary
         success_count = sum(1 for r in results if r.success)
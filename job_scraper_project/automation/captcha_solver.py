@@ -3,9 +3,11 @@ CAPTCHA detection and handling module.
 
 Provides enhanced CAPTCHA detection and optional solving capabilities.
 """
+import asyncio
 import time
 from typing import Optional, Dict, Any
-from playwright.sync_api import Page
+from playwright.async_api import Page
+from automation.waits import PageWaiter
 from core.logger import setup_logger
 
 logger = setup_logger("captcha_solver")
@@ -48,18 +50,20 @@ class CaptchaSolver:
         ]
     }
     
-    def __init__(self, page: Page, wait_time: int = 300):
+    def __init__(self, page: Page, wait_time: int = 300, waiter: Optional[PageWaiter] = None):
         """
         Initialize the CAPTCHA solver.
         
         Args:
             page: Playwright page object
             wait_time: Maximum time to wait for manual CAPTCHA solving (seconds)
+            waiter: Page waiter (created with default timeouts if omitted)
         """
         self.page = page
         self.wait_time = wait_time
+        self.waiter = waiter or PageWaiter(page)
     
-    def detect_captcha(self) -> Optional[Dict[str, Any]]:
+    async def detect_captcha(self) -> Optional[Dict[str, Any]]:
         """
         Detect if a CAPTCHA is present on the page.
         
@@ -70,9 +74,9 @@ class CaptchaSolver:
         try:
             for captcha_type, selectors in self.CAPTCHA_SELECTORS.items():
                 for selector in selectors:
-                    element = self.page.query_selector(selector)
+                    element = await self.page.query_selector(selector)
                     if element:
-                        is_visible = element.is_visible()
+                        is_visible = await element.is_visible()
                         logger.info(f"CAPTCHA detected: {captcha_type} (visible: {is_visible})")
                         return {
                             'type': captcha_type,
@@ -86,7 +90,7 @@ class CaptchaSolver:
             logger.error(f"Error detecting CAPTCHA: {e}")
             return None
     
-    def wait_for_manual_solve(self, notification_callback=None) -> bool:
+    async def wait_for_manual_solve(self, notification_callback=None) -> bool:
         """
         Wait for user to manually solve CAPTCHA.
         
@@ -107,14 +111,14 @@ class CaptchaSolver:
             
             while time.time() - start_time < self.wait_time:
                 # Check if CAPTCHA is still present
-                captcha_info = self.detect_captcha()
+                captcha_info = await self.detect_captcha()
                 
                 if not captcha_info or not captcha_info['visible']:
                     logger.info("CAPTCHA appears to be solved")
-                    time.sleep(2)  # Wait a bit for page to settle
+                    await self.waiter.settle(budget=2.0, kind='captcha')
                     return True
                 
-                time.sleep(check_interval)
+                await asyncio.sleep(check_interval)
             
             logger.error(f"CAPTCHA solving timeout after {self.wait_time}s")
             return False
@@ -123,7 +127,7 @@ class CaptchaSolver:
             logger.error(f"Error waiting for CAPTCHA solve: {e}")
             return False
     
-    def try_audio_captcha(self) -> bool:
+    async def try_audio_captcha(self) -> bool:
         """
         Attempt to switch to audio CAPTCHA (accessibility feature).
         
@@ -141,11 +145,10 @@ class CaptchaSolver:
             ]
             
             for selector in audio_buttons:
-                button = self.page.query_selector(selector)
-                if button and button.is_visible():
+                button = await self.page.query_selector(selector)
+                if button and await button.is_visible():
                     logger.info("Found audio CAPTCHA button, clicking...")
-                    button.click()
-                    time.sleep(2)
+                    await self.waiter.step(button.click, budget=2.0, kind='captcha')
                     return True
             
             return False
@@ -154,7 +157,7 @@ class CaptchaSolver:
             logger.error(f"Error trying audio CAPTCHA: {e}")
             return False
     
-    def check_captcha_bypass_strategies(self) -> bool:
+    async def check_captcha_bypass_strategies(self) -> bool:
         """
         Try various strategies to bypass or avoid CAPTCHA.
         
@@ -166,17 +169,20 @@ class CaptchaSolver:
             # Some pages show CAPTCHA but don't block progression
             next_buttons = ['button:has-text("Next")', 'button:has-text("Continue")']
             for selector in next_buttons:
-                button = self.page.query_selector(selector)
-                if button and button.is_visible() and not button.is_disabled():
+                button = await self.page.query_selector(selector)
+                if button and await button.is_visible() and not await button.is_disabled():
                     logger.info("Found enabled next button despite CAPTCHA, trying to proceed")
                     return True
             
             # Strategy 2: Wait for CAPTCHA to auto-resolve
             # Some CAPTCHAs have automatic verification
             logger.info("Waiting briefly for automatic CAPTCHA resolution...")
-            time.sleep(5)
+            selectors = [s for group in self.CAPTCHA_SELECTORS.values() for s in group]
+            await self.waiter.for_selector(
+                ', '.join(selectors), budget=5.0, timeout=5, state='hidden', kind='captcha'
+            )
             
-            captcha_info = self.detect_captcha()
+            captcha_info = await self.detect_captcha()
             if not captcha_info or not captcha_info['visible']:
                 logger.info("CAPTCHA resolved automatically")
                 return True
@@ -187,7 +193,7 @@ class CaptchaSolver:
             logger.error(f"Error checking bypass strategies: {e}")
             return False
     
-    def handle_captcha(
+    async def handle_captcha(
         self,
         auto_solve: bool = False,
         notification_callback=None
@@ -203,7 +209,7 @@ class CaptchaSolver:
             True if CAPTCHA handled successfully, False otherwise
         """
         try:
-            captcha_info = self.detect_captcha()
+            captcha_info = await self.detect_captcha()
             
             if not captcha_info:
                 return True  # No CAPTCHA detected
@@ -211,30 +217,30 @@ class CaptchaSolver:
             logger.warning(f"CAPTCHA detected: {captcha_info['type']}")
             
             # Try bypass strategies first
-            if self.check_captcha_bypass_strategies():
+            if await self.check_captcha_bypass_strategies():
                 return True
             
             # Try audio CAPTCHA if available
             if captcha_info['type'] == 'recaptcha':
-                if self.try_audio_captcha():
+                if await self.try_audio_captcha():
                     logger.info("Switched to audio CAPTCHA")
                     # Could implement audio transcription here
             
             # Fall back to manual solving
-            return self.wait_for_manual_solve(notification_callback)
+            return await self.wait_for_manual_solve(notification_callback)
             
         except Exception as e:
             logger.error(f"Error handling CAPTCHA: {e}")
             return False
     
-    def get_captcha_info_for_user(self) -> Optional[str]:
+    async def get_captcha_info_for_user(self) -> Optional[str]:
         """
         Get user-friendly CAPTCHA information.
         
         Returns:
             String with instructions for user, or None
         """
-        captcha_info = self.detect_captcha()
+        captcha_info = await self.detect_captcha()
         
         if not captcha_info:
             return None
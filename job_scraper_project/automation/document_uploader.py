@@ -4,10 +4,10 @@ Document upload automation module.
 Handles file upload for resumes, cover letters, and other documents during application submission.
 """
 import os
-import time
 from pathlib import Path
 from typing import Optional, List
-from playwright.sync_api import Page, ElementHandle
+from playwright.async_api import Page, ElementHandle
+from automation.waits import PageWaiter
 from core.logger import setup_logger
 
 logger = setup_logger("document_uploader")
@@ -27,16 +27,18 @@ class DocumentUploader:
     RESUME_FORMATS = ['.pdf', '.doc', '.docx', '.txt']
     COVER_LETTER_FORMATS = ['.pdf', '.doc', '.docx', '.txt']
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, waiter: Optional[PageWaiter] = None):
         """
         Initialize the document uploader.
         
         Args:
             page: Playwright page object
+            waiter: Page waiter (created with default timeouts if omitted)
         """
         self.page = page
+        self.waiter = waiter or PageWaiter(page)
     
-    def upload_file(
+    async def upload_file(
         self, 
         file_path: str, 
         selector: Optional[str] = None,
@@ -69,29 +71,29 @@ class DocumentUploader:
             
             # Try to find file input
             if selector:
-                file_input = self.page.wait_for_selector(selector, timeout=timeout)
+                file_input = await self.page.wait_for_selector(selector, timeout=timeout)
             else:
-                file_input = self._find_file_input()
+                file_input = await self._find_file_input()
             
             if not file_input:
                 logger.error("Could not find file input element")
                 return False
             
             # Upload file
-            file_input.set_input_files(abs_path)
+            await file_input.set_input_files(abs_path)
             logger.info(f"Successfully uploaded file: {file_path}")
             
-            # Wait a bit for upload to process
-            time.sleep(1)
+            # Wait for the input to take the file and any upload request to finish
+            await self.waiter.for_upload(file_input, budget=1.0)
             
             # Verify upload
-            return self._verify_upload(file_input, file_path)
+            return await self._verify_upload(file_input, file_path)
             
         except Exception as e:
             logger.error(f"Error uploading file: {e}")
             return False
     
-    def upload_resume(
+    async def upload_resume(
         self, 
         resume_path: str,
         selector: Optional[str] = None
@@ -110,11 +112,11 @@ class DocumentUploader:
         
         # Try to find resume input if no selector provided
         if not selector:
-            selector = self._find_resume_input_selector()
+            selector = await self._find_resume_input_selector()
         
-        return self.upload_file(resume_path, selector)
+        return await self.upload_file(resume_path, selector)
     
-    def upload_cover_letter(
+    async def upload_cover_letter(
         self, 
         cover_letter_path: str,
         selector: Optional[str] = None
@@ -133,11 +135,11 @@ class DocumentUploader:
         
         # Try to find cover letter input if no selector provided
         if not selector:
-            selector = self._find_cover_letter_input_selector()
+            selector = await self._find_cover_letter_input_selector()
         
-        return self.upload_file(cover_letter_path, selector)
+        return await self.upload_file(cover_letter_path, selector)
     
-    def _find_file_input(self) -> Optional[ElementHandle]:
+    async def _find_file_input(self) -> Optional[ElementHandle]:
         """
         Find any visible file input on the page.
         
@@ -145,11 +147,11 @@ class DocumentUploader:
             ElementHandle for file input or None
         """
         try:
-            file_inputs = self.page.query_selector_all('input[type="file"]')
+            file_inputs = await self.page.query_selector_all('input[type="file"]')
             
             for file_input in file_inputs:
                 # Check if visible
-                if file_input.is_visible():
+                if await file_input.is_visible():
                     return file_input
             
             # Return first one even if not visible
@@ -162,7 +164,7 @@ class DocumentUploader:
             logger.error(f"Error finding file input: {e}")
             return None
     
-    def _find_resume_input_selector(self) -> Optional[str]:
+    async def _find_resume_input_selector(self) -> Optional[str]:
         """
         Find the selector for resume upload input.
         
@@ -173,27 +175,27 @@ class DocumentUploader:
             # Look for inputs with resume-related attributes
             resume_keywords = ['resume', 'cv', 'curriculum']
             
-            file_inputs = self.page.query_selector_all('input[type="file"]')
+            file_inputs = await self.page.query_selector_all('input[type="file"]')
             
             for file_input in file_inputs:
                 # Check various attributes
-                elem_id = file_input.get_attribute('id') or ''
-                elem_name = file_input.get_attribute('name') or ''
-                elem_class = file_input.get_attribute('class') or ''
+                elem_id = await file_input.get_attribute('id') or ''
+                elem_name = await file_input.get_attribute('name') or ''
+                elem_class = await file_input.get_attribute('class') or ''
                 
                 # Check if any resume keyword matches
                 combined = f"{elem_id} {elem_name} {elem_class}".lower()
                 if any(keyword in combined for keyword in resume_keywords):
                     # Build selector
-                    if file_input.get_attribute('id'):
-                        return f'#{file_input.get_attribute("id")}'
-                    elif file_input.get_attribute('name'):
-                        return f'[name="{file_input.get_attribute("name")}"]'
+                    if await file_input.get_attribute('id'):
+                        return f'#{await file_input.get_attribute("id")}'
+                    elif await file_input.get_attribute('name'):
+                        return f'[name="{await file_input.get_attribute("name")}"]'
             
             # Fallback: return first file input
             if file_inputs:
-                if file_inputs[0].get_attribute('id'):
-                    return f'#{file_inputs[0].get_attribute("id")}'
+                if await file_inputs[0].get_attribute('id'):
+                    return f'#{await file_inputs[0].get_attribute("id")}'
             
             return 'input[type="file"]'
             
@@ -201,7 +203,7 @@ class DocumentUploader:
             logger.error(f"Error finding resume input: {e}")
             return 'input[type="file"]'
     
-    def _find_cover_letter_input_selector(self) -> Optional[str]:
+    async def _find_cover_letter_input_selector(self) -> Optional[str]:
         """
         Find the selector for cover letter upload input.
         
@@ -212,27 +214,27 @@ class DocumentUploader:
             # Look for inputs with cover letter-related attributes
             cover_keywords = ['cover', 'letter', 'coverletter']
             
-            file_inputs = self.page.query_selector_all('input[type="file"]')
+            file_inputs = await self.page.query_selector_all('input[type="file"]')
             
             for file_input in file_inputs:
                 # Check various attributes
-                elem_id = file_input.get_attribute('id') or ''
-                elem_name = file_input.get_attribute('name') or ''
-                elem_class = file_input.get_attribute('class') or ''
+                elem_id = await file_input.get_attribute('id') or ''
+                elem_name = await file_input.get_attribute('name') or ''
+                elem_class = await file_input.get_attribute('class') or ''
                 
                 # Check if any cover letter keyword matches
                 combined = f"{elem_id} {elem_name} {elem_class}".lower()
                 if any(keyword in combined for keyword in cover_keywords):
                     # Build selector
-                    if file_input.get_attribute('id'):
-                        return f'#{file_input.get_attribute("id")}'
-                    elif file_input.get_attribute('name'):
-                        return f'[name="{file_input.get_attribute("name")}"]'
+                    if await file_input.get_attribute('id'):
+                        return f'#{await file_input.get_attribute("id")}'
+                    elif await file_input.get_attribute('name'):
+                        return f'[name="{await file_input.get_attribute("name")}"]'
             
             # Fallback: return second file input if available
             if len(file_inputs) > 1:
-                if file_inputs[1].get_attribute('id'):
-                    return f'#{file_inputs[1].get_attribute("id")}'
+                if await file_inputs[1].get_attribute('id'):
+                    return f'#{await file_inputs[1].get_attribute("id")}'
             
             return 'input[type="file"]'
             
@@ -256,7 +258,7 @@ class DocumentUploader:
         supported = self.RESUME_FORMATS + self.COVER_LETTER_FORMATS
         return ext in supported
     
-    def _verify_upload(
+    async def _verify_upload(
         self, 
         file_input: ElementHandle, 
         file_path: str
@@ -273,7 +275,7 @@ class DocumentUploader:
         """
         try:
             # Check if input has files
-            files = file_input.evaluate('el => el.files.length')
+            files = await file_input.evaluate('el => el.files.length')
             if files > 0:
                 logger.info("Upload verified: file input has files")
                 return True
@@ -286,13 +288,13 @@ class DocumentUploader:
             ]
             
             for selector in success_indicators:
-                if self.page.query_selector(selector):
+                if await self.page.query_selector(selector):
                     logger.info(f"Upload verified: found success indicator {selector}")
                     return True
             
             # Look for filename in DOM
             filename = Path(file_path).name
-            if self.page.locator(f'text="{filename}"').count() > 0:
+            if await self.page.locator(f'text="{filename}"').count() > 0:
                 logger.info("Upload verified: filename found on page")
                 return True
             
@@ -305,7 +307,7 @@ class DocumentUploader:
             # Assume success if we can't verify
             return True
     
-    def clear_upload(self, selector: str) -> bool:
+    async def clear_upload(self, selector: str) -> bool:
         """
         Clear an uploaded file.
         
@@ -316,9 +318,9 @@ class DocumentUploader:
             True if successful
         """
         try:
-            file_input = self.page.wait_for_selector(selector, timeout=5000)
+            file_input = await self.page.wait_for_selector(selector, timeout=5000)
             if file_input:
-                file_input.set_input_files([])
+                await file_input.set_input_files([])
                 logger.info("Cleared file upload")
                 return True
             return False
@@ -326,7 +328,7 @@ class DocumentUploader:
             logger.error(f"Error clearing upload: {e}")
             return False
     
-    def get_uploaded_files(self) -> List[str]:
+    async def get_uploaded_files(self) -> List[str]:
         """
         Get list of uploaded filenames.
         
@@ -334,15 +336,15 @@ class DocumentUploader:
             List of filenames that have been uploaded
         """
         try:
-            file_inputs = self.page.query_selector_all('input[type="file"]')
+            file_inputs = await self.page.query_selector_all('input[type="file"]')
             uploaded = []
             
             for file_input in file_inputs:
-                files_count = file_input.evaluate('el => el.files.length')
+                files_count = await file_input.evaluate('el => el.files.length')
                 if files_count > 0:
                     # Try to get filename
                     for i in range(files_count):
-                        filename = file_input.evaluate(f'el => el.files[{i}].name')
+                        filename = await file_input.evaluate(f'el => el.files[{i}].name')
                         if filename:
                             uploaded.append(filename)
             
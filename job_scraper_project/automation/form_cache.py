@@ -0,0 +1,128 @@
+"""
+Form signature cache module.
+
+Remembers the field purposes resolved for a form layout, so repeat visits
+to the same ATS template (Greenhouse, Lever, Workday, ...) reuse them.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.logger import setup_logger
+from core.utils import atomic_write
+
+logger = setup_logger("form_cache")
+
+
+def form_signature(rows: Sequence[Sequence[Any]]) -> str:
+    """
+    Structural signature of a form from its field snapshot rows.
+    
+    Only the layout is hashed (field group, id, name, placeholder, label
+    and options: everything field classification reads), not current
+    values, so the same template hashes alike on every job.
+    
+    Args:
+        rows: Rows returned by ``FormMapper``'s snapshot script
+        
+    Returns:
+        Hex SHA-1 digest
+    """
+    layout = [[row[0], row[1], row[2], row[3], row[8], row[10]] for row in rows]
+    return hashlib.sha1(json.dumps(layout, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+class FormSignatureCache:
+    """
+    LRU map of form signature -> resolved field purposes, saved as JSON.
+    
+    Lookups count hits and misses; :attr:`stats` exposes them. Changes are
+    written by :meth:`save` (atomically), typically when the submitter
+    shuts down.
+    
+    Example:
+        >>> cache = FormSignatureCache("data/form_cache.json")
+        >>> mapper = FormMapper(page, cache=cache)
+        >>> fields = await mapper.detect_all_fields()
+        >>> cache.stats
+        {'hits': 0, 'misses': 1, 'entries': 1, 'hit_rate': 0.0}
+    """
+    
+    def __init__(self, path: Optional[str] = None, max_entries: int = 2000):
+        """
+        Initialize the cache
+        
+        Args:
+            path: JSON file to load from and save to (None to keep in memory)
+            max_entries: Form layouts kept; the least recently used is evicted
+        """
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, List[Optional[str]]]" = OrderedDict()
+        self._dirty = False
+        if self.path is not None and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries.update(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable form cache {self.path}: {e}")
+    
+    def __len__(self) -> int:
+        """Number of cached form layouts"""
+        return len(self._entries)
+    
+    def get(self, signature: str) -> Optional[List[Optional[str]]]:
+        """
+        Look up the purposes resolved for a form layout
+        
+        Args:
+            signature: Form signature
+            
+        Returns:
+            Purpose per field (in snapshot order), or None on a miss
+        """
+        purposes = self._entries.get(signature)
+        if purposes is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(signature)
+        return purposes
+    
+    def put(self, signature: str, purposes: List[Optional[str]]) -> None:
+        """
+        Remember the purposes resolved for a form layout
+        
+        Args:
+            signature: Form signature
+            purposes: Purpose per field, in snapshot order
+        """
+        self._entries[signature] = list(purposes)
+        self._entries.move_to_end(signature)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+    
+    def save(self) -> None:
+        """Write the cache file atomically if anything changed"""
+        if self.path is None or not self._dirty:
+            return
+        with atomic_write(self.path, encoding='utf-8') as f:
+            json.dump(self._entries, f)
+        self._dirty = False
+        logger.info(f"Saved {len(self._entries)} form layouts to {self.path}")
@@ -4,13 +4,79 @@ Form field detection and mapping module.
 This module provides intelligent form field detection using heuristics and pattern matching.
 """
 import re
-from typing import List, Dict, Optional, Any
-from playwright.sync_api import Page, ElementHandle
+from typing import List, Dict, Optional, Any, Pattern
+from playwright.async_api import Page, ElementHandle
+from automation.form_cache import FormSignatureCache, form_signature
 from automation.models import FormField, FieldType
 from core.logger import setup_logger
 
 logger = setup_logger("form_mapper")
 
+# Marks a snapshot row whose purpose still has to be classified
+_UNCLASSIFIED = object()
+
+# Field groups in detection order, as queried by the per-element detectors
+FIELD_GROUPS = [
+    (FieldType.TEXT, 'input[type="text"], input:not([type])'),
+    (FieldType.EMAIL, 'input[type="email"]'),
+    (FieldType.PHONE, 'input[type="tel"], input[type="phone"]'),
+    (FieldType.FILE, 'input[type="file"]'),
+    (FieldType.SELECT, 'select'),
+    (FieldType.TEXTAREA, 'textarea'),
+    (FieldType.CHECKBOX, 'input[type="checkbox"]'),
+]
+
+# Collects every field of every group with its attributes, label, options
+# and selector in one round trip. Rows are
+# [group, id, name, placeholder, required, readonly, disabled, value, label, selector, options]
+SNAPSHOT_SCRIPT = r"""
+(groups) => {
+    const labelsFor = new Map();
+    for (const label of document.querySelectorAll('label[for]')) {
+        const key = label.getAttribute('for');
+        if (!labelsFor.has(key)) labelsFor.set(key, label);
+    }
+    const labelOf = (el, id) => {
+        const label = (id && labelsFor.get(id)) || el.closest('label');
+        return label ? label.textContent.trim() : null;
+    };
+    const selectorOf = (el, id, name) => {
+        if (id) return '#' + CSS.escape(id);
+        if (name) return '[name="' + name.replace(/["\\]/g, '\\$&') + '"]';
+        const path = [];
+        for (let node = el; node && node.nodeType === 1; node = node.parentElement) {
+            if (node !== el && node.id) {
+                path.unshift('#' + CSS.escape(node.id));
+                break;
+            }
+            let index = 1;
+            for (let sib = node.previousElementSibling; sib; sib = sib.previousElementSibling) {
+                if (sib.tagName === node.tagName) index++;
+            }
+            path.unshift(node.tagName.toLowerCase() + ':nth-of-type(' + index + ')');
+        }
+        return path.join(' > ');
+    };
+    const rows = [];
+    groups.forEach((selector, group) => {
+        for (const el of document.querySelectorAll(selector)) {
+            const id = el.getAttribute('id');
+            const name = el.getAttribute('name');
+            rows.push([
+                group, id, name, el.getAttribute('placeholder'),
+                el.hasAttribute('required'), el.hasAttribute('readonly'),
+                el.hasAttribute('disabled'), el.getAttribute('value'),
+                labelOf(el, id), selectorOf(el, id, name),
+                el.tagName === 'SELECT'
+                    ? Array.from(el.options, o => o.textContent).filter(Boolean)
+                    : null,
+            ]);
+        }
+    });
+    return rows;
+}
+"""
+
 
 class FormMapper:
     """
@@ -62,56 +128,167 @@ class FormMapper:
         r'\bportfolio\b'
     ]
     
-    def __init__(self, page: Page):
+    # Purposes memoized per label text before the memo is reset
+    PURPOSE_MEMO_SIZE = 4096
+    
+    def __init__(self, page: Page, cache: Optional[FormSignatureCache] = None):
         """
         Initialize the form mapper.
         
         Args:
             page: Playwright page object
+            cache: Optional form signature cache; snapshot detection reuses
+                the purposes resolved for a previously seen form layout
         """
         self.page = page
+        self.cache = cache
+        self._purpose_memo: Dict[str, Optional[str]] = {}
     
-    def detect_all_fields(self) -> List[FormField]:
+    @classmethod
+    def _purpose_regex(cls) -> Pattern:
+        """
+        All purpose patterns as one compiled regex, one named group per category.
+        
+        Built on first use from the class's pattern lists, so subclasses
+        overriding a list get their own regex.
+        """
+        compiled = cls.__dict__.get('_compiled_purpose_regex')
+        if compiled is None:
+            categories = {
+                'name': cls.NAME_PATTERNS,
+                'email': cls.EMAIL_PATTERNS,
+                'phone': cls.PHONE_PATTERNS,
+                'url': cls.URL_PATTERNS,
+                'address': cls.ADDRESS_PATTERNS,
+            }
+            compiled = re.compile('|'.join(
+                f"(?P<{category}>{'|'.join(patterns)})" for category, patterns in categories.items()
+            ), re.IGNORECASE)
+            cls._compiled_purpose_regex = compiled
+        return compiled
+    
+    async def detect_all_fields(self, snapshot: bool = True) -> List[FormField]:
         """
         Detect all form fields on the current page.
         
+        Args:
+            snapshot: Collect every field in a single ``page.evaluate``
+                (see :meth:`snapshot_fields`) instead of querying each
+                element's attributes and label separately. Falls back to
+                per-element detection if the snapshot script fails.
+                
         Returns:
             List of detected FormField objects
         """
+        if snapshot:
+            try:
+                fields = await self.snapshot_fields()
+                logger.info(f"Detected {len(fields)} form fields on page")
+                return fields
+            except Exception as e:
+                logger.warning(f"Field snapshot failed, detecting per element: {e}")
+        
         fields = []
         
         # Detect text inputs
-        fields.extend(self._detect_text_inputs())
+        fields.extend(await self._detect_text_inputs())
         
         # Detect email inputs
-        fields.extend(self._detect_email_inputs())
+        fields.extend(await self._detect_email_inputs())
         
         # Detect phone inputs
-        fields.extend(self._detect_phone_inputs())
+        fields.extend(await self._detect_phone_inputs())
         
         # Detect file inputs
-        fields.extend(self._detect_file_inputs())
+        fields.extend(await self._detect_file_inputs())
         
         # Detect select dropdowns
-        fields.extend(self._detect_select_fields())
+        fields.extend(await self._detect_select_fields())
         
         # Detect textareas
-        fields.extend(self._detect_textareas())
+        fields.extend(await self._detect_textareas())
         
         # Detect checkboxes
-        fields.extend(self._detect_checkboxes())
+        fields.extend(await self._detect_checkboxes())
         
         logger.info(f"Detected {len(fields)} form fields on page")
         return fields
     
-    def _detect_text_inputs(self) -> List[FormField]:
+    async def snapshot_fields(self) -> List[FormField]:
+        """
+        Detect all form fields with one browser round trip.
+        
+        Attributes, labels (``label[for]`` or an enclosing label), select
+        options and a selector for each field come back in one payload,
+        so the cost no longer grows with the number of fields. Fields are
+        returned in the same order as the per-element detectors.
+        
+        With a cache, the snapshot's structural signature is looked up
+        first and a known layout reuses its stored purposes instead of
+        classifying each field again.
+        
+        Returns:
+            List of detected FormField objects
+        """
+        rows = await self.page.evaluate(SNAPSHOT_SCRIPT, [selector for _, selector in FIELD_GROUPS])
+        if self.cache is None:
+            return [self._field_from_row(row) for row in rows]
+        
+        signature = form_signature(rows)
+        purposes = self.cache.get(signature)
+        if purposes is not None and len(purposes) == len(rows):
+            return [self._field_from_row(row, purpose) for row, purpose in zip(rows, purposes)]
+        
+        fields = [self._field_from_row(row) for row in rows]
+        self.cache.put(signature, [field.detected_purpose for field in fields])
+        return fields
+    
+    def _field_from_row(self, row: List[Any], purpose: Any = _UNCLASSIFIED) -> FormField:
+        """Build a FormField from a snapshot row, classifying it unless a purpose is given."""
+        group, elem_id, name, placeholder, required, readonly, disabled, value, label, \
+            selector, options = row
+        field = FormField(
+            selector=selector,
+            field_type=FIELD_GROUPS[group][0],
+            label=label,
+            placeholder=placeholder,
+            name=name,
+            id=elem_id,
+            required=required,
+            readonly=readonly,
+            disabled=disabled,
+            current_value=value,
+            options=options or []
+        )
+        if purpose is not _UNCLASSIFIED:
+            field.detected_purpose = purpose
+            return field
+        field.detected_purpose = self._detect_field_purpose(field)
+        self._refine_purpose(field)
+        return field
+    
+    def _refine_purpose(self, field: FormField) -> None:
+        """Apply the purpose implied by the field's input type."""
+        if field.field_type == FieldType.EMAIL:
+            field.detected_purpose = 'email'
+        elif field.field_type == FieldType.PHONE:
+            field.detected_purpose = 'phone'
+        elif field.field_type == FieldType.FILE:
+            # Try to determine if it's for resume or cover letter
+            label_text = (field.label or field.placeholder or '').lower()
+            if 'resume' in label_text or 'cv' in label_text:
+                field.detected_purpose = 'resume'
+            elif 'cover' in label_text or 'letter' in label_text:
+                field.detected_purpose = 'cover_letter'
+    
+    async def _detect_text_inputs(self) -> List[FormField]:
         """Detect text input fields."""
         fields = []
         try:
-            inputs = self.page.query_selector_all('input[type="text"], input:not([type])')
+            inputs = await self.page.query_selector_all('input[type="text"], input:not([type])')
             
             for input_elem in inputs:
-                field = self._create_field_from_element(input_elem, FieldType.TEXT)
+                field = await self._create_field_from_element(input_elem, FieldType.TEXT)
                 if field:
                     fields.append(field)
         except Exception as e:
@@ -119,85 +296,81 @@ class FormMapper:
         
         return fields
     
-    def _detect_email_inputs(self) -> List[FormField]:
+    async def _detect_email_inputs(self) -> List[FormField]:
         """Detect email input fields."""
         fields = []
         try:
-            inputs = self.page.query_selector_all('input[type="email"]')
+            inputs = await self.page.query_selector_all('input[type="email"]')
             
             for input_elem in inputs:
-                field = self._create_field_from_element(input_elem, FieldType.EMAIL)
+                field = await self._create_field_from_element(input_elem, FieldType.EMAIL)
                 if field:
-                    field.detected_purpose = 'email'
+                    self._refine_purpose(field)
                     fields.append(field)
         except Exception as e:
             logger.error(f"Error detecting email inputs: {e}")
         
         return fields
     
-    def _detect_phone_inputs(self) -> List[FormField]:
+    async def _detect_phone_inputs(self) -> List[FormField]:
         """Detect phone input fields."""
         fields = []
         try:
-            inputs = self.page.query_selector_all('input[type="tel"], input[type="phone"]')
+            inputs = await self.page.query_selector_all('input[type="tel"], input[type="phone"]')
             
             for input_elem in inputs:
-                field = self._create_field_from_element(input_elem, FieldType.PHONE)
+                field = await self._create_field_from_element(input_elem, FieldType.PHONE)
                 if field:
-                    field.detected_purpose = 'phone'
+                    self._refine_purpose(field)
                     fields.append(field)
         except Exception as e:
             logger.error(f"Error detecting phone inputs: {e}")
         
         return fields
     
-    def _detect_file_inputs(self) -> List[FormField]:
+    async def _detect_file_inputs(self) -> List[FormField]:
         """Detect file upload inputs."""
         fields = []
         try:
-            inputs = self.page.query_selector_all('input[type="file"]')
+            inputs = await self.page.query_selector_all('input[type="file"]')
             
             for input_elem in inputs:
-                field = self._create_field_from_element(input_elem, FieldType.FILE)
+                field = await self._create_field_from_element(input_elem, FieldType.FILE)
                 if field:
-                    # Try to determine if it's for resume or cover letter
-                    label_text = (field.label or field.placeholder or '').lower()
-                    if 'resume' in label_text or 'cv' in label_text:
-                        field.detected_purpose = 'resume'
-                    elif 'cover' in label_text or 'letter' in label_text:
-                        field.detected_purpose = 'cover_letter'
+                    self._refine_purpose(field)
                     fields.append(field)
         except Exception as e:
             logger.error(f"Error detecting file inputs: {e}")
         
         return fields
     
-    def _detect_select_fields(self) -> List[FormField]:
+    async def _detect_select_fields(self) -> List[FormField]:
         """Detect select dropdown fields."""
         fields = []
         try:
-            selects = self.page.query_selector_all('select')
+            selects = await self.page.query_selector_all('select')
             
             for select_elem in selects:
-                field = self._create_field_from_element(select_elem, FieldType.SELECT)
+                field = await self._create_field_from_element(select_elem, FieldType.SELECT)
                 if field:
                     # Extract options
-                    options = select_elem.query_selector_all('option')
-                    field.options = [opt.text_content() for opt in options if opt.text_content()]
+                    options = await select_elem.query_selector_all('option')
+                    texts = [await opt.text_content() for opt in options]
+                    field.options = [text for text in texts if text]
                     fields.append(field)
         except Exception as e:
             logger.error(f"Error detecting select fields: {e}")
         
         return fields
     
-    def _detect_textareas(self) -> List[FormField]:
+    async def _detect_textareas(self) -> List[FormField]:
         """Detect textarea fields."""
         fields = []
         try:
-            textareas = self.page.query_selector_all('textarea')
+            textareas = await self.page.query_selector_all('textarea')
             
             for textarea_elem in textareas:
-                field = self._create_field_from_element(textarea_elem, FieldType.TEXTAREA)
+                field = await self._create_field_from_element(textarea_elem, FieldType.TEXTAREA)
                 if field:
                     fields.append(field)
         except Exception as e:
@@ -205,14 +378,14 @@ class FormMapper:
         
         return fields
     
-    def _detect_checkboxes(self) -> List[FormField]:
+    async def _detect_checkboxes(self) -> List[FormField]:
         """Detect checkbox fields."""
         fields = []
         try:
-            checkboxes = self.page.query_selector_all('input[type="checkbox"]')
+            checkboxes = await self.page.query_selector_all('input[type="checkbox"]')
             
             for checkbox_elem in checkboxes:
-                field = self._create_field_from_element(checkbox_elem, FieldType.CHECKBOX)
+                field = await self._create_field_from_element(checkbox_elem, FieldType.CHECKBOX)
                 if field:
                     fields.append(field)
         except Exception as e:
@@ -220,7 +393,7 @@ class FormMapper:
         
         return fields
     
-    def _create_field_from_element(
+    async def _create_field_from_element(
         self, 
         element: ElementHandle, 
         field_type: FieldType
@@ -237,15 +410,15 @@ class FormMapper:
         """
         try:
             # Get element attributes
-            elem_id = element.get_attribute('id')
-            elem_name = element.get_attribute('name')
-            placeholder = element.get_attribute('placeholder')
-            required = element.get_attribute('required') is not None
-            readonly = element.get_attribute('readonly') is not None
-            disabled = element.get_attribute('disabled') is not None
+            elem_id = await element.get_attribute('id')
+            elem_name = await element.get_attribute('name')
+            placeholder = await element.get_attribute('placeholder')
+            required = await element.get_attribute('required') is not None
+            readonly = await element.get_attribute('readonly') is not None
+            disabled = await element.get_attribute('disabled') is not None
             
             # Try to find associated label
-            label = self._find_label_for_element(element, elem_id)
+            label = await self._find_label_for_element(element, elem_id)
             
             # Create selector - prefer ID, fall back to name, then other attributes
             if elem_id:
@@ -253,10 +426,10 @@ class FormMapper:
             elif elem_name:
                 selector = f'[name="{elem_name}"]'
             else:
-                selector = self._generate_unique_selector(element)
+                selector = await self._generate_unique_selector(element)
             
             # Get current value
-            current_value = element.get_attribute('value')
+            current_value = await element.get_attribute('value')
             
             # Create field
             field = FormField(
@@ -281,7 +454,7 @@ class FormMapper:
             logger.error(f"Error creating field from element: {e}")
             return None
     
-    def _find_label_for_element(
+    async def _find_label_for_element(
         self, 
         element: ElementHandle, 
         elem_id: Optional[str]
@@ -299,18 +472,18 @@ class FormMapper:
         try:
             # Try to find label by 'for' attribute
             if elem_id:
-                label = self.page.query_selector(f'label[for="{elem_id}"]')
+                label = await self.page.query_selector(f'label[for="{elem_id}"]')
                 if label:
-                    return label.text_content().strip()
+                    return (await label.text_content()).strip()
             
             # Try to find parent label
-            parent = element.evaluate('el => el.parentElement')
+            parent = await element.evaluate('el => el.parentElement')
             if parent:
-                parent_elem = element.evaluate_handle('el => el.parentElement')
+                parent_elem = await element.evaluate_handle('el => el.parentElement')
                 if parent_elem:
-                    tag_name = parent_elem.evaluate('el => el.tagName.toLowerCase()')
+                    tag_name = await parent_elem.evaluate('el => el.tagName.toLowerCase()')
                     if tag_name == 'label':
-                        return parent_elem.evaluate('el => el.textContent').strip()
+                        return (await parent_elem.evaluate('el => el.textContent')).strip()
             
             return None
             
@@ -318,7 +491,7 @@ class FormMapper:
             logger.debug(f"Could not find label: {e}")
             return None
     
-    def _generate_unique_selector(self, element: ElementHandle) -> str:
+    async def _generate_unique_selector(self, element: ElementHandle) -> str:
         """
         Generate a unique CSS selector for an element.
         
@@ -330,7 +503,7 @@ class FormMapper:
         """
         try:
             # Use Playwright's built-in selector generation
-            selector = element.evaluate('''
+            selector = await element.evaluate('''
                 el => {
                     let path = [];
                     while (el.parentElement) {
@@ -367,8 +540,28 @@ class FormMapper:
             field.id
         ])).lower()
         
+        if text_to_check not in self._purpose_memo:
+            if len(self._purpose_memo) >= self.PURPOSE_MEMO_SIZE:
+                self._purpose_memo.clear()
+            self._purpose_memo[text_to_check] = self._classify_purpose(text_to_check)
+        return self._purpose_memo[text_to_check]
+    
+    def _classify_purpose(self, text_to_check: str) -> Optional[str]:
+        """
+        Classify lowercased field text in one pass of the combined regex.
+        
+        Args:
+            text_to_check: Label, placeholder, name and id joined
+            
+        Returns:
+            Detected purpose string or None
+        """
+        found = {match.lastgroup for match in self._purpose_regex().finditer(text_to_check)}
+        if not found:
+            return None
+        
         # Check for name fields
-        if any(re.search(pattern, text_to_check, re.IGNORECASE) for pattern in self.NAME_PATTERNS):
+        if 'name' in found:
             if 'first' in text_to_check:
                 return 'first_name'
             elif 'last' in text_to_check:
@@ -377,15 +570,15 @@ class FormMapper:
                 return 'full_name'
         
         # Check for email
-        if any(re.search(pattern, text_to_check, re.IGNORECASE) for pattern in self.EMAIL_PATTERNS):
+        if 'email' in found:
             return 'email'
         
         # Check for phone
-        if any(re.search(pattern, text_to_check, re.IGNORECASE) for pattern in self.PHONE_PATTERNS):
+        if 'phone' in found:
             return 'phone'
         
         # Check for URL/website fields
-        if any(re.search(pattern, text_to_check, re.IGNORECASE) for pattern in self.URL_PATTERNS):
+        if 'url' in found:
             if 'linkedin' in text_to_check:
                 return 'linkedin_url'
             elif 'github' in text_to_check:
@@ -396,19 +589,16 @@ class FormMapper:
                 return 'website_url'
         
         # Check for address fields
-        if any(re.search(pattern, text_to_check, re.IGNORECASE) for pattern in self.ADDRESS_PATTERNS):
-            if 'city' in text_to_check:
-                return 'city'
-            elif 'state' in text_to_check:
-                return 'state'
-            elif 'zip' in text_to_check or 'postal' in text_to_check:
-                return 'zip_code'
-            elif 'country' in text_to_check:
-                return 'country'
-            else:
-                return 'address'
-        
-        return None
+        if 'city' in text_to_check:
+            return 'city'
+        elif 'state' in text_to_check:
+            return 'state'
+        elif 'zip' in text_to_check or 'postal' in text_to_check:
+            return 'zip_code'
+        elif 'country' in text_to_check:
+            return 'country'
+        else:
+            return 'address'
     
     def map_fields_to_data(
         self, 
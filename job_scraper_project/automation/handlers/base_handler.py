@@ -6,13 +6,15 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
-from playwright.sync_api import Page
+from playwright.async_api import Page
 from automation.models import SubmissionResult, SubmissionStatus, ApplicationData
+from automation.form_cache import FormSignatureCache
 from automation.form_mapper import FormMapper
 from automation.document_uploader import DocumentUploader
 from automation.navigation import FormNavigator
 from automation.captcha_solver import CaptchaSolver
 from automation.redirect_handler import RedirectHandler
+from automation.waits import PageWaiter
 from core.logger import setup_logger
 
 logger = setup_logger("base_handler")
@@ -32,23 +34,33 @@ class BaseHandler(ABC):
     - Multi-step navigation
     """
     
-    def __init__(self, page: Page, screenshot_dir: str = "data/screenshots"):
+    def __init__(
+        self,
+        page: Page,
+        screenshot_dir: str = "data/screenshots",
+        form_cache: Optional[FormSignatureCache] = None,
+        waiter: Optional[PageWaiter] = None
+    ):
         """
         Initialize the handler
         
         Args:
             page: Playwright page object
             screenshot_dir: Directory to save screenshots
+            form_cache: Form signature cache shared across handlers
+            waiter: Page waiter shared across handlers (created with default
+                timeouts if omitted)
         """
         self.page = page
         self.screenshot_dir = screenshot_dir
+        self.waiter = waiter or PageWaiter(page)
         
         # Initialize helper modules
-        self.form_mapper = FormMapper(page)
-        self.document_uploader = DocumentUploader(page)
-        self.navigator = FormNavigator(page)
-        self.captcha_solver = CaptchaSolver(page)
-        self.redirect_handler = RedirectHandler(page)
+        self.form_mapper = FormMapper(page, cache=form_cache)
+        self.document_uploader = DocumentUploader(page, waiter=self.waiter)
+        self.navigator = FormNavigator(page, waiter=self.waiter)
+        self.captcha_solver = CaptchaSolver(page, waiter=self.waiter)
+        self.redirect_handler = RedirectHandler(page, waiter=self.waiter)
         
         # Ensure screenshot directory exists
         Path(screenshot_dir).mkdir(parents=True, exist_ok=True)
@@ -112,7 +124,7 @@ class BaseHandler(ABC):
         """
         pass
     
-    def capture_screenshot(self, job_id: str, step: str = "final") -> Optional[str]:
+    async def capture_screenshot(self, job_id: str, step: str = "final") -> Optional[str]:
         """
         Capture a screenshot of the current page.
         
@@ -128,7 +140,7 @@ class BaseHandler(ABC):
             filename = f"{job_id}_{step}_{timestamp}.png"
             filepath = Path(self.screenshot_dir) / filename
             
-            self.page.screenshot(path=str(filepath), full_page=True)
+            await self.page.screenshot(path=str(filepath), full_page=True)
             logger.info(f"Screenshot saved: {filepath}")
             
             return str(filepath)
@@ -137,17 +149,17 @@ class BaseHandler(ABC):
             logger.error(f"Error capturing screenshot: {e}")
             return None
     
-    def detect_captcha(self) -> bool:
+    async def detect_captcha(self) -> bool:
         """
         Detect if a CAPTCHA is present on the page.
         
         Returns:
             True if CAPTCHA detected
         """
-        captcha_info = self.captcha_solver.detect_captcha()
+        captcha_info = await self.captcha_solver.detect_captcha()
         return captcha_info is not None
     
-    def handle_captcha(self, auto_solve: bool = False) -> bool:
+    async def handle_captcha(self, auto_solve: bool = False) -> bool:
         """
         Handle CAPTCHA if present.
         
@@ -157,21 +169,19 @@ class BaseHandler(ABC):
         Returns:
             True if CAPTCHA handled successfully
         """
-        return self.captcha_solver.handle_captcha(auto_solve=auto_solve)
+        return await self.captcha_solver.handle_captcha(auto_solve=auto_solve)
     
-    def wait_for_page_load(self, timeout: int = 30):
+    async def wait_for_page_load(self, timeout: Optional[int] = None):
         """
         Wait for page to fully load.
         
         Args:
-            timeout: Timeout in seconds
+            timeout: Timeout in seconds (default: the configured page load timeout)
         """
-        try:
-            self.page.wait_for_load_state('networkidle', timeout=timeout * 1000)
-        except Exception as e:
-            logger.warning(f"Page load timeout: {e}")
+        if not await self.waiter.load('networkidle', timeout=timeout, kind='page_load'):
+            logger.warning("Page load timeout")
     
-    def fill_text_field(self, selector: str, value: str, delay: int = 100) -> bool:
+    async def fill_text_field(self, selector: str, value: str, delay: int = 100) -> bool:
         """
         Fill a text field with the given value.
         
@@ -184,9 +194,9 @@ class BaseHandler(ABC):
             True if successful
         """
         try:
-            element = self.page.wait_for_selector(selector, timeout=5000)
+            element = await self.page.wait_for_selector(selector, timeout=5000)
             if element:
-                element.fill(value, timeout=5000)
+                await element.fill(value, timeout=5000)
                 logger.debug(f"Filled field {selector} with value")
                 return True
             return False
@@ -194,7 +204,7 @@ class BaseHandler(ABC):
             logger.error(f"Error filling field {selector}: {e}")
             return False
     
-    def click_element(self, selector: str, timeout: int = 5000) -> bool:
+    async def click_element(self, selector: str, timeout: int = 5000) -> bool:
         """
         Click an element.
         
@@ -206,9 +216,9 @@ class BaseHandler(ABC):
             True if successful
         """
         try:
-            element = self.page.wait_for_selector(selector, timeout=timeout)
-            if element and element.is_visible():
-                element.click()
+            element = await self.page.wait_for_selector(selector, timeout=timeout)
+            if element and await element.is_visible():
+                await element.click()
                 logger.debug(f"Clicked element: {selector}")
                 return True
             return False
@@ -216,7 +226,7 @@ class BaseHandler(ABC):
             logger.error(f"Error clicking element {selector}: {e}")
             return False
     
-    def select_option(self, selector: str, value: str) -> bool:
+    async def select_option(self, selector: str, value: str) -> bool:
         """
         Select an option from a dropdown.
         
@@ -228,9 +238,9 @@ class BaseHandler(ABC):
             True if successful
         """
         try:
-            element = self.page.wait_for_selector(selector, timeout=5000)
+            element = await self.page.wait_for_selector(selector, timeout=5000)
             if element:
-                element.select_option(value)
+                await element.select_option(value)
                 logger.debug(f"Selected option {value} in {selector}")
                 return True
             return False
@@ -5,7 +5,7 @@ Handles application submission for platforms without specific handlers.
 Uses heuristic detection and best-effort submission.
 """
 
-import time
+import asyncio
 from typing import Dict, Any, Optional
 from automation.handlers.base_handler import BaseHandler
 from automation.models import SubmissionResult, SubmissionStatus
@@ -46,14 +46,14 @@ class GenericHandler(BaseHandler):
         
         try:
             # Navigate to page
-            self.page.goto(application_url)
-            self.wait_for_page_load()
+            await self.page.goto(application_url)
+            await self.wait_for_page_load()
             
             # Capture initial screenshot
-            screenshot_path = self.capture_screenshot(job_id, "start")
+            screenshot_path = await self.capture_screenshot(job_id, "start")
             
             # Check for CAPTCHA
-            if self.detect_captcha():
+            if await self.detect_captcha():
                 logger.warning("CAPTCHA detected")
                 return SubmissionResult(
                     success=False,
@@ -73,32 +73,32 @@ class GenericHandler(BaseHandler):
                 await self.upload_documents(resume, cover_letter)
             
             # Handle multi-step if detected
-            if self.navigator.detect_multi_step_form():
+            if await self.navigator.detect_multi_step_form():
                 logger.info("Multi-step form detected")
                 attempt_count = 0
                 max_attempts = 10  # Prevent infinite loops
                 
                 while not self.navigator.state.is_final_step and attempt_count < max_attempts:
-                    if not self.navigator.go_next():
+                    if not await self.navigator.go_next():
                         break
                     await self.fill_form(user_profile)
-                    time.sleep(1)
                     attempt_count += 1
             
             # Attempt submission
-            if not self._attempt_submission():
+            await self.waiter.arm_confirmation()
+            if not await self._attempt_submission():
                 logger.warning("Could not find submit button")
                 return SubmissionResult(
                     success=False,
                     job_id=job_id,
                     platform='generic',
                     status=SubmissionStatus.MANUAL_INTERVENTION_REQUIRED,
-                    screenshot_path=self.capture_screenshot(job_id, "no_submit"),
+                    screenshot_path=await self.capture_screenshot(job_id, "no_submit"),
                     error_message="Could not locate submit button - manual submission required"
                 )
             
             # Wait for potential confirmation
-            time.sleep(3)
+            await self.waiter.for_confirmation(budget=3.0)
             
             # Try to verify, but be lenient
             verified = await self.verify_submission()
@@ -110,7 +110,7 @@ class GenericHandler(BaseHandler):
                     job_id=job_id,
                     platform='generic',
                     status=SubmissionStatus.SUCCESS,
-                    screenshot_path=self.capture_screenshot(job_id, "success")
+                    screenshot_path=await self.capture_screenshot(job_id, "success")
                 )
             else:
                 # Could not verify, but may still be successful
@@ -120,10 +120,10 @@ class GenericHandler(BaseHandler):
                     job_id=job_id,
                     platform='generic',
                     status=SubmissionStatus.MANUAL_INTERVENTION_REQUIRED,
-                    screenshot_path=self.capture_screenshot(job_id, "unverified"),
+                    screenshot_path=await self.capture_screenshot(job_id, "unverified"),
                     error_message="Submission attempted but not verified - please check manually"
                 )
-            
+                
         except Exception as e:
             logger.error(f"Error during generic submission: {e}", exc_info=True)
             return SubmissionResult(
@@ -131,7 +131,7 @@ class GenericHandler(BaseHandler):
                 job_id=job_id,
                 platform='generic',
                 status=SubmissionStatus.FAILED,
-                screenshot_path=self.capture_screenshot(job_id, "error"),
+                screenshot_path=await self.capture_screenshot(job_id, "error"),
                 error_message=str(e)
             )
     
@@ -141,7 +141,7 @@ class GenericHandler(BaseHandler):
             logger.info("Detecting and filling form fields")
             
             # Detect all fields
-            fields = self.form_mapper.detect_all_fields()
+            fields = await self.form_mapper.detect_all_fields()
             logger.info(f"Detected {len(fields)} fields")
             
             if not fields:
@@ -157,19 +157,19 @@ class GenericHandler(BaseHandler):
             for field, value in field_mapping.items():
                 try:
                     if field.field_type.value in ['text', 'email', 'phone', 'url']:
-                        if self.fill_text_field(field.selector, str(value)):
+                        if await self.fill_text_field(field.selector, str(value)):
                             filled_count += 1
                     elif field.field_type.value == 'select':
-                        if self.select_option(field.selector, str(value)):
+                        if await self.select_option(field.selector, str(value)):
                             filled_count += 1
                     elif field.field_type.value == 'checkbox':
-                        if value and self.click_element(field.selector):
+                        if value and await self.click_element(field.selector):
                             filled_count += 1
                     elif field.field_type.value == 'textarea':
-                        if self.fill_text_field(field.selector, str(value)):
+                        if await self.fill_text_field(field.selector, str(value)):
                             filled_count += 1
                     
-                    time.sleep(0.5)
+                    await asyncio.sleep(0.5)
                 except Exception as e:
                     logger.warning(f"Could not fill field {field.selector}: {e}")
             
@@ -189,7 +189,7 @@ class GenericHandler(BaseHandler):
             
             # Try to upload resume
             if resume:
-                if self.document_uploader.upload_resume(resume):
+                if await self.document_uploader.upload_resume(resume):
                     logger.info("Resume uploaded successfully")
                     success = True
                 else:
@@ -197,7 +197,7 @@ class GenericHandler(BaseHandler):
             
             # Try to upload cover letter
             if cover_letter:
-                if self.document_uploader.upload_cover_letter(cover_letter):
+                if await self.document_uploader.upload_cover_letter(cover_letter):
                     logger.info("Cover letter uploaded successfully")
                     success = True
                 else:
@@ -222,7 +222,7 @@ class GenericHandler(BaseHandler):
                 'application sent'
             ]
             
-            page_text = self.page.text_content('body').lower()
+            page_text = (await self.page.text_content('body')).lower()
             
             for pattern in success_patterns:
                 if pattern in page_text:
@@ -241,7 +241,7 @@ class GenericHandler(BaseHandler):
             logger.error(f"Error verifying submission: {e}")
             return False
     
-    def _attempt_submission(self) -> bool:
+    async def _attempt_submission(self) -> bool:
         """Attempt to find and click submit button"""
         try:
             # Common submit button patterns
@@ -257,23 +257,23 @@ class GenericHandler(BaseHandler):
             # Try each pattern
             for pattern in submit_patterns:
                 # Try button
-                button = self.page.query_selector(f'button:has-text("{pattern}")')
-                if button and button.is_visible():
-                    button.click()
+                button = await self.page.query_selector(f'button:has-text("{pattern}")')
+                if button and await button.is_visible():
+                    await button.click()
                     logger.info(f"Clicked submit button with text: {pattern}")
                     return True
                 
                 # Try input[type=submit]
-                submit_input = self.page.query_selector(f'input[type="submit"][value*="{pattern}" i]')
-                if submit_input and submit_input.is_visible():
-                    submit_input.click()
+                submit_input = await self.page.query_selector(f'input[type="submit"][value*="{pattern}" i]')
+                if submit_input and await submit_input.is_visible():
+                    await submit_input.click()
                     logger.info(f"Clicked submit input with value: {pattern}")
                     return True
             
             # Fallback: any submit button
-            any_submit = self.page.query_selector('button[type="submit"], input[type="submit"]')
-            if any_submit and any_submit.is_visible():
-                any_submit.click()
+            any_submit = await self.page.query_selector('button[type="submit"], input[type="submit"]')
+            if any_submit and await any_submit.is_visible():
+                await any_submit.click()
                 logger.info("Clicked generic submit button")
                 return True
             
@@ -4,7 +4,7 @@ Greenhouse ATS Handler
 Handles automated application submission for Greenhouse ATS.
 """
 
-import time
+import asyncio
 from typing import Dict, Any, Optional
 from automation.handlers.base_handler import BaseHandler
 from automation.models import SubmissionResult, SubmissionStatus
@@ -47,14 +47,14 @@ class GreenhouseHandler(BaseHandler):
         
         try:
             # Navigate to application page
-            self.page.goto(application_url)
-            self.wait_for_page_load()
+            await self.page.goto(application_url)
+            await self.wait_for_page_load()
             
             # Capture initial screenshot
-            screenshot_path = self.capture_screenshot(job_id, "start")
+            screenshot_path = await self.capture_screenshot(job_id, "start")
             
             # Check for CAPTCHA
-            if self.detect_captcha():
+            if await self.detect_captcha():
                 logger.warning("CAPTCHA detected")
                 return SubmissionResult(
                     success=False,
@@ -73,7 +73,7 @@ class GreenhouseHandler(BaseHandler):
                     job_id=job_id,
                     platform='greenhouse',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "fill_error"),
+                    screenshot_path=await self.capture_screenshot(job_id, "fill_error"),
                     error_message="Failed to fill form fields"
                 )
             
@@ -86,7 +86,7 @@ class GreenhouseHandler(BaseHandler):
                         job_id=job_id,
                         platform='greenhouse',
                         status=SubmissionStatus.FAILED,
-                        screenshot_path=self.capture_screenshot(job_id, "upload_error"),
+                        screenshot_path=await self.capture_screenshot(job_id, "upload_error"),
                         error_message="Failed to upload documents"
                     )
             
@@ -94,22 +94,29 @@ class GreenhouseHandler(BaseHandler):
             await self._answer_custom_questions(user_profile)
             
             # Accept privacy policy if required
-            self._accept_privacy_policy()
+            await self._accept_privacy_policy()
             
             # Submit application
-            if not self._submit_application():
+            await self.waiter.arm_confirmation()
+            if not await self._submit_application():
                 logger.error("Could not submit application")
                 return SubmissionResult(
                     success=False,
                     job_id=job_id,
                     platform='greenhouse',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "submit_error"),
+                    screenshot_path=await self.capture_screenshot(job_id, "submit_error"),
                     error_message="Could not submit application"
                 )
             
             # Wait for confirmation
-            time.sleep(3)
+            await self.waiter.for_confirmation(
+                budget=3.0,
+                patterns=['application submitted', 'thank you for applying',
+                          'your application has been submitted'],
+                url_words=['confirmation', 'thank'],
+                selector='.application-confirmation, #application_confirmation'
+            )
             
             # Verify submission
             if await self.verify_submission():
@@ -119,7 +126,7 @@ class GreenhouseHandler(BaseHandler):
                     job_id=job_id,
                     platform='greenhouse',
                     status=SubmissionStatus.SUCCESS,
-                    screenshot_path=self.capture_screenshot(job_id, "success")
+                    screenshot_path=await self.capture_screenshot(job_id, "success")
                 )
             else:
                 logger.warning("Could not verify submission")
@@ -128,10 +135,10 @@ class GreenhouseHandler(BaseHandler):
                     job_id=job_id,
                     platform='greenhouse',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "verify_error"),
+                    screenshot_path=await self.capture_screenshot(job_id, "verify_error"),
                     error_message="Could not verify submission"
                 )
-            
+                
         except Exception as e:
             logger.error(f"Error during Greenhouse submission: {e}", exc_info=True)
             return SubmissionResult(
@@ -139,7 +146,7 @@ class GreenhouseHandler(BaseHandler):
                 job_id=job_id,
                 platform='greenhouse',
                 status=SubmissionStatus.FAILED,
-                screenshot_path=self.capture_screenshot(job_id, "error"),
+                screenshot_path=await self.capture_screenshot(job_id, "error"),
                 error_message=str(e)
             )
     
@@ -160,26 +167,26 @@ class GreenhouseHandler(BaseHandler):
             for field_name, selector in standard_fields.items():
                 if field_name in form_data and form_data[field_name]:
                     try:
-                        self.fill_text_field(selector, str(form_data[field_name]))
-                        time.sleep(0.3)
+                        await self.fill_text_field(selector, str(form_data[field_name]))
+                        await asyncio.sleep(0.3)
                     except:
                         logger.debug(f"Could not fill {field_name} using standard selector")
             
             # Detect and fill remaining fields
-            fields = self.form_mapper.detect_all_fields()
+            fields = await self.form_mapper.detect_all_fields()
             field_mapping = self.form_mapper.map_fields_to_data(fields, form_data)
             
             for field, value in field_mapping.items():
                 try:
                     if field.field_type.value in ['text', 'email', 'phone']:
-                        self.fill_text_field(field.selector, str(value))
+                        await self.fill_text_field(field.selector, str(value))
                     elif field.field_type.value == 'select':
-                        self.select_option(field.selector, str(value))
+                        await self.select_option(field.selector, str(value))
                     elif field.field_type.value == 'checkbox':
                         if value:
-                            self.click_element(field.selector)
+                            await self.click_element(field.selector)
                     
-                    time.sleep(0.5)
+                    await asyncio.sleep(0.5)
                 except Exception as e:
                     logger.warning(f"Could not fill field {field.selector}: {e}")
             
@@ -206,7 +213,7 @@ class GreenhouseHandler(BaseHandler):
                 uploaded = False
                 for selector in resume_selectors:
                     try:
-                        success = self.document_uploader.upload_file(resume, selector)
+                        success = await self.document_uploader.upload_file(resume, selector)
                         if success:
                             uploaded = True
                             break
@@ -215,7 +222,7 @@ class GreenhouseHandler(BaseHandler):
                 
                 if not uploaded:
                     # Fallback to generic file input
-                    uploaded = self.document_uploader.upload_resume(resume)
+                    uploaded = await self.document_uploader.upload_resume(resume)
                 
                 if not uploaded:
                     logger.error("Could not upload resume")
@@ -231,7 +238,7 @@ class GreenhouseHandler(BaseHandler):
                 
                 for selector in cover_letter_selectors:
                     try:
-                        self.document_uploader.upload_file(cover_letter, selector)
+                        await self.document_uploader.upload_file(cover_letter, selector)
                         break
                     except:
                         continue
@@ -255,7 +262,7 @@ class GreenhouseHandler(BaseHandler):
             ]
             
             for selector in success_selectors:
-                if self.page.locator(selector).count() > 0:
+                if await self.page.locator(selector).count() > 0:
                     logger.info(f"Success indicator found: {selector}")
                     return True
             
@@ -274,7 +281,7 @@ class GreenhouseHandler(BaseHandler):
         """Answer custom screening questions"""
         try:
             # Look for custom question fields
-            custom_questions = self.page.query_selector_all('[data-question-type]')
+            custom_questions = await self.page.query_selector_all('[data-question-type]')
             
             if not custom_questions:
                 logger.info("No custom questions found")
@@ -288,7 +295,7 @@ class GreenhouseHandler(BaseHandler):
             for question_elem in custom_questions:
                 try:
                     # Get question text
-                    question_text = question_elem.text_content().strip()
+                    question_text = (await question_elem.text_content()).strip()
                     logger.debug(f"Question: {question_text}")
                     
                     # Check if we have a response
@@ -296,13 +303,13 @@ class GreenhouseHandler(BaseHandler):
                         response = screening_responses[question_text]
                         
                         # Find input field within question
-                        input_field = question_elem.query_selector('input, select, textarea')
+                        input_field = await question_elem.query_selector('input, select, textarea')
                         if input_field:
-                            tag_name = input_field.evaluate('el => el.tagName.toLowerCase()')
+                            tag_name = await input_field.evaluate('el => el.tagName.toLowerCase()')
                             if tag_name == 'select':
-                                input_field.select_option(response)
+                                await input_field.select_option(response)
                             else:
-                                input_field.fill(response)
+                                await input_field.fill(response)
                 except Exception as e:
                     logger.warning(f"Could not answer custom question: {e}")
             
@@ -312,7 +319,7 @@ class GreenhouseHandler(BaseHandler):
             logger.error(f"Error answering custom questions: {e}")
             return False
     
-    def _accept_privacy_policy(self) -> bool:
+    async def _accept_privacy_policy(self) -> bool:
         """Accept privacy policy checkbox if present"""
         try:
             # Look for privacy policy checkboxes
@@ -323,9 +330,9 @@ class GreenhouseHandler(BaseHandler):
             ]
             
             for selector in privacy_selectors:
-                checkbox = self.page.query_selector(selector)
-                if checkbox and not checkbox.is_checked():
-                    checkbox.click()
+                checkbox = await self.page.query_selector(selector)
+                if checkbox and not await checkbox.is_checked():
+                    await checkbox.click()
                     logger.info("Accepted privacy policy")
                     return True
             
@@ -335,7 +342,7 @@ class GreenhouseHandler(BaseHandler):
             logger.warning(f"Error accepting privacy policy: {e}")
             return True  # Continue even if this fails
     
-    def _submit_application(self) -> bool:
+    async def _submit_application(self) -> bool:
         """Submit the Greenhouse application"""
         try:
             submit_selectors = [
@@ -346,7 +353,7 @@ class GreenhouseHandler(BaseHandler):
             ]
             
             for selector in submit_selectors:
-                if self.click_element(selector, timeout=2000):
+                if await self.click_element(selector, timeout=2000):
                     logger.info("Submit button clicked")
                     return True
             
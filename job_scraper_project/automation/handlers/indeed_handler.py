@@ -4,7 +4,7 @@ Indeed Application Handler
 Handles automated application submission for Indeed job postings.
 """
 
-import time
+import asyncio
 from typing import Dict, Any, Optional
 from automation.handlers.base_handler import BaseHandler
 from automation.models import SubmissionResult, SubmissionStatus
@@ -46,14 +46,14 @@ class IndeedHandler(BaseHandler):
         
         try:
             # Navigate to job page
-            self.page.goto(application_url)
-            self.wait_for_page_load()
+            await self.page.goto(application_url)
+            await self.wait_for_page_load()
             
             # Capture initial screenshot
-            screenshot_path = self.capture_screenshot(job_id, "start")
+            screenshot_path = await self.capture_screenshot(job_id, "start")
             
             # Check for CAPTCHA
-            if self.detect_captcha():
+            if await self.detect_captcha():
                 logger.warning("CAPTCHA detected")
                 return SubmissionResult(
                     success=False,
@@ -65,22 +65,22 @@ class IndeedHandler(BaseHandler):
                 )
             
             # Click Apply button
-            if not self._click_apply_button():
+            if not await self._click_apply_button():
                 logger.error("Could not find Apply button")
                 return SubmissionResult(
                     success=False,
                     job_id=job_id,
                     platform='indeed',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "no_button"),
+                    screenshot_path=await self.capture_screenshot(job_id, "no_button"),
                     error_message="Apply button not found"
                 )
             
             # Wait for form to load
-            time.sleep(2)
+            await self.waiter.settle(budget=2.0, kind='form_load')
             
             # Detect if Indeed-hosted or external redirect
-            is_indeed_hosted = self._is_indeed_hosted_application()
+            is_indeed_hosted = await self._is_indeed_hosted_application()
             
             if not is_indeed_hosted:
                 logger.warning("External application detected - may not be fully supported")
@@ -89,7 +89,7 @@ class IndeedHandler(BaseHandler):
                     job_id=job_id,
                     platform='indeed',
                     status=SubmissionStatus.MANUAL_INTERVENTION_REQUIRED,
-                    screenshot_path=self.capture_screenshot(job_id, "external"),
+                    screenshot_path=await self.capture_screenshot(job_id, "external"),
                     error_message="External company application - manual application required"
                 )
             
@@ -106,33 +106,38 @@ class IndeedHandler(BaseHandler):
                     job_id=job_id,
                     platform='indeed',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "fill_error"),
+                    screenshot_path=await self.capture_screenshot(job_id, "fill_error"),
                     error_message="Failed to fill form fields"
                 )
             
             # Handle multi-step if needed
-            if self.navigator.detect_multi_step_form():
+            if await self.navigator.detect_multi_step_form():
                 logger.info("Multi-step form detected")
                 while not self.navigator.state.is_final_step:
-                    if not self.navigator.go_next():
+                    if not await self.navigator.go_next():
                         break
                     await self.fill_form(user_profile)
-                    time.sleep(1)
             
             # Submit application
-            if not self._submit_application():
+            await self.waiter.arm_confirmation()
+            if not await self._submit_application():
                 logger.error("Could not submit application")
                 return SubmissionResult(
                     success=False,
                     job_id=job_id,
                     platform='indeed',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "submit_error"),
+                    screenshot_path=await self.capture_screenshot(job_id, "submit_error"),
                     error_message="Could not submit application"
                 )
             
             # Wait for confirmation
-            time.sleep(3)
+            await self.waiter.for_confirmation(
+                budget=3.0,
+                patterns=['application submitted', 'your application has been submitted',
+                          'successfully applied'],
+                selector='[data-testid="application-confirmation"]'
+            )
             
             # Verify submission
             if await self.verify_submission():
@@ -142,7 +147,7 @@ class IndeedHandler(BaseHandler):
                     job_id=job_id,
                     platform='indeed',
                     status=SubmissionStatus.SUCCESS,
-                    screenshot_path=self.capture_screenshot(job_id, "success")
+                    screenshot_path=await self.capture_screenshot(job_id, "success")
                 )
             else:
                 logger.warning("Could not verify submission")
@@ -151,10 +156,10 @@ class IndeedHandler(BaseHandler):
                     job_id=job_id,
                     platform='indeed',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "verify_error"),
+                    screenshot_path=await self.capture_screenshot(job_id, "verify_error"),
                     error_message="Could not verify submission"
                 )
-            
+                
         except Exception as e:
             logger.error(f"Error during Indeed submission: {e}", exc_info=True)
             return SubmissionResult(
@@ -162,7 +167,7 @@ class IndeedHandler(BaseHandler):
                 job_id=job_id,
                 platform='indeed',
                 status=SubmissionStatus.FAILED,
-                screenshot_path=self.capture_screenshot(job_id, "error"),
+                screenshot_path=await self.capture_screenshot(job_id, "error"),
                 error_message=str(e)
             )
     
@@ -172,7 +177,7 @@ class IndeedHandler(BaseHandler):
             logger.info("Filling form fields")
             
             # Detect all fields
-            fields = self.form_mapper.detect_all_fields()
+            fields = await self.form_mapper.detect_all_fields()
             logger.info(f"Detected {len(fields)} fields")
             
             # Map fields to data
@@ -182,14 +187,14 @@ class IndeedHandler(BaseHandler):
             for field, value in field_mapping.items():
                 try:
                     if field.field_type.value in ['text', 'email', 'phone']:
-                        self.fill_text_field(field.selector, str(value))
+                        await self.fill_text_field(field.selector, str(value))
                     elif field.field_type.value == 'select':
-                        self.select_option(field.selector, str(value))
+                        await self.select_option(field.selector, str(value))
                     elif field.field_type.value == 'checkbox':
                         if value:
-                            self.click_element(field.selector)
+                            await self.click_element(field.selector)
                     
-                    time.sleep(0.5)
+                    await asyncio.sleep(0.5)
                 except Exception as e:
                     logger.warning(f"Could not fill field {field.selector}: {e}")
             
@@ -205,13 +210,13 @@ class IndeedHandler(BaseHandler):
             logger.info("Uploading documents")
             
             if resume:
-                success = self.document_uploader.upload_resume(resume)
+                success = await self.document_uploader.upload_resume(resume)
                 if not success:
                     logger.warning("Resume upload failed")
                     return False
             
             if cover_letter:
-                self.document_uploader.upload_cover_letter(cover_letter)
+                await self.document_uploader.upload_cover_letter(cover_letter)
             
             return True
             
@@ -232,7 +237,7 @@ class IndeedHandler(BaseHandler):
             ]
             
             for selector in success_selectors:
-                if self.page.locator(selector).count() > 0:
+                if await self.page.locator(selector).count() > 0:
                     logger.info(f"Success indicator found: {selector}")
                     return True
             
@@ -242,7 +247,7 @@ class IndeedHandler(BaseHandler):
             logger.error(f"Error verifying submission: {e}")
             return False
     
-    def _click_apply_button(self) -> bool:
+    async def _click_apply_button(self) -> bool:
         """Click the Apply button"""
         try:
             selectors = [
@@ -253,7 +258,7 @@ class IndeedHandler(BaseHandler):
             ]
             
             for selector in selectors:
-                if self.click_element(selector, timeout=3000):
+                if await self.click_element(selector, timeout=3000):
                     logger.info("Apply button clicked")
                     return True
             
@@ -263,7 +268,7 @@ class IndeedHandler(BaseHandler):
             logger.error(f"Error clicking Apply button: {e}")
             return False
     
-    def _is_indeed_hosted_application(self) -> bool:
+    async def _is_indeed_hosted_application(self) -> bool:
         """Check if application is Indeed-hosted"""
         try:
             from urllib.parse import urlparse
@@ -284,7 +289,7 @@ class IndeedHandler(BaseHandler):
             ]
             
             for selector in indeed_indicators:
-                if self.page.query_selector(selector):
+                if await self.page.query_selector(selector):
                     return True
             
             return False
@@ -293,7 +298,7 @@ class IndeedHandler(BaseHandler):
             logger.error(f"Error checking application type: {e}")
             return False
     
-    def _submit_application(self) -> bool:
+    async def _submit_application(self) -> bool:
         """Submit the application"""
         try:
             submit_selectors = [
@@ -304,7 +309,7 @@ class IndeedHandler(BaseHandler):
             ]
             
             for selector in submit_selectors:
-                if self.click_element(selector, timeout=2000):
+                if await self.click_element(selector, timeout=2000):
                     logger.info("Submit button clicked")
                     return True
             
@@ -4,7 +4,7 @@ LinkedIn Easy Apply Handler
 Handles automated application submission for LinkedIn Easy Apply jobs.
 """
 
-import time
+import asyncio
 from typing import Dict, Any, Optional
 from automation.handlers.base_handler import BaseHandler
 from automation.models import SubmissionResult, SubmissionStatus, ApplicationData
@@ -46,14 +46,14 @@ class LinkedInHandler(BaseHandler):
         
         try:
             # Navigate to job page
-            self.page.goto(application_url)
-            self.wait_for_page_load()
+            await self.page.goto(application_url)
+            await self.wait_for_page_load()
             
             # Capture initial screenshot
-            screenshot_path = self.capture_screenshot(job_id, "start")
+            screenshot_path = await self.capture_screenshot(job_id, "start")
             
             # Check for CAPTCHA
-            if self.detect_captcha():
+            if await self.detect_captcha():
                 logger.warning("CAPTCHA detected")
                 return SubmissionResult(
                     success=False,
@@ -65,26 +65,26 @@ class LinkedInHandler(BaseHandler):
                 )
             
             # Click Easy Apply button
-            if not self._click_easy_apply():
+            if not await self._click_easy_apply():
                 logger.error("Could not find Easy Apply button")
                 return SubmissionResult(
                     success=False,
                     job_id=job_id,
                     platform='linkedin',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "no_button"),
+                    screenshot_path=await self.capture_screenshot(job_id, "no_button"),
                     error_message="Easy Apply button not found"
                 )
             
             # Wait for modal to appear
-            time.sleep(2)
+            await self.waiter.for_selector('.jobs-easy-apply-modal, [role="dialog"]', budget=2.0, kind='modal')
             
             # Detect if multi-step form
-            is_multi_step = self.navigator.detect_multi_step_form()
+            is_multi_step = await self.navigator.detect_multi_step_form()
             
             if is_multi_step:
                 logger.info("Multi-step form detected")
-                nav_state = self.navigator.detect_steps()
+                nav_state = await self.navigator.detect_steps()
                 logger.info(f"Detected {nav_state.total_steps} steps")
             
             # Fill form fields
@@ -95,7 +95,7 @@ class LinkedInHandler(BaseHandler):
                     job_id=job_id,
                     platform='linkedin',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "fill_error"),
+                    screenshot_path=await self.capture_screenshot(job_id, "fill_error"),
                     error_message="Failed to fill form fields"
                 )
             
@@ -108,13 +108,13 @@ class LinkedInHandler(BaseHandler):
             if is_multi_step:
                 while not self.navigator.state.is_final_step:
                     # Validate current step
-                    is_valid, errors = self.navigator.validate_step()
+                    is_valid, errors = await self.navigator.validate_step()
                     if not is_valid:
                         logger.warning(f"Validation errors: {errors}")
                         # Try to fix errors or continue
                     
                     # Try to go to next step
-                    if not self.navigator.go_next():
+                    if not await self.navigator.go_next():
                         logger.error("Could not navigate to next step")
                         break
                     
@@ -122,24 +122,29 @@ class LinkedInHandler(BaseHandler):
                     await self.fill_form(user_profile)
                     
                     # Small delay to appear human-like
-                    time.sleep(1)
+                    await asyncio.sleep(1)
             
             # Submit the application
-            if not self.navigator.submit_form():
+            await self.waiter.arm_confirmation()
+            if not await self.navigator.submit_form():
                 # Try alternative submit methods
-                if not self._submit_alternative():
+                if not await self._submit_alternative():
                     logger.error("Could not submit application")
                     return SubmissionResult(
                         success=False,
                         job_id=job_id,
                         platform='linkedin',
                         status=SubmissionStatus.FAILED,
-                        screenshot_path=self.capture_screenshot(job_id, "submit_error"),
+                        screenshot_path=await self.capture_screenshot(job_id, "submit_error"),
                         error_message="Could not submit application"
                     )
             
             # Wait for confirmation
-            time.sleep(3)
+            await self.waiter.for_confirmation(
+                budget=3.0,
+                patterns=['application sent', 'your application was sent', 'successfully applied'],
+                selector='.artdeco-inline-feedback--success, [data-test-artdeco-toast-item-type="success"]'
+            )
             
             # Verify submission
             if await self.verify_submission():
@@ -149,8 +154,8 @@ class LinkedInHandler(BaseHandler):
                     job_id=job_id,
                     platform='linkedin',
                     status=SubmissionStatus.SUCCESS,
-                    screenshot_path=self.capture_screenshot(job_id, "success"),
-                    confirmation_number=self._extract_confirmation_number()
+                    screenshot_path=await self.capture_screenshot(job_id, "success"),
+                    confirmation_number=await self._extract_confirmation_number()
                 )
             else:
                 logger.warning("Could not verify submission")
@@ -159,10 +164,10 @@ class LinkedInHandler(BaseHandler):
                     job_id=job_id,
                     platform='linkedin',
                     status=SubmissionStatus.FAILED,
-                    screenshot_path=self.capture_screenshot(job_id, "verify_error"),
+                    screenshot_path=await self.capture_screenshot(job_id, "verify_error"),
                     error_message="Could not verify submission"
                 )
-            
+                
         except Exception as e:
             logger.error(f"Error during LinkedIn submission: {e}", exc_info=True)
             return SubmissionResult(
@@ -170,7 +175,7 @@ class LinkedInHandler(BaseHandler):
                 job_id=job_id,
                 platform='linkedin',
                 status=SubmissionStatus.FAILED,
-                screenshot_path=self.capture_screenshot(job_id, "error"),
+                screenshot_path=await self.capture_screenshot(job_id, "error"),
                 error_message=str(e)
             )
     
@@ -180,7 +185,7 @@ class LinkedInHandler(BaseHandler):
             logger.info("Filling form fields")
             
             # Detect all fields on current step
-            fields = self.form_mapper.detect_all_fields()
+            fields = await self.form_mapper.detect_all_fields()
             logger.info(f"Detected {len(fields)} fields")
             
             # Map fields to data
@@ -190,14 +195,14 @@ class LinkedInHandler(BaseHandler):
             for field, value in field_mapping.items():
                 try:
                     if field.field_type.value in ('text', 'email', 'phone'):
-                        self.fill_text_field(field.selector, str(value))
+                        await self.fill_text_field(field.selector, str(value))
                     elif field.field_type.value == 'select':
-                        self.select_option(field.selector, str(value))
+                        await self.select_option(field.selector, str(value))
                     elif field.field_type.value == 'checkbox':
                         if value:
-                            self.click_element(field.selector)
+                            await self.click_element(field.selector)
                     
-                    time.sleep(0.5)  # Small delay between fields
+                    await asyncio.sleep(0.5)  # Small delay between fields
                 except Exception as e:
                     logger.warning(f"Could not fill field {field.selector}: {e}")
             
@@ -214,14 +219,14 @@ class LinkedInHandler(BaseHandler):
             
             # LinkedIn usually has a resume upload section
             if resume:
-                success = self.document_uploader.upload_resume(resume)
+                success = await self.document_uploader.upload_resume(resume)
                 if not success:
                     logger.warning("Resume upload failed")
                     return False
             
             # Cover letter is less common on LinkedIn Easy Apply
             if cover_letter:
-                self.document_uploader.upload_cover_letter(cover_letter)
+                await self.document_uploader.upload_cover_letter(cover_letter)
             
             return True
             
@@ -242,13 +247,13 @@ class LinkedInHandler(BaseHandler):
             ]
             
             for selector in success_selectors:
-                if self.page.locator(selector).count() > 0:
+                if await self.page.locator(selector).count() > 0:
                     logger.info(f"Success indicator found: {selector}")
                     return True
             
             # Check if modal is closed (might indicate success)
-            modal = self.page.query_selector('.jobs-easy-apply-modal')
-            if not modal or not modal.is_visible():
+            modal = await self.page.query_selector('.jobs-easy-apply-modal')
+            if not modal or not await modal.is_visible():
                 logger.info("Easy Apply modal closed - assuming success")
                 return True
             
@@ -258,7 +263,7 @@ class LinkedInHandler(BaseHandler):
             logger.error(f"Error verifying submission: {e}")
             return False
     
-    def _click_easy_apply(self) -> bool:
+    async def _click_easy_apply(self) -> bool:
         """Click the Easy Apply button"""
         try:
             # Try various selectors for Easy Apply button
@@ -269,7 +274,7 @@ class LinkedInHandler(BaseHandler):
             ]
             
             for selector in selectors:
-                if self.click_element(selector, timeout=3000):
+                if await self.click_element(selector, timeout=3000):
                     logger.info("Easy Apply button clicked")
                     return True
             
@@ -279,7 +284,7 @@ class LinkedInHandler(BaseHandler):
             logger.error(f"Error clicking Easy Apply: {e}")
             return False
     
-    def _submit_alternative(self) -> bool:
+    async def _submit_alternative(self) -> bool:
         """Try alternative methods to submit"""
         try:
             # Try to find and click submit/apply button
@@ -291,7 +296,7 @@ class LinkedInHandler(BaseHandler):
             ]
             
             for selector in submit_selectors:
-                if self.click_element(selector, timeout=2000):
+                if await self.click_element(selector, timeout=2000):
                     logger.info("Alternative submit clicked")
                     return True
             
@@ -301,7 +306,7 @@ class LinkedInHandler(BaseHandler):
             logger.error(f"Error with alternative submit: {e}")
             return False
     
-    def _extract_confirmation_number(self) -> Optional[str]:
+    async def _extract_confirmation_number(self) -> Optional[str]:
         """Extract confirmation number if available"""
         try:
             # LinkedIn doesn't typically provide confirmation numbers
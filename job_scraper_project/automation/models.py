@@ -3,11 +3,14 @@ Data models for application submission system.
 
 This module contains all data classes used throughout the application submission process.
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+import yaml
+
 
 class SubmissionStatus(Enum):
     """Status of an application submission."""
@@ -36,7 +39,7 @@ class FieldType(Enum):
     NUMBER = "number"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubmissionResult:
     """
     Result of an application submission attempt.
@@ -142,7 +145,7 @@ class ApplicationData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FormField:
     """
     Detected form field information.
@@ -229,6 +232,12 @@ class SubmissionConfig:
     page_load_timeout: int = 30  # seconds
     element_timeout: int = 10  # seconds
     
+    # Event-driven waits (seconds); each returns as soon as the page is ready
+    step_timeout: int = 10  # page reacting to a next/apply click
+    upload_timeout: int = 10  # file input holding the uploaded file
+    redirect_timeout: int = 10  # external redirect after applying
+    network_idle_timeout: float = 2.0  # quiet network once a step has loaded
+    
     # Screenshots
     screenshot_on_error: bool = True
     screenshot_on_success: bool = True
@@ -246,7 +255,58 @@ class SubmissionConfig:
     pause_on_captcha: bool = True
     captcha_wait_time: int = 300  # seconds to wait for manual CAPTCHA solving
     
+    # Form signature cache (None to classify every form from scratch)
+    form_cache_path: Optional[str] = "data/form_cache.json"
+    form_cache_size: int = 2000
+    
     # Validation
     verify_submission: bool = True
     wait_for_confirmation: bool = True
     confirmation_wait_time: int = 10  # seconds
+    
+    # Keys of the automation.yaml "submission" section named differently here
+    _CONFIG_ALIASES = {
+        'retry_delay_seconds': 'retry_delay',
+        'screenshot_directory': 'screenshot_dir',
+    }
+    
+    @classmethod
+    def from_config(cls, config_path: str = "config/automation.yaml", **overrides: Any) -> "SubmissionConfig":
+        """
+        Create a config from the "submission" section of the automation config.
+        
+        Keys that match a field (or an alias) override its default; other
+        keys are ignored. The "form_cache" section sets form_cache_path
+        and form_cache_size (``enabled: false`` turns the cache off).
+        
+        Args:
+            config_path: Path to automation configuration file
+            **overrides: Field values taking precedence over the file
+                (e.g. command line options)
+            
+        Returns:
+            SubmissionConfig
+        """
+        path = Path(config_path)
+        settings: Dict[str, Any] = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = yaml.safe_load(f) or {}
+        section = settings.get('submission', {}) or {}
+        names = {f.name for f in fields(cls)}
+        values = {}
+        for key, value in section.items():
+            key = cls._CONFIG_ALIASES.get(key, key)
+            if key in names:
+                values[key] = value
+        
+        form_cache = settings.get('form_cache', {}) or {}
+        if not form_cache.get('enabled', True):
+            values['form_cache_path'] = None
+        else:
+            if 'path' in form_cache:
+                values['form_cache_path'] = form_cache['path']
+            if 'max_entries' in form_cache:
+                values['form_cache_size'] = form_cache['max_entries']
+        values.update(overrides)
+        return cls(**values)
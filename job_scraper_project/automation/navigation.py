@@ -3,10 +3,10 @@ Multi-step form navigation module.
 
 Handles navigation through multi-step application forms.
 """
-import time
 from typing import Optional, List, Tuple
-from playwright.sync_api import Page
+from playwright.async_api import Page
 from automation.models import NavigationState
+from automation.waits import PageWaiter
 from core.logger import setup_logger
 
 logger = setup_logger("navigation")
@@ -45,17 +45,19 @@ class FormNavigator:
         'done'
     ]
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, waiter: Optional[PageWaiter] = None):
         """
         Initialize the form navigator.
         
         Args:
             page: Playwright page object
+            waiter: Page waiter (created with default timeouts if omitted)
         """
         self.page = page
+        self.waiter = waiter or PageWaiter(page)
         self.state = NavigationState()
     
-    def detect_multi_step_form(self) -> bool:
+    async def detect_multi_step_form(self) -> bool:
         """
         Detect if the current form is multi-step.
         
@@ -74,17 +76,17 @@ class FormNavigator:
             ]
             
             for selector in progress_indicators:
-                if self.page.query_selector(selector):
+                if await self.page.query_selector(selector):
                     logger.info(f"Multi-step form detected: {selector}")
                     return True
             
             # Look for "next" button (indicator of multi-step)
-            if self._find_next_button():
+            if await self._find_next_button():
                 logger.info("Multi-step form detected: next button found")
                 return True
             
             # Look for step numbers in text
-            if self.page.locator('text=/step [0-9]/i').count() > 0:
+            if await self.page.locator('text=/step [0-9]/i').count() > 0:
                 logger.info("Multi-step form detected: step text found")
                 return True
             
@@ -94,7 +96,7 @@ class FormNavigator:
             logger.error(f"Error detecting multi-step form: {e}")
             return False
     
-    def detect_steps(self) -> NavigationState:
+    async def detect_steps(self) -> NavigationState:
         """
         Detect the number of steps and current position.
         
@@ -103,7 +105,7 @@ class FormNavigator:
         """
         try:
             # Try to find step indicators
-            step_elements = self.page.query_selector_all(
+            step_elements = await self.page.query_selector_all(
                 '.step, .wizard-step, [data-step], .stepper-item'
             )
             
@@ -113,7 +115,7 @@ class FormNavigator:
                 # Try to determine current step
                 current_step = 0
                 for i, elem in enumerate(step_elements):
-                    classes = elem.get_attribute('class') or ''
+                    classes = await elem.get_attribute('class') or ''
                     if 'active' in classes or 'current' in classes:
                         current_step = i
                         break
@@ -123,16 +125,16 @@ class FormNavigator:
                 
                 # Extract step titles if available
                 for elem in step_elements:
-                    title = elem.text_content()
+                    title = await elem.text_content()
                     if title:
                         self.state.step_titles.append(title.strip())
                 
                 logger.info(f"Detected {total_steps} steps, currently on step {current_step + 1}")
             
             # Update navigation capabilities
-            self.state.can_go_next = self._find_next_button() is not None
-            self.state.can_go_back = self._find_back_button() is not None
-            self.state.is_final_step = self._is_final_step()
+            self.state.can_go_next = await self._find_next_button() is not None
+            self.state.can_go_back = await self._find_back_button() is not None
+            self.state.is_final_step = await self._is_final_step()
             
             return self.state
             
@@ -140,18 +142,19 @@ class FormNavigator:
             logger.error(f"Error detecting steps: {e}")
             return self.state
     
-    def go_next(self, wait_time: float = 2.0) -> bool:
+    async def go_next(self, timeout: Optional[float] = None) -> bool:
         """
         Navigate to the next step.
         
         Args:
-            wait_time: Time to wait after clicking (seconds)
-            
+            timeout: Maximum time to wait for the next step after clicking
+                (seconds, default: the waiter's step timeout)
+                
         Returns:
             True if navigation successful
         """
         try:
-            next_button = self._find_next_button()
+            next_button = await self._find_next_button()
             
             if not next_button:
                 logger.warning("No next button found")
@@ -159,18 +162,15 @@ class FormNavigator:
             
             # Click the button
             logger.info("Clicking next button")
-            next_button.click()
-            
-            # Wait for navigation
-            time.sleep(wait_time)
+            await self.waiter.step(next_button.click, budget=2.0, timeout=timeout)
             
             # Update state
             self.state.advance_step()
             
             # Re-detect capabilities
-            self.state.can_go_next = self._find_next_button() is not None
-            self.state.can_go_back = self._find_back_button() is not None
-            self.state.is_final_step = self._is_final_step()
+            self.state.can_go_next = await self._find_next_button() is not None
+            self.state.can_go_back = await self._find_back_button() is not None
+            self.state.is_final_step = await self._is_final_step()
             
             logger.info(f"Navigated to step {self.state.current_step + 1}")
             return True
@@ -179,18 +179,19 @@ class FormNavigator:
             logger.error(f"Error navigating to next step: {e}")
             return False
     
-    def go_back(self, wait_time: float = 2.0) -> bool:
+    async def go_back(self, timeout: Optional[float] = None) -> bool:
         """
         Navigate to the previous step.
         
         Args:
-            wait_time: Time to wait after clicking (seconds)
-            
+            timeout: Maximum time to wait for the previous step after clicking
+                (seconds, default: the waiter's step timeout)
+                
         Returns:
             True if navigation successful
         """
         try:
-            back_button = self._find_back_button()
+            back_button = await self._find_back_button()
             
             if not back_button:
                 logger.warning("No back button found")
@@ -198,18 +199,15 @@ class FormNavigator:
             
             # Click the button
             logger.info("Clicking back button")
-            back_button.click()
-            
-            # Wait for navigation
-            time.sleep(wait_time)
+            await self.waiter.step(back_button.click, budget=2.0, timeout=timeout)
             
             # Update state
             self.state.go_back()
             
             # Re-detect capabilities
-            self.state.can_go_next = self._find_next_button() is not None
-            self.state.can_go_back = self._find_back_button() is not None
-            self.state.is_final_step = self._is_final_step()
+            self.state.can_go_next = await self._find_next_button() is not None
+            self.state.can_go_back = await self._find_back_button() is not None
+            self.state.is_final_step = await self._is_final_step()
             
             logger.info(f"Navigated back to step {self.state.current_step + 1}")
             return True
@@ -218,18 +216,19 @@ class FormNavigator:
             logger.error(f"Error navigating to previous step: {e}")
             return False
     
-    def submit_form(self, wait_time: float = 3.0) -> bool:
+    async def submit_form(self, timeout: Optional[float] = None) -> bool:
         """
         Submit the final form.
         
         Args:
-            wait_time: Time to wait after submission (seconds)
-            
+            timeout: Maximum time to wait for the page to react after
+                submitting (seconds, default: the waiter's step timeout)
+                
         Returns:
             True if submission successful
         """
         try:
-            submit_button = self._find_submit_button()
+            submit_button = await self._find_submit_button()
             
             if not submit_button:
                 logger.warning("No submit button found")
@@ -237,10 +236,7 @@ class FormNavigator:
             
             # Click submit
             logger.info("Clicking submit button")
-            submit_button.click()
-            
-            # Wait for submission to process
-            time.sleep(wait_time)
+            await self.waiter.step(submit_button.click, budget=3.0, timeout=timeout, kind='submit')
             
             logger.info("Form submitted")
             return True
@@ -249,19 +245,19 @@ class FormNavigator:
             logger.error(f"Error submitting form: {e}")
             return False
     
-    def _find_next_button(self):
+    async def _find_next_button(self):
         """Find the next/continue button."""
-        return self._find_button_by_patterns(self.NEXT_BUTTON_PATTERNS)
+        return await self._find_button_by_patterns(self.NEXT_BUTTON_PATTERNS)
     
-    def _find_back_button(self):
+    async def _find_back_button(self):
         """Find the back/previous button."""
-        return self._find_button_by_patterns(self.BACK_BUTTON_PATTERNS)
+        return await self._find_button_by_patterns(self.BACK_BUTTON_PATTERNS)
     
-    def _find_submit_button(self):
+    async def _find_submit_button(self):
         """Find the submit/apply button."""
-        return self._find_button_by_patterns(self.SUBMIT_BUTTON_PATTERNS)
+        return await self._find_button_by_patterns(self.SUBMIT_BUTTON_PATTERNS)
     
-    def _find_button_by_patterns(self, patterns: List[str]):
+    async def _find_button_by_patterns(self, patterns: List[str]):
         """
         Find a button matching any of the given text patterns.
         
@@ -275,19 +271,19 @@ class FormNavigator:
             # Try to find button or input[type=submit] with matching text
             for pattern in patterns:
                 # Case-insensitive search
-                button = self.page.query_selector(
+                button = await self.page.query_selector(
                     f'button:has-text("{pattern}"), '
                     f'input[type="submit"][value*="{pattern}" i], '
                     f'a:has-text("{pattern}")'
                 )
                 
-                if button and button.is_visible():
+                if button and await button.is_visible():
                     return button
             
             # Try aria-label
             for pattern in patterns:
-                button = self.page.query_selector(f'button[aria-label*="{pattern}" i]')
-                if button and button.is_visible():
+                button = await self.page.query_selector(f'button[aria-label*="{pattern}" i]')
+                if button and await button.is_visible():
                     return button
             
             return None
@@ -296,7 +292,7 @@ class FormNavigator:
             logger.debug(f"Error finding button: {e}")
             return None
     
-    def _is_final_step(self) -> bool:
+    async def _is_final_step(self) -> bool:
         """
         Check if we're on the final step.
         
@@ -305,13 +301,13 @@ class FormNavigator:
         """
         try:
             # Check if submit button is visible
-            if self._find_submit_button():
+            if await self._find_submit_button():
                 return True
             
             # Check if "next" button says something like "submit" or "finish"
-            next_button = self._find_next_button()
+            next_button = await self._find_next_button()
             if next_button:
-                button_text = next_button.text_content().lower()
+                button_text = (await next_button.text_content()).lower()
                 if any(pattern in button_text for pattern in self.SUBMIT_BUTTON_PATTERNS):
                     return True
             
@@ -325,7 +321,7 @@ class FormNavigator:
             logger.debug(f"Error checking if final step: {e}")
             return False
     
-    def wait_for_navigation(self, timeout: float = 10.0) -> bool:
+    async def wait_for_navigation(self, timeout: float = 10.0) -> bool:
         """
         Wait for page navigation to complete.
         
@@ -335,14 +331,12 @@ class FormNavigator:
         Returns:
             True if navigation completed
         """
-        try:
-            self.page.wait_for_load_state('networkidle', timeout=timeout * 1000)
-            return True
-        except Exception as e:
-            logger.warning(f"Navigation wait timed out: {e}")
+        if not await self.waiter.load('networkidle', timeout=timeout, kind='navigation'):
+            logger.warning(f"Navigation wait timed out after {timeout}s")
             return False
+        return True
     
-    def validate_step(self) -> Tuple[bool, List[str]]:
+    async def validate_step(self) -> Tuple[bool, List[str]]:
         """
         Validate current step for errors.
         
@@ -363,10 +357,10 @@ class FormNavigator:
             ]
             
             for selector in error_selectors:
-                error_elements = self.page.query_selector_all(selector)
+                error_elements = await self.page.query_selector_all(selector)
                 for elem in error_elements:
-                    if elem.is_visible():
-                        error_text = elem.text_content().strip()
+                    if await elem.is_visible():
+                        error_text = (await elem.text_content()).strip()
                         if error_text:
                             errors.append(error_text)
             
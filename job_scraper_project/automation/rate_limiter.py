@@ -3,6 +3,7 @@ Adaptive rate limiting module.
 
 Provides intelligent rate limiting that adapts to platform responses.
 """
+import asyncio
 import time
 import random
 from typing import Dict, List, Optional
@@ -173,7 +174,7 @@ class AdaptiveRateLimiter:
         
         return delay
     
-    def wait_if_needed(self, platform: str) -> float:
+    async def wait_if_needed(self, platform: str) -> float:
         """
         Wait if necessary before next submission.
         
@@ -187,7 +188,7 @@ class AdaptiveRateLimiter:
         
         if required_delay > 0:
             logger.info(f"Waiting {required_delay:.1f}s before next {platform} submission")
-            time.sleep(required_delay)
+            await asyncio.sleep(required_delay)
             return required_delay
         
         return 0
@@ -6,7 +6,8 @@ Handles cases where job applications redirect to external company sites.
 import time
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
-from playwright.sync_api import Page
+from playwright.async_api import Page
+from automation.waits import PageWaiter
 from core.logger import setup_logger
 
 logger = setup_logger("redirect_handler")
@@ -22,24 +23,27 @@ class RedirectHandler:
     3. Attempts to continue with appropriate handler
     """
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, waiter: Optional[PageWaiter] = None):
         """
         Initialize the redirect handler.
         
         Args:
             page: Playwright page object
+            waiter: Page waiter (created with default timeouts if omitted)
         """
         self.page = page
+        self.waiter = waiter or PageWaiter(page)
         self.redirect_history = []
     
-    def detect_redirect(self, original_url: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
+    async def detect_redirect(self, original_url: str, timeout: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         Detect if a redirect has occurred.
         
         Args:
             original_url: The original URL we navigated to
-            timeout: Time to wait for redirect detection
-            
+            timeout: Time to wait for redirect detection (default: the
+                waiter's redirect timeout)
+                
         Returns:
             Dictionary with redirect info or None
         """
@@ -47,30 +51,24 @@ class RedirectHandler:
             start_time = time.time()
             original_domain = urlparse(original_url).netloc
             
-            # Wait a bit for potential redirects
-            time.sleep(2)
+            # Returns as soon as the URL leaves the original domain
+            if not await self.waiter.for_domain_change(original_url, timeout=timeout):
+                return None
             
-            while time.time() - start_time < timeout:
-                current_url = self.page.url
-                current_domain = urlparse(current_url).netloc
-                
-                if current_domain != original_domain:
-                    redirect_info = {
-                        'original_url': original_url,
-                        'redirected_url': current_url,
-                        'original_domain': original_domain,
-                        'redirected_domain': current_domain,
-                        'redirect_time': time.time() - start_time
-                    }
-                    
-                    logger.info(f"Redirect detected: {original_domain} -> {current_domain}")
-                    self.redirect_history.append(redirect_info)
-                    
-                    return redirect_info
-                
-                time.sleep(0.5)
+            current_url = self.page.url
+            current_domain = urlparse(current_url).netloc
+            redirect_info = {
+                'original_url': original_url,
+                'redirected_url': current_url,
+                'original_domain': original_domain,
+                'redirected_domain': current_domain,
+                'redirect_time': time.time() - start_time
+            }
             
-            return None
+            logger.info(f"Redirect detected: {original_domain} -> {current_domain}")
+            self.redirect_history.append(redirect_info)
+            
+            return redirect_info
             
         except Exception as e:
             logger.error(f"Error detecting redirect: {e}")
@@ -115,12 +113,12 @@ class RedirectHandler:
                 if any(word in hostname_lower for word in ['career', 'jobs', 'hiring', 'talent']):
                     return 'company_careers'
                 return 'unknown'
-            
+                
         except Exception as e:
             logger.error(f"Error identifying platform: {e}")
             return 'unknown'
     
-    def check_for_external_apply_button(self) -> Optional[str]:
+    async def check_for_external_apply_button(self) -> Optional[str]:
         """
         Check if there's an external apply button/link.
         
@@ -140,9 +138,9 @@ class RedirectHandler:
             ]
             
             for selector in selectors:
-                element = self.page.query_selector(selector)
+                element = await self.page.query_selector(selector)
                 if element:
-                    href = element.get_attribute('href')
+                    href = await element.get_attribute('href')
                     if href:
                         logger.info(f"Found external apply link: {href}")
                         return href
@@ -153,7 +151,7 @@ class RedirectHandler:
             logger.error(f"Error checking for external apply: {e}")
             return None
     
-    def handle_external_redirect(
+    async def handle_external_redirect(
         self,
         original_platform: str,
         follow_redirect: bool = True
@@ -170,15 +168,15 @@ class RedirectHandler:
         """
         try:
             # Check for external apply button first
-            external_url = self.check_for_external_apply_button()
+            external_url = await self.check_for_external_apply_button()
             
             if external_url:
                 logger.info(f"External application detected from {original_platform}")
                 
                 if follow_redirect:
                     logger.info("Following external redirect...")
-                    self.page.goto(external_url)
-                    time.sleep(2)
+                    await self.page.goto(external_url)
+                    await self.waiter.settle(budget=2.0, kind='redirect')
                     
                     # Identify new platform
                     new_platform = self.identify_redirected_platform(self.page.url)
@@ -221,7 +219,7 @@ class RedirectHandler:
         """
         return self.redirect_history.copy()
     
-    def detect_iframe_application(self) -> Optional[str]:
+    async def detect_iframe_application(self) -> Optional[str]:
         """
         Detect if application is in an iframe.
         
@@ -231,10 +229,10 @@ class RedirectHandler:
             iframe source URL if detected, None otherwise
         """
         try:
-            iframes = self.page.query_selector_all('iframe')
+            iframes = await self.page.query_selector_all('iframe')
             
             for iframe in iframes:
-                src = iframe.get_attribute('src')
+                src = await iframe.get_attribute('src')
                 if src and any(keyword in src.lower() for keyword in ['apply', 'job', 'application', 'career']):
                     logger.info(f"Detected application iframe: {src}")
                     return src
@@ -0,0 +1,396 @@
+"""
+Event-driven page wait module.
+
+Waits on what the page actually does (load states, network idle, URL
+changes, DOM changes, in-page conditions) instead of fixed sleeps, and
+records how much time each wait saved against the sleep it replaces.
+"""
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+from playwright.async_api import Page, ElementHandle, Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from automation.models import SubmissionConfig
+from core.logger import setup_logger
+
+logger = setup_logger("waits")
+
+# Flags the first element added or removed after it runs, ignoring ripples,
+# spinners and label swaps inside buttons (attribute changes such as hover
+# and focus classes never count). A URL change counts too, and a navigation
+# replaces window, which also reads as a change.
+ARM_CHANGE_SCRIPT = """() => {
+    const state = window.__formStep = {url: location.href, changed: false};
+    new MutationObserver((mutations, observer) => {
+        const inButton = mutation => mutation.target.closest
+            && mutation.target.closest('button, [role="button"]');
+        if (mutations.every(inButton)) return;
+        state.changed = true;
+        observer.disconnect();
+    }).observe(document, {childList: true, subtree: true});
+}"""
+
+CHANGED_SCRIPT = """() => !window.__formStep || window.__formStep.changed
+    || location.href !== window.__formStep.url"""
+
+BODY_TEXT_SCRIPT = "() => (document.body && document.body.innerText) || ''"
+
+UPLOAD_SCRIPT = "input => !!input.files && input.files.length > 0"
+
+# Resolves once the page has changed since the baseline (URL or body text)
+# and shows a success message or element, a confirmation URL or a visible,
+# non-empty error. Without a baseline any page counts as changed.
+CONFIRMATION_SCRIPT = """([patterns, urlWords, selector, baseline]) => {
+    const body = (document.body && document.body.innerText) || '';
+    if (baseline && location.href === baseline[0] && body === baseline[1]) return false;
+    const url = location.href.toLowerCase();
+    if (urlWords.some(word => url.includes(word))) return true;
+    if (selector && document.querySelector(selector)) return true;
+    const text = body.toLowerCase();
+    if (patterns.some(pattern => text.includes(pattern))) return true;
+    return [...document.querySelectorAll('[role="alert"], .error-message, .field-error')].some(
+        el => el.getClientRects().length > 0 && (el.innerText || '').trim() !== ''
+    );
+}"""
+
+CONFIRMATION_PATTERNS = [
+    'thank you',
+    'success',
+    'submitted',
+    'received',
+    'confirmation',
+    'application sent'
+]
+
+CONFIRMATION_URL_WORDS = ['confirm', 'thank', 'success']
+
+
+@dataclass
+class WaitStats:
+    """
+    Totals for one kind of wait.
+    
+    Attributes:
+        count: Waits performed
+        timeouts: Waits that hit their timeout
+        waited: Seconds actually spent waiting
+        budget: Seconds the fixed sleeps these waits replace would have taken
+    """
+    count: int = 0
+    timeouts: int = 0
+    waited: float = 0.0
+    budget: float = 0.0
+    
+    @property
+    def saved(self) -> float:
+        """Seconds saved against the fixed sleeps (negative if slower)"""
+        return self.budget - self.waited
+
+
+class PageWaiter:
+    """
+    Waits for page conditions with timeouts from the submission config.
+    
+    Every wait returns as soon as its condition holds and never raises on
+    timeout; it returns False instead, so callers continue as they did
+    after a fixed sleep.
+    
+    Example:
+        >>> waiter = PageWaiter(page, SubmissionConfig(step_timeout=5))
+        >>> await waiter.step(next_button.click, budget=2.0)
+        True
+        >>> waiter.total_saved()
+        1.62
+    """
+    
+    def __init__(self, page: Page, config: Optional[SubmissionConfig] = None):
+        """
+        Initialize the waiter.
+        
+        Args:
+            page: Playwright page object
+            config: Submission config supplying the timeouts
+        """
+        self.page = page
+        self.config = config or SubmissionConfig()
+        self.stats: Dict[str, WaitStats] = {}
+        self._confirmation_baseline: Optional[List[str]] = None
+    
+    def _record(self, kind: str, started: float, budget: float, ok: bool) -> bool:
+        """Add one wait to the stats for its kind."""
+        stats = self.stats.setdefault(kind, WaitStats())
+        stats.count += 1
+        stats.waited += time.perf_counter() - started
+        stats.budget += budget
+        if not ok:
+            stats.timeouts += 1
+        return ok
+    
+    async def _load_state(self, state: str, timeout: float) -> bool:
+        """Wait for a load state, returning False on timeout."""
+        try:
+            await self.page.wait_for_load_state(state, timeout=timeout * 1000)
+            return True
+        except PlaywrightError as e:
+            logger.debug(f"Load state '{state}' not reached: {e}")
+            return False
+    
+    async def load(
+        self,
+        state: str = 'load',
+        timeout: Optional[float] = None,
+        budget: float = 0.0,
+        kind: str = 'load'
+    ) -> bool:
+        """
+        Wait for a page load state.
+        
+        Args:
+            state: 'load', 'domcontentloaded' or 'networkidle'
+            timeout: Maximum wait in seconds (default: page_load_timeout)
+            budget: Seconds of fixed sleep this wait replaces
+            kind: Stats bucket
+            
+        Returns:
+            True if the state was reached
+        """
+        started = time.perf_counter()
+        ok = await self._load_state(state, timeout if timeout is not None else self.config.page_load_timeout)
+        return self._record(kind, started, budget, ok)
+    
+    async def settle(self, budget: float = 0.0, kind: str = 'settle') -> bool:
+        """
+        Wait for the page to load and its network to go briefly idle.
+        
+        Network idle is capped at network_idle_timeout, so pages that
+        keep polling in the background do not hold up the flow.
+        
+        Args:
+            budget: Seconds of fixed sleep this wait replaces
+            kind: Stats bucket
+            
+        Returns:
+            True if the page loaded
+        """
+        started = time.perf_counter()
+        ok = await self._load_state('load', self.config.page_load_timeout)
+        if ok:
+            await self._load_state('networkidle', self.config.network_idle_timeout)
+        return self._record(kind, started, budget, ok)
+    
+    async def step(
+        self,
+        action: Callable[[], Awaitable[Any]],
+        budget: float = 0.0,
+        timeout: Optional[float] = None,
+        kind: str = 'step'
+    ) -> bool:
+        """
+        Run an action (usually a click) and wait for the page to react.
+        
+        Waits for the first element added or removed outside a button, a
+        URL change or a navigation caused by the action, then for the page
+        to settle.
+        
+        Args:
+            action: Coroutine function performing the action
+            budget: Seconds of fixed sleep this wait replaces
+            timeout: Maximum wait in seconds (default: step_timeout)
+            kind: Stats bucket
+            
+        Returns:
+            True if the page changed
+        """
+        timeout = timeout if timeout is not None else self.config.step_timeout
+        try:
+            await self.page.evaluate(ARM_CHANGE_SCRIPT)
+            armed = True
+        except PlaywrightError as e:
+            logger.debug(f"Could not watch for page changes: {e}")
+            armed = False
+        
+        await action()
+        started = time.perf_counter()
+        ok = True
+        if armed:
+            try:
+                await self.page.wait_for_function(CHANGED_SCRIPT, timeout=timeout * 1000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"No page change after {timeout}s")
+                ok = False
+            except PlaywrightError as e:
+                # A navigation can tear down the context mid-wait; that is a change too
+                logger.debug(f"Page changed context while waiting: {e}")
+        if await self._load_state('load', self.config.page_load_timeout):
+            await self._load_state('networkidle', self.config.network_idle_timeout)
+        return self._record(kind, started, budget, ok)
+    
+    async def for_selector(
+        self,
+        selector: str,
+        budget: float = 0.0,
+        timeout: Optional[float] = None,
+        state: str = 'visible',
+        kind: str = 'element'
+    ) -> bool:
+        """
+        Wait for an element to reach a state.
+        
+        Args:
+            selector: CSS selector
+            budget: Seconds of fixed sleep this wait replaces
+            timeout: Maximum wait in seconds (default: step_timeout)
+            state: 'attached', 'detached', 'visible' or 'hidden'
+            kind: Stats bucket
+            
+        Returns:
+            True if the element reached the state
+        """
+        timeout = timeout if timeout is not None else self.config.step_timeout
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_selector(selector, state=state, timeout=timeout * 1000)
+            ok = True
+        except PlaywrightError as e:
+            logger.debug(f"'{selector}' not {state}: {e}")
+            ok = False
+        return self._record(kind, started, budget, ok)
+    
+    async def for_upload(self, file_input: ElementHandle, budget: float = 0.0) -> bool:
+        """
+        Wait for a file input to hold its file and the upload request to finish.
+        
+        Args:
+            file_input: The file input element
+            budget: Seconds of fixed sleep this wait replaces
+            
+        Returns:
+            True if the input holds a file
+        """
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_function(
+                UPLOAD_SCRIPT, arg=file_input, timeout=self.config.upload_timeout * 1000
+            )
+            ok = True
+        except PlaywrightError as e:
+            logger.debug(f"Upload not confirmed: {e}")
+            ok = False
+        # Many ATS forms post the file as soon as it is chosen
+        await self._load_state('networkidle', self.config.network_idle_timeout)
+        return self._record('upload', started, budget, ok)
+    
+    async def for_domain_change(self, original_url: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the page to leave the domain of a URL.
+        
+        The stats budget is what the replaced 2 s sleep plus 0.5 s polling
+        would have taken: until the first poll after the redirect, or the
+        whole timeout when none happens.
+        
+        Args:
+            original_url: URL whose domain the page started on
+            timeout: Maximum wait in seconds (default: redirect_timeout)
+            
+        Returns:
+            True if the page moved to another domain
+        """
+        timeout = timeout if timeout is not None else self.config.redirect_timeout
+        domain = urlparse(original_url).netloc
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_url(
+                lambda url: urlparse(url).netloc != domain,
+                wait_until='commit',
+                timeout=timeout * 1000
+            )
+            ok = True
+        except PlaywrightError as e:
+            logger.debug(f"No redirect from {domain}: {e}")
+            ok = False
+        if ok:
+            elapsed = time.perf_counter() - started
+            budget = max(2.0, math.ceil(elapsed * 2) / 2)
+        else:
+            budget = timeout
+        return self._record('redirect', started, budget, ok)
+    
+    async def arm_confirmation(self) -> None:
+        """
+        Remember the page before a submit click.
+        
+        The next :meth:`for_confirmation` only accepts a confirmation or
+        error once the URL or body text differs from this snapshot, so
+        messages already on the form page do not end the wait early.
+        """
+        try:
+            text = await self.page.evaluate(BODY_TEXT_SCRIPT)
+            self._confirmation_baseline = [self.page.url, text or '']
+        except PlaywrightError as e:
+            logger.debug(f"Could not snapshot page before submit: {e}")
+            self._confirmation_baseline = None
+    
+    async def for_confirmation(
+        self,
+        budget: float = 0.0,
+        patterns: Optional[Sequence[str]] = None,
+        url_words: Optional[Sequence[str]] = None,
+        selector: Optional[str] = None
+    ) -> bool:
+        """
+        Wait for a submission to be confirmed or rejected on the page.
+        
+        Call :meth:`arm_confirmation` before the submit click; the wait
+        then ignores the unchanged form page.
+        
+        Args:
+            budget: Seconds of fixed sleep this wait replaces
+            patterns: Lowercase success phrases (default: CONFIRMATION_PATTERNS)
+            url_words: Words in a confirmation URL (default: CONFIRMATION_URL_WORDS)
+            selector: CSS selector of a success element
+            
+        Returns:
+            True if a confirmation, confirmation URL or error appeared
+        """
+        baseline, self._confirmation_baseline = self._confirmation_baseline, None
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_function(
+                CONFIRMATION_SCRIPT,
+                arg=[
+                    list(patterns or CONFIRMATION_PATTERNS),
+                    list(url_words or CONFIRMATION_URL_WORDS),
+                    selector,
+                    baseline
+                ],
+                timeout=self.config.confirmation_wait_time * 1000
+            )
+            ok = True
+        except PlaywrightError as e:
+            logger.debug(f"No confirmation shown: {e}")
+            ok = False
+        return self._record('confirmation', started, budget, ok)
+    
+    def total_saved(self) -> float:
+        """Seconds saved by all waits so far"""
+        return sum(stats.saved for stats in self.stats.values())
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get wait statistics per kind of wait.
+        
+        Returns:
+            Dictionary mapping wait kind to count, timeouts, waited, budget and saved seconds
+        """
+        return {
+            kind: {
+                'count': stats.count,
+                'timeouts': stats.timeouts,
+                'waited': round(stats.waited, 3),
+                'budget': round(stats.budget, 3),
+                'saved': round(stats.saved, 3),
+            }
+            for kind, stats in self.stats.items()
+        }
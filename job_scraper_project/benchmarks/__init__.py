@@ -0,0 +1,5 @@
+"""
+Benchmarks - Standalone performance benchmarks
+
+Run a benchmark from the project root, e.g. ``python -m benchmarks.bench_dedup``.
+"""
@@ -0,0 +1,128 @@
+"""
+Application database benchmark - bulk inserts and keyset-paginated status pages
+
+Loads applications for many users with ``create_applications`` batches,
+then times status pages (first pages and deep pages reached by keyset
+cursor) and dashboard summaries read from the trigger-maintained summary
+tables, compared with aggregating the applications table.
+
+Usage:
+    python -m benchmarks.bench_applications --applications 1000000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List
+
+import numpy as np
+
+from tracking.database import ApplicationDatabase
+from tracking.models import Application, ApplicationStatus
+
+STATUSES = list(ApplicationStatus)
+START = datetime(2024, 1, 1)
+
+# Funnel aggregated from the applications table, for comparison
+SCAN_FUNNEL = (
+    "SELECT COUNT(*), SUM(response_received), SUM(response_type IS 'interview'), "
+    "SUM(response_type IS 'offer'), SUM(response_type IS 'rejection') "
+    "FROM applications WHERE user_id = ?"
+)
+
+
+def generate_applications(count: int, users: int, seed: int = 5) -> Iterator[Application]:
+    """Yield synthetic applications spread over users and statuses"""
+    rng = random.Random(seed)
+    for i in range(count):
+        submitted = START + timedelta(seconds=rng.randrange(365 * 86400))
+        yield Application(
+            id=f"app{i:08d}",
+            user_id=f"user{rng.randrange(users):05d}",
+            job_id=f"job{rng.randrange(count)}",
+            job_title="Software Engineer",
+            company=f"Company {rng.randrange(5000)}",
+            application_url=f"https://jobs.example.com/{i}",
+            submitted_at=submitted,
+            resume_version="v3",
+            cover_letter_version=None,
+            match_score=round(rng.uniform(50, 100), 1),
+            status=rng.choice(STATUSES),
+            status_updated_at=submitted,
+        )
+
+
+def percentiles(samples: List[float]) -> str:
+    """Format p50/p99 of timings in milliseconds"""
+    p50, p99 = np.percentile(np.array(samples) * 1000, [50, 99])
+    return f"{p50:>8.3f} {p99:>8.3f}"
+
+
+def main() -> None:
+    """Run the benchmark and print timings"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--batch-size', type=int, default=10_000)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--queries', type=int, default=2000)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = ApplicationDatabase(f"sqlite:///{Path(tmp) / 'applications.db'}")
+        
+        start = time.perf_counter()
+        batch: List[Application] = []
+        for application in generate_applications(args.applications, args.users):
+            batch.append(application)
+            if len(batch) == args.batch_size:
+                db.create_applications(batch)
+                batch = []
+        if batch:
+            db.create_applications(batch)
+        elapsed = time.perf_counter() - start
+        print(f"Inserted {args.applications} applications for {args.users} users in "
+              f"{elapsed:.1f}s ({args.applications / elapsed:,.0f}/s)")
+        
+        rng = random.Random(7)
+        first, deep, counts, funnels, scans = [], [], [], [], []
+        for _ in range(args.queries):
+            user = f"user{rng.randrange(args.users):05d}"
+            status = rng.choice(STATUSES)
+            
+            start = time.perf_counter()
+            page = db.get_user_applications(user, status, limit=args.page_size)
+            first.append(time.perf_counter() - start)
+            
+            # Jump to a page near the end of the listing via its cursor
+            if page:
+                start = time.perf_counter()
+                db.get_user_applications(user, status, limit=args.page_size, after=page[-1])
+                deep.append(time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            db.count_by_status(user)
+            counts.append(time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            db.get_funnel(user)
+            funnels.append(time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            db._conn.execute(SCAN_FUNNEL, (user,)).fetchall()
+            scans.append(time.perf_counter() - start)
+        
+        print(f"{'query':>18} {'p50 ms':>8} {'p99 ms':>8}")
+        print(f"{'first status page':>18} {percentiles(first)}")
+        print(f"{'next status page':>18} {percentiles(deep)}")
+        print(f"{'count by status':>18} {percentiles(counts)}")
+        print(f"{'funnel (summary)':>18} {percentiles(funnels)}")
+        print(f"{'funnel (scan)':>18} {percentiles(scans)}")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
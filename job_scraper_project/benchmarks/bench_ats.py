@@ -0,0 +1,71 @@
+"""
+ATS scoring benchmark - one resume against many job descriptions
+
+Times ``ATSScorer.score_resume`` called per job with the resume analysis
+cache cleared (re-scanning the resume every time) against
+``ATSScorer.score_many``, which analyzes the resume once.
+
+Usage:
+    python -m benchmarks.bench_ats --jobs 1000
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.bench_dedup import generate_jobs
+from optimization.ats_scorer import ATSScorer
+from optimization.keyword_extractor import KeywordExtractor
+
+SKILLS = ["python", "java", "sql", "docker", "kubernetes", "aws", "react", "django",
+          "terraform", "kafka", "spark", "typescript", "postgresql", "redis", "git"]
+
+
+def generate_resume(paragraphs: int = 40, seed: int = 3) -> str:
+    """Generate a long synthetic resume with standard sections"""
+    rng = random.Random(seed)
+    lines = ["SUMMARY", "Backend engineer focused on reliable services.", "EXPERIENCE"]
+    for _ in range(paragraphs):
+        lines.append(f"- Built {rng.choice(SKILLS)} and {rng.choice(SKILLS)} systems "
+                     f"serving {rng.randrange(1, 100)}M requests with {rng.choice(SKILLS)}")
+    lines += ["EDUCATION", "BSc Computer Science", "SKILLS", ", ".join(SKILLS[:8])]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run the benchmark and print timings"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--jobs', type=int, default=1000)
+    args = parser.parse_args()
+    
+    rng = random.Random(5)
+    descriptions = [
+        f"{job['title']} with {', '.join(rng.sample(SKILLS, 4))}. {job['description']}"
+        for job in generate_jobs(args.jobs, repost_rate=0.0)
+    ]
+    resume = generate_resume()
+    scorer = ATSScorer(keyword_extractor=KeywordExtractor(df_path=None))
+    scorer.keyword_extractor.update_document_frequencies(descriptions, save=False)
+    
+    start = time.perf_counter()
+    single = []
+    for description in descriptions:
+        scorer._analysis_cache.clear()
+        single.append(scorer.score_resume(resume, description))
+    per_job = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    ranked = scorer.score_many(resume, descriptions)
+    batch = time.perf_counter() - start
+    
+    for result in ranked:
+        assert abs(result['overall_score'] - single[result['job_index']]['overall_score']) < 1e-9
+    
+    print(f"{'method':>12} {'seconds':>9} {'ms/job':>8}")
+    for name, seconds in (('per job', per_job), ('score_many', batch)):
+        print(f"{name:>12} {seconds:>9.2f} {seconds * 1000 / args.jobs:>8.2f}")
+    print(f"Speedup: {per_job / batch:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
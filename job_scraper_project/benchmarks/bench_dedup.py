@@ -0,0 +1,108 @@
+"""
+Deduplication benchmark - MinHash LSH index vs. pairwise comparison
+
+Generates synthetic job postings (with a share of reworded cross-board
+reposts) and times ``JobDeduplicator.deduplicate_batch`` as the batch grows.
+
+Usage:
+    python -m benchmarks.bench_dedup --sizes 10000,100000 --large
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from discovery.deduplicator import JobDeduplicator
+
+TITLES = ["python developer", "backend engineer", "data scientist", "devops engineer",
+          "frontend developer", "machine learning engineer", "site reliability engineer"]
+LEVELS = ["junior", "senior", "staff", "lead", "principal", ""]
+WORDS = ("build scalable services design apis mentor engineers own features review code "
+         "deploy cloud infrastructure analyse data ship products collaborate with teams "
+         "improve reliability automate pipelines write tests optimise performance").split()
+
+
+def generate_jobs(count: int, repost_rate: float = 0.1, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Generate synthetic jobs, some of which are reworded reposts
+    
+    Args:
+        count: Number of jobs
+        repost_rate: Share of jobs that repost an earlier one with small edits
+        seed: Random seed
+        
+    Returns:
+        List of job dicts
+    """
+    rng = random.Random(seed)
+    jobs: List[Dict[str, Any]] = []
+    for i in range(count):
+        if jobs and rng.random() < repost_rate:
+            original = rng.choice(jobs)
+            words = original['description'].split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            jobs.append({**original, 'location': 'Remote', 'description': ' '.join(words)})
+            continue
+        jobs.append({
+            'title': f"{rng.choice(LEVELS)} {rng.choice(TITLES)}".strip(),
+            'company': f"company {rng.randrange(count // 5 + 1)}",
+            'location': f"city {rng.randrange(200)}",
+            'description': ' '.join(rng.choice(WORDS) for _ in range(60)) + f" ref {i}",
+        })
+    return jobs
+
+
+def bench_lsh(jobs: List[Dict[str, Any]], threshold: float) -> Dict[str, float]:
+    """Time deduplication with the LSH index"""
+    # Unbounded so reposts of any earlier job in the batch are still found
+    dedup = JobDeduplicator(similarity_threshold=threshold, cache_size=None)
+    start = time.perf_counter()
+    unique = dedup.deduplicate_batch(jobs)
+    elapsed = time.perf_counter() - start
+    return {'seconds': elapsed, 'unique': len(unique)}
+
+
+def bench_pairwise(jobs: List[Dict[str, Any]], threshold: float) -> Dict[str, float]:
+    """Time the previous O(n^2) comparison against every kept job"""
+    dedup = JobDeduplicator(similarity_threshold=threshold, strategy="fingerprint")
+    unique: List[Dict[str, Any]] = []
+    start = time.perf_counter()
+    for job in jobs:
+        if not dedup.is_duplicate(job, unique):
+            unique.append(job)
+            dedup.add_job(job)
+    elapsed = time.perf_counter() - start
+    return {'seconds': elapsed, 'unique': len(unique)}
+
+
+def main() -> None:
+    """Run the benchmark and print a scaling table"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='10000,100000',
+                        help='Comma-separated batch sizes')
+    parser.add_argument('--large', action='store_true',
+                        help='Also run 1,000,000 jobs (minutes, ~4.5 GB of memory)')
+    parser.add_argument('--threshold', type=float, default=0.8)
+    parser.add_argument('--pairwise-max', type=int, default=2000,
+                        help='Largest size to also run the pairwise baseline on')
+    args = parser.parse_args()
+    
+    print(f"{'jobs':>10} {'method':>9} {'seconds':>9} {'jobs/s':>10} {'unique':>9}")
+    sizes = [int(s) for s in args.sizes.split(',')]
+    if args.large:
+        sizes.append(1000000)
+    for size in sizes:
+        jobs = generate_jobs(size)
+        runs = [('lsh', bench_lsh)]
+        if size <= args.pairwise_max:
+            runs.append(('pairwise', bench_pairwise))
+        for name, bench in runs:
+            result = bench(jobs, args.threshold)
+            rate = size / result['seconds'] if result['seconds'] else float('inf')
+            print(f"{size:>10} {name:>9} {result['seconds']:>9.2f} {rate:>10.0f} "
+                  f"{result['unique']:>9}")
+
+
+if __name__ == '__main__':
+    main()
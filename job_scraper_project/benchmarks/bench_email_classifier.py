@@ -0,0 +1,78 @@
+"""
+Email classification benchmark - per-message classify vs. classify_batch
+
+Generates a synthetic mailbox of response-like emails and reports
+throughput (messages/sec) of ``EmailClassifier.classify`` called per
+message against ``EmailClassifier.classify_batch``.
+
+Usage:
+    python -m benchmarks.bench_email_classifier --messages 200000 --workers 4
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from tracking.classifier import EmailClassifier
+
+FILLER = (
+    "thank you for your interest in the position at our company we have received "
+    "your application and our recruiting team will review your background carefully "
+    "please let us know if anything changes in the meantime best regards talent team"
+).split()
+
+
+def generate_messages(count: int, seed: int = 1) -> List[Tuple[str, str]]:
+    """Generate (subject, body) pairs of a few hundred words each"""
+    rng = random.Random(seed)
+    classifier = EmailClassifier
+    keywords = (classifier.REJECTION_KEYWORDS + classifier.INTERVIEW_KEYWORDS
+                + classifier.OFFER_KEYWORDS)
+    messages = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.randrange(80, 400))]
+        for _ in range(rng.randrange(0, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        messages.append(("Your application", " ".join(words).capitalize()))
+    return messages
+
+
+def main() -> None:
+    """Run the benchmark and print throughput"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--messages', type=int, default=200_000)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+    
+    messages = generate_messages(args.messages)
+    classifier = EmailClassifier()
+    
+    start = time.perf_counter()
+    results = [classifier.classify(subject, body) for subject, body in messages]
+    loop = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    batch = classifier.classify_batch(messages)
+    single = time.perf_counter() - start
+    
+    rows = [('classify loop', loop), ('batch', single)]
+    if args.workers > 1:
+        start = time.perf_counter()
+        classifier.classify_batch(messages, workers=args.workers)
+        rows.append((f"batch x{args.workers}", time.perf_counter() - start))
+    
+    labels = [batch.LABELS.index(result['classification']) for result in results]
+    assert np.array_equal(batch.labels, labels)
+    
+    print(f"{args.messages} messages, "
+          f"{sum(len(b) for _, b in messages) / args.messages:.0f} chars avg")
+    print(f"{'method':>14} {'seconds':>8} {'msgs/sec':>10}")
+    for name, seconds in rows:
+        print(f"{name:>14} {seconds:>8.2f} {args.messages / seconds:>10,.0f}")
+
+
+if __name__ == '__main__':
+    main()
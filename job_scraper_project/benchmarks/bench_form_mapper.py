@@ -0,0 +1,79 @@
+"""
+Form mapper benchmark - per-element field detection vs. single-evaluate snapshot
+
+Loads saved application forms (``benchmarks/fixtures/forms/*.html``) into a
+headless Chromium page with ``page.set_content`` and times
+``FormMapper.detect_all_fields`` with and without snapshot mode. Also
+reports how many fields each mode found and how many got a label (the
+snapshot also resolves labels that wrap the field's container, not only
+its direct parent).
+
+Requires Playwright with Chromium installed (``playwright install chromium``).
+
+Usage:
+    python -m benchmarks.bench_form_mapper --repeat 20
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from playwright.async_api import async_playwright
+
+from automation.form_mapper import FormMapper
+from automation.models import FormField
+
+FIXTURES = Path(__file__).parent / "fixtures" / "forms"
+
+
+async def time_detection(mapper: FormMapper, snapshot: bool, repeat: int) -> List[float]:
+    """Seconds per detect_all_fields call"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await mapper.detect_all_fields(snapshot=snapshot)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def field_keys(fields: List[FormField]) -> List[tuple]:
+    """Identity of detected fields, for comparing the two modes"""
+    return [(f.field_type, f.name, f.id) for f in fields]
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Time both detection modes on every fixture"""
+    print(f"{'form':>24} {'mode':>9} {'fields':>6} {'labels':>6} {'p50 ms':>8} {'p99 ms':>8}")
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        for fixture in sorted(args.fixtures.glob("*.html")):
+            await page.set_content(fixture.read_text(encoding='utf-8'))
+            mapper = FormMapper(page)
+            results = {}
+            for mode, snapshot in (("element", False), ("snapshot", True)):
+                fields = await mapper.detect_all_fields(snapshot=snapshot)
+                samples = np.array(await time_detection(mapper, snapshot, args.repeat)) * 1000
+                p50, p99 = np.percentile(samples, [50, 99])
+                labels = sum(1 for f in fields if f.label)
+                print(f"{fixture.stem:>24} {mode:>9} {len(fields):>6} {labels:>6} "
+                      f"{p50:>8.2f} {p99:>8.2f}")
+                results[mode] = fields
+            if field_keys(results["element"]) != field_keys(results["snapshot"]):
+                print(f"{'':>24} warning: modes detected different fields")
+        await browser.close()
+
+
+def main() -> None:
+    """Run the benchmark and print timings"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--fixtures', type=Path, default=FIXTURES)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Job record benchmark - pipeline over raw job dicts vs. JobRecords normalized at ingest
+
+Runs exact-fingerprint deduplication, per-job deal-breaker checks against
+several profiles and feature extraction over the same jobs, once as
+adapter dicts (every consumer re-parses salary, remote flag and keys) and
+once as JobRecords (parsed once; the ingest time is reported separately
+and included in the total).
+
+Usage:
+    python -m benchmarks.bench_job_records --jobs 200000 --profiles 5
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+from benchmarks.bench_dedup import generate_jobs
+from core.job_record import JobRecord
+from discovery.deduplicator import JobDeduplicator
+from matching.deal_breakers import DealBreakerChecker, ProfileIndex
+from matching.features import job_is_remote, job_salary_range
+
+SALARIES = ["$80,000 - $120,000", "90k-110k", "Competitive", "$150,000", None]
+
+
+def with_adapter_fields(jobs: List[Dict[str, Any]], seed: int = 3) -> List[Dict[str, Any]]:
+    """Add the salary text and link keys the adapters emit"""
+    rng = random.Random(seed)
+    return [
+        {**job, 'salary': rng.choice(SALARIES), 'link': f"https://jobs.example.com/{i}"}
+        for i, job in enumerate(jobs)
+    ]
+
+
+def run_pipeline(jobs: Sequence[Any], profiles: List[ProfileIndex]) -> int:
+    """Deduplicate, then check deal-breakers and read features for each profile"""
+    unique = JobDeduplicator(strategy="fingerprint", cache_size=None).deduplicate_batch(jobs)
+    checker = DealBreakerChecker()
+    kept = 0
+    for profile in profiles:
+        for job in unique:
+            if not checker.has_dealbreaker(job, profile):
+                job_salary_range(job)
+                job_is_remote(job)
+                kept += 1
+    return kept
+
+
+def timed(run: Callable[[], Any]) -> float:
+    """Seconds taken by one call"""
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print timings"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--jobs', type=int, default=200_000)
+    parser.add_argument('--profiles', type=int, default=5)
+    args = parser.parse_args()
+    
+    jobs = with_adapter_fields(generate_jobs(args.jobs))
+    rng = random.Random(11)
+    profiles = [
+        ProfileIndex(
+            blacklisted_companies=frozenset(f"company {rng.randrange(args.jobs // 5)}"
+                                            for _ in range(50)),
+            salary_floor=rng.choice([0, 100000]),
+            remote_required=rng.random() < 0.3,
+        )
+        for _ in range(args.profiles)
+    ]
+    
+    dict_time = timed(lambda: run_pipeline(jobs, profiles))
+    records: List[JobRecord] = []
+    ingest_time = timed(lambda: records.extend(JobRecord.from_dict(job) for job in jobs))
+    record_time = timed(lambda: run_pipeline(records, profiles))
+    
+    print(f"{len(jobs)} jobs, {args.profiles} profiles")
+    print(f"{'pipeline':>18} {'seconds':>8} {'jobs/s':>12}")
+    print(f"{'dicts':>18} {dict_time:>8.2f} {len(jobs) / dict_time:>12,.0f}")
+    print(f"{'records (ingest)':>18} {ingest_time:>8.2f} {len(jobs) / ingest_time:>12,.0f}")
+    print(f"{'records':>18} {record_time:>8.2f} {len(jobs) / record_time:>12,.0f}")
+    total = ingest_time + record_time
+    print(f"{'records (total)':>18} {total:>8.2f} {len(jobs) / total:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
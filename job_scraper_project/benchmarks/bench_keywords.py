@@ -0,0 +1,49 @@
+"""
+Keyword extraction benchmark - in-process vs. process-pool TF-IDF scoring
+
+Counts synthetic job descriptions into a document-frequency table, then
+extracts keywords for every posting in-process and with a process pool.
+
+Usage:
+    python -m benchmarks.bench_keywords --postings 50000
+"""
+
+import argparse
+import time
+
+from benchmarks.bench_dedup import generate_jobs
+from optimization.keyword_extractor import KeywordExtractor
+
+
+def main() -> None:
+    """Run the benchmark and print throughput per method"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--postings', type=int, default=50000)
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per CPU)')
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+    
+    descriptions = [job['description'] for job in generate_jobs(args.postings, repost_rate=0.0)]
+    extractor = KeywordExtractor(df_path=None)
+    
+    start = time.perf_counter()
+    extractor.update_document_frequencies(descriptions, save=False)
+    elapsed = time.perf_counter() - start
+    print(f"Counted {args.postings} postings ({len(extractor.df_table)} terms) in {elapsed:.1f}s")
+    
+    print(f"{'method':>12} {'seconds':>9} {'postings/s':>11}")
+    results = {}
+    for name, workers in (('in-process', 1), ('pool', args.workers)):
+        start = time.perf_counter()
+        results[name] = extractor.extract_keywords_batch(
+            descriptions, workers=workers, chunk_size=args.chunk_size
+        )
+        elapsed = time.perf_counter() - start
+        print(f"{name:>12} {elapsed:>9.2f} {args.postings / elapsed:>11.0f}")
+    
+    assert results['pool'] == results['in-process']
+
+
+if __name__ == '__main__':
+    main()
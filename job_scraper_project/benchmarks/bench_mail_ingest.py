@@ -0,0 +1,101 @@
+"""
+Mail ingestion benchmark - full mailbox poll, then incremental re-poll
+
+Writes a synthetic mailbox (Maildir or mbox) in which a small share of
+messages come from recruiting senders, then times ``EmailMonitor.poll``:
+the first poll processes every message once, and a second poll with no
+new mail should find nothing to read.
+
+Usage:
+    python -m benchmarks.bench_mail_ingest --messages 100000 --format mbox
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from tracking import mail_source
+from tracking.email_monitor import EmailMonitor
+from tracking.mail_source import MaildirSource, MboxSource
+
+JOB_SENDERS = ["no-reply@acme.greenhouse.io", "jobs@lever.co", "talent@myworkdayjobs.com"]
+JOB_BODIES = [
+    "Unfortunately we are not moving forward with your application.",
+    "We would like to schedule a phone screen to discuss your application.",
+    "We are pleased to offer you the position. Your offer letter is attached.",
+]
+OTHER_SENDERS = ["news@shop.com", "friend@mail.com", "alerts@bank.com", "team@saas.io"]
+FILLER = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod".split()
+
+
+def generate_message(rng: random.Random, i: int, job_share: float) -> bytes:
+    """One raw message with a body of a few KB"""
+    if rng.random() < job_share:
+        sender, subject = rng.choice(JOB_SENDERS), "Your application"
+        body = rng.choice(JOB_BODIES)
+    else:
+        sender, subject = rng.choice(OTHER_SENDERS), "Weekly update"
+        body = ""
+    body += "\n" + "\n".join(" ".join(rng.choices(FILLER, k=12)) for _ in range(40))
+    return (f"From: {sender}\nTo: me@example.com\nSubject: {subject}\n"
+            f"Message-ID: <{i}@bench>\nDate: Mon, 1 Jan 2024 10:00:00 +0000\n\n"
+            f"{body}\n").encode()
+
+
+def write_mailbox(root: Path, kind: str, count: int, job_share: float):
+    """Write the synthetic mailbox and return its source"""
+    rng = random.Random(9)
+    if kind == 'maildir':
+        for folder in ('new', 'cur', 'tmp'):
+            (root / 'Maildir' / folder).mkdir(parents=True)
+        for i in range(count):
+            (root / 'Maildir' / 'new' / f"{i:08d}.bench").write_bytes(
+                generate_message(rng, i, job_share)
+            )
+        return MaildirSource(str(root / 'Maildir'), str(root / 'state.json'))
+    with open(root / 'inbox.mbox', 'wb') as f:
+        for i in range(count):
+            f.write(b"From bench Mon Jan  1 10:00:00 2024\n")
+            f.write(generate_message(rng, i, job_share))
+            f.write(b"\n")
+    return MboxSource(str(root / 'inbox.mbox'), str(root / 'state.json'))
+
+
+def main() -> None:
+    """Run the benchmark and print timings"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--messages', type=int, default=100_000)
+    parser.add_argument('--format', choices=['maildir', 'mbox'], default='maildir')
+    parser.add_argument('--job-share', type=float, default=0.05)
+    args = parser.parse_args()
+    
+    bodies = 0
+    message_text = mail_source.message_text
+    
+    def counting_message_text(data: bytes) -> str:
+        nonlocal bodies
+        bodies += 1
+        return message_text(data)
+    mail_source.message_text = counting_message_text
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        source = write_mailbox(Path(tmp), args.format, args.messages, args.job_share)
+        size = sum(f.stat().st_size for f in Path(tmp).rglob('*') if f.is_file())
+        print(f"{args.format}: {args.messages} messages, {size / 2**20:.0f} MiB")
+        
+        monitor = EmailMonitor(source=source)
+        print(f"{'poll':>8} {'seconds':>8} {'msgs/sec':>10} {'bodies':>7} {'results':>8}")
+        for name in ('first', 'second'):
+            bodies = 0
+            start = time.perf_counter()
+            results = monitor.poll()
+            elapsed = time.perf_counter() - start
+            rate = f"{args.messages / elapsed:>10,.0f}" if name == 'first' else f"{'-':>10}"
+            print(f"{name:>8} {elapsed:>8.2f} {rate} {bodies:>7} {len(results):>8}")
+    mail_source.message_text = message_text
+
+
+if __name__ == '__main__':
+    main()
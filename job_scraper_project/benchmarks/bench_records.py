@@ -0,0 +1,103 @@
+"""
+Application record benchmark - memory per record and bulk serialize/deserialize throughput
+
+Measures traced memory per Application (slotted) against the same fields
+in a dict-backed dataclass, and per application decoded from the packed
+format (low-cardinality strings shared). Then times a bulk store and load
+of all applications with ``tracking.codec`` against ``to_dict`` + JSON
+lines and pickle.
+
+Usage:
+    python -m benchmarks.bench_records --applications 1000000
+"""
+
+import argparse
+import json
+import pickle
+import time
+import tracemalloc
+from dataclasses import astuple, fields, make_dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.bench_applications import generate_applications
+from tracking.codec import pack_applications, unpack_applications
+from tracking.models import Application, ApplicationStatus, ResponseType
+
+# Same fields as Application, with an instance __dict__
+DictApplication = make_dataclass('DictApplication', [f.name for f in fields(Application)])
+
+
+def from_dict(row: Dict[str, Any]) -> Application:
+    """Rebuild an application from its ``to_dict`` form"""
+    for key in ('submitted_at', 'status_updated_at', 'response_at', 'interview_date'):
+        if row[key] is not None:
+            row[key] = datetime.fromisoformat(row[key])
+    row['status'] = ApplicationStatus(row['status'])
+    if row['response_type'] is not None:
+        row['response_type'] = ResponseType(row['response_type'])
+    return Application(**row)
+
+
+def traced_bytes(build: Callable[[], List[Any]]) -> float:
+    """Traced bytes per item of the list built by ``build``"""
+    tracemalloc.start()
+    items = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(items)
+
+
+def timed(label: str, count: int, run: Callable[[], Any], size: Optional[int] = None) -> Any:
+    """Run once and print throughput and data size (the result's, by default)"""
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    size = len(result) if size is None else size
+    print(f"{label:>22} {elapsed:>8.2f} {count / elapsed:>12,.0f} {size / 2**20:>9.1f}")
+    return result
+
+
+def main() -> None:
+    """Run the benchmark and print results"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--memory-sample', type=int, default=100_000)
+    args = parser.parse_args()
+    
+    sample = list(generate_applications(args.memory_sample, args.users))
+    packed_sample = pack_applications(sample)
+    rows = [astuple(application) for application in sample]
+    print(f"{'records':>22} {'bytes/record':>12}")
+    print(f"{'dict-backed':>22} "
+          f"{traced_bytes(lambda: [DictApplication(*row) for row in rows]):>12.0f}")
+    print(f"{'slotted':>22} "
+          f"{traced_bytes(lambda: [Application(*row) for row in rows]):>12.0f}")
+    print(f"{'slotted, unpacked':>22} "
+          f"{traced_bytes(lambda: unpack_applications(packed_sample)):>12.0f}")
+    print("(dict-backed and slotted records share the sample's field values)")
+    del sample, rows, packed_sample
+    
+    applications = list(generate_applications(args.applications, args.users))
+    count = len(applications)
+    print(f"\n{count} applications")
+    print(f"{'format':>22} {'seconds':>8} {'records/s':>12} {'size MiB':>9}")
+    
+    packed = timed("packed: store", count, lambda: pack_applications(applications))
+    timed("packed: load", count, lambda: unpack_applications(packed), len(packed))
+    del packed
+    
+    encoded = timed("to_dict+json: store", count,
+                    lambda: '\n'.join(json.dumps(a.to_dict()) for a in applications))
+    timed("to_dict+json: load", count,
+          lambda: [from_dict(json.loads(line)) for line in encoded.split('\n')], len(encoded))
+    del encoded
+    
+    pickled = timed("pickle: store", count,
+                    lambda: pickle.dumps(applications, protocol=pickle.HIGHEST_PROTOCOL))
+    timed("pickle: load", count, lambda: pickle.loads(pickled), len(pickled))
+
+
+if __name__ == '__main__':
+    main()
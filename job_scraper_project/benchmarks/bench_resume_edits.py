@@ -0,0 +1,62 @@
+"""
+Resume editing benchmark - incremental vs. full ATS rescoring per edit
+
+Simulates interactive edits (rewriting one experience bullet at a time)
+on a long CV and times the score refresh after each edit.
+
+Usage:
+    python -m benchmarks.bench_resume_edits --bullets 300 --edits 200
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.bench_ats import SKILLS, generate_resume
+from optimization.ats_scorer import ATSScorer
+from optimization.keyword_extractor import KeywordExtractor
+from optimization.resume_optimizer import ResumeOptimizer
+
+JOB = ("Senior backend engineer with Python, Django, Kubernetes, Terraform and Kafka. "
+       "Own reliability of distributed systems and mentor engineers.")
+
+
+def main() -> None:
+    """Run the benchmark and print per-edit latency"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bullets', type=int, default=300)
+    parser.add_argument('--edits', type=int, default=200)
+    args = parser.parse_args()
+    
+    rng = random.Random(11)
+    optimizer = ResumeOptimizer(ATSScorer(keyword_extractor=KeywordExtractor(df_path=None)))
+    resume = generate_resume(paragraphs=args.bullets)
+    session = optimizer.start_session(resume, JOB)
+    experience = session.document.find_section('experience')
+    bullets = len(session.document.sections[experience].lines)
+    
+    incremental = full = 0.0
+    for _ in range(args.edits):
+        line = rng.randrange(bullets)
+        text = f"- Migrated {rng.choice(SKILLS)} workloads to {rng.choice(SKILLS)}"
+        
+        start = time.perf_counter()
+        session.set_line(experience, line, text)
+        score = session.score()
+        incremental += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        optimizer.ats_scorer._analysis_cache.clear()
+        expected = optimizer.ats_scorer.score_resume(session.document.text, JOB)
+        full += time.perf_counter() - start
+        assert score == expected
+    
+    words = session.word_count
+    print(f"CV: {args.bullets} bullets, {words} words; {args.edits} edits")
+    print(f"{'method':>12} {'ms/edit':>9}")
+    for name, seconds in (('full', full), ('incremental', incremental)):
+        print(f"{name:>12} {seconds * 1000 / args.edits:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
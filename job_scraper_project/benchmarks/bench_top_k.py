@@ -0,0 +1,112 @@
+"""
+Top-K retrieval benchmark - JobIndex pruning vs. brute-force batch scoring
+
+Builds a synthetic job pool, then for each synthetic profile retrieves the
+best ``k`` jobs with ``JobMatcher.top_k`` and with ``score_batch`` over the
+whole pool. Brute force is timed on a sample of users and extrapolated;
+both methods must return the same scores.
+
+Usage:
+    python -m benchmarks.bench_top_k --users 10000 --jobs 500000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from matching.features import JobFeatures
+from matching.matcher import JobMatcher, UserProfile
+
+LEVELS = ["junior", "senior", "staff", "lead", ""]
+ROLES = ["python developer", "backend engineer", "data scientist", "devops engineer",
+         "frontend developer", "machine learning engineer", "data analyst", "qa engineer",
+         "product manager", "mobile developer", "security engineer", "java developer"]
+SKILLS = [f"skill{i}" for i in range(400)] + ["python", "java", "sql", "docker", "aws",
+                                              "kubernetes", "react", "go", "git", "linux"]
+CITIES = [f"city {i}" for i in range(100)] + ["Remote"]
+
+
+def generate_jobs(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate synthetic jobs with explicit skill lists"""
+    rng = random.Random(seed)
+    return [
+        {
+            'title': f"{rng.choice(LEVELS)} {rng.choice(ROLES)}".strip(),
+            'company': f"company {rng.randrange(5000)}",
+            'location': rng.choice(CITIES),
+            'skills': rng.sample(SKILLS, rng.randrange(3, 9)),
+            'salary_max': rng.choice([None, 60000, 90000, 120000, 160000]),
+            'experience_years': rng.choice([None, 1, 3, 5, 8]),
+        }
+        for _ in range(count)
+    ]
+
+
+def generate_profiles(count: int, seed: int = 7) -> List[UserProfile]:
+    """Generate synthetic user profiles"""
+    rng = random.Random(seed)
+    return [
+        UserProfile(
+            user_id=f"user-{i}",
+            target_titles=[f"{rng.choice(LEVELS)} {rng.choice(ROLES)}".strip()],
+            skills={skill: "advanced" for skill in rng.sample(SKILLS, rng.randrange(4, 12))},
+            experience_years=rng.randrange(0, 12),
+            location=rng.choice(CITIES),
+            remote_preference=rng.choice(["any", "remote_only", "on_site"]),
+            salary_min=rng.choice([0, 80000, 100000]),
+            salary_max=200000,
+            education=[],
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print per-user latency and extrapolated totals"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--jobs', type=int, default=500000)
+    parser.add_argument('--k', type=int, default=20)
+    parser.add_argument('--sample-users', type=int, default=20,
+                        help='Users actually timed for brute force (extrapolated to --users)')
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    jobs = generate_jobs(args.jobs)
+    features = JobFeatures.from_jobs(jobs)
+    print(f"Parsed {args.jobs} jobs in {time.perf_counter() - start:.1f}s")
+    
+    matcher = JobMatcher()
+    start = time.perf_counter()
+    index = matcher.index_jobs(features)
+    print(f"Built index ({len(index.titles)} distinct titles) in "
+          f"{time.perf_counter() - start:.1f}s")
+    
+    profiles = generate_profiles(args.users)
+    
+    start = time.perf_counter()
+    for profile in profiles:
+        matcher.top_k(profile, k=args.k)
+    indexed = (time.perf_counter() - start) / len(profiles)
+    
+    sample = profiles[:args.sample_users]
+    start = time.perf_counter()
+    brute = [matcher.score_batch(features, profile) for profile in sample]
+    brute_force = (time.perf_counter() - start) / len(sample)
+    
+    for profile, batch in zip(sample, brute):
+        expected = batch.overall_scores[batch.top(args.k)]
+        result = [score.overall_score for _, score in matcher.top_k(profile, k=args.k)]
+        assert np.allclose(result, expected), f"mismatch for {profile.user_id}"
+    
+    print(f"{'method':>12} {'ms/user':>10} {'total (s)':>12}")
+    for name, seconds in (('brute force', brute_force), ('indexed', indexed)):
+        print(f"{name:>12} {seconds * 1000:>10.1f} {seconds * args.users:>12.1f}")
+    print(f"Speedup: {brute_force / indexed:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,23 +1,384 @@
-"""Browser automation with stealth capabilities."""
-from playwright.sync_api import sync_playwright
+"""Browser automation with stealth capabilities and a pool of warm browsers."""
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Set, Tuple
 
-def launch_stealth_browser():
-    """Launch a browser with stealth patches to avoid detection."""
+import yaml
+from playwright.async_api import Browser, BrowserContext, BrowserType, Page, async_playwright
+from playwright.sync_api import Page as SyncPage, sync_playwright
+
+from core.logger import setup_logger
+
+logger = setup_logger("browser")
+
+# Masks navigator.webdriver in every page of a context
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
+DEFAULT_CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+
+@contextmanager
+def launch_stealth_browser() -> Iterator[SyncPage]:
+    """
+    Launch a browser with stealth patches to avoid detection.
+    
+    Yields a page; the browser and the Playwright driver are shut down
+    when the ``with`` block exits. Async code running many tasks should
+    lease contexts from a :class:`BrowserPool` instead.
+    
+    Example:
+        >>> with launch_stealth_browser() as page:
+        ...     page.goto(url)
+    """
     with sync_playwright() as p:
         # Launch browser in headless mode
         browser = p.chromium.launch(headless=True)
+        try:
+            # Create new context
+            context = browser.new_context()
+            
+            # Create new page
+            page = context.new_page()
+            
+            # Apply stealth patches (navigator.webdriver masking, etc.)
+            page.add_init_script(STEALTH_SCRIPT)
+            
+            yield page
+        finally:
+            browser.close()
+
+
+@dataclass(eq=False)
+class _BrowserSlot:
+    """A warm browser and the fresh context waiting to be leased from it.
+    
+    A slot without a browser stands for one whose relaunch failed; the
+    next lease launches it again, so a failed launch never shrinks the pool.
+    """
+    browser: Optional[Browser] = None
+    spare: Optional["asyncio.Task[Tuple[BrowserContext, Page]]"] = None
+    uses: int = 0
+
+
+@dataclass(eq=False)
+class BrowserLease:
+    """
+    Isolated browser context leased from a :class:`BrowserPool`.
+    
+    Attributes:
+        context: Fresh context with its own cookies and storage
+        page: Page opened in the context, with the stealth script installed
+        browser: Browser the context belongs to
+        released: Whether the lease was returned to the pool
+    """
+    context: BrowserContext
+    page: Page
+    browser: Browser
+    released: bool = False
+    _slot: Optional[_BrowserSlot] = field(default=None, repr=False)
+
+
+class BrowserPool:
+    """
+    Pool of warm browser processes handing out isolated contexts.
+    
+    Each browser keeps one fresh context (with a page and the stealth
+    script) ready, so a lease costs a queue pop instead of a browser
+    launch. A returned context is closed, never reused, and the next one
+    is warmed in the background. Browsers are relaunched after
+    ``max_uses`` leases or when they fail a health check, and at most
+    ``size`` contexts are out at once, which caps memory.
+    
+    Example:
+        >>> async with BrowserPool(size=2, max_uses=50) as pool:
+        ...     async with pool.lease() as lease:
+        ...         await lease.page.goto(url)
+        >>> pool.get_stats()['launches']
+        2
+    """
+    
+    def __init__(
+        self,
+        size: int = 2,
+        max_uses: int = 50,
+        headless: bool = True,
+        slow_mo: int = 0,
+        context_options: Optional[Dict[str, Any]] = None,
+        browser_type: Optional[BrowserType] = None
+    ):
+        """
+        Initialize the pool; browsers are launched by :meth:`start`.
+        
+        Args:
+            size: Number of browsers, and of contexts leased at once
+            max_uses: Leases served by a browser before it is relaunched
+            headless: Run browsers without a window
+            slow_mo: Milliseconds added to every browser action
+            context_options: Options for new contexts (default: desktop viewport and user agent)
+            browser_type: Browser type to launch (default: Chromium from a pool-owned Playwright)
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self.launch_options = {'headless': headless, 'slow_mo': slow_mo}
+        self.context_options = dict(DEFAULT_CONTEXT_OPTIONS if context_options is None else context_options)
+        self._browser_type = browser_type
+        self._playwright = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._slots: Set[_BrowserSlot] = set()
+        self._pending: Set[asyncio.Task] = set()
+        self._start_lock = asyncio.Lock()
+        self.stats = {
+            'launches': 0,
+            'recycles': 0,
+            'unhealthy': 0,
+            'launch_failures': 0,
+            'leases': 0,
+            'lease_wait': 0.0,
+        }
+    
+    @classmethod
+    def from_config(cls, config_path: str = "config/automation.yaml", **overrides: Any) -> "BrowserPool":
+        """
+        Create a pool from the "browser_pool" section of the automation config.
+        
+        Args:
+            config_path: Path to automation configuration file
+            **overrides: Constructor arguments taking precedence over the file
+            
+        Returns:
+            Unstarted BrowserPool
+        """
+        path = Path(config_path)
+        settings: Dict[str, Any] = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = (yaml.safe_load(f) or {}).get('browser_pool', {}) or {}
+        options = {key: settings[key] for key in ('size', 'max_uses', 'headless', 'slow_mo') if key in settings}
+        options.update(overrides)
+        return cls(**options)
+    
+    async def __aenter__(self) -> "BrowserPool":
+        """Async context manager entry"""
+        return await self.start()
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+    
+    @property
+    def started(self) -> bool:
+        """Whether the browsers have been launched"""
+        return self._idle is not None
+    
+    async def start(self) -> "BrowserPool":
+        """
+        Launch the browsers and warm a context in each; a no-op if started.
+        
+        Returns:
+            The pool
+        """
+        async with self._start_lock:
+            if self.started:
+                return self
+            if self._browser_type is None:
+                self._playwright = await async_playwright().start()
+                self._browser_type = self._playwright.chromium
+            slots = await asyncio.gather(*(self._launch_slot() for _ in range(self.size)))
+            self._idle = asyncio.Queue()
+            for slot in slots:
+                self._idle.put_nowait(slot)
+            logger.info(f"Browser pool started with {self.size} browsers")
+        return self
+    
+    async def _launch_slot(self) -> _BrowserSlot:
+        """Launch a browser and start warming its first context"""
+        browser = await self._browser_type.launch(**self.launch_options)
+        self.stats['launches'] += 1
+        slot = _BrowserSlot(browser, self._warm(browser))
+        self._slots.add(slot)
+        return slot
+    
+    def _warm(self, browser: Browser) -> "asyncio.Task[Tuple[BrowserContext, Page]]":
+        """Create a fresh context and page in the background"""
+        return asyncio.create_task(self._new_context(browser))
+    
+    async def _new_context(self, browser: Browser) -> Tuple[BrowserContext, Page]:
+        """Open a context with the stealth script and one page"""
+        context = await browser.new_context(**self.context_options)
+        await context.add_init_script(STEALTH_SCRIPT)
+        page = await context.new_page()
+        return context, page
+    
+    async def _close_slot(self, slot: _BrowserSlot) -> None:
+        """Close a browser, dropping its warm context"""
+        self._slots.discard(slot)
+        if slot.spare is not None and not slot.spare.done():
+            slot.spare.cancel()
+        if slot.browser is None:
+            return
+        try:
+            await slot.browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {e}")
+    
+    def _restock(self, slot: _BrowserSlot, relaunch: bool) -> None:
+        """Warm a new context (or relaunch the browser) and return the slot to the queue"""
+        task = asyncio.create_task(self._refill(slot, relaunch))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+    
+    async def _refill(self, slot: _BrowserSlot, relaunch: bool) -> None:
+        """Background part of :meth:`_restock`"""
+        try:
+            if relaunch:
+                await self._close_slot(slot)
+                slot = await self._launch_slot()
+            else:
+                slot.spare = self._warm(slot.browser)
+        except Exception as e:
+            logger.error(f"Could not relaunch browser, retrying on next lease: {e}")
+            self.stats['launch_failures'] += 1
+            slot = _BrowserSlot()
+        if self.started:
+            self._idle.put_nowait(slot)
+    
+    async def acquire(self, timeout: Optional[float] = None) -> BrowserLease:
+        """
+        Lease a fresh context, waiting for a free browser if all are in use.
+        
+        Browsers that are disconnected or fail to open a context are
+        replaced and the next free one is tried. A browser whose relaunch
+        failed earlier is launched again here.
+        
+        Args:
+            timeout: Maximum seconds to wait for a free browser (None waits forever)
+            
+        Returns:
+            BrowserLease to give back with :meth:`release`
+            
+        Raises:
+            RuntimeError: If the pool is not started
+            asyncio.TimeoutError: If no browser became free in time
+            playwright.async_api.Error: If a browser could not be launched
+        """
+        if not self.started:
+            raise RuntimeError("Browser pool is not started")
+        started = time.perf_counter()
+        while True:
+            slot = await asyncio.wait_for(self._idle.get(), timeout)
+            if slot.browser is None:
+                try:
+                    slot = await self._launch_slot()
+                except Exception as e:
+                    logger.error(f"Could not launch browser: {e}")
+                    # Keep the slot so a later lease can try again
+                    self.stats['launch_failures'] += 1
+                    self._idle.put_nowait(slot)
+                    raise
+            try:
+                if not slot.browser.is_connected():
+                    raise RuntimeError("browser disconnected")
+                context, page = await slot.spare
+                break
+            except Exception as e:
+                logger.warning(f"Replacing unhealthy browser: {e}")
+                self.stats['unhealthy'] += 1
+                self._restock(slot, relaunch=True)
+        
+        self.stats['leases'] += 1
+        self.stats['lease_wait'] += time.perf_counter() - started
+        return BrowserLease(context, page, slot.browser, _slot=slot)
+    
+    async def release(self, lease: BrowserLease) -> None:
+        """
+        Return a lease; its context is closed and never handed out again.
         
-        # Create new context
-        context = browser.new_context()
+        Args:
+            lease: Lease from :meth:`acquire`
+        """
+        if lease.released:
+            return
+        lease.released = True
+        slot = lease._slot
+        healthy = True
+        try:
+            await lease.context.close()
+        except Exception as e:
+            logger.warning(f"Error closing leased context: {e}")
+            healthy = False
         
-        # Create new page
-        page = context.new_page()
+        if not self.started or slot not in self._slots:
+            return
+        slot.uses += 1
+        if not healthy or not slot.browser.is_connected():
+            self.stats['unhealthy'] += 1
+            self._restock(slot, relaunch=True)
+        elif slot.uses >= self.max_uses:
+            logger.info(f"Recycling browser after {slot.uses} uses")
+            self.stats['recycles'] += 1
+            self._restock(slot, relaunch=True)
+        else:
+            self._restock(slot, relaunch=False)
+    
+    @asynccontextmanager
+    async def lease(self, timeout: Optional[float] = None) -> AsyncIterator[BrowserLease]:
+        """
+        Lease a context for the duration of an ``async with`` block.
         
-        # Apply stealth patches (navigator.webdriver masking, etc.)
-        page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        Args:
+            timeout: Maximum seconds to wait for a free browser
+            
+        Yields:
+            BrowserLease
+        """
+        lease = await self.acquire(timeout)
+        try:
+            yield lease
+        finally:
+            await self.release(lease)
+    
+    async def close(self) -> None:
+        """Close every browser, including any with contexts still leased"""
+        async with self._start_lock:
+            if not self.started:
+                return
+            self._idle = None
+            await asyncio.gather(*self._pending, return_exceptions=True)
+            for slot in list(self._slots):
+                await self._close_slot(slot)
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+                self._browser_type = None
+            logger.info("Browser pool closed")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
         
-        return page
+        Returns:
+            Dictionary with launches, recycles, unhealthy replacements,
+            failed launches, leases, average lease wait in seconds and
+            idle browsers
+        """
+        leases = self.stats['leases']
+        return {
+            'size': self.size,
+            'launches': self.stats['launches'],
+            'recycles': self.stats['recycles'],
+            'unhealthy': self.stats['unhealthy'],
+            'launch_failures': self.stats['launch_failures'],
+            'leases': leases,
+            'avg_lease_wait': round(self.stats['lease_wait'] / leases, 4) if leases else 0.0,
+            'idle': self._idle.qsize() if self.started else 0,
+        }
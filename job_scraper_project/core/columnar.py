@@ -0,0 +1,429 @@
+"""Columnar job archive: Parquet via pyarrow, NumPy ``.npz`` column store fallback."""
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Union
+import logging
+
+import numpy as np
+
+from core.job_record import JobRecord
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Low-cardinality job fields that compress well as dictionary codes
+DICTIONARY_COLUMNS = ("company", "location", "source")
+
+DEFAULT_ROW_GROUP_SIZE = 50_000
+
+_META_ENTRY = "__meta__"
+
+
+def columnar_backend() -> str:
+    """Return the backend used for new archives ("parquet" or "npz")."""
+    return "parquet" if pq is not None else "npz"
+
+
+def _infer_kind(values: Iterable[Any]) -> str:
+    """
+    Infer a column kind from sample values.
+    
+    Returns:
+        "bool", "float" (any int/float) or "str"
+    """
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            kinds.add("bool")
+        elif isinstance(value, (int, float)):
+            kinds.add("float")
+        else:
+            kinds.add("str")
+    if len(kinds) == 1:
+        return kinds.pop()
+    return "str"
+
+
+def _matches_kind(value: Any, kind: str) -> bool:
+    """Whether a value can be stored in a column of ``kind`` without coercion."""
+    if value is None or kind == "str":
+        return True
+    if kind == "bool":
+        return isinstance(value, bool)
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_str(value: Any) -> Optional[str]:
+    """Coerce a value for a string column (nested values become JSON)."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+class ColumnarWriter:
+    """
+    Row-group batched writer for a columnar job archive.
+    
+    Records are buffered until ``row_group_size`` is reached and then
+    written as one row group, so memory is bounded by a single group.
+    The schema (column names and kinds) is fixed by the first row group
+    unless ``columns`` is given; later keys outside it are dropped (with a
+    warning when the schema was inferred), and a later value that does
+    not fit its column's kind raises ``ValueError`` rather than being
+    coerced. Columns in ``dictionary_columns`` are dictionary-encoded.
+    
+    With pyarrow installed the archive is Parquet; otherwise it is a
+    NumPy ``.npz`` column store where every column of every row group is
+    a separate entry, so readers load only the columns they ask for.
+    Numeric columns are stored as float64.
+    
+    Example:
+        >>> with ColumnarWriter(Path("data/output/jobs")) as writer:
+        ...     writer.write_many(scraper.iter_jobs())
+        >>> read_columnar(writer.path, columns=["title", "company"])
+    """
+    
+    def __init__(
+        self,
+        base_path: Path,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        dictionary_columns: Sequence[str] = DICTIONARY_COLUMNS,
+        columns: Optional[List[str]] = None,
+        backend: Optional[str] = None
+    ):
+        """
+        Open a new columnar archive.
+        
+        Args:
+            base_path: Output path without extension
+            row_group_size: Records per row group
+            dictionary_columns: Columns to dictionary-encode
+            columns: Fixed column list (inferred from the first row group if omitted)
+            backend: "parquet" or "npz" (defaults to the best available)
+            
+        Raises:
+            ValueError: If the backend is unknown or unavailable
+        """
+        backend = backend or columnar_backend()
+        if backend not in ("parquet", "npz"):
+            raise ValueError(f"Unsupported columnar backend: {backend}")
+        if backend == "parquet" and pq is None:
+            raise ValueError("Parquet backend requires pyarrow")
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be positive")
+        
+        self.backend = backend
+        self.row_group_size = row_group_size
+        self.dictionary_columns = set(dictionary_columns)
+        self.columns = list(columns) if columns else None
+        self.kinds: Dict[str, str] = {}
+        self.count = 0
+        self.row_groups = 0
+        self.closed = False
+        
+        base_path = Path(base_path)
+        self.path = base_path.with_suffix(f".{backend}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            prefix=f".{base_path.name}.", suffix=f".{backend}.tmp", dir=self.path.parent
+        )
+        os.close(fd)
+        self._tmp_path = Path(tmp)
+        
+        self._infer_columns = self.columns is None
+        self._dropped_keys: Set[str] = set()
+        self._buffer: List[Dict[str, Any]] = []
+        self._parquet_writer = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        # npz dictionaries are global across row groups: value -> code
+        self._dictionaries: Dict[str, Dict[str, int]] = {}
+    
+    def write(self, record: Union[JobRecord, Dict[str, Any]]) -> None:
+        """
+        Append a single record.
+        
+        Args:
+            record: Record to write (JobRecords use the EXPORT_FIELDS schema)
+            
+        Raises:
+            ValueError: If a value does not fit its column's kind (raised
+                when the record's row group is flushed)
+        """
+        if isinstance(record, JobRecord):
+            record = record.to_dict()
+        self._buffer.append(record)
+        self.count += 1
+        if len(self._buffer) >= self.row_group_size:
+            self._flush()
+    
+    def write_many(self, records: Iterable[Union[JobRecord, Dict[str, Any]]]) -> int:
+        """
+        Append records from any iterable.
+        
+        Args:
+            records: Records to write
+            
+        Returns:
+            Number of records written
+        """
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+    
+    def close(self) -> Path:
+        """
+        Flush the last row group and move the archive into place.
+        
+        Returns:
+            Path of the completed archive
+        """
+        if self.closed:
+            return self.path
+        self._flush()
+        
+        if self.backend == "parquet":
+            if self._parquet_writer is None:
+                # No records: still produce a valid (empty) file
+                schema = pa.schema([(name, pa.string()) for name in self.columns or []])
+                self._parquet_writer = pq.ParquetWriter(str(self._tmp_path), schema)
+            self._parquet_writer.close()
+        else:
+            zf = self._open_zip()
+            for name, mapping in self._dictionaries.items():
+                self._write_strings(zf, f"{name}.dictionary", list(mapping))
+            meta = {
+                "columns": self.columns or [],
+                "kinds": self.kinds,
+                "dictionary_columns": sorted(self._dictionaries),
+                "row_groups": self.row_groups,
+                "rows": self.count,
+            }
+            self._write_array(zf, _META_ENTRY, np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8))
+            zf.close()
+        
+        os.replace(self._tmp_path, self.path)
+        self.closed = True
+        logger.info(f"Wrote {self.count} records in {self.row_groups} row groups to {self.path}")
+        return self.path
+    
+    def abort(self) -> None:
+        """Discard the archive, leaving any previous file untouched."""
+        if self.closed:
+            return
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if self._zip is not None:
+            self._zip.close()
+        if self._tmp_path.exists():
+            self._tmp_path.unlink()
+        self.closed = True
+        logger.warning(f"Aborted columnar export to {self.path} after {self.count} records")
+    
+    def __enter__(self) -> "ColumnarWriter":
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Commit the archive, or discard it if the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+    
+    def _flush(self) -> None:
+        """Write buffered records as one row group."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        
+        if self.columns is None:
+            self.columns = list(dict.fromkeys(key for record in batch for key in record))
+        if not self.kinds:
+            for name in self.columns:
+                if name in self.dictionary_columns:
+                    self.kinds[name] = "str"
+                else:
+                    self.kinds[name] = _infer_kind(record.get(name) for record in batch)
+        
+        if self._infer_columns:
+            known = set(self.columns)
+            late = {key for record in batch for key in record if key not in known} - self._dropped_keys
+            if late:
+                logger.warning(
+                    f"Dropping keys first seen after the schema was fixed: {sorted(late)}"
+                )
+                self._dropped_keys.update(late)
+        
+        columns = {name: [record.get(name) for record in batch] for name in self.columns}
+        for name, values in columns.items():
+            kind = self.kinds[name]
+            for index, value in enumerate(values):
+                if not _matches_kind(value, kind):
+                    raise ValueError(
+                        f"Column '{name}' holds {kind} values but record "
+                        f"{self.count - len(batch) + index} has {value!r}"
+                    )
+        if self.backend == "parquet":
+            self._flush_parquet(columns, len(batch))
+        else:
+            self._flush_npz(columns)
+        self.row_groups += 1
+    
+    def _flush_parquet(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        """Write one Parquet row group."""
+        arrow_types = {"bool": pa.bool_(), "float": pa.float64(), "str": pa.string()}
+        arrays = []
+        for name in self.columns:
+            kind = self.kinds[name]
+            values = columns[name]
+            if kind == "str":
+                values = [_to_str(v) for v in values]
+            elif kind == "float":
+                values = [float(v) if v is not None else None for v in values]
+            else:
+                values = [bool(v) if v is not None else None for v in values]
+            arrays.append(pa.array(values, type=arrow_types[kind]))
+        table = pa.Table.from_arrays(arrays, names=self.columns)
+        
+        if self._parquet_writer is None:
+            use_dictionary = [name for name in self.columns if name in self.dictionary_columns]
+            self._parquet_writer = pq.ParquetWriter(
+                str(self._tmp_path), table.schema, use_dictionary=use_dictionary or False
+            )
+        self._parquet_writer.write_table(table, row_group_size=rows)
+    
+    def _flush_npz(self, columns: Dict[str, List[Any]]) -> None:
+        """Write one row group as per-column ``.npz`` entries."""
+        zf = self._open_zip()
+        group = self.row_groups
+        for name in self.columns:
+            kind = self.kinds[name]
+            values = columns[name]
+            prefix = f"{name}.{group}"
+            if name in self.dictionary_columns:
+                mapping = self._dictionaries.setdefault(name, {})
+                codes = np.fromiter(
+                    (-1 if v is None else mapping.setdefault(_to_str(v), len(mapping))
+                     for v in values),
+                    dtype=np.int32, count=len(values)
+                )
+                self._write_array(zf, f"{prefix}.codes", codes)
+            elif kind == "float":
+                data = np.array(
+                    [float(v) if v is not None else np.nan for v in values],
+                    dtype=np.float64
+                )
+                self._write_array(zf, prefix, data)
+            elif kind == "bool":
+                self._write_array(zf, prefix, np.array([bool(v) for v in values], dtype=bool))
+                self._write_array(zf, f"{prefix}.valid", np.array([v is not None for v in values], dtype=bool))
+            else:
+                self._write_strings(zf, prefix, [_to_str(v) for v in values])
+    
+    def _open_zip(self) -> zipfile.ZipFile:
+        """Open the ``.npz`` container on first use."""
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(
+                self._tmp_path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
+            )
+        return self._zip
+    
+    @staticmethod
+    def _write_array(zf: zipfile.ZipFile, name: str, array: np.ndarray) -> None:
+        """Write one array as a ``.npy`` entry."""
+        with zf.open(f"{name}.npy", "w", force_zip64=True) as f:
+            np.lib.format.write_array(f, np.ascontiguousarray(array), allow_pickle=False)
+    
+    @classmethod
+    def _write_strings(cls, zf: zipfile.ZipFile, name: str, values: List[Optional[str]]) -> None:
+        """Write strings as UTF-8 bytes plus offsets (and a validity mask)."""
+        encoded = [v.encode("utf-8") if v is not None else b"" for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        cls._write_array(zf, f"{name}.data", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        cls._write_array(zf, f"{name}.offsets", offsets)
+        cls._write_array(zf, f"{name}.valid", np.array([v is not None for v in values], dtype=bool))
+
+
+def _read_strings(npz: Any, name: str) -> List[Optional[str]]:
+    """Decode a string column written by ``ColumnarWriter._write_strings``."""
+    data = npz[f"{name}.data"].tobytes()
+    offsets = npz[f"{name}.offsets"]
+    valid = npz[f"{name}.valid"]
+    return [
+        data[offsets[i]:offsets[i + 1]].decode("utf-8") if valid[i] else None
+        for i in range(len(valid))
+    ]
+
+
+def read_columnar(
+    path: Path,
+    columns: Optional[List[str]] = None
+) -> Dict[str, List[Any]]:
+    """
+    Load selected columns from a columnar archive.
+    
+    Only the requested columns are read from disk.
+    
+    Args:
+        path: Path to a ``.parquet`` or ``.npz`` archive
+        columns: Columns to load (all columns if omitted)
+        
+    Returns:
+        Mapping of column name to list of values
+        
+    Raises:
+        ValueError: If a requested column does not exist
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        if pq is None:
+            raise ValueError("Reading Parquet archives requires pyarrow")
+        return pq.read_table(str(path), columns=columns).to_pydict()
+    
+    with np.load(path, allow_pickle=False) as npz:
+        meta = json.loads(npz[_META_ENTRY].tobytes())
+        wanted = columns or meta["columns"]
+        missing = [name for name in wanted if name not in meta["kinds"]]
+        if missing:
+            raise ValueError(f"Unknown columns: {missing}")
+        
+        result: Dict[str, List[Any]] = {}
+        for name in wanted:
+            kind = meta["kinds"][name]
+            values: List[Any] = []
+            if name in meta["dictionary_columns"]:
+                dictionary = _read_strings(npz, f"{name}.dictionary")
+                for group in range(meta["row_groups"]):
+                    codes = npz[f"{name}.{group}.codes"]
+                    values.extend(dictionary[c] if c >= 0 else None for c in codes.tolist())
+            elif kind == "str":
+                for group in range(meta["row_groups"]):
+                    values.extend(_read_strings(npz, f"{name}.{group}"))
+            else:
+                for group in range(meta["row_groups"]):
+                    array = npz[f"{name}.{group}"]
+                    if kind == "float":
+                        values.extend(None if np.isnan(v) else v for v in array.tolist())
+                    elif f"{name}.{group}.valid" in npz.files:
+                        valid = npz[f"{name}.{group}.valid"].tolist()
+                        values.extend(v if ok else None for v, ok in zip(array.tolist(), valid))
+                    else:
+                        values.extend(array.tolist())
+            result[name] = values
+        return result
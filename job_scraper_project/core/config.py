@@ -15,6 +15,7 @@ class GlobalConfig:
     log_level: str = "INFO"
     max_retries: int = 3
     timeout: int = 30
+    max_workers: int = 4
 
 
 @dataclass
@@ -62,9 +63,9 @@ class Config:
             global_data = self._config.get('global', {})
             self.global_config = GlobalConfig(**global_data)
             
-            # Parse site configs
+            # Parse site configs (other sections such as 'automation' have no base_url)
             for site_name, site_data in self._config.items():
-                if site_name != 'global' and isinstance(site_data, dict):
+                if site_name != 'global' and isinstance(site_data, dict) and 'base_url' in site_data:
                     self.site_configs[site_name] = SiteConfig(**site_data)
             
             logger.info(f"Configuration loaded from {self.config_path}")
@@ -1,14 +1,20 @@
 """Unified export manager for all data formats with improved error handling."""
 import json
 import csv
+import gzip
 import os
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Any, Union, Literal
+from typing import List, Dict, Any, Union, Literal, Iterable, Optional, IO
 import logging
 
+from core.columnar import ColumnarWriter
+from core.job_record import JobRecord
+
 logger = logging.getLogger(__name__)
 
-FormatType = Literal["json", "csv"]
+FormatType = Literal["json", "jsonl", "csv", "parquet"]
+StreamFormatType = Literal["jsonl", "csv"]
 
 # Allowed output directories for security
 ALLOWED_OUTPUT_DIRS = {
@@ -73,8 +79,13 @@ def _validate_output_folder(folder: str) -> Path:
     return Path(folder)
 
 
+def _export_record(record: Union[JobRecord, Dict[str, Any]]) -> Dict[str, Any]:
+    """Plain dict for a record (JobRecords use the fixed EXPORT_FIELDS schema)."""
+    return record.to_dict() if isinstance(record, JobRecord) else record
+
+
 def export_data(
-    data: Union[List[Dict[str, Any]], Dict[str, Any]],
+    data: Union[List[Union[JobRecord, Dict[str, Any]]], JobRecord, Dict[str, Any]],
     name: str,
     format: FormatType = "json",
     folder: str = "data/output"
@@ -83,9 +94,10 @@ def export_data(
     Export data to specified format.
     
     Args:
-        data: Data to export (list of dicts or single dict)
+        data: Data to export (list of dicts or JobRecords, or a single one)
         name: Base name for the output file (without extension)
-        format: Output format ("json" or "csv")
+        format: Output format ("json", "jsonl", "csv" or "parquet"; parquet
+            falls back to a NumPy .npz column store without pyarrow)
         folder: Output directory path (must be in allowed list)
         
     Returns:
@@ -100,9 +112,13 @@ def export_data(
         if not data:
             logger.warning(f"No data to export to {name}.{format}")
             return False
-            
-        if format not in ["json", "csv"]:
-            raise ValueError(f"Unsupported format: {format}. Use 'json' or 'csv'")
+        
+        if format not in ["json", "jsonl", "csv", "parquet"]:
+            raise ValueError(
+                f"Unsupported format: {format}. Use 'json', 'jsonl', 'csv' or 'parquet'"
+            )
+        
+        data = [_export_record(r) for r in data] if isinstance(data, list) else _export_record(data)
         
         # Sanitize filename to prevent path traversal
         safe_name = _validate_filename(name)
@@ -124,8 +140,15 @@ def export_data(
         # Export based on format
         if format == "json":
             _export_json(data, file_path)
+        elif format == "jsonl":
+            with ExportWriter(safe_name, "jsonl", folder=str(output_path)) as writer:
+                writer.write_many(data if isinstance(data, list) else [data])
         elif format == "csv":
             _export_csv(data, file_path)
+        elif format == "parquet":
+            with ColumnarWriter(output_path / safe_name) as writer:
+                writer.write_many(data if isinstance(data, list) else [data])
+            file_path = writer.path
         
         # Calculate record count
         record_count = len(data) if isinstance(data, list) else 1
@@ -166,10 +189,174 @@ def _export_csv(data: Union[List[Dict], Dict], file_path: Path) -> None:
     if not data:
         raise ValueError("Cannot export empty data to CSV")
     
-    # Get keys from first item
-    keys = list(data[0].keys())
+    # Union of keys across all records, in first-seen order
+    keys = list(dict.fromkeys(key for record in data for key in record))
     
     with open(file_path, "w", newline="", encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=keys)
         writer.writeheader()
         writer.writerows(data)
+
+
+class ExportWriter:
+    """
+    Incremental JSON Lines / CSV writer for large exports.
+    
+    Records are appended as they arrive, so a crawl never has to be held in
+    memory. Output goes to a temporary file in the target directory and is
+    renamed into place on close, so readers never see a partial export.
+    
+    CSV rows are spooled without a header while the union of keys grows;
+    on close the header is written with every key ever seen and earlier
+    rows are padded to the final width.
+    
+    Example:
+        >>> with ExportWriter("all_jobs", "csv", compress=True) as writer:
+        ...     for job in scraper.iter_jobs():
+        ...         writer.write(job)
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        format: StreamFormatType = "jsonl",
+        folder: str = "data/output",
+        compress: bool = False
+    ):
+        """
+        Open a new streaming export.
+        
+        Args:
+            name: Base name for the output file (without extension)
+            format: Output format ("jsonl" or "csv")
+            folder: Output directory path (must be in allowed list)
+            compress: Gzip the output (adds a ".gz" suffix)
+            
+        Raises:
+            ValueError: If format is unsupported or filename is unsafe
+        """
+        if format not in ["jsonl", "csv"]:
+            raise ValueError(f"Unsupported stream format: {format}. Use 'jsonl' or 'csv'")
+        
+        self.format = format
+        self.compress = compress
+        self.fieldnames: List[str] = []
+        self._field_index: Dict[str, int] = {}
+        self.count = 0
+        self.closed = False
+        
+        output_path = _validate_output_folder(folder)
+        output_path.mkdir(parents=True, exist_ok=True)
+        suffix = f".{format}" + (".gz" if compress else "")
+        self._name = _validate_filename(name)
+        self.path = output_path / f"{self._name}{suffix}"
+        
+        # JSONL streams straight into the final temp file; CSV spools rows
+        # first because the header is only known on close
+        self._tmp_path = self._make_temp(output_path, suffix)
+        self._spool_path: Optional[Path] = None
+        if format == "jsonl":
+            self._file: IO[str] = self._open_output(self._tmp_path)
+        else:
+            self._spool_path = self._make_temp(output_path, ".rows")
+            self._file = open(self._spool_path, "w", newline="", encoding="utf-8")
+            self._csv_writer = csv.writer(self._file)
+    
+    def write(self, record: Union[JobRecord, Dict[str, Any]]) -> None:
+        """
+        Append a single record.
+        
+        Args:
+            record: Record to write
+        """
+        record = _export_record(record)
+        for key in record:
+            if key not in self._field_index:
+                self._field_index[key] = len(self.fieldnames)
+                self.fieldnames.append(key)
+        
+        if self.format == "jsonl":
+            self._file.write(json.dumps(record, ensure_ascii=False))
+            self._file.write("\n")
+        else:
+            row = [""] * len(self.fieldnames)
+            for key, value in record.items():
+                row[self._field_index[key]] = "" if value is None else value
+            self._csv_writer.writerow(row)
+        self.count += 1
+    
+    def write_many(self, records: Iterable[Union[JobRecord, Dict[str, Any]]]) -> int:
+        """
+        Append records from any iterable (e.g. ``BaseScraper.iter_jobs()``).
+        
+        Args:
+            records: Records to write
+            
+        Returns:
+            Number of records written
+        """
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+    
+    def close(self) -> Path:
+        """
+        Finish the export and move it into place atomically.
+        
+        Returns:
+            Path of the completed export file
+        """
+        if self.closed:
+            return self.path
+        self._file.close()
+        
+        if self.format == "csv":
+            width = len(self.fieldnames)
+            with open(self._spool_path, "r", newline="", encoding="utf-8") as spool, \
+                    self._open_output(self._tmp_path) as out:
+                writer = csv.writer(out)
+                writer.writerow(self.fieldnames)
+                for row in csv.reader(spool):
+                    writer.writerow(row + [""] * (width - len(row)))
+            self._spool_path.unlink()
+        
+        os.replace(self._tmp_path, self.path)
+        self.closed = True
+        logger.info(f"Exported {self.count} records to {self.path}")
+        return self.path
+    
+    def abort(self) -> None:
+        """Discard the export, leaving any previous file untouched."""
+        if self.closed:
+            return
+        self._file.close()
+        for path in (self._tmp_path, self._spool_path):
+            if path is not None and path.exists():
+                path.unlink()
+        self.closed = True
+        logger.warning(f"Aborted export to {self.path} after {self.count} records")
+    
+    def __enter__(self) -> "ExportWriter":
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Commit the export, or discard it if the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+    
+    def _open_output(self, path: Path) -> IO[str]:
+        """Open the final output file, gzipped if requested."""
+        if self.compress:
+            return gzip.open(path, "wt", newline="", encoding="utf-8")
+        return open(path, "w", newline="", encoding="utf-8")
+    
+    def _make_temp(self, folder: Path, suffix: str) -> Path:
+        """Create an empty temp file next to the final output."""
+        fd, tmp = tempfile.mkstemp(prefix=f".{self._name}.", suffix=f"{suffix}.tmp", dir=folder)
+        os.close(fd)
+        return Path(tmp)
@@ -0,0 +1,223 @@
+"""Typed job record, normalized once when a scraped job enters the pipeline."""
+import hashlib
+import math
+import re
+from functools import lru_cache
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+_SALARY_RE = re.compile(r"\$?\s*(\d[\d,]*(?:\.\d+)?)\s*([kK])?")
+
+# Adapter keys that mean the same field
+URL_KEYS = ("application_url", "link", "url")
+
+# Fixed export schema, in column order
+EXPORT_FIELDS = (
+    "title", "company", "location", "description", "application_url", "source",
+    "posted_date", "salary", "salary_min", "salary_max", "is_remote", "fingerprint",
+)
+
+_KNOWN_KEYS = frozenset(EXPORT_FIELDS) | frozenset(URL_KEYS)
+
+
+def parse_salary(text: Optional[str]) -> Tuple[float, float]:
+    """
+    Parse a free-text salary such as "$80,000 - $120,000" or "90k-110k"
+    
+    Args:
+        text: Salary text
+        
+    Returns:
+        Tuple of (min, max); NaN for values that cannot be parsed
+    """
+    if not text:
+        return math.nan, math.nan
+    values = []
+    for number, thousands in _SALARY_RE.findall(str(text)):
+        value = float(number.replace(",", ""))
+        if thousands:
+            value *= 1000
+        values.append(value)
+    if not values:
+        return math.nan, math.nan
+    return min(values), max(values)
+
+
+def normalize_location(location: Optional[str]) -> str:
+    """Lowercase location with punctuation removed"""
+    return (location or '').lower().replace(',', ' ').replace('.', ' ').strip()
+
+
+def normalize_company(company: Optional[str]) -> str:
+    """Lowercase, stripped company name"""
+    return (company or '').lower().strip()
+
+
+def job_fingerprint(company: Optional[str], title: Optional[str], location: Optional[str]) -> str:
+    """
+    Exact-duplicate fingerprint of a job
+    
+    Uses the same normalization as fingerprints already held in
+    persistent stores, so records and dicts of one job hash alike.
+    
+    Returns:
+        MD5 hex digest of "company:title:location"
+    """
+    location_part = (location or '').lower().strip().replace(',', '').replace('.', '')
+    key = f"{normalize_company(company)}:{(title or '').lower().strip()}:{location_part}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def _salary_bound(value: Any, upper: bool = False) -> Optional[float]:
+    """
+    None for missing, zero, NaN or unparseable salary values, else a float
+    
+    Text such as "100k" goes through :func:`parse_salary`; of a range,
+    the lower end is used, or the upper end when ``upper`` is set.
+    """
+    if not value:
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        low, high = parse_salary(value)
+        value = high if upper else low
+    return None if math.isnan(value) or not value else value
+
+
+@lru_cache(maxsize=4096)
+def _salary_text_bounds(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """Bounds of a salary text; adapters repeat a few formats, so parses are cached"""
+    low, high = parse_salary(text)
+    return _salary_bound(low), _salary_bound(high, upper=True)
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """
+    Scraped job with its normalized fields precomputed.
+    
+    Adapters emit dicts with differing keys ("link" vs "application_url")
+    and free-text salaries; :meth:`from_dict` resolves those once, so
+    deduplication, deal-breaker checks, matching and export read ready
+    values instead of re-parsing the dict in every loop.
+    
+    Attributes:
+        title: Job title
+        company: Company name as scraped
+        location: Location as scraped
+        description: Job description
+        application_url: Posting / application link
+        source: Adapter that found the job (e.g. "linkedin")
+        posted_date: Posting date as scraped
+        salary: Salary text as scraped
+        salary_min: Lower salary bound (None if unknown)
+        salary_max: Upper salary bound (None if unknown)
+        is_remote: Remote flag
+        company_key: Normalized company, for blacklists and grouping
+        location_key: Normalized location, for location matching
+        fingerprint: Exact-duplicate fingerprint
+        extra: Any other adapter fields (skills, experience_years, ...)
+    """
+    title: str
+    company: str
+    location: str = ''
+    description: str = ''
+    application_url: Optional[str] = None
+    source: Optional[str] = None
+    posted_date: Optional[str] = None
+    salary: Optional[str] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    is_remote: bool = False
+    company_key: str = ''
+    location_key: str = ''
+    fingerprint: str = ''
+    extra: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, job: Mapping[str, Any], source: Optional[str] = None) -> "JobRecord":
+        """
+        Normalize an adapter job dict
+        
+        Args:
+            job: Job dict as emitted by an adapter
+            source: Adapter name, used when the dict has no "source"
+            
+        Returns:
+            JobRecord
+        """
+        get = job.get
+        title = get('title') or ''
+        company = get('company') or ''
+        location = get('location') or ''
+        salary = get('salary')
+        if salary is not None:
+            salary = str(salary)
+        
+        low, high = _salary_bound(get('salary_min')), _salary_bound(get('salary_max'), upper=True)
+        if low is None and high is None:
+            if salary:
+                low, high = _salary_text_bounds(salary)
+        elif low is None:
+            low = high
+        elif high is None:
+            high = low
+        
+        if 'is_remote' in job:
+            is_remote = bool(job['is_remote'])
+        else:
+            is_remote = 'remote' in f"{location} {title}".lower()
+        
+        url = get('application_url') or get('link') or get('url')
+        company_key = company.lower().strip()
+        return cls(
+            title,
+            company,
+            location,
+            get('description') or '',
+            url or None,
+            get('source') or source,
+            get('posted_date'),
+            salary,
+            low,
+            high,
+            is_remote,
+            company_key,
+            normalize_location(location),
+            job_fingerprint(company_key, title, location),
+            {key: value for key, value in job.items() if key not in _KNOWN_KEYS},
+        )
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Dict-style field read, for code that accepts records and job dicts
+        
+        Args:
+            key: Field name or key of :attr:`extra`
+            default: Returned when the field is missing or None
+            
+        Returns:
+            Field value
+        """
+        if key in _RECORD_FIELDS:
+            value = getattr(self, key)
+        else:
+            value = self.extra.get(key)
+        return default if value is None else value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Fields of the fixed export schema, in EXPORT_FIELDS order"""
+        return {name: getattr(self, name) for name in EXPORT_FIELDS}
+
+
+_RECORD_FIELDS = frozenset(f.name for f in fields(JobRecord)) - {'extra'}
+
+JobLike = Union[JobRecord, Mapping[str, Any]]
+
+
+def as_job_record(job: JobLike, source: Optional[str] = None) -> JobRecord:
+    """Return a record unchanged, or normalize a job dict"""
+    if isinstance(job, JobRecord):
+        return job
+    return JobRecord.from_dict(job, source)
@@ -0,0 +1,137 @@
+"""Concurrent adapter runner with per-host crawl throttling."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Type
+import logging
+
+from adapters.base_scraper import BaseScraper
+from core.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class HostThrottle:
+    """
+    Enforces a minimum delay between requests to the same host.
+    
+    Slots are reserved under a lock and the sleep happens outside it, so
+    workers hitting different hosts never wait on each other.
+    """
+    
+    def __init__(self):
+        """Initialize throttle with no recorded hosts."""
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+    
+    def wait(self, host: str, delay: float) -> float:
+        """
+        Block until a request to ``host`` is allowed.
+        
+        Args:
+            host: Host name (e.g., 'www.indeed.com')
+            delay: Minimum seconds between requests to this host
+            
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + max(delay, 0.0)
+        
+        wait_time = slot - now
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+
+@dataclass
+class AdapterResult:
+    """Outcome of running a single adapter."""
+    name: str
+    jobs: List[Dict[str, Any]] = field(default_factory=list)
+    duration: float = 0.0
+    error: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        """Whether the adapter finished without raising."""
+        return self.error is None
+
+
+def _run_adapter(
+    name: str,
+    scraper_class: Type[BaseScraper],
+    throttle: HostThrottle,
+    crawl_delay: float
+) -> AdapterResult:
+    """
+    Run one adapter, capturing its jobs, timing and any failure.
+    
+    Args:
+        name: Adapter name (matches the site key in config.yaml)
+        scraper_class: Scraper class to instantiate
+        throttle: Shared per-host throttle
+        crawl_delay: Minimum seconds between requests to the adapter's host
+        
+    Returns:
+        AdapterResult for this adapter
+    """
+    start = time.perf_counter()
+    try:
+        scraper = scraper_class()
+        scraper.throttle = throttle
+        scraper.crawl_delay = crawl_delay
+        jobs = scraper.run()
+        return AdapterResult(name=name, jobs=jobs, duration=time.perf_counter() - start)
+    except Exception as e:
+        logger.error(f"Adapter {name} failed: {e}", exc_info=True)
+        return AdapterResult(name=name, duration=time.perf_counter() - start, error=str(e))
+
+
+def run_adapters(
+    scrapers: Dict[str, Type[BaseScraper]],
+    max_workers: Optional[int] = None,
+    config: Optional[Config] = None,
+    throttle: Optional[HostThrottle] = None
+) -> List[AdapterResult]:
+    """
+    Run adapters in parallel on a bounded thread pool.
+    
+    A failure in one adapter is recorded on its result and never affects the
+    others. Each adapter honours its site's ``crawl_delay`` per host.
+    
+    Args:
+        scrapers: Mapping of adapter name to scraper class
+        max_workers: Maximum concurrent adapters (defaults to global config)
+        config: Configuration supplying crawl delays and worker count
+        throttle: Shared throttle (a new one is created if omitted)
+        
+    Returns:
+        List of AdapterResult in the same order as ``scrapers``
+    """
+    if max_workers is None:
+        max_workers = config.get_global_config().max_workers if config else 1
+    max_workers = max(1, min(max_workers, len(scrapers) or 1))
+    throttle = throttle or HostThrottle()
+    
+    results: Dict[str, AdapterResult] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="adapter") as pool:
+        futures = {}
+        for name, scraper_class in scrapers.items():
+            site_config = config.get_site_config(name) if config else None
+            crawl_delay = site_config.crawl_delay if site_config else 0.0
+            future = pool.submit(_run_adapter, name, scraper_class, throttle, crawl_delay)
+            futures[future] = name
+        
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.name] = result
+            logger.info(
+                f"Adapter {result.name} finished in {result.duration:.2f}s "
+                f"({len(result.jobs)} jobs{'' if result.success else ', failed'})"
+            )
+    
+    return [results[name] for name in scrapers]
@@ -1,7 +1,11 @@
 """Utility functions including retry logic with type hints and improved error handling."""
+import os
 import time
 import functools
-from typing import Callable, Type, Tuple, TypeVar, Any
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Callable, Iterator, Optional, Type, Tuple, TypeVar, Any, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -60,6 +64,43 @@ def retry(
             
             # This should never be reached due to raise in loop
             raise RuntimeError(f"{func.__name__} failed after {max_attempts} attempts")
-            
+        
         return wrapper
     return decorator
+
+
+@contextmanager
+def atomic_write(
+    path: Union[str, Path],
+    mode: str = 'w',
+    encoding: Optional[str] = None
+) -> Iterator[IO[Any]]:
+    """
+    Write a file atomically through a temp file in the same directory.
+    
+    The temp file replaces ``path`` only when the block exits cleanly;
+    if it raises, the temp file is removed and any previous file is
+    left untouched. Parent directories are created as needed.
+    
+    Args:
+        path: Target file
+        mode: 'w' for text or 'wb' for bytes
+        encoding: Text encoding (text mode only)
+        
+    Yields:
+        Open file object for the temp file
+        
+    Example:
+        >>> with atomic_write("data/state.json", encoding="utf-8") as f:
+        ...     json.dump(state, f)
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -148,8 +148,8 @@ with tabs[1]:
                             'state': state
                         }
                         
-                        # Create config
-                        config = SubmissionConfig(
+                        # Create config: automation.yaml, with the settings above on top
+                        config = SubmissionConfig.from_config(
                             headless=headless,
                             screenshot_on_error=screenshot,
                             screenshot_on_success=screenshot,
@@ -158,7 +158,7 @@ with tabs[1]:
                         
                         # Submit application
                         async def submit():
-                            with ApplicationSubmitter(config) as submitter:
+                            async with ApplicationSubmitter(config) as submitter:
                                 return await submitter.submit_application(
                                     job=job,
                                     resume=str(resume_path),
@@ -2,8 +2,20 @@
 Job Deduplicator - Detects and removes duplicate job listings
 """
 
-import hashlib
-from typing import List, Dict, Any, Set
+from pathlib import Path
+from typing import List, Dict, Any, Set, Optional
+
+import yaml
+
+from core.job_record import JobLike, JobRecord, job_fingerprint
+from discovery.fingerprint_store import (
+    BloomFilter,
+    FingerprintStore,
+    MemoryFingerprintStore,
+    SQLiteFingerprintStore,
+    TieredFingerprintStore,
+)
+from discovery.minhash import MinHashLSH, jaccard, shingle
 
 
 class JobDeduplicator:
@@ -12,37 +24,115 @@ class JobDeduplicator:
     
     Uses fingerprinting and fuzzy matching to identify duplicate
     jobs even when posted on different platforms.
+    
+    Exact duplicates are caught by a fingerprint of company, title and
+    location. With the "fuzzy" strategy, a MinHash LSH index over shingled
+    title + company + description also catches reposts with slightly
+    different wording, without comparing against every seen job.
     """
     
-    def __init__(self):
-        """Initialize deduplicator"""
-        self.seen_fingerprints: Set[str] = set()
+    def __init__(
+        self,
+        similarity_threshold: float = 0.9,
+        strategy: str = "fuzzy",
+        num_perm: int = 128,
+        shingle_size: int = 3,
+        store: Optional[FingerprintStore] = None,
+        cache_size: Optional[int] = 10000,
+        ttl: Optional[float] = None
+    ):
+        """
+        Initialize deduplicator
+        
+        Args:
+            similarity_threshold: Minimum Jaccard similarity for a near-duplicate
+            strategy: "fingerprint" (exact only) or "fuzzy" (exact + near-duplicate)
+            num_perm: MinHash signature length
+            shingle_size: Words per shingle
+            store: Fingerprint store (defaults to an in-memory LRU)
+            cache_size: LRU size for the default store and the near-duplicate
+                index (None for unbounded)
+            ttl: Seconds a job stays in the default store and the index
+                (None for no expiry)
+        """
+        if strategy not in ("fingerprint", "fuzzy"):
+            raise ValueError(f"Unknown deduplication strategy: {strategy}")
+        
+        self.similarity_threshold = similarity_threshold
+        self.strategy = strategy
+        self.shingle_size = shingle_size
+        self.seen_fingerprints: FingerprintStore = (
+            store if store is not None else MemoryFingerprintStore(max_size=cache_size, ttl=ttl)
+        )
+        self.index: Optional[MinHashLSH] = None
+        if strategy == "fuzzy":
+            self.index = MinHashLSH(
+                threshold=similarity_threshold,
+                num_perm=num_perm,
+                max_size=cache_size,
+                ttl=ttl
+            )
     
-    def generate_fingerprint(self, job: Dict[str, Any]) -> str:
+    @classmethod
+    def from_config(cls, config_path: str = "config/discovery.yaml") -> "JobDeduplicator":
         """
-        Generate unique fingerprint for a job
+        Create a deduplicator from the ``deduplication`` config section
         
         Args:
-            job: Job details
+            config_path: Path to discovery configuration file
             
         Returns:
-            Fingerprint hash
+            Configured deduplicator (defaults if the file is missing)
         """
-        # Normalize data
-        company = job.get('company', '').lower().strip()
-        title = job.get('title', '').lower().strip()
-        location = self._normalize_location(job.get('location', ''))
+        path = Path(config_path)
+        settings: Dict[str, Any] = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = (yaml.safe_load(f) or {}).get('deduplication', {}) or {}
         
-        # Create fingerprint
-        fingerprint_str = f"{company}:{title}:{location}"
+        cache_size = settings.get('cache_size', 10000)
+        ttl_days = settings.get('ttl_days')
+        ttl = ttl_days * 86400 if ttl_days else None
         
-        # Hash for storage
-        return hashlib.md5(fingerprint_str.encode()).hexdigest()
+        store: FingerprintStore = MemoryFingerprintStore(max_size=cache_size, ttl=ttl)
+        if settings.get('store', 'memory') == 'sqlite':
+            bloom = None
+            if settings.get('bloom_filter', False):
+                bloom = BloomFilter(capacity=settings.get('bloom_capacity', 1_000_000))
+            store = TieredFingerprintStore(
+                store,
+                persistent=SQLiteFingerprintStore(
+                    settings.get('store_path', 'data/fingerprints.db'), ttl=ttl
+                ),
+                bloom=bloom
+            )
+        
+        return cls(
+            similarity_threshold=settings.get('similarity_threshold', 0.9),
+            strategy=settings.get('strategy', 'fingerprint'),
+            store=store,
+            cache_size=cache_size,
+            ttl=ttl
+        )
+    
+    def generate_fingerprint(self, job: JobLike) -> str:
+        """
+        Generate unique fingerprint for a job
+        
+        Args:
+            job: JobRecord (fingerprint precomputed) or job dict
+            
+        Returns:
+            Fingerprint hash
+        """
+        if isinstance(job, JobRecord):
+            return job.fingerprint
+        return job_fingerprint(job.get('company'), job.get('title'), job.get('location'))
     
     def is_duplicate(
         self,
-        job: Dict[str, Any],
-        existing_jobs: List[Dict[str, Any]] = None
+        job: JobLike,
+        existing_jobs: List[JobLike] = None
     ) -> bool:
         """
         Check if job is a duplicate
@@ -60,15 +150,19 @@ class JobDeduplicator:
         if fingerprint in self.seen_fingerprints:
             return True
         
-        # Check against existing jobs with fuzzy matching
+        # Check the near-duplicate index
+        if self.index is not None and self.index.query(self._signature(job)):
+            return True
+        
+        # Check against an explicit list of jobs with fuzzy matching
         if existing_jobs:
             for existing in existing_jobs:
-                if self._calculate_similarity(job, existing) > 0.9:
+                if self._calculate_similarity(job, existing) >= self.similarity_threshold:
                     return True
         
         return False
     
-    def add_job(self, job: Dict[str, Any]) -> str:
+    def add_job(self, job: JobLike) -> str:
         """
         Add job to seen set
         
@@ -79,39 +173,47 @@ class JobDeduplicator:
             Job fingerprint
         """
         fingerprint = self.generate_fingerprint(job)
+        if fingerprint not in self.seen_fingerprints and self.index is not None:
+            self.index.insert(fingerprint, self._signature(job))
         self.seen_fingerprints.add(fingerprint)
         return fingerprint
     
     def deduplicate_batch(
         self,
-        jobs: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+        jobs: List[JobLike]
+    ) -> List[JobLike]:
         """
         Deduplicate a batch of jobs
         
         Args:
-            jobs: List of jobs to deduplicate
+            jobs: JobRecords or job dicts to deduplicate
             
         Returns:
             List of unique jobs
         """
         unique_jobs = []
         
+        # Jobs kept so far are in the fingerprint set and LSH index, so
+        # each lookup is independent of the batch size. The fingerprint and
+        # signature are computed once per job for both the check and the add.
         for job in jobs:
-            if not self.is_duplicate(job, unique_jobs):
-                unique_jobs.append(job)
-                self.add_job(job)
+            fingerprint = self.generate_fingerprint(job)
+            if fingerprint in self.seen_fingerprints:
+                continue
+            if self.index is not None:
+                signature = self._signature(job)
+                if self.index.query(signature):
+                    continue
+                self.index.insert(fingerprint, signature)
+            self.seen_fingerprints.add(fingerprint)
+            unique_jobs.append(job)
         
         return unique_jobs
     
-    def _normalize_location(self, location: str) -> str:
-        """Normalize location string"""
-        return location.lower().strip().replace(',', '').replace('.', '')
-    
     def _calculate_similarity(
         self,
-        job1: Dict[str, Any],
-        job2: Dict[str, Any]
+        job1: JobLike,
+        job2: JobLike
     ) -> float:
         """
         Calculate similarity between two jobs
@@ -123,9 +225,20 @@ class JobDeduplicator:
         Returns:
             Similarity score (0-1)
         """
-        # TODO: Implement Levenshtein distance or similar
-        # For now, simple comparison
         if (job1.get('company') == job2.get('company') and
             job1.get('title') == job2.get('title')):
             return 1.0
-        return 0.0
+        return jaccard(self._shingles(job1), self._shingles(job2))
+    
+    def _shingles(self, job: JobLike) -> Set[str]:
+        """Shingle title, company and description"""
+        text = f"{job.get('title', '')} {job.get('company', '')} {job.get('description', '')}"
+        return shingle(text, self.shingle_size)
+    
+    def _signature(self, job: JobLike):
+        """MinHash signature of a job's shingles"""
+        return self.index.signature(self._shingles(job))
+    
+    def close(self) -> None:
+        """Flush and close the fingerprint store"""
+        self.seen_fingerprints.close()
@@ -0,0 +1,302 @@
+"""
+Fingerprint Store - Bounded and persistent storage for seen job fingerprints
+"""
+
+import hashlib
+import math
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+class FingerprintStore(ABC):
+    """
+    Interface for remembering which job fingerprints have been seen.
+    
+    Stores support ``in`` and ``add`` so they can replace the plain set
+    previously used by ``JobDeduplicator.seen_fingerprints``.
+    """
+    
+    @abstractmethod
+    def __contains__(self, fingerprint: str) -> bool:
+        """Check whether a fingerprint has been seen"""
+    
+    @abstractmethod
+    def add(self, fingerprint: str) -> None:
+        """Record a fingerprint as seen"""
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored fingerprints"""
+    
+    def close(self) -> None:
+        """Release any resources held by the store"""
+
+
+class MemoryFingerprintStore(FingerprintStore):
+    """
+    In-memory LRU store with optional time-to-live.
+    
+    Holds at most ``max_size`` fingerprints; the least recently seen one
+    is evicted first. Entries older than ``ttl`` seconds are treated as
+    unseen, so a job reposted after the TTL is reported again.
+    """
+    
+    def __init__(self, max_size: Optional[int] = 10000, ttl: Optional[float] = None):
+        """
+        Initialize store
+        
+        Args:
+            max_size: Maximum fingerprints kept (None for unbounded)
+            ttl: Seconds a fingerprint stays valid (None for no expiry)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+    
+    def __contains__(self, fingerprint: str) -> bool:
+        """Check fingerprint, refreshing its LRU position on a hit"""
+        seen_at = self._entries.get(fingerprint)
+        if seen_at is None:
+            return False
+        if self.ttl is not None and time.time() - seen_at > self.ttl:
+            del self._entries[fingerprint]
+            return False
+        self._entries.move_to_end(fingerprint)
+        return True
+    
+    def add(self, fingerprint: str) -> None:
+        """Record fingerprint, evicting the least recently seen if full"""
+        self._entries[fingerprint] = time.time()
+        self._entries.move_to_end(fingerprint)
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        """Number of stored fingerprints"""
+        return len(self._entries)
+
+
+class SQLiteFingerprintStore(FingerprintStore):
+    """
+    On-disk fingerprint history that survives restarts.
+    
+    Uses a WITHOUT ROWID table keyed by fingerprint, so lookups are a
+    single B-tree probe and memory use does not grow with history.
+    Inserts are committed every ``commit_interval`` additions and on close.
+    With a ``ttl``, expired rows are deleted when the store is opened and
+    every ``prune_interval`` additions, so the file does not keep growing.
+    """
+    
+    def __init__(
+        self,
+        path: str = "data/fingerprints.db",
+        ttl: Optional[float] = None,
+        commit_interval: int = 500,
+        prune_interval: int = 50000
+    ):
+        """
+        Open (or create) the store
+        
+        Args:
+            path: SQLite database file
+            ttl: Seconds a fingerprint stays valid (None for no expiry)
+            commit_interval: Additions between commits
+            prune_interval: Additions between deletions of expired rows
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.commit_interval = commit_interval
+        self.prune_interval = prune_interval
+        self._pending = 0
+        self._since_prune = 0
+        
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            " fingerprint TEXT PRIMARY KEY,"
+            " seen_at REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.commit()
+        self.prune()
+    
+    def __contains__(self, fingerprint: str) -> bool:
+        """Check fingerprint against the on-disk history"""
+        row = self._conn.execute(
+            "SELECT seen_at FROM fingerprints WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        if row is None:
+            return False
+        return self.ttl is None or time.time() - row[0] <= self.ttl
+    
+    def add(self, fingerprint: str) -> None:
+        """Record fingerprint (refreshing its timestamp if present)"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO fingerprints (fingerprint, seen_at) VALUES (?, ?)",
+            (fingerprint, time.time())
+        )
+        self._pending += 1
+        self._since_prune += 1
+        if self.ttl is not None and self._since_prune >= self.prune_interval:
+            self.prune()
+        elif self._pending >= self.commit_interval:
+            self.flush()
+    
+    def __len__(self) -> int:
+        """Number of stored fingerprints"""
+        return self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over stored fingerprints that have not expired"""
+        if self.ttl is None:
+            cursor = self._conn.execute("SELECT fingerprint FROM fingerprints")
+        else:
+            cursor = self._conn.execute(
+                "SELECT fingerprint FROM fingerprints WHERE seen_at >= ?",
+                (time.time() - self.ttl,)
+            )
+        for (fingerprint,) in cursor:
+            yield fingerprint
+    
+    def prune(self) -> int:
+        """
+        Delete expired fingerprints
+        
+        Returns:
+            Number of fingerprints removed
+        """
+        if self.ttl is None:
+            return 0
+        cursor = self._conn.execute(
+            "DELETE FROM fingerprints WHERE seen_at < ?", (time.time() - self.ttl,)
+        )
+        self.flush()
+        self._since_prune = 0
+        return cursor.rowcount
+    
+    def flush(self) -> None:
+        """Commit pending additions"""
+        self._conn.commit()
+        self._pending = 0
+    
+    def close(self) -> None:
+        """Commit and close the database"""
+        self.flush()
+        self._conn.close()
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter for constant-memory negative lookups.
+    
+    A miss is definitive; a hit may be a false positive at roughly
+    ``error_rate`` once ``capacity`` items have been added.
+    """
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        """
+        Initialize an empty filter
+        
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive rate at capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item: str) -> Iterator[int]:
+        """Bit positions for an item (Kirsch-Mitzenmacher double hashing)"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item: str) -> None:
+        """Add an item"""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added"""
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class TieredFingerprintStore(FingerprintStore):
+    """
+    Memory LRU in front of an optional Bloom filter and persistent store.
+    
+    Lookups try the LRU first, then let the Bloom filter reject unseen
+    fingerprints without touching disk, and only then query the
+    persistent store. Persistent hits are promoted into the LRU.
+    
+    Example:
+        >>> store = TieredFingerprintStore(
+        ...     MemoryFingerprintStore(max_size=10000),
+        ...     persistent=SQLiteFingerprintStore("data/fingerprints.db"),
+        ...     bloom=BloomFilter(capacity=5_000_000)
+        ... )
+        >>> dedup = JobDeduplicator(store=store)
+    """
+    
+    def __init__(
+        self,
+        memory: MemoryFingerprintStore,
+        persistent: Optional[SQLiteFingerprintStore] = None,
+        bloom: Optional[BloomFilter] = None
+    ):
+        """
+        Initialize tiers (the Bloom filter is warmed from the persistent store)
+        
+        Args:
+            memory: Hot in-memory tier
+            persistent: Long-term history across runs
+            bloom: Negative-lookup filter over the persistent history
+        """
+        self.memory = memory
+        self.persistent = persistent
+        self.bloom = bloom
+        if bloom is not None and persistent is not None:
+            for fingerprint in persistent:
+                bloom.add(fingerprint)
+    
+    def __contains__(self, fingerprint: str) -> bool:
+        """Check fingerprint across tiers"""
+        if fingerprint in self.memory:
+            return True
+        if self.persistent is None:
+            return False
+        if self.bloom is not None and fingerprint not in self.bloom:
+            return False
+        if fingerprint in self.persistent:
+            self.memory.add(fingerprint)
+            return True
+        return False
+    
+    def add(self, fingerprint: str) -> None:
+        """Record fingerprint in every tier"""
+        self.memory.add(fingerprint)
+        if self.bloom is not None:
+            self.bloom.add(fingerprint)
+        if self.persistent is not None:
+            self.persistent.add(fingerprint)
+    
+    def __len__(self) -> int:
+        """Number of fingerprints in the longest-lived tier"""
+        return len(self.persistent) if self.persistent is not None else len(self.memory)
+    
+    def close(self) -> None:
+        """Close the persistent tier"""
+        if self.persistent is not None:
+            self.persistent.close()
@@ -0,0 +1,214 @@
+"""
+MinHash LSH Index - Sub-linear near-duplicate lookup for job postings
+"""
+
+import re
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Mersenne prime for the universal hash family h(x) = (a*x + b) mod p
+_PRIME = (1 << 31) - 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def shingle(text: str, size: int = 3) -> Set[str]:
+    """
+    Split text into overlapping word shingles
+    
+    Args:
+        text: Text to shingle
+        size: Words per shingle
+        
+    Returns:
+        Set of shingles (the tokens themselves for very short text)
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < size:
+        return set(tokens)
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose (bands, rows) so the LSH S-curve crosses at the threshold
+    
+    Two documents with Jaccard similarity s become candidates with
+    probability 1 - (1 - s^rows)^bands; its steepest point sits near
+    (1 / bands)^(1 / rows).
+    
+    Args:
+        threshold: Target Jaccard similarity
+        num_perm: Number of MinHash permutations
+        
+    Returns:
+        Tuple of (bands, rows) with bands * rows <= num_perm
+    """
+    best = (1, num_perm)
+    best_error = float("inf")
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        # Bias slightly below the threshold so true matches are not missed
+        error = abs((1.0 / bands) ** (1.0 / rows) - (threshold - 0.05))
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+    """
+    MinHash signatures with banded locality-sensitive hashing.
+    
+    Each document is reduced to a fixed-size signature whose positions
+    agree with another document's with probability equal to their
+    Jaccard similarity. Signatures are split into bands and bucketed, so
+    a query only compares against documents sharing at least one band
+    instead of the whole collection.
+    
+    With ``max_size`` or ``ttl`` the index forgets its oldest documents
+    (first in, first out, along with their band entries), so it stays as
+    bounded as the fingerprint store it sits next to.
+    
+    Example:
+        >>> index = MinHashLSH(threshold=0.8)
+        >>> index.insert("job-1", index.signature(shingle(text_a)))
+        >>> index.query(index.signature(shingle(text_b)))
+        ['job-1']
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        seed: int = 1,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None
+    ):
+        """
+        Initialize an empty index
+        
+        Args:
+            threshold: Minimum estimated Jaccard similarity for a match
+            num_perm: Number of hash permutations (signature length)
+            seed: Seed for the hash family (indexes must share it to compare)
+            max_size: Maximum documents kept, oldest evicted first (None for unbounded)
+            ttl: Seconds a document stays indexed (None for no expiry)
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=(num_perm, 1)).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=(num_perm, 1)).astype(np.uint64)
+        
+        self.max_size = max_size
+        self.ttl = ttl
+        
+        # doc_id -> (key, signature, inserted_at), oldest first
+        self._docs: "OrderedDict[int, Tuple[Hashable, np.ndarray, float]]" = OrderedDict()
+        self._next_id = 0
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+    
+    def __len__(self) -> int:
+        """Number of indexed documents"""
+        return len(self._docs)
+    
+    def signature(self, shingles: Iterable[str]) -> np.ndarray:
+        """
+        Compute the MinHash signature of a shingle set
+        
+        Args:
+            shingles: Document shingles
+            
+        Returns:
+            uint32 array of length num_perm
+        """
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64
+        )
+        if hashes.size == 0:
+            return np.full(self.num_perm, _PRIME, dtype=np.uint32)
+        hashes %= _PRIME
+        permuted = (self._a * hashes[np.newaxis, :] + self._b) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+    
+    def insert(self, key: Hashable, signature: np.ndarray) -> None:
+        """
+        Add a document signature to the index
+        
+        Args:
+            key: Caller's identifier for the document
+            signature: Signature from :meth:`signature`
+        """
+        doc_id = self._next_id
+        self._next_id += 1
+        self._docs[doc_id] = (key, signature, time.time())
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, []).append(doc_id)
+        self._evict()
+    
+    def query(self, signature: np.ndarray) -> List[Hashable]:
+        """
+        Find indexed documents similar to a signature
+        
+        Candidates sharing a band are verified against the estimated
+        Jaccard similarity, so the result only contains matches at or
+        above the threshold.
+        
+        Args:
+            signature: Signature from :meth:`signature`
+            
+        Returns:
+            Keys of matching documents
+        """
+        self._evict()
+        candidates: Set[int] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        
+        matches = []
+        for doc_id in sorted(candidates):
+            key, doc_signature, _ = self._docs[doc_id]
+            if self.estimate_similarity(signature, doc_signature) >= self.threshold:
+                matches.append(key)
+        return matches
+    
+    def _evict(self) -> None:
+        """Drop documents over max_size or older than ttl, oldest first"""
+        expired_before = time.time() - self.ttl if self.ttl is not None else None
+        while self._docs:
+            doc_id, (_, signature, inserted_at) = next(iter(self._docs.items()))
+            over_size = self.max_size is not None and len(self._docs) > self.max_size
+            expired = expired_before is not None and inserted_at < expired_before
+            if not (over_size or expired):
+                break
+            del self._docs[doc_id]
+            for band, band_key in enumerate(self._band_keys(signature)):
+                bucket = self._buckets[band][band_key]
+                bucket.remove(doc_id)
+                if not bucket:
+                    del self._buckets[band][band_key]
+    
+    def estimate_similarity(self, sig1: np.ndarray, sig2: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.count_nonzero(sig1 == sig2)) / self.num_perm
+    
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """Bucket keys for each band of a signature"""
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
@@ -5,6 +5,8 @@ Job Notifier - Sends notifications for new job matches
 from typing import Dict, Any, List
 from enum import Enum
 
+from core.job_record import JobLike
+
 
 class NotificationChannel(Enum):
     """Notification delivery channels"""
@@ -29,7 +31,7 @@ class JobNotifier:
     async def notify_new_match(
         self,
         user_id: str,
-        job: Dict[str, Any],
+        job: JobLike,
         match_score: float,
         channels: List[NotificationChannel] = None
     ) -> bool:
@@ -99,14 +101,14 @@ class JobNotifier:
     
     def format_match_notification(
         self,
-        job: Dict[str, Any],
+        job: JobLike,
         match_score: float
     ) -> Dict[str, str]:
         """
         Format a job match notification message
         
         Args:
-            job: Job details
+            job: JobRecord or job dict
             match_score: Match score
             
         Returns:
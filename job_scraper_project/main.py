@@ -4,48 +4,82 @@ import logging
 import argparse
 import asyncio
 import csv
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from adapters.indeed import IndeedScraper
 from adapters.linkedin import LinkedInScraper
 from adapters.glassdoor import GlassdoorScraper
+from core.config import get_config
 from core.export_manager import export_data
+from core.runner import AdapterResult, run_adapters
 from core.logger import setup_logger
 from automation.application_submitter import ApplicationSubmitter
 from automation.models import SubmissionConfig, ApplicationData
+from optimization.keyword_extractor import KeywordExtractor
 
 # Setup main logger
 logger = setup_logger("main")
 
 
-def run_scraper(name: str, scraper_class) -> List[Dict[str, Any]]:
+def report_results(results: List[AdapterResult]) -> List[Dict[str, Any]]:
     """
-    Run a single scraper and handle errors.
+    Print per-adapter outcome and timing, and collect all jobs.
     
     Args:
-        name: Display name of the scraper
-        scraper_class: Scraper class to instantiate
+        results: Results returned by the concurrent runner
         
     Returns:
-        List of scraped jobs or empty list on error
+        Jobs from every adapter that succeeded
     """
-    print(f"\nScraping {name.capitalize()}...")
+    all_jobs: List[Dict[str, Any]] = []
+    
+    for result in results:
+        if result.success:
+            print(f"✅ {result.name.capitalize()}: {len(result.jobs)} jobs in {result.duration:.2f}s")
+            logger.info(f"Successfully scraped {len(result.jobs)} jobs from {result.name}")
+            all_jobs.extend(result.jobs)
+        else:
+            print(f"❌ {result.name.capitalize()}: {result.error} (after {result.duration:.2f}s)")
+            logger.error(f"Failed to scrape {result.name}: {result.error}")
+    
+    return all_jobs
+
+
+def update_keyword_statistics(jobs: List[Dict[str, Any]], df_path: str = "data/keyword_df.npz") -> int:
+    """
+    Count scraped descriptions into the keyword document frequencies.
+    
+    Keeps data/keyword_df.npz current so keyword extraction weighs terms
+    by how common they are across every scraped posting.
+    
+    Args:
+        jobs: Jobs scraped in this run
+        df_path: Persisted document-frequency table
+        
+    Returns:
+        Number of descriptions added (0 if the update failed)
+    """
+    descriptions = [job['description'] for job in jobs if job.get('description')]
+    if not descriptions:
+        return 0
     try:
-        scraper = scraper_class()
-        jobs = scraper.run()
-        print(f"✅ Found {len(jobs)} jobs")
-        logger.info(f"Successfully scraped {len(jobs)} jobs from {name}")
-        return jobs
+        added = KeywordExtractor(df_path=df_path).update_document_frequencies(descriptions)
     except Exception as e:
-        print(f"❌ Error: {e}")
-        logger.error(f"Failed to scrape {name}: {e}", exc_info=True)
-        return []
+        logger.error(f"Failed to update keyword statistics: {e}")
+        return 0
+    logger.info(f"Added {added} descriptions to keyword statistics")
+    return added
 
 
-def main() -> int:
+def main(max_workers: Optional[int] = None) -> int:
     """
-    Run scrapers and export results.
+    Run scrapers concurrently and export results.
     
+    Args:
+        max_workers: Maximum adapters to run at once (defaults to
+            ``global.max_workers`` in config.yaml; 1 runs them sequentially)
+            
     Returns:
         Exit code (0 for success, 1 for failure)
     """
@@ -62,12 +96,18 @@ def main() -> int:
         'glassdoor': GlassdoorScraper
     }
     
-    all_jobs: List[Dict[str, Any]] = []
+    config = get_config()
+    if max_workers is None:
+        max_workers = config.get_global_config().max_workers
+    
+    print(f"\nScraping {len(scrapers)} sites with up to {max_workers} workers...")
+    start = time.perf_counter()
+    results = run_adapters(scrapers, max_workers=max_workers, config=config)
+    elapsed = time.perf_counter() - start
     
-    # Run each scraper
-    for name, scraper_class in scrapers.items():
-        jobs = run_scraper(name, scraper_class)
-        all_jobs.extend(jobs)
+    all_jobs = report_results(results)
+    print(f"Scraping finished in {elapsed:.2f}s")
+    logger.info(f"Scraped {len(scrapers)} sites in {elapsed:.2f}s")
     
     # Export results
     if all_jobs:
@@ -84,6 +124,8 @@ def main() -> int:
         else:
             print("\n⚠️ Warning: Some exports may have failed")
             logger.warning("Some exports failed")
+        
+        update_keyword_statistics(all_jobs)
     else:
         print("\nNo jobs found")
         logger.warning("No jobs were scraped")
@@ -127,15 +169,15 @@ async def submit_application(args) -> int:
             'github_url': getattr(args, 'github_url', None),
         }
         
-        # Create config
-        config = SubmissionConfig(
+        # Create config: automation.yaml, with command line options on top
+        config = SubmissionConfig.from_config(
             headless=args.headless,
             screenshot_on_error=True,
             screenshot_on_success=True
         )
         
         # Submit application
-        with ApplicationSubmitter(config) as submitter:
+        async with ApplicationSubmitter(config) as submitter:
             result = await submitter.submit_application(
                 job=job,
                 resume=args.resume,
@@ -209,15 +251,15 @@ async def submit_batch(args) -> int:
             'github_url': getattr(args, 'github_url', None),
         }
         
-        # Create config
-        config = SubmissionConfig(
+        # Create config: automation.yaml, with command line options on top
+        config = SubmissionConfig.from_config(
             headless=args.headless,
             screenshot_on_error=True,
             screenshot_on_success=True
         )
         
         # Submit applications
-        with ApplicationSubmitter(config) as submitter:
+        async with ApplicationSubmitter(config) as submitter:
             results = await submitter.submit_batch(
                 jobs=jobs,
                 resume=args.resume,
@@ -257,6 +299,10 @@ if __name__ == '__main__':
         
         # Scrape command (default)
         scrape_parser = subparsers.add_parser('scrape', help='Scrape job listings')
+        scrape_parser.add_argument(
+            '--max-workers', type=int,
+            help='Maximum adapters to scrape concurrently (1 = sequential)'
+        )
         
         # Submit command
         submit_parser = subparsers.add_parser('submit', help='Submit a job application')
@@ -294,7 +340,7 @@ if __name__ == '__main__':
             sys.exit(asyncio.run(submit_batch(args)))
         else:
             # Default: run scrapers
-            sys.exit(main())
+            sys.exit(main(getattr(args, 'max_workers', None)))
             
     except KeyboardInterrupt:
         print("\n\n⚠️ Interrupted by user")
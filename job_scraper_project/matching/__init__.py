@@ -5,7 +5,8 @@ This module provides AI-powered job matching capabilities with multi-dimensional
 scoring to match jobs to user profiles.
 """
 
+from matching.embeddings import TextEmbedder
 from matching.matcher import JobMatcher
-from matching.scoring import MatchScore
+from matching.scoring import BatchMatchScores, MatchScore
 
-__all__ = ["JobMatcher", "MatchScore"]
+__all__ = ["JobMatcher", "MatchScore", "BatchMatchScores", "TextEmbedder"]
@@ -2,7 +2,69 @@
 Deal Breaker Checker - Fast filtering for disqualifying criteria
 """
 
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from typing import Dict, Any, FrozenSet, Union
+
+import numpy as np
+
+from core.job_record import JobLike
+from matching.features import JobFeatures, job_company_key, job_is_remote, job_salary_range
+
+
+@dataclass(frozen=True)
+class ProfileIndex:
+    """
+    Deal-breaker criteria of a user profile, compiled once.
+    
+    Normalizing the blacklist up front means each job check is a single
+    set lookup instead of re-lowercasing the whole list per job.
+    
+    Attributes:
+        blacklisted_companies: Lowercased, stripped company names
+        salary_floor: Minimum acceptable salary (0 for none)
+        remote_required: Whether only remote jobs are acceptable
+    """
+    blacklisted_companies: FrozenSet[str] = frozenset()
+    salary_floor: int = 0
+    remote_required: bool = False
+    
+    @classmethod
+    def from_profile(cls, profile: Any) -> "ProfileIndex":
+        """
+        Compile the deal-breaker criteria of a UserProfile
+        
+        Args:
+            profile: User profile with preferences
+            
+        Returns:
+            ProfileIndex for the profile
+        """
+        return cls(
+            blacklisted_companies=frozenset(
+                c.lower().strip() for c in (profile.blacklisted_companies or [])
+            ),
+            salary_floor=profile.minimum_salary or 0,
+            remote_required=bool(profile.only_remote),
+        )
+
+
+@dataclass
+class PrefilterResult:
+    """
+    Outcome of running deal-breaker rules over a job batch.
+    
+    Attributes:
+        passed: True for jobs without any deal-breaker
+        eliminated: Rule name -> number of jobs the rule rejected (a job
+            failing several rules is counted under each)
+    """
+    passed: np.ndarray
+    eliminated: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def total_eliminated(self) -> int:
+        """Number of jobs rejected by at least one rule"""
+        return int(len(self.passed) - np.count_nonzero(self.passed))
 
 
 class DealBreakerChecker:
@@ -13,56 +75,111 @@ class DealBreakerChecker:
     jobs that don't meet mandatory requirements.
     """
     
-    def has_dealbreaker(self, job: Dict[str, Any], user_profile: Any) -> bool:
+    def has_dealbreaker(
+        self,
+        job: JobLike,
+        user_profile: Union[ProfileIndex, Any]
+    ) -> bool:
         """
         Check if job has any deal-breaker criteria
         
         Args:
-            job: Job details
-            user_profile: User profile with preferences
-            
+            job: JobRecord or job dict
+            user_profile: User profile with preferences, or its compiled
+                ProfileIndex (preferred when checking many jobs)
+                
         Returns:
             True if job has deal-breaker, False otherwise
         """
+        index = self._index(user_profile)
+        
         # Check location deal-breaker
-        if self._check_location_dealbreaker(job, user_profile):
+        if self._check_location_dealbreaker(job, index):
             return True
         
         # Check salary deal-breaker
-        if self._check_salary_dealbreaker(job, user_profile):
+        if self._check_salary_dealbreaker(job, index):
             return True
         
         # Check blacklisted company
-        if self._check_company_blacklist(job, user_profile):
+        if self._check_company_blacklist(job, index):
             return True
         
         # Check other requirements
-        if self._check_requirement_dealbreakers(job, user_profile):
+        if self._check_requirement_dealbreakers(job, index):
             return True
         
         return False
     
-    def _check_location_dealbreaker(self, job: Dict[str, Any], profile: Any) -> bool:
+    def prefilter(
+        self,
+        features: JobFeatures,
+        user_profile: Union[ProfileIndex, Any]
+    ) -> PrefilterResult:
+        """
+        Apply every deal-breaker rule to a batch as boolean masks
+        
+        Args:
+            features: Parsed job batch
+            user_profile: User profile or its compiled ProfileIndex
+            
+        Returns:
+            PrefilterResult with the surviving jobs and per-rule counts
+        """
+        index = self._index(user_profile)
+        n = len(features)
+        rules = {
+            'location': np.zeros(n, dtype=bool),
+            'salary': np.zeros(n, dtype=bool),
+            'company_blacklist': np.zeros(n, dtype=bool),
+        }
+        
+        if index.remote_required:
+            rules['location'] = ~features.is_remote
+        if index.salary_floor > 0:
+            with np.errstate(invalid='ignore'):
+                rules['salary'] = (
+                    (features.salary_max > 0) & (features.salary_max < index.salary_floor)
+                )
+        if index.blacklisted_companies and n:
+            rules['company_blacklist'] = np.isin(
+                features.companies, list(index.blacklisted_companies)
+            )
+        
+        rejected = np.zeros(n, dtype=bool)
+        for mask in rules.values():
+            rejected |= mask
+        
+        return PrefilterResult(
+            passed=~rejected,
+            eliminated={name: int(np.count_nonzero(mask)) for name, mask in rules.items()}
+        )
+    
+    def _index(self, user_profile: Union[ProfileIndex, Any]) -> ProfileIndex:
+        """Compile a profile unless it already is a ProfileIndex"""
+        if isinstance(user_profile, ProfileIndex):
+            return user_profile
+        return ProfileIndex.from_profile(user_profile)
+    
+    def _check_location_dealbreaker(self, job: JobLike, index: ProfileIndex) -> bool:
         """Check location compatibility"""
-        if profile.only_remote:
-            return not job.get('is_remote', False)
+        if index.remote_required:
+            return not job_is_remote(job)
         return False
     
-    def _check_salary_dealbreaker(self, job: Dict[str, Any], profile: Any) -> bool:
+    def _check_salary_dealbreaker(self, job: JobLike, index: ProfileIndex) -> bool:
         """Check salary requirements"""
-        if profile.minimum_salary > 0:
-            job_max_salary = job.get('salary_max', 0)
-            if job_max_salary > 0 and job_max_salary < profile.minimum_salary:
+        if index.salary_floor > 0:
+            job_max_salary = job_salary_range(job)[1]
+            if job_max_salary > 0 and job_max_salary < index.salary_floor:
                 return True
         return False
     
-    def _check_company_blacklist(self, job: Dict[str, Any], profile: Any) -> bool:
+    def _check_company_blacklist(self, job: JobLike, index: ProfileIndex) -> bool:
         """Check if company is blacklisted"""
-        company = job.get('company', '').lower()
-        blacklist = [c.lower() for c in profile.blacklisted_companies]
-        return company in blacklist
+        return job_company_key(job) in index.blacklisted_companies
     
-    def _check_requirement_dealbreakers(self, job: Dict[str, Any], profile: Any) -> bool:
+    def _check_requirement_dealbreakers(self, job: JobLike, index: ProfileIndex) -> bool:
         """Check other mandatory requirements"""
         # TODO: Check security clearance, work authorization, etc.
         return False
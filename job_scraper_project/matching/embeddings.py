@@ -0,0 +1,399 @@
+"""
+Text Embeddings - Cached sentence embeddings for semantic title matching
+"""
+
+import hashlib
+import logging
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+# Common title abbreviations, expanded so "Sr. Python Dev" and
+# "Senior Python Developer" share one cache entry
+_ABBREVIATIONS = {
+    'sr': 'senior',
+    'jr': 'junior',
+    'dev': 'developer',
+    'eng': 'engineer',
+    'engr': 'engineer',
+    'mgr': 'manager',
+    'swe': 'software engineer',
+}
+
+# Size of the cache key (blake2b digest) in bytes
+_KEY_SIZE = 16
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase, tokenize and expand abbreviations"""
+    tokens = _TOKEN_RE.findall((text or '').lower())
+    return ' '.join(_ABBREVIATIONS.get(token, token) for token in tokens)
+
+
+def text_key(normalized: str) -> bytes:
+    """Content address of normalized text"""
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=_KEY_SIZE).digest()
+
+
+class HashingEncoder:
+    """
+    Pure-NumPy fallback encoder using hashed bag-of-words vectors.
+    
+    Words and their character trigrams are hashed into a fixed number of
+    signed buckets and the result is L2-normalized, so cosine similarity
+    reflects shared words and word stems. No model download is needed.
+    """
+    
+    def __init__(self, dim: int = 384, trigram_weight: float = 0.5):
+        """
+        Initialize encoder
+        
+        Args:
+            dim: Vector dimension
+            trigram_weight: Weight of character trigrams relative to words
+        """
+        self.dim = dim
+        self.trigram_weight = trigram_weight
+        self.name = f"hashing-{dim}"
+    
+    def _features(self, text: str) -> Dict[str, float]:
+        """Weighted word and trigram features of normalized text"""
+        features: Dict[str, float] = {}
+        for token in text.split():
+            features[token] = features.get(token, 0.0) + 1.0
+            padded = f"<{token}>"
+            for i in range(len(padded) - 2):
+                trigram = '#' + padded[i:i + 3]
+                features[trigram] = features.get(trigram, 0.0) + self.trigram_weight
+        return features
+    
+    def encode(self, texts: Sequence[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Encode normalized texts
+        
+        Args:
+            texts: Normalized texts
+            batch_size: Unused, kept for interface compatibility
+            
+        Returns:
+            float32 array of shape (len(texts), dim) with unit-length rows
+        """
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text).items():
+                h = zlib.crc32(feature.encode('utf-8'))
+                sign = 1.0 if h & 0x80000000 else -1.0
+                vectors[row, h % self.dim] += sign * weight
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class SentenceTransformerEncoder:
+    """
+    Encoder backed by a sentence-transformers model
+    
+    The model is loaded when the encoder is created; ``sentence-transformers`` is an
+    optional dependency.
+    """
+    
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        """
+        Load the model
+        
+        Args:
+            model_name: Hugging Face model id
+            
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        from sentence_transformers import SentenceTransformer
+        
+        self.model = SentenceTransformer(model_name)
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = model_name.replace('/', '__')
+    
+    def encode(self, texts: Sequence[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Encode texts in batches
+        
+        Args:
+            texts: Normalized texts
+            batch_size: Texts per forward pass
+            
+        Returns:
+            float32 array of shape (len(texts), dim) with unit-length rows
+        """
+        vectors = self.model.encode(
+            list(texts),
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        return np.asarray(vectors, dtype=np.float32)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed store of embedding vectors.
+    
+    Vectors live in a memory-mapped float32 file (``<name>.f32``) and
+    their keys, the blake2b digest of the normalized text, are appended to
+    ``<name>.keys``. The row of a key is its position in the key file, so
+    reopening the cache only reads the keys. Each encoder gets its own
+    ``name`` so vectors from different models never mix. With no
+    directory the cache is kept in memory.
+    
+    The cache assumes a single writer process.
+    """
+    
+    def __init__(
+        self,
+        directory: Optional[str],
+        name: str,
+        dim: int,
+        initial_capacity: int = 1024
+    ):
+        """
+        Open (or create) the cache
+        
+        Args:
+            directory: Cache directory (None for an in-memory cache)
+            name: Encoder name the vectors belong to
+            dim: Vector dimension
+            initial_capacity: Rows allocated when the cache is created
+        """
+        self.dim = dim
+        self._rows: Dict[bytes, int] = {}
+        self._keys_path: Optional[Path] = None
+        self._vectors_path: Optional[Path] = None
+        
+        if directory is None:
+            self._vectors = np.zeros((initial_capacity, dim), dtype=np.float32)
+            return
+        
+        base = Path(directory)
+        base.mkdir(parents=True, exist_ok=True)
+        self._keys_path = base / f"{name}-{dim}.keys"
+        self._vectors_path = base / f"{name}-{dim}.f32"
+        
+        if self._keys_path.exists():
+            data = self._keys_path.read_bytes()
+            count = len(data) // _KEY_SIZE
+            if len(data) != count * _KEY_SIZE:
+                # Drop a torn trailing key from an interrupted write, so the
+                # next append starts on a key boundary
+                logger.warning(f"Truncating torn key in {self._keys_path}")
+                with open(self._keys_path, 'r+b') as f:
+                    f.truncate(count * _KEY_SIZE)
+            for row in range(count):
+                self._rows[data[row * _KEY_SIZE:(row + 1) * _KEY_SIZE]] = row
+        
+        row_bytes = dim * 4
+        capacity = max(initial_capacity, len(self._rows))
+        if self._vectors_path.exists():
+            capacity = max(capacity, self._vectors_path.stat().st_size // row_bytes)
+        self._open_vectors(capacity)
+        logger.info(f"Opened embedding cache {self._vectors_path} with {len(self._rows)} vectors")
+    
+    def _open_vectors(self, capacity: int) -> None:
+        """Size the vector file to ``capacity`` rows and map it"""
+        with open(self._vectors_path, 'ab') as f:
+            if f.tell() < capacity * self.dim * 4:
+                f.truncate(capacity * self.dim * 4)
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=np.float32, mode='r+', shape=(capacity, self.dim)
+        )
+    
+    def _reserve(self, rows: int) -> None:
+        """Grow storage (doubling) to hold at least ``rows`` vectors"""
+        capacity = len(self._vectors)
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        if self._vectors_path is None:
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[:len(self._vectors)] = self._vectors
+            self._vectors = grown
+        else:
+            self._vectors.flush()
+            del self._vectors
+            self._open_vectors(capacity)
+    
+    def __len__(self) -> int:
+        """Number of cached vectors"""
+        return len(self._rows)
+    
+    def __contains__(self, key: bytes) -> bool:
+        """Check whether a key is cached"""
+        return key in self._rows
+    
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """Cached vector for a key, or None"""
+        row = self._rows.get(key)
+        return None if row is None else np.array(self._vectors[row])
+    
+    def put_many(self, keys: Sequence[bytes], vectors: np.ndarray) -> None:
+        """
+        Store vectors for new keys
+        
+        Args:
+            keys: Content addresses (already cached keys are skipped)
+            vectors: float32 array with one row per key
+        """
+        new = [(key, vector) for key, vector in zip(keys, vectors) if key not in self._rows]
+        if not new:
+            return
+        start = len(self._rows)
+        self._reserve(start + len(new))
+        for offset, (key, vector) in enumerate(new):
+            self._vectors[start + offset] = vector
+        
+        if self._keys_path is not None:
+            # Vectors reach disk before the keys that reference them
+            self._vectors.flush()
+            with open(self._keys_path, 'ab') as f:
+                f.write(b''.join(key for key, _ in new))
+        for offset, (key, _) in enumerate(new):
+            self._rows[key] = start + offset
+    
+    def lookup(self, keys: Sequence[bytes]) -> np.ndarray:
+        """
+        Gather cached vectors
+        
+        Args:
+            keys: Cached content addresses
+            
+        Returns:
+            float32 array with one row per key
+        """
+        rows = np.fromiter((self._rows[key] for key in keys), dtype=np.int64, count=len(keys))
+        return np.asarray(self._vectors[rows])
+    
+    def close(self) -> None:
+        """Flush the vector file"""
+        if isinstance(self._vectors, np.memmap):
+            self._vectors.flush()
+
+
+class TextEmbedder:
+    """
+    Embeds text through a content-addressed cache.
+    
+    Texts are normalized and deduplicated, cached vectors are gathered,
+    and only unseen texts are sent to the encoder in batches. Repeated
+    titles are therefore embedded once across runs and users.
+    
+    Example:
+        >>> embedder = TextEmbedder(cache_dir="data/embeddings")
+        >>> embedder.similarity(["Sr. Python Dev"], ["Senior Python Developer"])
+        array([[1.]], dtype=float32)
+    """
+    
+    def __init__(
+        self,
+        encoder=None,
+        cache_dir: Optional[str] = None,
+        batch_size: int = 64
+    ):
+        """
+        Initialize embedder
+        
+        Args:
+            encoder: Object with ``name``, ``dim`` and ``encode(texts, batch_size)``
+                (defaults to HashingEncoder)
+            cache_dir: Directory for the persistent cache (None for in-memory)
+            batch_size: Texts per encoder call
+        """
+        self.encoder = encoder or HashingEncoder()
+        self.batch_size = batch_size
+        self.cache = EmbeddingCache(cache_dir, self.encoder.name, self.encoder.dim)
+        self.encoded = 0
+    
+    @classmethod
+    def from_settings(cls, settings: Dict) -> "TextEmbedder":
+        """
+        Create an embedder from the ``semantic_matching`` config section
+        
+        ``backend`` is "hashing", "sentence-transformers" or "auto" (the
+        model if sentence-transformers is installed, else hashing).
+        
+        Args:
+            settings: Config section
+            
+        Returns:
+            Configured embedder
+        """
+        backend = settings.get('backend', 'auto')
+        if backend not in ('auto', 'hashing', 'sentence-transformers'):
+            raise ValueError(f"Unknown embedding backend: {backend}")
+        
+        encoder = None
+        if backend != 'hashing':
+            model = settings.get('model', 'sentence-transformers/all-MiniLM-L6-v2')
+            try:
+                encoder = SentenceTransformerEncoder(model)
+            except ImportError:
+                if backend == 'sentence-transformers':
+                    raise
+                logger.warning("sentence-transformers not installed, using hashing encoder")
+        
+        return cls(
+            encoder=encoder,
+            cache_dir=settings.get('cache_dir'),
+            batch_size=settings.get('batch_size', 64)
+        )
+    
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts, encoding only those not already cached
+        
+        Args:
+            texts: Raw texts
+            
+        Returns:
+            float32 array of shape (len(texts), dim) with unit-length rows
+            (zero rows for empty text)
+        """
+        normalized = [normalize_text(text) for text in texts]
+        keys = [text_key(text) for text in normalized]
+        
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, normalized):
+            if text and key not in self.cache and key not in missing:
+                missing[key] = text
+        
+        if missing:
+            pending = list(missing.items())
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start:start + self.batch_size]
+                vectors = self.encoder.encode([text for _, text in batch], self.batch_size)
+                self.cache.put_many([key for key, _ in batch], vectors)
+            self.encoded += len(missing)
+        
+        result = np.zeros((len(texts), self.encoder.dim), dtype=np.float32)
+        present = [i for i, text in enumerate(normalized) if text]
+        if present:
+            result[present] = self.cache.lookup([keys[i] for i in present])
+        return result
+    
+    def similarity(self, texts_a: Sequence[str], texts_b: Sequence[str]) -> np.ndarray:
+        """
+        Cosine similarity between two lists of texts
+        
+        Returns:
+            Array of shape (len(texts_a), len(texts_b))
+        """
+        return self.embed(texts_a) @ self.embed(texts_b).T
+    
+    def close(self) -> None:
+        """Flush the cache"""
+        self.cache.close()
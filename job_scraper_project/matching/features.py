@@ -0,0 +1,207 @@
+"""
+Job Features - Parse job dicts into numeric feature arrays for batch scoring
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from core.job_record import JobLike, JobRecord, normalize_company, normalize_location, parse_salary
+from optimization.skill_matcher import load_skill_matcher
+
+_EXPERIENCE_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?(?:years?|yrs?)", re.IGNORECASE)
+
+# Popcount for every byte value, used to count set bits in packed bitsets
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def parse_experience_years(text: Optional[str]) -> float:
+    """
+    Extract required years of experience (e.g. "5+ years") from text
+    
+    Returns:
+        Smallest number of years mentioned, or NaN if none
+    """
+    if not text:
+        return np.nan
+    years = [int(y) for y in _EXPERIENCE_RE.findall(text)]
+    return float(min(years)) if years else np.nan
+
+
+def job_is_remote(job: JobLike) -> bool:
+    """Whether a job is remote (explicit flag, or "remote" in location/title)"""
+    if isinstance(job, JobRecord):
+        return job.is_remote
+    if 'is_remote' in job:
+        return bool(job['is_remote'])
+    text = f"{job.get('location', '')} {job.get('title', '')}".lower()
+    return 'remote' in text
+
+
+def job_salary_range(job: JobLike) -> Tuple[float, float]:
+    """Salary bounds from salary_min/salary_max, else parsed from 'salary'"""
+    if isinstance(job, JobRecord):
+        if job.salary_min is None:
+            return np.nan, np.nan
+        return job.salary_min, job.salary_max
+    low, high = job.get('salary_min'), job.get('salary_max')
+    if low or high:
+        low = float(low) if low else float(high)
+        high = float(high) if high else float(low)
+        return low, high
+    return parse_salary(job.get('salary'))
+
+
+def job_experience_years(job: JobLike) -> float:
+    """Required years from 'experience_years', else parsed from the description"""
+    years = job.get('experience_years')
+    if years is not None:
+        return float(years)
+    return parse_experience_years(job.get('description'))
+
+
+def job_skills(job: JobLike) -> Set[str]:
+    """Required skills from 'skills', else extracted from the description"""
+    skills = job.get('skills') or job.get('required_skills')
+    if skills:
+        return {s.lower().strip() for s in skills}
+    # Taxonomy is compiled on first use and cached by load_skill_matcher
+    return set(load_skill_matcher().extract(job.get('description', '') or ''))
+
+
+def job_location_key(job: JobLike) -> str:
+    """Normalized location of a job"""
+    if isinstance(job, JobRecord):
+        return job.location_key
+    return normalize_location(job.get('location'))
+
+
+def job_company_key(job: JobLike) -> str:
+    """Normalized company of a job"""
+    if isinstance(job, JobRecord):
+        return job.company_key
+    return normalize_company(job.get('company'))
+
+
+def pack_skills(skills: Iterable[str], vocabulary: Dict[str, int]) -> np.ndarray:
+    """
+    Pack skills into a bitset over a vocabulary
+    
+    Args:
+        skills: Skill names
+        vocabulary: Skill -> bit position
+        
+    Returns:
+        uint8 array of ceil(len(vocabulary) / 8) bytes
+    """
+    bits = np.zeros(max(len(vocabulary), 1), dtype=bool)
+    for skill in skills:
+        position = vocabulary.get(skill.lower().strip())
+        if position is not None:
+            bits[position] = True
+    return np.packbits(bits)
+
+
+def popcount(bitsets: np.ndarray) -> np.ndarray:
+    """Number of set bits per row of a packed bitset matrix"""
+    return _POPCOUNT[bitsets].sum(axis=-1, dtype=np.int32)
+
+
+@dataclass
+class JobFeatures:
+    """
+    Struct-of-arrays view of a job batch.
+    
+    Every array has one entry per job; the batch is parsed once and can
+    then be scored against any number of profiles.
+    
+    Attributes:
+        salary_min: Lower salary bound (NaN if unknown)
+        salary_max: Upper salary bound (NaN if unknown)
+        is_remote: Remote flag
+        experience_years: Required years of experience (NaN if unknown)
+        skill_bits: Packed bitsets of required skills over ``skill_vocabulary``
+        skill_counts: Number of required skills per job
+        locations: Normalized location strings
+        companies: Normalized company names
+        titles: Raw job titles
+        skill_vocabulary: Skill -> bit position
+    """
+    salary_min: np.ndarray
+    salary_max: np.ndarray
+    is_remote: np.ndarray
+    experience_years: np.ndarray
+    skill_bits: np.ndarray
+    skill_counts: np.ndarray
+    locations: np.ndarray
+    companies: np.ndarray
+    titles: List[str]
+    skill_vocabulary: Dict[str, int]
+    
+    def __len__(self) -> int:
+        """Number of jobs in the batch"""
+        return len(self.salary_min)
+    
+    def take(self, indices: np.ndarray) -> "JobFeatures":
+        """
+        Select a subset of jobs (e.g. those surviving the deal-breaker prefilter)
+        
+        Args:
+            indices: Row indices to keep
+            
+        Returns:
+            JobFeatures with the selected rows (the skill vocabulary is shared)
+        """
+        return JobFeatures(
+            salary_min=self.salary_min[indices],
+            salary_max=self.salary_max[indices],
+            is_remote=self.is_remote[indices],
+            experience_years=self.experience_years[indices],
+            skill_bits=self.skill_bits[indices],
+            skill_counts=self.skill_counts[indices],
+            locations=self.locations[indices],
+            companies=self.companies[indices],
+            titles=[self.titles[i] for i in indices],
+            skill_vocabulary=self.skill_vocabulary,
+        )
+    
+    @classmethod
+    def from_jobs(cls, jobs: Sequence[JobLike]) -> "JobFeatures":
+        """
+        Parse a batch of jobs
+        
+        Args:
+            jobs: JobRecords, or job dicts as emitted by the adapters
+            
+        Returns:
+            JobFeatures for the batch
+        """
+        salaries = [job_salary_range(job) for job in jobs]
+        skills = [job_skills(job) for job in jobs]
+        
+        vocabulary: Dict[str, int] = {}
+        for job_skill_set in skills:
+            for skill in sorted(job_skill_set):
+                vocabulary.setdefault(skill, len(vocabulary))
+        
+        width = (max(len(vocabulary), 1) + 7) // 8
+        skill_bits = np.zeros((len(jobs), width), dtype=np.uint8)
+        for row, job_skill_set in enumerate(skills):
+            skill_bits[row] = pack_skills(job_skill_set, vocabulary)
+        
+        return cls(
+            salary_min=np.array([s[0] for s in salaries], dtype=np.float64),
+            salary_max=np.array([s[1] for s in salaries], dtype=np.float64),
+            is_remote=np.array([job_is_remote(job) for job in jobs], dtype=bool),
+            experience_years=np.array(
+                [job_experience_years(job) for job in jobs], dtype=np.float64
+            ),
+            skill_bits=skill_bits,
+            skill_counts=np.array([len(s) for s in skills], dtype=np.int32),
+            locations=np.array([job_location_key(job) for job in jobs], dtype=str),
+            companies=np.array([job_company_key(job) for job in jobs], dtype=str),
+            titles=[job.get('title', '') or '' for job in jobs],
+            skill_vocabulary=vocabulary,
+        )
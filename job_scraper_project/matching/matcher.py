@@ -2,10 +2,29 @@
 Job Matcher - Main matching engine for job-to-profile matching
 """
 
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
-from matching.scoring import MatchScore
-from matching.deal_breakers import DealBreakerChecker
+
+import numpy as np
+import yaml
+
+from core.job_record import JobLike
+from matching.scoring import BatchMatchScores, MatchScore, explain_score
+from matching.deal_breakers import DealBreakerChecker, ProfileIndex
+from matching.embeddings import TextEmbedder
+from matching.retrieval import JobIndex
+from matching.features import (
+    JobFeatures,
+    job_experience_years,
+    job_is_remote,
+    job_location_key,
+    job_salary_range,
+    job_skills,
+    normalize_location,
+    pack_skills,
+    popcount,
+)
 
 
 @dataclass
@@ -31,6 +50,71 @@ class UserProfile:
             self.blacklisted_companies = []
 
 
+# Fixed scores until company and requirement matching are implemented
+_COMPANY_SCORE = 70.0
+_REQUIREMENTS_SCORE = 95.0
+
+# Highest score each dimension can produce, used as retrieval upper bounds
+_DIMENSION_MAX = {
+    'title_match': 100.0,
+    'skills_match': 100.0,
+    'location_match': 100.0,
+    'salary_match': 100.0,
+    'experience_match': 100.0,
+    'company_match': _COMPANY_SCORE,
+    'requirements_met': _REQUIREMENTS_SCORE,
+}
+
+
+# Dimension formulas shared by the per-job and batch paths. Each accepts
+# scalars or NumPy arrays; unknown job values (NaN) get a neutral score.
+
+def _title_scores_from_similarity(similarity):
+    """Best cosine similarity to any target title, scaled to 0-100"""
+    similarity = np.asarray(similarity, dtype=np.float64)
+    if similarity.shape[-1] == 0:
+        return np.full(similarity.shape[:-1], 75.0)
+    return 100.0 * np.clip(similarity.max(axis=-1), 0.0, 1.0)
+
+
+def _skills_scores(matched, required):
+    """Share of required skills the user has (neutral 80 when none are listed)"""
+    required = np.asarray(required, dtype=np.float64)
+    return np.where(required == 0, 80.0, 100.0 * np.asarray(matched) / np.maximum(required, 1))
+
+
+def _location_scores(is_remote, location_match, preference: str):
+    """Remote/location compatibility for the user's remote preference"""
+    if preference == 'remote_only':
+        return np.where(is_remote, 100.0, 20.0)
+    if preference == 'on_site':
+        return np.where(location_match, 100.0, np.where(is_remote, 70.0, 40.0))
+    return np.where(is_remote | np.asarray(location_match), 100.0, 50.0)
+
+
+def _salary_scores(job_max, profile_min: int):
+    """How much of the user's minimum salary the job's upper bound covers"""
+    job_max = np.asarray(job_max, dtype=np.float64)
+    if profile_min <= 0:
+        return np.where(np.isnan(job_max), 85.0, 100.0)
+    with np.errstate(invalid='ignore'):
+        ratio = np.clip(job_max / profile_min, 0.0, 1.0)
+    return np.where(np.isnan(job_max), 85.0, 100.0 * ratio)
+
+
+def _experience_scores(required_years, user_years: int):
+    """Penalize 20 points per missing year of required experience"""
+    required_years = np.asarray(required_years, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        score = np.clip(100.0 - 20.0 * np.maximum(required_years - user_years, 0.0), 0.0, 100.0)
+    return np.where(np.isnan(required_years), 88.0, score)
+
+
+def _profile_city(profile: "UserProfile") -> str:
+    """Normalized city part of the user's location"""
+    return normalize_location((profile.location or '').split(',')[0])
+
+
 class JobMatcher:
     """
     Intelligent job matching engine with multi-dimensional scoring.
@@ -51,9 +135,17 @@ class JobMatcher:
         ...     print(f"Great match! Score: {score.overall_score}")
     """
     
-    def __init__(self):
-        """Initialize the job matcher"""
+    def __init__(self, embedder: Optional[TextEmbedder] = None):
+        """
+        Initialize the job matcher
+        
+        Args:
+            embedder: Text embedder for title similarity (defaults to an
+                in-memory hashing embedder)
+        """
         self.deal_breaker_checker = DealBreakerChecker()
+        self.embedder = embedder or TextEmbedder()
+        self.job_index: Optional[JobIndex] = None
         self.weights = {
             'title_match': 0.25,
             'skills_match': 0.30,
@@ -64,9 +156,27 @@ class JobMatcher:
             'requirements_met': 0.05
         }
     
+    @classmethod
+    def from_config(cls, config_path: str = "config/matching.yaml") -> "JobMatcher":
+        """
+        Create a matcher from the ``semantic_matching`` config section
+        
+        Args:
+            config_path: Path to matching configuration file
+            
+        Returns:
+            Configured matcher (defaults if the file is missing)
+        """
+        path = Path(config_path)
+        settings: Dict[str, Any] = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = (yaml.safe_load(f) or {}).get('semantic_matching', {}) or {}
+        return cls(embedder=TextEmbedder.from_settings(settings))
+    
     def calculate_match_score(
         self,
-        job: Dict[str, Any],
+        job: JobLike,
         user_profile: UserProfile
     ) -> MatchScore:
         """
@@ -109,49 +219,276 @@ class JobMatcher:
             explanation=self._generate_explanation(scores, overall)
         )
     
-    def _score_title_match(self, job: Dict[str, Any], profile: UserProfile) -> float:
+    def score_batch(
+        self,
+        jobs: Union[Sequence[JobLike], JobFeatures],
+        user_profile: UserProfile
+    ) -> BatchMatchScores:
+        """
+        Score a batch of jobs against one profile with array operations
+        
+        Jobs are parsed once into feature arrays (salary bounds, remote flag,
+        experience years, skill bitsets); every dimension and the weighted
+        total are then computed for the whole batch at once. Deal-breakers
+        are applied first as boolean masks, so rejected jobs are never
+        scored. Pass a
+        ``JobFeatures`` to reuse parsed features across profiles.
+        
+        Args:
+            jobs: JobRecords, job dicts or pre-parsed JobFeatures
+            user_profile: User profile
+            
+        Returns:
+            BatchMatchScores with one row per job
+        """
+        features = jobs if isinstance(jobs, JobFeatures) else JobFeatures.from_jobs(jobs)
+        return self._score_features(features, user_profile)
+    
+    def index_jobs(
+        self,
+        jobs: Union[Sequence[JobLike], JobFeatures],
+        title_search: bool = True
+    ) -> JobIndex:
+        """
+        Build the retrieval index used by :meth:`top_k`
+        
+        Args:
+            jobs: Job pool as JobRecords, dicts or pre-parsed JobFeatures
+            title_search: Embed distinct titles for tighter title bounds
+            
+        Returns:
+            The index (also kept as ``self.job_index``)
+        """
+        self.job_index = JobIndex(jobs, embedder=self.embedder if title_search else None)
+        return self.job_index
+    
+    def top_k(
+        self,
+        user_profile: UserProfile,
+        k: int = 10,
+        threshold: float = 0.0,
+        index: Optional[JobIndex] = None,
+        chunk_size: int = 1024
+    ) -> List[Tuple[int, MatchScore]]:
+        """
+        Best-matching jobs of an indexed pool without scoring the whole pool
+        
+        Every job gets an upper bound on its overall score: exact skills and
+        title scores (from the posting lists and the distinct-title vectors)
+        plus the maximum of every other dimension. Jobs sharing a profile
+        skill are bounded individually; the rest are bounded per title group.
+        Candidates are fully scored in descending bound order, in chunks,
+        until no remaining bound can beat the current k-th best score.
+        
+        Args:
+            user_profile: User profile
+            k: Number of jobs to return
+            threshold: Minimum overall score
+            index: Job index (defaults to the one built by :meth:`index_jobs`)
+            chunk_size: Jobs scored per batch
+            
+        Returns:
+            List of (job index, MatchScore) tuples, best first
+            
+        Raises:
+            ValueError: If no index was given or built
+        """
+        index = index or self.job_index
+        if index is None:
+            raise ValueError("No job index; call index_jobs() first")
+        if k <= 0 or not len(index):
+            return []
+        
+        profile = user_profile
+        weights = self.weights
+        rest_bound = sum(
+            weight * _DIMENSION_MAX[name] for name, weight in weights.items()
+            if name not in ('title_match', 'skills_match')
+        )
+        
+        similarity = index.title_similarity(profile.target_titles)
+        if similarity is None:
+            title_bounds = np.full(len(index.titles), _DIMENSION_MAX['title_match'])
+        else:
+            title_bounds = _title_scores_from_similarity(similarity)
+        
+        # Jobs sharing a profile skill: exact skills score per job
+        hit_jobs, matched = index.skill_matches(profile.skills)
+        hit_bounds = (
+            weights['skills_match'] * _skills_scores(matched, index.features.skill_counts[hit_jobs])
+            + weights['title_match'] * title_bounds[index.job_titles[hit_jobs]]
+            + rest_bound
+        )
+        # Other jobs score 0 on skills if they list any, else the neutral score
+        group_ids = np.arange(index.num_groups)
+        group_skills = np.where(group_ids % 2 == 1, 0.0, _skills_scores(0, 0))
+        group_bounds = (
+            weights['skills_match'] * group_skills
+            + weights['title_match'] * title_bounds[group_ids // 2]
+            + rest_bound
+        )
+        
+        bounds = np.concatenate([hit_bounds, group_bounds])
+        order = np.argsort(-bounds, kind="stable")
+        in_hits = np.zeros(len(index), dtype=bool)
+        in_hits[hit_jobs] = True
+        
+        scored_jobs: List[np.ndarray] = []
+        scored: List[BatchMatchScores] = []
+        best = np.zeros(0)
+        pending: List[np.ndarray] = []
+        pending_size = 0
+        
+        def flush() -> None:
+            nonlocal best, pending, pending_size
+            jobs = np.concatenate(pending)
+            pending, pending_size = [], 0
+            title_scores = None if similarity is None else title_bounds[index.job_titles[jobs]]
+            batch = self._score_features(index.features.take(jobs), profile, title_scores)
+            scored_jobs.append(jobs)
+            scored.append(batch)
+            keep = batch.overall_scores[~batch.is_dealbreaker]
+            best = np.sort(np.concatenate([best, keep[keep >= threshold]]))[::-1][:k]
+        
+        for block in order:
+            # Small tolerance so float rounding never prunes a tying job
+            bound = bounds[block] + 1e-9
+            if bound < threshold or (len(best) >= k and bound <= best[-1]):
+                break
+            if block < len(hit_jobs):
+                members = hit_jobs[block:block + 1]
+            else:
+                members = index.group(block - len(hit_jobs))
+                members = members[~in_hits[members]]
+            for start in range(0, len(members), chunk_size):
+                pending.append(members[start:start + chunk_size])
+                pending_size += len(pending[-1])
+                if pending_size >= chunk_size:
+                    flush()
+                    if len(best) >= k and bound <= best[-1]:
+                        break
+        if pending:
+            flush()
+        
+        candidates = [
+            (int(jobs[row]), batch, row)
+            for jobs, batch in zip(scored_jobs, scored)
+            for row in np.flatnonzero(
+                ~batch.is_dealbreaker & (batch.overall_scores >= threshold)
+            )
+        ]
+        candidates.sort(key=lambda c: (-c[1].overall_scores[c[2]], c[0]))
+        return [(job, batch[row]) for job, batch, row in candidates[:k]]
+    
+    def _score_features(
+        self,
+        features: JobFeatures,
+        profile: UserProfile,
+        title_scores: Optional[np.ndarray] = None
+    ) -> BatchMatchScores:
+        """
+        Score parsed jobs against one profile
+        
+        Args:
+            features: Parsed job batch
+            profile: User profile
+            title_scores: Precomputed title scores per job (computed if omitted)
+            
+        Returns:
+            BatchMatchScores with one row per job
+        """
+        n = len(features)
+        
+        # Deal-breakers first, so only surviving jobs reach dimension scoring
+        prefilter = self.deal_breaker_checker.prefilter(
+            features, ProfileIndex.from_profile(profile)
+        )
+        survivors = np.flatnonzero(prefilter.passed)
+        candidates = features if len(survivors) == n else features.take(survivors)
+        
+        profile_bits = pack_skills(profile.skills, candidates.skill_vocabulary)
+        matched = popcount(candidates.skill_bits & profile_bits)
+        city = _profile_city(profile)
+        if city and len(candidates):
+            location_match = np.char.find(candidates.locations, city) >= 0
+        else:
+            location_match = np.zeros(len(candidates), dtype=bool)
+        
+        candidate_scores = {
+            'title_match': (
+                self._title_scores(candidates, profile) if title_scores is None
+                else title_scores[survivors]
+            ),
+            'skills_match': _skills_scores(matched, candidates.skill_counts),
+            'location_match': _location_scores(
+                candidates.is_remote, location_match, profile.remote_preference
+            ),
+            'salary_match': _salary_scores(candidates.salary_max, profile.salary_min),
+            'experience_match': _experience_scores(
+                candidates.experience_years, profile.experience_years
+            ),
+            'company_match': np.full(len(candidates), _COMPANY_SCORE),
+            'requirements_met': np.full(len(candidates), _REQUIREMENTS_SCORE),
+        }
+        
+        # Scatter back to full batch size; deal-breaker rows stay at 0
+        breakdown = {}
+        overall = np.zeros(n, dtype=np.float64)
+        for name, weight in self.weights.items():
+            scores = np.zeros(n, dtype=np.float64)
+            scores[survivors] = candidate_scores[name]
+            breakdown[name] = scores
+            overall += weight * scores
+        
+        return BatchMatchScores(
+            overall_scores=overall,
+            breakdown=breakdown,
+            is_dealbreaker=~prefilter.passed,
+            prefilter_counts=prefilter.eliminated
+        )
+    
+    def _title_scores(self, features: JobFeatures, profile: UserProfile) -> np.ndarray:
+        """Batch title scores (each distinct title is embedded once)"""
+        if not len(features):
+            return np.zeros(0)
+        similarity = self.embedder.similarity(features.titles, profile.target_titles)
+        return _title_scores_from_similarity(similarity)
+    
+    def _score_title_match(self, job: JobLike, profile: UserProfile) -> float:
         """Score job title match using semantic similarity"""
-        # TODO: Implement using sentence transformers
-        return 75.0
+        similarity = self.embedder.similarity([job.get('title', '') or ''], profile.target_titles)
+        return float(_title_scores_from_similarity(similarity)[0])
     
-    def _score_skills_match(self, job: Dict[str, Any], profile: UserProfile) -> float:
+    def _score_skills_match(self, job: JobLike, profile: UserProfile) -> float:
         """Score required skills match"""
-        # TODO: Extract required skills from job description
-        # TODO: Compare with user's skills
-        return 80.0
+        required = job_skills(job)
+        user_skills = {s.lower().strip() for s in profile.skills}
+        return float(_skills_scores(len(required & user_skills), len(required)))
     
-    def _score_location_match(self, job: Dict[str, Any], profile: UserProfile) -> float:
+    def _score_location_match(self, job: JobLike, profile: UserProfile) -> float:
         """Score location compatibility"""
-        # TODO: Implement location matching logic
-        return 90.0
+        city = _profile_city(profile)
+        location_match = bool(city) and city in job_location_key(job)
+        return float(_location_scores(job_is_remote(job), location_match, profile.remote_preference))
     
-    def _score_salary_match(self, job: Dict[str, Any], profile: UserProfile) -> float:
+    def _score_salary_match(self, job: JobLike, profile: UserProfile) -> float:
         """Score salary range alignment"""
-        # TODO: Implement salary matching
-        return 85.0
+        return float(_salary_scores(job_salary_range(job)[1], profile.salary_min))
     
-    def _score_experience_match(self, job: Dict[str, Any], profile: UserProfile) -> float:
+    def _score_experience_match(self, job: JobLike, profile: UserProfile) -> float:
         """Score experience level match"""
-        # TODO: Implement experience matching
-        return 88.0
+        return float(_experience_scores(job_experience_years(job), profile.experience_years))
     
-    def _score_company_match(self, job: Dict[str, Any], profile: UserProfile) -> float:
+    def _score_company_match(self, job: JobLike, profile: UserProfile) -> float:
         """Score company preferences"""
         # TODO: Implement company matching
-        return 70.0
+        return _COMPANY_SCORE
     
-    def _score_requirements_met(self, job: Dict[str, Any], profile: UserProfile) -> float:
+    def _score_requirements_met(self, job: JobLike, profile: UserProfile) -> float:
         """Score requirements fulfillment"""
         # TODO: Check education, certifications, etc.
-        return 95.0
+        return _REQUIREMENTS_SCORE
     
     def _generate_explanation(self, scores: Dict[str, float], overall: float) -> str:
         """Generate human-readable match explanation"""
-        if overall >= 90:
-            return "Excellent match! Highly recommended to apply."
-        elif overall >= 75:
-            return "Strong match with good alignment on key criteria."
-        elif overall >= 60:
-            return "Good match, but some gaps in requirements."
-        else:
-            return "Moderate match, consider if expanding search."
+        return explain_score(overall)
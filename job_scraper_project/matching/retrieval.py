@@ -0,0 +1,118 @@
+"""
+Job Index - Inverted index over a job pool for top-K retrieval
+"""
+
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.job_record import JobLike
+from matching.embeddings import TextEmbedder, normalize_text
+from matching.features import JobFeatures
+
+
+class JobIndex:
+    """
+    Retrieval structures over a fixed job pool, built once and shared by
+    every profile queried against it.
+    
+    - Skill posting lists: for each skill in the pool vocabulary, the
+      sorted indices of the jobs requiring it.
+    - Title groups: jobs bucketed by normalized title (and whether they
+      list any skills), so a title score is computed once per distinct
+      title instead of once per job.
+    - Title vectors (optional): one embedding per distinct title, so the
+      title score of every group is a single matrix product.
+      
+    Example:
+        >>> index = JobIndex(jobs, embedder=matcher.embedder)
+        >>> matcher.top_k(profile, k=20, index=index)
+    """
+    
+    def __init__(
+        self,
+        jobs: Union[Sequence[JobLike], JobFeatures],
+        embedder: Optional[TextEmbedder] = None
+    ):
+        """
+        Build the index
+        
+        Args:
+            jobs: JobRecords, job dicts or pre-parsed JobFeatures
+            embedder: Embedder for title-vector search (None to skip it, in
+                which case title scores are bounded by 100)
+        """
+        self.features = jobs if isinstance(jobs, JobFeatures) else JobFeatures.from_jobs(jobs)
+        self.embedder = embedder
+        n = len(self.features)
+        
+        # Skill posting lists in CSR form: skill bit -> job indices
+        postings = []
+        for position in range(len(self.features.skill_vocabulary)):
+            column = self.features.skill_bits[:, position >> 3]
+            postings.append(np.flatnonzero(column & (0x80 >> (position & 7))))
+        self._posting_ptr = np.zeros(len(postings) + 1, dtype=np.int64)
+        if postings:
+            np.cumsum([len(p) for p in postings], out=self._posting_ptr[1:])
+            self._postings = np.concatenate(postings).astype(np.int64)
+        else:
+            self._postings = np.zeros(0, dtype=np.int64)
+        
+        # Distinct normalized titles
+        title_ids: Dict[str, int] = {}
+        job_titles = np.empty(n, dtype=np.int64)
+        for row, title in enumerate(self.features.titles):
+            job_titles[row] = title_ids.setdefault(normalize_text(title), len(title_ids))
+        self.titles = list(title_ids)
+        self.job_titles = job_titles
+        self.title_vectors = embedder.embed(self.titles) if embedder is not None else None
+        
+        # Group jobs by (title, has skills) so a group shares one upper bound
+        group_ids = job_titles * 2 + (self.features.skill_counts > 0)
+        self._group_order = np.argsort(group_ids, kind="stable")
+        self._group_ptr = np.searchsorted(
+            group_ids[self._group_order], np.arange(2 * len(self.titles) + 1)
+        )
+    
+    def __len__(self) -> int:
+        """Number of indexed jobs"""
+        return len(self.features)
+    
+    @property
+    def num_groups(self) -> int:
+        """Number of (title, has skills) groups"""
+        return 2 * len(self.titles)
+    
+    def skill_matches(self, skills: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Jobs requiring at least one of the given skills
+        
+        Args:
+            skills: Skill names
+            
+        Returns:
+            Tuple of (job indices, number of the skills each job requires)
+        """
+        vocabulary = self.features.skill_vocabulary
+        positions = {vocabulary.get(s.lower().strip()) for s in skills} - {None}
+        if not positions:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        hits = np.concatenate([
+            self._postings[self._posting_ptr[p]:self._posting_ptr[p + 1]] for p in positions
+        ])
+        return np.unique(hits, return_counts=True)
+    
+    def title_similarity(self, target_titles: Sequence[str]) -> Optional[np.ndarray]:
+        """
+        Cosine similarity of every distinct title to the target titles
+        
+        Returns:
+            Array of shape (distinct titles, targets), or None without title vectors
+        """
+        if self.title_vectors is None:
+            return None
+        return self.title_vectors @ self.embedder.embed(target_titles).T
+    
+    def group(self, group_id: int) -> np.ndarray:
+        """Job indices in group ``2 * title id + has skills``"""
+        return self._group_order[self._group_ptr[group_id]:self._group_ptr[group_id + 1]]
@@ -2,9 +2,11 @@
 Match Scoring - Data structures and utilities for match scores
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict
 
+import numpy as np
+
 
 @dataclass
 class MatchScore:
@@ -48,3 +50,76 @@ class MatchScore:
             'explanation': self.explanation,
             'risk_level': self.get_risk_level()
         }
+
+
+def explain_score(overall: float) -> str:
+    """Generate human-readable match explanation for an overall score"""
+    if overall >= 90:
+        return "Excellent match! Highly recommended to apply."
+    elif overall >= 75:
+        return "Strong match with good alignment on key criteria."
+    elif overall >= 60:
+        return "Good match, but some gaps in requirements."
+    else:
+        return "Moderate match, consider if expanding search."
+
+
+@dataclass
+class BatchMatchScores:
+    """
+    Match scores for a batch of jobs as parallel arrays.
+    
+    Row ``i`` of every array belongs to job ``i`` of the scored batch.
+    Individual ``MatchScore`` objects are only built on access.
+    
+    Attributes:
+        overall_scores: Weighted overall score per job (0 for deal-breakers)
+        breakdown: Dimension name -> score array
+        is_dealbreaker: Deal-breaker flag per job
+        prefilter_counts: Deal-breaker rule -> number of jobs it eliminated
+    """
+    overall_scores: np.ndarray
+    breakdown: Dict[str, np.ndarray]
+    is_dealbreaker: np.ndarray
+    prefilter_counts: Dict[str, int] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        """Number of scored jobs"""
+        return len(self.overall_scores)
+    
+    def __getitem__(self, index: int) -> MatchScore:
+        """Materialize the MatchScore for one job"""
+        if self.is_dealbreaker[index]:
+            return MatchScore(
+                overall_score=0,
+                breakdown={},
+                is_dealbreaker=True,
+                explanation="Job has deal-breaker criteria"
+            )
+        overall = float(self.overall_scores[index])
+        return MatchScore(
+            overall_score=overall,
+            breakdown={name: float(scores[index]) for name, scores in self.breakdown.items()},
+            is_dealbreaker=False,
+            explanation=explain_score(overall)
+        )
+    
+    def top(self, k: int, threshold: float = 0.0) -> np.ndarray:
+        """
+        Indices of the best-scoring jobs, best first
+        
+        Args:
+            k: Maximum number of jobs
+            threshold: Minimum overall score
+            
+        Returns:
+            Array of job indices (deal-breakers excluded)
+        """
+        if k <= 0:
+            return np.array([], dtype=np.intp)
+        eligible = np.flatnonzero(~self.is_dealbreaker & (self.overall_scores >= threshold))
+        if len(eligible) > k:
+            part = np.argpartition(-self.overall_scores[eligible], k - 1)[:k]
+            eligible = eligible[part]
+        order = np.argsort(-self.overall_scores[eligible], kind="stable")
+        return eligible[order]
@@ -2,7 +2,45 @@
 ATS Scorer - Scores resume ATS compatibility
 """
 
-from typing import Dict, Any, List
+import hashlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, List, Optional, Sequence
+
+import numpy as np
+
+from optimization.keyword_extractor import KeywordExtractor
+from optimization.resume_document import ResumeDocument, ResumeSection
+from optimization.tfidf import document_terms
+
+STANDARD_SECTIONS = ['experience', 'education', 'skills', 'summary', 'objective']
+
+
+@dataclass(frozen=True)
+class ResumeAnalysis:
+    """
+    Resume-side results, computed once and reused for every job.
+    
+    Attributes:
+        terms: Resume unigrams and bigrams plus canonical skills found
+        word_count: Number of words in the resume
+        format_score: Format compatibility score (0-100)
+        sections_score: Section header score (0-100)
+    """
+    terms: FrozenSet[str]
+    word_count: int
+    format_score: float
+    sections_score: float
+
+
+def keyword_coverage_scores(coverage) -> np.ndarray:
+    """
+    Score the share of job keywords found in the resume (target 40-60%)
+    
+    Coverage below 40% scales linearly; reaching the target range scores 100.
+    """
+    coverage = np.asarray(coverage, dtype=np.float64)
+    return np.minimum(100.0 * coverage / 0.4, 100.0)
 
 
 class ATSScorer:
@@ -13,9 +51,24 @@ class ATSScorer:
     format compatibility, and structural elements.
     """
     
-    def __init__(self):
-        """Initialize ATS scorer"""
-        pass
+    def __init__(
+        self,
+        keyword_extractor: Optional[KeywordExtractor] = None,
+        max_job_keywords: int = 20,
+        cache_size: int = 32
+    ):
+        """
+        Initialize ATS scorer
+        
+        Args:
+            keyword_extractor: Extractor for job keywords and skills
+            max_job_keywords: TF-IDF keywords taken from each job description
+            cache_size: Resume analyses kept in memory
+        """
+        self.keyword_extractor = keyword_extractor or KeywordExtractor()
+        self.max_job_keywords = max_job_keywords
+        self.cache_size = cache_size
+        self._analysis_cache: "OrderedDict[bytes, ResumeAnalysis]" = OrderedDict()
     
     def score_resume(
         self,
@@ -32,25 +85,136 @@ class ATSScorer:
         Returns:
             Score breakdown and suggestions
         """
-        scores = {}
+        analysis = self.analyze_resume(resume_text)
+        return self._score_jobs(analysis, [self.job_keywords(job_description)])[0]
+    
+    def score_many(
+        self,
+        resume_text: str,
+        job_descriptions: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Score one resume against many job descriptions
         
-        # Keyword density (target 40-60%)
-        scores['keyword_density'] = self._score_keyword_density(
-            resume_text, job_description
+        The resume is analyzed once; keyword coverage for all jobs is then
+        computed with array operations over a shared keyword vocabulary.
+        
+        Args:
+            resume_text: Resume content
+            job_descriptions: Job descriptions
+            
+        Returns:
+            Results as from :meth:`score_resume` plus ``job_index`` (the
+            position in ``job_descriptions``), best overall score first
+        """
+        analysis = self.analyze_resume(resume_text)
+        results = self._score_jobs(
+            analysis, [self.job_keywords(description) for description in job_descriptions]
         )
+        for index, result in enumerate(results):
+            result['job_index'] = index
+        results.sort(key=lambda result: -result['overall_score'])
+        return results
+    
+    def analyze_resume(self, resume_text: str) -> ResumeAnalysis:
+        """
+        Tokenize and run the resume-side checks (cached per resume text)
         
-        # Format compatibility
-        scores['format'] = self._score_format(resume_text)
+        Args:
+            resume_text: Resume content
+            
+        Returns:
+            ResumeAnalysis for the resume
+        """
+        key = hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).digest()
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            self._analysis_cache.move_to_end(key)
+            return analysis
         
-        # Section headers
-        scores['sections'] = self._score_sections(resume_text)
+        terms = set(document_terms(resume_text))
+        terms.update(self.keyword_extractor.extract_skills(resume_text))
+        analysis = ResumeAnalysis(
+            terms=frozenset(terms),
+            word_count=len(resume_text.split()),
+            format_score=self._score_format(resume_text),
+            sections_score=self._score_sections(resume_text)
+        )
+        self._analysis_cache[key] = analysis
+        if len(self._analysis_cache) > self.cache_size:
+            self._analysis_cache.popitem(last=False)
+        return analysis
+    
+    def job_keywords(self, job_description: str) -> List[str]:
+        """
+        Keywords an ATS would look for: taxonomy skills, then top TF-IDF terms
         
-        # Overall score
-        overall = sum(scores.values()) / len(scores)
+        Args:
+            job_description: Job description
+            
+        Returns:
+            Unique keywords
+        """
+        keywords = dict.fromkeys(self.keyword_extractor.extract_skills(job_description))
+        for keyword in self.keyword_extractor.extract_keywords(
+            job_description, self.max_job_keywords
+        ):
+            keywords.setdefault(keyword['keyword'], None)
+        return list(keywords)
+    
+    def _score_jobs(
+        self,
+        analysis: ResumeAnalysis,
+        keyword_lists: List[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Score a resume analysis against the keyword lists of several jobs
         
+        Args:
+            analysis: Resume analysis
+            keyword_lists: Keywords per job
+            
+        Returns:
+            One result per job, in input order
+        """
+        vocabulary: Dict[str, int] = {}
+        ids = np.array(
+            [vocabulary.setdefault(kw, len(vocabulary)) for kws in keyword_lists for kw in kws],
+            dtype=np.int64
+        )
+        totals = np.array([len(kws) for kws in keyword_lists], dtype=np.int64)
+        owners = np.repeat(np.arange(len(keyword_lists)), totals)
+        
+        present = np.fromiter(
+            (term in analysis.terms for term in vocabulary), dtype=bool, count=len(vocabulary)
+        )
+        hits = present[ids]
+        matched = np.bincount(owners, weights=hits, minlength=len(keyword_lists))
+        coverage = matched / np.maximum(totals, 1)
+        keyword_scores = np.where(totals > 0, keyword_coverage_scores(coverage), 85.0)
+        
+        results = []
+        start = 0
+        for job, kws in enumerate(keyword_lists):
+            scores = {
+                'keyword_density': float(keyword_scores[job]),
+                'format': analysis.format_score,
+                'sections': analysis.sections_score,
+            }
+            job_hits = hits[start:start + len(kws)]
+            start += len(kws)
+            results.append(
+                self._build_result(scores, [kw for kw, hit in zip(kws, job_hits) if not hit])
+            )
+        return results
+    
+    def _build_result(self, scores: Dict[str, float], missing: List[str]) -> Dict[str, Any]:
+        """Assemble the result dict for one job from its dimension scores"""
+        overall = sum(scores.values()) / len(scores)
         return {
             'overall_score': overall,
             'breakdown': scores,
+            'missing_keywords': missing,
             'suggestions': self._generate_suggestions(scores),
             'pass_threshold': overall >= 75.0
         }
@@ -65,11 +229,10 @@ class ATSScorer:
         
         Returns score 0-100
         """
-        # TODO: Implement keyword density scoring
-        # - Extract keywords from job description
-        # - Calculate density in resume
-        # - Score based on 40-60% target range
-        return 85.0
+        analysis = self.analyze_resume(resume_text)
+        return self._score_jobs(
+            analysis, [self.job_keywords(job_description)]
+        )[0]['breakdown']['keyword_density']
     
     def _score_format(self, resume_text: str) -> float:
         """
@@ -77,6 +240,10 @@ class ATSScorer:
         
         Returns score 0-100
         """
+        return max(0, 100 - (self._format_issues(resume_text) * 10))
+    
+    def _format_issues(self, resume_text: str) -> int:
+        """Count problematic formatting elements"""
         # Check for problematic elements
         issues = 0
         
@@ -85,7 +252,7 @@ class ATSScorer:
         # - Check for special characters
         # - Check for standard formatting
         
-        return max(0, 100 - (issues * 10))
+        return issues
     
     def _score_sections(self, resume_text: str) -> float:
         """
@@ -93,15 +260,10 @@ class ATSScorer:
         
         Returns score 0-100
         """
-        standard_sections = [
-            'experience', 'education', 'skills',
-            'summary', 'objective'
-        ]
-        
         text_lower = resume_text.lower()
-        found_sections = sum(1 for section in standard_sections if section in text_lower)
+        found_sections = sum(1 for section in STANDARD_SECTIONS if section in text_lower)
         
-        return (found_sections / len(standard_sections)) * 100
+        return (found_sections / len(STANDARD_SECTIONS)) * 100
     
     def _generate_suggestions(self, scores: Dict[str, float]) -> List[str]:
         """
@@ -131,3 +293,160 @@ class ATSScorer:
             )
         
         return suggestions
+
+
+@dataclass(frozen=True)
+class _LineStats:
+    """Contribution of one resume line to the ATS score"""
+    keywords: FrozenSet[str]
+    standard_sections: FrozenSet[str]
+    words: int
+    format_issues: int
+
+
+class IncrementalScore:
+    """
+    ATS score of a resume kept current while it is edited.
+    
+    Each line's contribution (job keywords it mentions, standard section
+    names, word count, format issues) is cached and summed into
+    document-wide counters. After an edit only the changed lines are
+    re-analyzed and their old contribution swapped for the new one, so
+    re-scoring a rewritten bullet costs one line's work, not the whole
+    resume's. Keywords and skills are matched within a line; a phrase
+    wrapped across a line break is not counted.
+    
+    Example:
+        >>> session = IncrementalScore(scorer, ResumeDocument.from_text(resume), job)
+        >>> session.set_line(2, 0, "- Deployed Django services on Kubernetes")
+        >>> session.score()['overall_score']
+    """
+    
+    def __init__(self, scorer: ATSScorer, document: ResumeDocument, job_description: str):
+        """
+        Analyze every line once
+        
+        Args:
+            scorer: ATS scorer providing keyword extraction and suggestions
+            document: Resume being edited (edited in place)
+            job_description: Job the resume is optimized for
+        """
+        self.scorer = scorer
+        self.document = document
+        self.keywords = scorer.job_keywords(job_description)
+        self._keyword_set = frozenset(self.keywords)
+        self._keyword_lines: Counter = Counter()
+        self._standard_sections: Counter = Counter()
+        self.word_count = 0
+        self._format_issues = 0
+        self._line_cache: Dict[str, _LineStats] = {}
+        self._stats: List[List[_LineStats]] = []
+        for section in document.sections:
+            self._stats.append(self._analyze_section(section))
+            for stats in self._stats[-1]:
+                self._apply(stats, 1)
+    
+    def _analyze(self, line: str) -> _LineStats:
+        """Compute (or reuse) the contribution of one line"""
+        stats = self._line_cache.get(line)
+        if stats is None:
+            terms = set(document_terms(line))
+            terms.update(self.scorer.keyword_extractor.extract_skills(line))
+            lowered = line.lower()
+            stats = _LineStats(
+                keywords=frozenset(terms & self._keyword_set),
+                standard_sections=frozenset(s for s in STANDARD_SECTIONS if s in lowered),
+                words=len(line.split()),
+                format_issues=self.scorer._format_issues(line)
+            )
+            if len(self._line_cache) >= 4096:
+                self._line_cache.clear()
+            self._line_cache[line] = stats
+        return stats
+    
+    def _analyze_section(self, section: ResumeSection) -> List[_LineStats]:
+        """Contributions of a section's heading and body lines"""
+        head = [section.heading] if section.heading is not None else []
+        return [self._analyze(line) for line in head + section.lines]
+    
+    def _apply(self, stats: _LineStats, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a line's contribution"""
+        for keyword in stats.keywords:
+            self._keyword_lines[keyword] += sign
+        for name in stats.standard_sections:
+            self._standard_sections[name] += sign
+        self.word_count += sign * stats.words
+        self._format_issues += sign * stats.format_issues
+    
+    def update_section(self, index: int) -> None:
+        """
+        Re-analyze a section after it was edited (or appended) in place
+        
+        Args:
+            index: Section index in ``document.sections``
+        """
+        new = self._analyze_section(self.document.sections[index])
+        if index < len(self._stats):
+            for stats in self._stats[index]:
+                self._apply(stats, -1)
+            self._stats[index] = new
+        else:
+            self._stats.append(new)
+        for stats in new:
+            self._apply(stats, 1)
+    
+    def remove_section(self, index: int) -> None:
+        """Delete a section and its contribution"""
+        for stats in self._stats.pop(index):
+            self._apply(stats, -1)
+        del self.document.sections[index]
+    
+    def set_line(self, index: int, line_number: int, text: str) -> None:
+        """
+        Replace one body line of a section (e.g. an edited bullet)
+        
+        Args:
+            index: Section index
+            line_number: Line index within the section body
+            text: New line text
+        """
+        section = self.document.sections[index]
+        section.lines[line_number] = text
+        position = line_number + (section.heading is not None)
+        stats = self._analyze(text)
+        self._apply(self._stats[index][position], -1)
+        self._stats[index][position] = stats
+        self._apply(stats, 1)
+    
+    def add_skills(self, skills: List[str]) -> None:
+        """Append skills to the skills section and re-score it"""
+        self.update_section(self.document.add_skills(skills))
+    
+    @property
+    def coverage(self) -> float:
+        """Share of job keywords present in the resume"""
+        if not self.keywords:
+            return 0.0
+        return sum(1 for kw in self.keywords if self._keyword_lines[kw] > 0) / len(self.keywords)
+    
+    def missing_keywords(self) -> List[str]:
+        """Job keywords not yet present in the resume"""
+        return [kw for kw in self.keywords if self._keyword_lines[kw] <= 0]
+    
+    def score(self) -> Dict[str, Any]:
+        """
+        Current score, in the same format as :meth:`ATSScorer.score_resume`
+        
+        Returns:
+            Score breakdown and suggestions
+        """
+        keyword_score = (
+            float(keyword_coverage_scores(self.coverage)) if self.keywords else 85.0
+        )
+        found_sections = sum(1 for name in STANDARD_SECTIONS if self._standard_sections[name] > 0)
+        scores = {
+            'keyword_density': keyword_score,
+            'format': max(0, 100 - (self._format_issues * 10)),
+            'sections': (found_sections / len(STANDARD_SECTIONS)) * 100,
+        }
+        return self.scorer._build_result(scores, self.missing_keywords())
@@ -2,9 +2,12 @@
 Keyword Extractor - Extracts keywords from job descriptions
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Set, Tuple
 from collections import Counter
 
+from optimization.skill_matcher import SkillMatcher, load_skill_matcher, normalize
+from optimization.tfidf import DocumentFrequencyTable, KeywordScorer, score_documents
+
 
 class KeywordExtractor:
     """
@@ -14,11 +17,26 @@ class KeywordExtractor:
     keywords for ATS optimization.
     """
     
-    def __init__(self):
-        """Initialize keyword extractor"""
+    def __init__(
+        self,
+        taxonomy_path: str = "config/skills.yaml",
+        df_path: Optional[str] = "data/keyword_df.npz"
+    ):
+        """
+        Initialize keyword extractor
+        
+        Args:
+            taxonomy_path: Skills taxonomy compiled into the skill matcher
+            df_path: Persisted document-frequency table (None for in-memory only)
+        """
         # TODO: Initialize spaCy model
-        # TODO: Initialize TF-IDF vectorizer
-        pass
+        self.skill_matcher = load_skill_matcher(taxonomy_path)
+        self._keyword_matchers: Dict[Tuple[str, ...], Tuple[SkillMatcher, Dict[str, Set[str]]]] = {}
+        self.df_path = df_path
+        self.df_table = (
+            DocumentFrequencyTable.load(df_path) if df_path else DocumentFrequencyTable()
+        )
+        self._scorer: Optional[KeywordScorer] = None
     
     def extract_keywords(
         self,
@@ -33,20 +51,71 @@ class KeywordExtractor:
             max_keywords: Maximum number of keywords to return
             
         Returns:
-            List of keywords with scores
+            List of keywords with scores (best first, best scored 1.0)
+        """
+        scored = self._get_scorer().top_keywords(job_description, max_keywords)
+        return [{'keyword': term, 'score': score} for term, score in scored]
+    
+    def extract_keywords_batch(
+        self,
+        job_descriptions: Sequence[str],
+        max_keywords: int = 20,
+        workers: Optional[int] = None,
+        chunk_size: int = 500
+    ) -> List[List[Dict[str, Any]]]:
         """
-        # TODO: Implement keyword extraction
-        # - Tokenize text
-        # - Remove stop words
-        # - Calculate TF-IDF scores
-        # - Extract top keywords
+        Extract keywords for many job descriptions
         
+        Batches larger than one chunk are scored in a process pool.
+        
+        Args:
+            job_descriptions: Job description texts
+            max_keywords: Maximum number of keywords per description
+            workers: Worker processes (None for one per CPU, 1 to stay in-process)
+            chunk_size: Descriptions per task
+            
+        Returns:
+            Keyword lists in input order
+        """
+        results = score_documents(
+            self._get_scorer(), job_descriptions, max_keywords, workers, chunk_size
+        )
         return [
-            {'keyword': 'python', 'score': 0.95},
-            {'keyword': 'software engineer', 'score': 0.90},
-            {'keyword': 'agile', 'score': 0.85}
+            [{'keyword': term, 'score': score} for term, score in scored]
+            for scored in results
         ]
     
+    def update_document_frequencies(
+        self,
+        job_descriptions: Iterable[str],
+        save: bool = True
+    ) -> int:
+        """
+        Count new job descriptions into the corpus statistics
+        
+        The scrape entry point (``main.update_keyword_statistics``) calls
+        this after every run; other ingest paths should pass their new
+        descriptions here too.
+        
+        Args:
+            job_descriptions: Newly scraped descriptions
+            save: Persist the table to ``df_path`` afterwards
+            
+        Returns:
+            Number of descriptions added
+        """
+        added = self.df_table.add_documents(job_descriptions)
+        self._scorer = None
+        if save and self.df_path:
+            self.df_table.save(self.df_path)
+        return added
+    
+    def _get_scorer(self) -> KeywordScorer:
+        """IDF snapshot of the current table (rebuilt after updates)"""
+        if self._scorer is None:
+            self._scorer = KeywordScorer.from_table(self.df_table)
+        return self._scorer
+    
     def extract_skills(self, job_description: str) -> List[str]:
         """
         Extract technical skills from job description
@@ -57,17 +126,7 @@ class KeywordExtractor:
         Returns:
             List of identified skills
         """
-        # Common technical skills to look for
-        common_skills = {
-            'python', 'java', 'javascript', 'c++', 'sql', 'aws',
-            'docker', 'kubernetes', 'react', 'node.js', 'git',
-            'machine learning', 'data analysis', 'api', 'rest'
-        }
-        
-        text_lower = job_description.lower()
-        found_skills = [skill for skill in common_skills if skill in text_lower]
-        
-        return found_skills
+        return self.skill_matcher.extract(job_description)
     
     def calculate_keyword_density(
         self,
@@ -82,17 +141,19 @@ class KeywordExtractor:
             keywords: Keywords to check for
             
         Returns:
-            Keyword density (0-1)
+            Keyword density (0-1): share of resume words that belong to a
+            keyword (or one of its aliases) mention
         """
-        resume_lower = resume_text.lower()
-        words = resume_lower.split()
-        
-        keyword_count = sum(1 for word in words if word in [k.lower() for k in keywords])
-        
-        if len(words) == 0:
+        text = normalize(resume_text)
+        word_count = len(text.split())
+        if word_count == 0:
             return 0.0
         
-        return keyword_count / len(words)
+        matcher, _ = self._keyword_matcher(keywords)
+        matches = matcher.find_longest(text)
+        keyword_words = sum(text.count(' ', start, end) + 1 for start, end, _ in matches)
+        
+        return keyword_words / word_count
     
     def get_missing_keywords(
         self,
@@ -109,8 +170,38 @@ class KeywordExtractor:
         Returns:
             List of missing keywords
         """
-        resume_lower = resume_text.lower()
+        matcher, owners = self._keyword_matcher(job_keywords)
+        found: Set[str] = set()
+        for form in matcher.extract(resume_text):
+            found.update(owners[form])
         
-        missing = [kw for kw in job_keywords if kw.lower() not in resume_lower]
+        missing = [kw for kw in job_keywords if normalize(kw) not in found]
         
         return missing
+    
+    def _keyword_matcher(self, keywords: List[str]) -> Tuple[SkillMatcher, Dict[str, Set[str]]]:
+        """
+        Compile (and cache) a matcher for a keyword list
+        
+        Each keyword also matches its taxonomy aliases, e.g. "kubernetes"
+        matches "k8s". Matches report the surface form found; a form can
+        belong to several keywords (both "kubernetes" and "k8s" own "k8s").
+        
+        Returns:
+            Matcher over every surface form, and form -> normalized
+            keywords owning it
+        """
+        key = tuple(keywords)
+        cached = self._keyword_matchers.get(key)
+        if cached is None:
+            if len(self._keyword_matchers) >= 256:
+                self._keyword_matchers.clear()
+            owners: Dict[str, Set[str]] = {}
+            for kw in keywords:
+                if not kw.strip():
+                    continue
+                for form in {normalize(kw)} | self.skill_matcher.variants(kw):
+                    owners.setdefault(form, set()).add(normalize(kw))
+            cached = (SkillMatcher({form: [] for form in owners}), owners)
+            self._keyword_matchers[key] = cached
+        return cached
@@ -0,0 +1,130 @@
+"""
+Resume Document - Section-structured resume for incremental editing
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# Headings recognized even when not written in capitals
+KNOWN_HEADINGS = frozenset({
+    'summary', 'professional summary', 'profile', 'objective', 'career objective',
+    'experience', 'work experience', 'professional experience', 'employment history',
+    'education', 'skills', 'technical skills', 'core competencies', 'projects',
+    'certifications', 'certificates', 'awards', 'publications', 'languages',
+    'volunteer experience', 'interests', 'references',
+})
+
+_HEADING_RE = re.compile(r"^[A-Z][A-Z &/]{2,40}:?$")
+
+
+def is_heading(line: str) -> bool:
+    """Whether a resume line is a section heading"""
+    stripped = line.strip()
+    if not stripped or len(stripped.split()) > 4:
+        return False
+    return stripped.rstrip(':').lower() in KNOWN_HEADINGS or bool(_HEADING_RE.match(stripped))
+
+
+@dataclass
+class ResumeSection:
+    """
+    One resume section: an optional heading line and its body lines.
+    
+    Attributes:
+        heading: Heading line as written (None for the preamble before the
+            first heading, e.g. name and contact details)
+        lines: Body lines (bullets, paragraphs) as written
+    """
+    heading: Optional[str]
+    lines: List[str] = field(default_factory=list)
+    
+    @property
+    def name(self) -> str:
+        """Normalized heading ("" for the preamble)"""
+        return (self.heading or '').strip().rstrip(':').lower()
+    
+    @property
+    def text(self) -> str:
+        """Section text including the heading line"""
+        head = [self.heading] if self.heading is not None else []
+        return '\n'.join(head + self.lines)
+
+
+@dataclass
+class ResumeDocument:
+    """
+    Resume split into sections, so edits can be applied (and re-scored)
+    one section at a time. ``from_text(text).text == text``.
+    """
+    sections: List[ResumeSection] = field(default_factory=list)
+    
+    @classmethod
+    def from_text(cls, text: str) -> "ResumeDocument":
+        """
+        Split resume text at section headings
+        
+        Args:
+            text: Resume text
+            
+        Returns:
+            ResumeDocument
+        """
+        sections: List[ResumeSection] = []
+        current = ResumeSection(heading=None)
+        for line in text.split('\n'):
+            if is_heading(line):
+                if current.heading is not None or current.lines:
+                    sections.append(current)
+                current = ResumeSection(heading=line)
+            else:
+                current.lines.append(line)
+        sections.append(current)
+        return cls(sections=sections)
+    
+    @property
+    def text(self) -> str:
+        """Full resume text"""
+        return '\n'.join(section.text for section in self.sections)
+    
+    def find_section(self, name: str) -> Optional[int]:
+        """
+        Index of the first section whose heading contains ``name``
+        
+        Args:
+            name: Heading word, e.g. "skills"
+            
+        Returns:
+            Section index, or None
+        """
+        name = name.lower()
+        for index, section in enumerate(self.sections):
+            if section.heading is not None and name in section.name:
+                return index
+        return None
+    
+    def add_skills(self, skills: List[str]) -> int:
+        """
+        Append skills to the skills section (created at the end if missing)
+        
+        Skills are appended to the last line of the section, so a
+        comma-separated list stays a single line.
+        
+        Args:
+            skills: Skills to add
+            
+        Returns:
+            Index of the edited or added section
+        """
+        index = self.find_section('skill')
+        if index is None:
+            self.sections.append(ResumeSection(heading='SKILLS', lines=[', '.join(skills)]))
+            return len(self.sections) - 1
+        
+        lines = self.sections[index].lines
+        last = max((i for i, line in enumerate(lines) if line.strip()), default=None)
+        if last is None:
+            lines.insert(0, ', '.join(skills))
+        else:
+            lines[last] = f"{lines[last].rstrip().rstrip(',')}, {', '.join(skills)}"
+        return index
@@ -2,18 +2,46 @@
 Resume Optimizer - Optimizes resumes for ATS compatibility
 """
 
-from typing import Dict, Any, List
+import math
+from typing import Dict, Any, List, Optional
+
+from optimization.ats_scorer import ATSScorer, IncrementalScore
+from optimization.resume_document import ResumeDocument
 
 
 class ResumeOptimizer:
     """
     Optimizes resumes for ATS systems by automatically inserting
     keywords and improving formatting.
+    
+    Interactive editing goes through :meth:`start_session`, which keeps
+    the ATS score current section by section instead of rescoring the
+    whole resume after every edit.
     """
     
-    def __init__(self):
-        """Initialize resume optimizer"""
-        pass
+    def __init__(self, ats_scorer: Optional[ATSScorer] = None):
+        """
+        Initialize resume optimizer
+        
+        Args:
+            ats_scorer: Scorer used for keywords and scores
+        """
+        self.ats_scorer = ats_scorer or ATSScorer()
+    
+    def start_session(self, resume_text: str, job_description: str) -> IncrementalScore:
+        """
+        Start an incremental editing session for a resume and job
+        
+        Args:
+            resume_text: Resume text
+            job_description: Job description
+            
+        Returns:
+            IncrementalScore wrapping the parsed resume
+        """
+        return IncrementalScore(
+            self.ats_scorer, ResumeDocument.from_text(resume_text), job_description
+        )
     
     def optimize_for_job(
         self,
@@ -32,13 +60,22 @@ class ResumeOptimizer:
         Returns:
             Optimized resume text
         """
-        # TODO: Implement resume optimization
-        # - Extract keywords from job description
-        # - Identify where to insert keywords naturally
-        # - Update resume content
-        # - Ensure readability
+        session = self.start_session(resume_text, job_description)
+        needed = math.ceil(target_density * len(session.keywords)) - round(
+            session.coverage * len(session.keywords)
+        )
+        if needed <= 0:
+            return resume_text
         
-        return resume_text
+        # Only taxonomy skills are inserted; free-text TF-IDF terms would
+        # read as keyword stuffing in a skills list
+        job_skills = set(self.ats_scorer.keyword_extractor.extract_skills(job_description))
+        additions = [kw for kw in session.missing_keywords() if kw in job_skills][:needed]
+        if not additions:
+            return resume_text
+        
+        session.add_skills(additions)
+        return session.document.text
     
     def insert_keywords_naturally(
         self,
@@ -48,6 +85,10 @@ class ResumeOptimizer:
         """
         Insert keywords into resume in a natural way
         
+        Keywords the resume does not mention yet are added to its skills
+        section (created if missing); experience bullets are left as
+        written.
+        
         Args:
             resume_text: Resume text
             keywords: Keywords to insert
@@ -55,12 +96,18 @@ class ResumeOptimizer:
         Returns:
             Updated resume text
         """
-        # TODO: Implement natural keyword insertion
-        # - Find appropriate locations (skills section, experience bullets)
-        # - Insert without keyword stuffing
-        # - Maintain readability
+        present = self.ats_scorer.analyze_resume(resume_text).terms
+        missing: Dict[str, str] = {}
+        for kw in keywords:
+            key = kw.lower().strip()
+            if key and key not in present:
+                missing.setdefault(key, kw)
+        if not missing:
+            return resume_text
         
-        return resume_text
+        document = ResumeDocument.from_text(resume_text)
+        document.add_skills(list(missing.values()))
+        return document.text
     
     def improve_formatting(self, resume_text: str) -> str:
         """
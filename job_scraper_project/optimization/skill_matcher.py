@@ -0,0 +1,228 @@
+"""
+Skill Matcher - Aho-Corasick multi-pattern matching over a skills taxonomy
+"""
+
+import logging
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Used when no taxonomy file is available
+DEFAULT_SKILLS: Dict[str, List[str]] = {
+    'python': [], 'java': [], 'javascript': ['js'], 'c++': ['cpp'], 'sql': [],
+    'aws': ['amazon web services'], 'docker': [], 'kubernetes': ['k8s'],
+    'react': ['react.js', 'reactjs'], 'node.js': ['nodejs'], 'git': [],
+    'machine learning': [], 'data analysis': [], 'api': ['apis'],
+    'rest api': ['restful'],
+}
+
+
+def normalize(text: str) -> str:
+    """Lowercase text and collapse runs of whitespace to single spaces"""
+    return ' '.join(text.lower().split())
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character is part of a word for boundary checks"""
+    return char.isalnum() or char == '_'
+
+
+def _continues_word(text: str, index: int, step: int) -> bool:
+    """
+    Whether ``text[index]`` extends the word next to a match
+    
+    Word characters do, and so do "." and "@" joining on to another word
+    character (``step`` is the direction away from the match), as in
+    "node.js" or "ai@company.com".
+    """
+    if not 0 <= index < len(text):
+        return False
+    char = text[index]
+    if _is_word_char(char):
+        return True
+    beyond = index + step
+    return char in '.@' and 0 <= beyond < len(text) and _is_word_char(text[beyond])
+
+
+def load_taxonomy(path: str) -> Dict[str, List[str]]:
+    """
+    Load a skills taxonomy file
+    
+    The file has a top-level ``skills`` mapping of categories to
+    ``canonical name: [aliases]`` entries.
+    
+    Args:
+        path: Path to the YAML taxonomy
+        
+    Returns:
+        Canonical skill -> aliases (DEFAULT_SKILLS if the file is missing)
+    """
+    taxonomy_path = Path(path)
+    if not taxonomy_path.exists():
+        logger.warning(f"Skills taxonomy {taxonomy_path} not found, using built-in skills")
+        return dict(DEFAULT_SKILLS)
+    
+    with open(taxonomy_path, 'r', encoding='utf-8') as f:
+        categories = (yaml.safe_load(f) or {}).get('skills', {}) or {}
+    
+    taxonomy: Dict[str, List[str]] = {}
+    for entries in categories.values():
+        for canonical, aliases in (entries or {}).items():
+            taxonomy[str(canonical)] = [str(alias) for alias in aliases or []]
+    return taxonomy
+
+
+class SkillMatcher:
+    """
+    Compiled Aho-Corasick automaton over skill names and their aliases.
+    
+    All surface forms are matched in a single left-to-right pass over the
+    text, independent of the number of skills. Matches must sit on word
+    boundaries, so "java" does not match inside "javascript", "js" not
+    inside "node.js" and "ai" not inside "ai@company.com", while "c++"
+    and "node.js" still match as written. Every surface form reports its
+    canonical skill name.
+    
+    Example:
+        >>> matcher = SkillMatcher({'kubernetes': ['k8s'], 'python': []})
+        >>> matcher.extract("Deploy Python services on K8s")
+        ['python', 'kubernetes']
+    """
+    
+    def __init__(self, taxonomy: Dict[str, Iterable[str]]):
+        """
+        Compile the automaton
+        
+        Args:
+            taxonomy: Canonical skill -> aliases
+        """
+        self.taxonomy = {canonical: list(aliases) for canonical, aliases in taxonomy.items()}
+        
+        # Every surface form -> all surface forms of its skill
+        self._variants: Dict[str, Set[str]] = {}
+        self._patterns: List[Tuple[str, str]] = []
+        seen: Set[str] = set()
+        for canonical, aliases in self.taxonomy.items():
+            forms = {normalize(form) for form in [canonical, *aliases]} - {''}
+            for form in forms:
+                self._variants.setdefault(form, set()).update(forms)
+                if form not in seen:
+                    seen.add(form)
+                    self._patterns.append((form, canonical))
+        
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for pattern_id, (form, _) in enumerate(self._patterns):
+            state = 0
+            for char in form:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(pattern_id)
+        
+        # Breadth-first failure links; outputs inherit their fallback's
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+        
+        self._bounded = [
+            (_is_word_char(form[0]), _is_word_char(form[-1])) for form, _ in self._patterns
+        ]
+    
+    def __len__(self) -> int:
+        """Number of compiled surface forms"""
+        return len(self._patterns)
+    
+    def variants(self, skill: str) -> Set[str]:
+        """All known surface forms of a skill (the skill itself if unknown)"""
+        form = normalize(skill)
+        return self._variants.get(form, {form})
+    
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield every word-bounded match, including overlapping ones
+        
+        Args:
+            text: Normalized text (see :func:`normalize`)
+            
+        Yields:
+            Tuples of (start, end, canonical skill)
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        patterns, bounded = self._patterns, self._bounded
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in out[state]:
+                form, canonical = patterns[pattern_id]
+                start = i - len(form) + 1
+                check_left, check_right = bounded[pattern_id]
+                if check_left and _continues_word(text, start - 1, -1):
+                    continue
+                if check_right and _continues_word(text, i + 1, 1):
+                    continue
+                yield start, i + 1, canonical
+    
+    def find_longest(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Leftmost-longest, non-overlapping matches
+        
+        Args:
+            text: Normalized text
+            
+        Returns:
+            Matches as (start, end, canonical skill), in text order
+        """
+        matches = sorted(self.finditer(text), key=lambda m: (m[0], -m[1]))
+        selected: List[Tuple[int, int, str]] = []
+        position = 0
+        for match in matches:
+            if match[0] >= position:
+                selected.append(match)
+                position = match[1]
+        return selected
+    
+    def extract(self, text: str) -> List[str]:
+        """
+        Canonical skills mentioned in text
+        
+        Uses the same leftmost-longest matches as :meth:`find_longest`, so
+        an alias inside a longer mention is not reported on its own.
+        
+        Args:
+            text: Raw text
+            
+        Returns:
+            Unique canonical skills in order of first mention
+        """
+        found: Dict[str, None] = {}
+        for _, _, canonical in self.find_longest(normalize(text)):
+            found.setdefault(canonical, None)
+        return list(found)
+
+
+@lru_cache(maxsize=8)
+def load_skill_matcher(path: str = "config/skills.yaml") -> SkillMatcher:
+    """Compile (once per path) the matcher for a taxonomy file"""
+    return SkillMatcher(load_taxonomy(path))
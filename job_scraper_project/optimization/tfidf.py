@@ -0,0 +1,324 @@
+"""
+TF-IDF Model - Incremental document frequencies for keyword scoring
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+# English function words plus job-posting boilerplate
+STOP_WORDS = frozenset("""
+a about above across after again against all also am an and any are as at be
+because been before being below between both but by can could did do does doing
+down during each either etc few for from further had has have having he her here
+hers him his how i if in into is it its itself just least less may me might more
+most must my no nor not now of off on once only or other our ours out over own
+per plus same she should so some such than that the their them then there these
+they this those through to too under until up upon us very via was we were what
+when where which while who whom why will with within without would you your
+ability able apply applicant applicants benefits candidate candidates company
+description equal employer environment excellent experience familiarity good
+great ideal including job join knowledge looking new opportunity plus position
+preferred qualifications related requirements required responsibilities role
+skills strong team teams understanding using work working year years
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, stop words and single letters removed"""
+    return [
+        token for token in _TOKEN_RE.findall((text or '').lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+def document_terms(text: str) -> List[str]:
+    """
+    Candidate keywords of a document: unigrams plus bigrams of adjacent tokens
+    
+    Bigrams do not span punctuation or removed stop words, so "Kubernetes,
+    Django" yields no "kubernetes django" phrase, and a repeated word
+    ("python python") is not a phrase either.
+    
+    Args:
+        text: Document text
+        
+    Returns:
+        Terms in document order (with repeats)
+    """
+    lowered = (text or '').lower()
+    unigrams: List[str] = []
+    bigrams: List[str] = []
+    previous, previous_end = None, 0
+    for match in _TOKEN_RE.finditer(lowered):
+        token = match.group()
+        if len(token) < 2 or token in STOP_WORDS:
+            previous = None
+            continue
+        if (previous is not None and previous != token
+                and not lowered[previous_end:match.start()].strip(' \t-')):
+            bigrams.append(f"{previous} {token}")
+        unigrams.append(token)
+        previous, previous_end = token, match.end()
+    return unigrams + bigrams
+
+
+class DocumentFrequencyTable:
+    """
+    Corpus document frequencies, maintained incrementally.
+    
+    Terms get consecutive ids as they are first seen and their document
+    counts live in one integer array, so adding a posting only bumps the
+    counts of its distinct terms and the IDF of any term is a single array
+    read. The table is saved as an ``.npz`` file holding the newline-joined
+    vocabulary as one UTF-8 blob, the uint32 counts, and the document total.
+    
+    Example:
+        >>> table = DocumentFrequencyTable.load("data/keyword_df.npz")
+        >>> table.add_documents(job['description'] for job in jobs)
+        >>> table.save("data/keyword_df.npz")
+    """
+    
+    def __init__(self):
+        """Initialize an empty table"""
+        self.vocabulary: Dict[str, int] = {}
+        self.num_docs = 0
+        self._counts = np.zeros(1024, dtype=np.uint32)
+    
+    def __len__(self) -> int:
+        """Number of distinct terms"""
+        return len(self.vocabulary)
+    
+    @property
+    def document_frequencies(self) -> np.ndarray:
+        """Document count per term id"""
+        return self._counts[:len(self.vocabulary)]
+    
+    def _term_ids(self, terms: Iterable[str]) -> np.ndarray:
+        """Ids of terms, adding unseen terms to the vocabulary"""
+        vocabulary = self.vocabulary
+        ids = [vocabulary.setdefault(term, len(vocabulary)) for term in terms]
+        if len(vocabulary) > len(self._counts):
+            grown = np.zeros(max(len(vocabulary), 2 * len(self._counts)), dtype=np.uint32)
+            grown[:len(self._counts)] = self._counts
+            self._counts = grown
+        return np.array(ids, dtype=np.int64)
+    
+    def add_document(self, text: str) -> None:
+        """
+        Count one document
+        
+        Args:
+            text: Document text
+        """
+        self._counts[self._term_ids(set(document_terms(text)))] += 1
+        self.num_docs += 1
+    
+    def add_documents(self, texts: Iterable[str]) -> int:
+        """
+        Count many documents
+        
+        Args:
+            texts: Document texts
+            
+        Returns:
+            Number of documents added
+        """
+        added = 0
+        for text in texts:
+            self.add_document(text)
+            added += 1
+        return added
+    
+    def merge(self, other: "DocumentFrequencyTable") -> None:
+        """
+        Add the counts of another table (e.g. one built by a worker process)
+        
+        Args:
+            other: Table to merge in
+        """
+        ids = self._term_ids(other.vocabulary)
+        self._counts[ids] += other.document_frequencies
+        self.num_docs += other.num_docs
+    
+    def idf(self) -> np.ndarray:
+        """
+        Smoothed inverse document frequency per term id
+        
+        Returns:
+            float32 array of ``log((1 + N) / (1 + df)) + 1``
+        """
+        df = self.document_frequencies.astype(np.float64)
+        return (np.log((1.0 + self.num_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+    
+    def unseen_idf(self) -> float:
+        """IDF of a term that appears in no counted document"""
+        return math.log(1.0 + self.num_docs) + 1.0
+    
+    def save(self, path: str) -> Path:
+        """
+        Write the table atomically
+        
+        Args:
+            path: Target ``.npz`` file
+            
+        Returns:
+            Path written
+        """
+        target = Path(path)
+        terms = np.frombuffer('\n'.join(self.vocabulary).encode('utf-8'), dtype=np.uint8)
+        with atomic_write(target, 'wb') as f:
+            np.savez_compressed(
+                f,
+                terms=terms,
+                counts=self.document_frequencies,
+                num_docs=np.array([self.num_docs], dtype=np.int64)
+            )
+        logger.info(f"Saved {len(self)} terms over {self.num_docs} documents to {target}")
+        return target
+    
+    @classmethod
+    def load(cls, path: str) -> "DocumentFrequencyTable":
+        """
+        Load a saved table
+        
+        Args:
+            path: ``.npz`` file written by :meth:`save`
+            
+        Returns:
+            The table (empty if the file does not exist)
+        """
+        table = cls()
+        source = Path(path)
+        if not source.exists():
+            return table
+        with np.load(source) as data:
+            blob = data['terms'].tobytes().decode('utf-8')
+            terms = blob.split('\n') if blob else []
+            table.vocabulary = {term: i for i, term in enumerate(terms)}
+            table._counts = data['counts'].astype(np.uint32)
+            table.num_docs = int(data['num_docs'][0])
+        return table
+
+
+class KeywordScorer:
+    """
+    Frozen IDF snapshot used to score documents.
+    
+    Small enough to ship to worker processes once, instead of the whole
+    table per document.
+    """
+    
+    def __init__(self, vocabulary: Dict[str, int], idf: np.ndarray, unseen_idf: float):
+        """
+        Initialize scorer
+        
+        Args:
+            vocabulary: Term -> id
+            idf: IDF per term id
+            unseen_idf: IDF of terms outside the vocabulary
+        """
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.unseen_idf = unseen_idf
+    
+    @classmethod
+    def from_table(cls, table: DocumentFrequencyTable) -> "KeywordScorer":
+        """Snapshot the current IDF of a table"""
+        return cls(dict(table.vocabulary), table.idf(), table.unseen_idf())
+    
+    def top_keywords(self, text: str, max_keywords: int = 20) -> List[Tuple[str, float]]:
+        """
+        Highest TF-IDF terms of a document
+        
+        Args:
+            text: Document text
+            max_keywords: Maximum number of keywords
+            
+        Returns:
+            (term, score) pairs, best first, scores scaled so the best is 1.0
+        """
+        counts = Counter(document_terms(text))
+        if not counts:
+            return []
+        terms = list(counts)
+        ids = np.array([self.vocabulary.get(term, -1) for term in terms], dtype=np.int64)
+        known = ids >= 0
+        idf = np.full(len(terms), self.unseen_idf, dtype=np.float32)
+        idf[known] = self.idf[ids[known]]
+        tf = np.array([counts[term] for term in terms], dtype=np.float32)
+        scores = tf * idf
+        
+        k = min(max_keywords, len(terms))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        best = float(scores[top[0]]) or 1.0
+        return [(terms[i], round(float(scores[i]) / best, 4)) for i in top]
+
+
+# Scorer installed in each worker process by the pool initializer
+_worker_scorer: Optional[KeywordScorer] = None
+
+
+def _init_worker(scorer: KeywordScorer) -> None:
+    """Install the IDF snapshot in a worker process"""
+    global _worker_scorer
+    _worker_scorer = scorer
+
+
+def _score_chunk(texts: List[str], max_keywords: int) -> List[List[Tuple[str, float]]]:
+    """Score a chunk of documents in a worker process"""
+    return [_worker_scorer.top_keywords(text, max_keywords) for text in texts]
+
+
+def score_documents(
+    scorer: KeywordScorer,
+    texts: Sequence[str],
+    max_keywords: int = 20,
+    workers: Optional[int] = None,
+    chunk_size: int = 500
+) -> List[List[Tuple[str, float]]]:
+    """
+    Top keywords for many documents
+    
+    Batches larger than one chunk are split across a process pool; the
+    scorer is sent to each worker once by the pool initializer rather
+    than with every chunk.
+    
+    Args:
+        scorer: IDF snapshot
+        texts: Document texts
+        max_keywords: Maximum keywords per document
+        workers: Worker processes (None for one per CPU, 1 to stay in-process)
+        chunk_size: Documents per task
+        
+    Returns:
+        Keyword lists in input order
+    """
+    if workers == 1 or len(texts) <= chunk_size:
+        return [scorer.top_keywords(text, max_keywords) for text in texts]
+    
+    chunks = [list(texts[i:i + chunk_size]) for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(scorer,)
+    ) as pool:
+        return [
+            keywords
+            for chunk in pool.map(_score_chunk, chunks, repeat(max_keywords))
+            for keywords in chunk
+        ]
@@ -0,0 +1,115 @@
+"""Unit tests for the packed application format."""
+from dataclasses import fields
+from datetime import datetime, timezone
+
+import pytest
+
+from tracking.codec import (
+    LAYOUT,
+    load_applications,
+    pack_applications,
+    save_applications,
+    unpack_applications,
+    unpack_columns,
+)
+from tracking.models import Application, ApplicationStatus, ResponseType
+
+
+def make_application(i, **overrides):
+    """Build an application with a few optional fields set"""
+    values = dict(
+        id=f"app{i}",
+        user_id=f"user{i % 3}",
+        job_id=f"job{i}",
+        job_title="Data Engineer",
+        company="Acme" if i % 2 else "Globex",
+        application_url=f"https://jobs.example.com/{i}",
+        submitted_at=datetime(2024, 3, 1, 9, 30, 15, 250),
+        resume_version="v2",
+        cover_letter_version=None if i % 2 else "cl1",
+        match_score=70.5 + i,
+        status=list(ApplicationStatus)[i % len(ApplicationStatus)],
+        status_updated_at=datetime(2024, 3, 2),
+    )
+    values.update(overrides)
+    return Application(**values)
+
+
+def test_layout_matches_model():
+    """Test the column layout follows the Application fields"""
+    assert [name for name, _ in LAYOUT] == [f.name for f in fields(Application)]
+
+
+def test_round_trip():
+    """Test every field survives pack/unpack, including None and non-ASCII text"""
+    applications = [make_application(i) for i in range(10)]
+    applications[3] = make_application(
+        3,
+        company="Société Générale",
+        response_received=True,
+        response_at=datetime(2024, 3, 9, 14, 0),
+        response_type=ResponseType.INTERVIEW,
+        response_email_id="<msg-3@example.com>",
+        interview_requested=True,
+        interview_date=datetime(2024, 3, 15, 10, 0),
+        interview_type="video",
+        notes="Recruiter: Zoë 👋",
+    )
+    applications[4].notes = ""
+    
+    restored = unpack_applications(pack_applications(applications))
+    assert restored == applications
+    assert restored[4].notes == ""
+    assert restored[5].notes is None
+
+
+def test_empty_round_trip():
+    """Test packing no applications"""
+    assert unpack_applications(pack_applications([])) == []
+
+
+def test_unpack_columns_projection():
+    """Test decoding selected columns only"""
+    applications = [make_application(i) for i in range(4)]
+    columns = unpack_columns(pack_applications(applications), ["company", "status"])
+    
+    assert list(columns) == ["company", "status"]
+    assert columns["company"] == ["Globex", "Acme", "Globex", "Acme"]
+    assert columns["status"] == [a.status for a in applications]
+    with pytest.raises(ValueError):
+        unpack_columns(pack_applications(applications), ["salary"])
+
+
+def test_rejects_aware_datetimes():
+    """Test timezone-aware datetimes are refused rather than shifted"""
+    application = make_application(0, submitted_at=datetime(2024, 3, 1, tzinfo=timezone.utc))
+    with pytest.raises(ValueError):
+        pack_applications([application])
+
+
+def test_rejects_bad_data():
+    """Test truncated and foreign data raise ValueError"""
+    data = pack_applications([make_application(0)])
+    with pytest.raises(ValueError):
+        unpack_applications(data[:-5])
+    with pytest.raises(ValueError):
+        unpack_applications(b"PK\x03\x04" + data[4:])
+
+
+def test_save_and_load(tmp_path):
+    """Test the atomic file round trip"""
+    path = tmp_path / "store" / "applications.bin"
+    applications = [make_application(i) for i in range(5)]
+    
+    assert load_applications(str(path)) == []
+    save_applications(applications, str(path))
+    assert load_applications(str(path)) == applications
+    assert [p.name for p in path.parent.iterdir()] == ["applications.bin"]
+
+
+def test_records_are_slotted():
+    """Test tracking records do not carry an instance __dict__"""
+    application = make_application(0)
+    assert not hasattr(application, "__dict__")
+    with pytest.raises(AttributeError):
+        application.extra = 1
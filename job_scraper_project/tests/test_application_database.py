@@ -0,0 +1,262 @@
+"""Unit tests for the SQLite application database."""
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from tracking.database import ApplicationDatabase, platform_of, sqlite_path, week_of
+from tracking.models import Application, ApplicationEvent, ApplicationStatus, ResponseType
+
+START = datetime(2024, 1, 1, 9, 0)
+
+
+def make_application(i, user_id="u1", status=ApplicationStatus.SUBMITTED, submitted_at=None):
+    """Build an application submitted ``i`` minutes after START"""
+    submitted_at = submitted_at or START + timedelta(minutes=i)
+    return Application(
+        id=f"app{i:04d}",
+        user_id=user_id,
+        job_id=f"job{i}",
+        job_title="Backend Engineer",
+        company=f"Company {i}",
+        application_url=f"https://example.com/jobs/{i}",
+        submitted_at=submitted_at,
+        resume_version="v1",
+        cover_letter_version=None,
+        match_score=80.0,
+        status=status,
+        status_updated_at=submitted_at,
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Database in a temporary file"""
+    database = ApplicationDatabase(f"sqlite:///{tmp_path}/applications.db")
+    yield database
+    database.close()
+
+
+def test_sqlite_path():
+    """Test connection strings map to files"""
+    assert sqlite_path("sqlite:///data/applications.db") == "data/applications.db"
+    assert sqlite_path("sqlite:////var/app.db") == "/var/app.db"
+    assert sqlite_path("sqlite://") == ":memory:"
+    with pytest.raises(ValueError):
+        sqlite_path("postgresql://localhost/jobs")
+
+
+def test_create_and_get_round_trip(db):
+    """Test a stored application is read back unchanged"""
+    application = make_application(1)
+    application.notes = "referral"
+    db.create_application(application)
+    
+    assert db.get_application("app0001") == application
+    assert db.get_application("missing") is None
+
+
+def test_create_generates_id(db):
+    """Test applications without an ID get one"""
+    application = make_application(1)
+    application.id = ""
+    created = db.create_application(application)
+    assert created.id
+    assert db.get_application(created.id) is not None
+
+
+def test_create_applications_is_atomic(db):
+    """Test a batch with a duplicate ID stores nothing"""
+    batch = [make_application(1), make_application(2), make_application(1)]
+    with pytest.raises(sqlite3.IntegrityError):
+        db.create_applications(batch)
+    assert db.get_user_applications("u1") == []
+
+
+def test_keyset_pagination_matches_full_listing(db):
+    """Test paging with ``after`` walks every application exactly once"""
+    statuses = [ApplicationStatus.SUBMITTED, ApplicationStatus.REJECTED]
+    batch = [make_application(i, status=statuses[i % 2]) for i in range(95)]
+    # Ties on submitted_at are ordered by id
+    batch += [make_application(100 + i, submitted_at=START) for i in range(5)]
+    db.create_applications(batch)
+    db.create_applications([make_application(500, user_id="u2")])
+    
+    expected = sorted(
+        (a for a in batch), key=lambda a: (a.submitted_at, a.id), reverse=True
+    )
+    pages = []
+    page = db.get_user_applications("u1", limit=7)
+    while page:
+        pages.append(page)
+        page = db.get_user_applications("u1", limit=7, after=page[-1])
+    assert [a.id for p in pages for a in p] == [a.id for a in expected]
+    assert all(len(p) == 7 for p in pages[:-1])
+    
+    rejected = list(db.iter_user_applications("u1", ApplicationStatus.REJECTED, page_size=10))
+    assert [a.id for a in rejected] == [
+        a.id for a in expected if a.status is ApplicationStatus.REJECTED
+    ]
+
+
+def test_status_page_uses_covering_index(db):
+    """Test status pages are served by the (user, status, submitted_at) index"""
+    plan = db._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM applications WHERE user_id = ? AND status = ? "
+        "AND (submitted_at, id) < (?, ?) ORDER BY submitted_at DESC, id DESC LIMIT 10",
+        ("u1", "submitted", "2024", "x")
+    ).fetchall()
+    detail = " ".join(row[-1] for row in plan)
+    assert "idx_applications_user_status_submitted" in detail
+    assert "TEMP B-TREE" not in detail
+
+
+def test_status_updates_and_responses(db):
+    """Test status changes, responses and per-status counts"""
+    db.create_applications([make_application(i) for i in range(3)])
+    
+    assert db.update_application_status("app0000", ApplicationStatus.INTERVIEW_REQUESTED)
+    assert not db.update_application_status("missing", ApplicationStatus.REJECTED)
+    assert db.record_response("app0000", "interview", START, email_id="m1")
+    
+    application = db.get_application("app0000")
+    assert application.status is ApplicationStatus.INTERVIEW_REQUESTED
+    assert application.response_received
+    assert application.response_type is ResponseType.INTERVIEW
+    assert application.interview_requested
+    assert application.response_email_id == "m1"
+    
+    assert db.count_by_status("u1") == {
+        ApplicationStatus.SUBMITTED: 2,
+        ApplicationStatus.INTERVIEW_REQUESTED: 1,
+    }
+    assert [a.id for a in db.get_applications_by_status(ApplicationStatus.SUBMITTED)] == [
+        "app0002", "app0001"
+    ]
+
+
+def test_data_survives_reopen(tmp_path):
+    """Test applications persist across connections"""
+    url = f"sqlite:///{tmp_path}/applications.db"
+    first = ApplicationDatabase(url)
+    first.create_application(make_application(1))
+    first.close()
+    
+    second = ApplicationDatabase(url)
+    assert second.get_application("app0001") is not None
+    assert second._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    second.close()
+
+
+def test_platform_and_week_keys():
+    """Test summary keys derived from URL and submission time"""
+    assert platform_of("https://boards.greenhouse.io/acme/jobs/1") == "greenhouse"
+    assert platform_of("https://www.linkedin.com/jobs/view/1") == "linkedin"
+    assert platform_of("https://jobs.example.co.uk/1") == "example"
+    assert platform_of("") == "unknown"
+    assert week_of(datetime(2024, 1, 3, 15, 0)) == "2024-01-01"
+    assert week_of(datetime(2024, 1, 7)) == "2024-01-01"
+
+
+def test_summaries_match_recomputation(db):
+    """Test trigger-maintained summaries equal a full recount after random changes"""
+    rng = random.Random(3)
+    batch = []
+    for i in range(200):
+        application = make_application(i * 300, user_id=f"u{i % 3}")
+        application.application_url = rng.choice([
+            "https://boards.greenhouse.io/a/1", "https://jobs.lever.co/b/2"
+        ])
+        batch.append(application)
+    db.create_applications(batch)
+    for _ in range(300):
+        application = rng.choice(batch)
+        if rng.random() < 0.5:
+            db.update_application_status(application.id, rng.choice(list(ApplicationStatus)))
+        else:
+            db.record_response(application.id, rng.choice(["rejection", "interview", "offer"]), START)
+    
+    summary = {user: db.count_by_status(user) for user in ("u0", "u1", "u2")}
+    lever = db.count_by_status("u1", platform="lever")
+    week = week_of(batch[0].submitted_at)
+    weekly = db.count_by_status("u0", week=week)
+    funnel = db.get_funnel("u2")
+    
+    db.rebuild_summaries()
+    assert summary == {user: db.count_by_status(user) for user in ("u0", "u1", "u2")}
+    assert lever == db.count_by_status("u1", platform="lever")
+    assert weekly == db.count_by_status("u0", week=week) == db.weekly_counts("u0")[week]
+    assert funnel == db.get_funnel("u2")
+    
+    for user in ("u0", "u1", "u2"):
+        apps = list(db.iter_user_applications(user))
+        statuses = {}
+        for application in apps:
+            statuses[application.status] = statuses.get(application.status, 0) + 1
+        assert summary[user] == statuses
+    apps = list(db.iter_user_applications("u2"))
+    assert funnel["applications"] == len(apps)
+    assert funnel["responses"] == sum(a.response_received for a in apps)
+    assert funnel["offers"] == sum(a.response_type is ResponseType.OFFER for a in apps)
+
+
+def test_event_journal_is_append_only(db):
+    """Test lifecycle events are journaled in order and cannot be changed"""
+    db.create_application(make_application(1))
+    db.update_application_status("app0001", ApplicationStatus.VIEWED)
+    db.record_response("app0001", "rejection", START, email_id="m1")
+    db.record_event(ApplicationEvent(
+        id="", application_id="app0001", event_type="note",
+        event_timestamp=START, event_data={"text": "followed up"}
+    ))
+    
+    events = db.get_events("app0001")
+    assert [e.event_type for e in events] == [
+        "submitted", "status_changed", "response_received", "note"
+    ]
+    assert events[1].event_data == {"from": "submitted", "to": "viewed"}
+    assert events[3].event_timestamp == START
+    
+    with pytest.raises(sqlite3.IntegrityError):
+        with db._conn:
+            db._conn.execute("DELETE FROM application_events")
+    with pytest.raises(sqlite3.IntegrityError):
+        db.record_event(ApplicationEvent(
+            id="", application_id="missing", event_type="note",
+            event_timestamp=START, event_data={}
+        ))
+    assert len(db.get_events("app0001")) == 4
+
+
+def test_summaries_built_for_existing_database(tmp_path):
+    """Test a database created before the summary tables is backfilled"""
+    path = tmp_path / "applications.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE applications (id TEXT PRIMARY KEY, user_id TEXT NOT NULL, "
+        "job_id TEXT NOT NULL, job_title TEXT NOT NULL, company TEXT NOT NULL, "
+        "application_url TEXT NOT NULL, submitted_at TEXT NOT NULL, "
+        "resume_version TEXT NOT NULL, cover_letter_version TEXT, match_score REAL NOT NULL, "
+        "status TEXT NOT NULL, status_updated_at TEXT NOT NULL, "
+        "response_received INTEGER NOT NULL DEFAULT 0, response_at TEXT, response_type TEXT, "
+        "response_email_id TEXT, interview_requested INTEGER NOT NULL DEFAULT 0, "
+        "interview_date TEXT, interview_type TEXT, confirmation_screenshot TEXT, "
+        "confirmation_number TEXT, notes TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO applications (id, user_id, job_id, job_title, company, application_url, "
+        "submitted_at, resume_version, match_score, status, status_updated_at) "
+        "VALUES ('a1', 'u1', 'j1', 'Engineer', 'Acme', 'https://jobs.lever.co/acme/1', "
+        "'2024-01-03T10:00:00', 'v1', 90.0, 'rejected', '2024-01-05T10:00:00')"
+    )
+    conn.commit()
+    conn.close()
+    
+    db = ApplicationDatabase(f"sqlite:///{path}")
+    assert db.count_by_status("u1", platform="lever", week="2024-01-01") == {
+        ApplicationStatus.REJECTED: 1
+    }
+    db.create_application(make_application(2))
+    assert db.get_funnel("u1")["applications"] == 2
+    db.close()
@@ -1,7 +1,10 @@
 """Unit tests for application submitter."""
+import asyncio
+import threading
+
 import pytest
 from automation.application_submitter import ApplicationSubmitter
-from automation.models import SubmissionConfig, SubmissionStatus
+from automation.models import SubmissionConfig, SubmissionResult, SubmissionStatus
 
 
 def test_platform_detection():
@@ -95,3 +98,62 @@ def test_validate_files():
     # Verify config is set
     assert submitter.config is not None
     assert isinstance(submitter.config, SubmissionConfig)
+
+
+class RecordingHandler:
+    """Handler stand-in that spends a moment "in the browser" per job."""
+    
+    def __init__(self, events):
+        """Append submission events to ``events``."""
+        self.events = events
+    
+    async def submit(self, job, resume, cover_letter, user_profile):
+        """Record the submission around a short browser wait."""
+        self.events.append(('submit', job['id']))
+        await asyncio.sleep(0.05)
+        self.events.append(('done', job['id']))
+        return SubmissionResult(
+            success=True, job_id=job['id'], platform='generic', status=SubmissionStatus.SUCCESS
+        )
+
+
+def test_submit_batch_prepares_next_job_during_submission(tmp_path):
+    """Test batch results keep job order and the next job is prepared during the current one."""
+    resume = tmp_path / 'resume.pdf'
+    resume.write_bytes(b'%PDF')
+    submitter = ApplicationSubmitter(SubmissionConfig(delay_between_submissions=0, form_cache_path=None))
+    events = []
+    submitter.handlers = {'generic': RecordingHandler(events)}
+    
+    def check_documents(resume_path, cover_letter):
+        events.append(('prepare', threading.current_thread() is not threading.main_thread()))
+        return None
+    
+    submitter._check_documents = check_documents
+    jobs = [{'id': f'job-{i}', 'application_url': 'https://example.com/apply'} for i in range(3)]
+    
+    results = asyncio.run(submitter.submit_batch(jobs, str(resume), None, {}))
+    
+    assert [r.job_id for r in results] == ['job-0', 'job-1', 'job-2']
+    assert all(r.success for r in results)
+    # Documents are checked off the event loop thread
+    assert all(off_thread for kind, off_thread in events if kind == 'prepare')
+    # Job 1 is prepared after job 0 enters the browser and before it leaves
+    assert [kind for kind, _ in events][:4] == ['prepare', 'submit', 'prepare', 'done']
+    assert submitter.get_rate_limiter_stats()['generic']['submissions_last_hour'] == 3
+
+
+def test_submit_application_missing_resume(tmp_path):
+    """Test a missing resume fails before the handler or rate limiter are used."""
+    submitter = ApplicationSubmitter(SubmissionConfig(form_cache_path=None))
+    events = []
+    submitter.handlers = {'generic': RecordingHandler(events)}
+    
+    result = asyncio.run(submitter.submit_application(
+        {'id': 'job-0', 'application_url': 'https://example.com/apply'},
+        str(tmp_path / 'missing.pdf'), None, {}
+    ))
+    
+    assert result.status == SubmissionStatus.FAILED
+    assert 'Resume file not found' in result.error_message
+    assert events == []
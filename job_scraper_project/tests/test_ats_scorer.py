@@ -0,0 +1,73 @@
+"""Unit tests for ATS scoring."""
+import pytest
+from optimization.ats_scorer import ATSScorer, keyword_coverage_scores
+from optimization.keyword_extractor import KeywordExtractor
+
+RESUME = """SUMMARY
+Python developer shipping Django services on k8s.
+EXPERIENCE
+Built REST APIs with Python, SQL and Docker.
+EDUCATION
+BSc Computer Science
+SKILLS
+Python, Django, Docker, SQL"""
+
+JOBS = [
+    "Java developer with Spring Boot and Oracle",
+    "Python developer with Django, Kubernetes and SQL",
+    "Frontend engineer: React, TypeScript and CSS",
+    "",
+]
+
+
+@pytest.fixture
+def scorer():
+    """ATS scorer without a persisted keyword table"""
+    return ATSScorer(keyword_extractor=KeywordExtractor(df_path=None))
+
+
+def test_keyword_coverage_target_range():
+    """Test coverage scoring reaches full marks at the 40% target"""
+    scores = keyword_coverage_scores([0.0, 0.2, 0.4, 0.6, 1.0])
+    assert scores.tolist() == pytest.approx([0.0, 50.0, 100.0, 100.0, 100.0])
+
+
+def test_score_many_matches_score_resume(scorer):
+    """Test batch results equal single-job scoring and are ranked"""
+    results = scorer.score_many(RESUME, JOBS)
+    
+    assert [r['job_index'] for r in results][0] == 1
+    assert [r['overall_score'] for r in results] == sorted(
+        (r['overall_score'] for r in results), reverse=True
+    )
+    for result in results:
+        single = scorer.score_resume(RESUME, JOBS[result['job_index']])
+        assert result['overall_score'] == pytest.approx(single['overall_score'])
+        assert result['missing_keywords'] == single['missing_keywords']
+
+
+def test_aliases_count_as_present(scorer):
+    """Test a skill mentioned through an alias is not reported missing"""
+    result = scorer.score_resume(RESUME, JOBS[1])
+    assert 'kubernetes' not in result['missing_keywords']
+    assert scorer._score_keyword_density(RESUME, JOBS[1]) == result['breakdown']['keyword_density']
+
+
+def test_resume_analysis_is_cached(scorer):
+    """Test the resume is analyzed once across jobs"""
+    first = scorer.analyze_resume(RESUME)
+    scorer.score_many(RESUME, JOBS)
+    assert scorer.analyze_resume(RESUME) is first
+    assert first.sections_score == 80.0
+    
+    small = ATSScorer(keyword_extractor=scorer.keyword_extractor, cache_size=1)
+    small.analyze_resume(RESUME)
+    small.analyze_resume("another resume")
+    assert len(small._analysis_cache) == 1
+
+
+def test_job_without_keywords_gets_neutral_score(scorer):
+    """Test an empty job description keeps the neutral keyword score"""
+    result = scorer.score_resume(RESUME, "")
+    assert result['breakdown']['keyword_density'] == 85.0
+    assert result['missing_keywords'] == []
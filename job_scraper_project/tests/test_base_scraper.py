@@ -1,4 +1,5 @@
 """Unit tests for base scraper functionality."""
+import asyncio
 import pytest
 from adapters.base_scraper import BaseScraper, ScraperError
 
@@ -25,6 +26,25 @@ class FailingScraper(BaseScraper):
         raise Exception("Mock failure")
 
 
+class PagedScraper(BaseScraper):
+    """Scraper returning one job per page for pagination tests."""
+    
+    def __init__(self, max_pages: int = 3, last_page: int = 10):
+        super().__init__(max_pages=max_pages)
+        self.last_page = last_page
+        self.pages_fetched = 0
+    
+    def start_url(self) -> str:
+        return "https://example.com"
+    
+    def extract_fields(self):
+        self.pages_fetched += 1
+        return [{"title": f"Job {self.current_page}", "company": "Test Corp"}]
+    
+    def handle_pagination(self) -> bool:
+        return self.current_page < self.last_page
+
+
 def test_scraper_initialization():
     """Test scraper can be initialized."""
     scraper = MockScraper()
@@ -67,3 +87,43 @@ def test_scraper_pagination():
     """Test pagination handling."""
     scraper = MockScraper()
     assert scraper.handle_pagination() is False
+
+
+def test_iter_jobs_follows_pagination():
+    """Test iter_jobs walks pages up to max_pages."""
+    scraper = PagedScraper(max_pages=3)
+    titles = [job["title"] for job in scraper.iter_jobs()]
+    assert titles == ["Job 0", "Job 1", "Job 2"]
+    assert scraper.current_page == 3
+
+
+def test_iter_jobs_stops_when_site_has_no_more_pages():
+    """Test iter_jobs stops when handle_pagination returns False."""
+    scraper = PagedScraper(max_pages=5, last_page=2)
+    assert len(list(scraper.iter_jobs())) == 2
+
+
+def test_iter_jobs_is_lazy():
+    """Test pages are fetched only as jobs are consumed."""
+    scraper = PagedScraper(max_pages=3)
+    jobs = scraper.iter_jobs()
+    next(jobs)
+    assert scraper.pages_fetched == 1
+
+
+def test_aiter_jobs():
+    """Test async iteration yields the same jobs as iter_jobs."""
+    async def collect():
+        return [job async for job in PagedScraper(max_pages=3).aiter_jobs()]
+    
+    jobs = asyncio.run(collect())
+    assert [job["title"] for job in jobs] == ["Job 0", "Job 1", "Job 2"]
+
+
+def test_aiter_jobs_error_handling():
+    """Test async iteration wraps adapter errors."""
+    async def collect():
+        return [job async for job in FailingScraper().aiter_jobs()]
+    
+    with pytest.raises(ScraperError):
+        asyncio.run(collect())
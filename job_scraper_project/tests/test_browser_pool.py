@@ -0,0 +1,213 @@
+"""Unit tests for the browser pool."""
+import asyncio
+
+import pytest
+from automation.application_submitter import ApplicationSubmitter
+from automation.models import SubmissionConfig
+from core.browser import STEALTH_SCRIPT, BrowserPool
+
+
+class FakePage:
+    """Page stand-in."""
+
+
+class FakeContext:
+    """Context stand-in recording init scripts and closes."""
+    
+    def __init__(self, browser, options):
+        """Belong to ``browser``."""
+        self.browser = browser
+        self.options = options
+        self.scripts = []
+        self.closed = False
+    
+    async def add_init_script(self, script):
+        """Record the script."""
+        self.scripts.append(script)
+    
+    async def new_page(self):
+        """Open a page."""
+        return FakePage()
+    
+    async def close(self):
+        """Mark closed."""
+        self.closed = True
+
+
+class FakeBrowser:
+    """Browser stand-in; ``connected`` can be cleared to simulate a crash."""
+    
+    def __init__(self):
+        """Start connected with no contexts."""
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+    
+    def is_connected(self):
+        """Connection state."""
+        return self.connected
+    
+    async def new_context(self, **options):
+        """Open a context."""
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+    
+    async def close(self):
+        """Mark closed."""
+        self.closed = True
+        self.connected = False
+
+
+class FakeBrowserType:
+    """Browser type stand-in recording launches."""
+    
+    def __init__(self):
+        """No browsers launched yet; ``failures`` launches will fail next."""
+        self.browsers = []
+        self.failures = 0
+    
+    async def launch(self, **options):
+        """Launch a browser."""
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("launch failed")
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+def run_with_pool(scenario, **kwargs):
+    """Run ``scenario(pool, browser_type)`` with a started fake pool."""
+    browser_type = FakeBrowserType()
+    
+    async def main():
+        async with BrowserPool(browser_type=browser_type, **kwargs) as pool:
+            return await scenario(pool, browser_type)
+    
+    return asyncio.run(main())
+
+
+def test_leases_fresh_contexts_from_warm_browsers():
+    """Test leases reuse the launched browsers but never a context."""
+    async def scenario(pool, browser_type):
+        contexts = []
+        for _ in range(4):
+            async with pool.lease() as lease:
+                assert STEALTH_SCRIPT in lease.context.scripts
+                contexts.append(lease.context)
+        return contexts
+    
+    contexts = run_with_pool(scenario, size=2)
+    
+    assert len(set(map(id, contexts))) == 4
+    assert all(context.closed for context in contexts)
+    assert len({id(context.browser) for context in contexts}) <= 2
+
+
+def test_recycles_browser_after_max_uses():
+    """Test a browser is relaunched once it has served max_uses leases."""
+    async def scenario(pool, browser_type):
+        for _ in range(3):
+            async with pool.lease():
+                pass
+        return pool.get_stats(), browser_type.browsers
+    
+    stats, browsers = run_with_pool(scenario, size=1, max_uses=2)
+    
+    assert stats['launches'] == 2 and stats['recycles'] == 1 and stats['leases'] == 3
+    assert browsers[0].closed
+
+
+def test_replaces_disconnected_browser():
+    """Test a crashed browser fails its health check and is replaced on lease."""
+    async def scenario(pool, browser_type):
+        browser_type.browsers[0].connected = False
+        lease = await pool.acquire(timeout=1)
+        await pool.release(lease)
+        return lease, pool.get_stats(), browser_type.browsers
+    
+    lease, stats, browsers = run_with_pool(scenario, size=1)
+    
+    assert lease.browser is browsers[1]
+    assert stats['unhealthy'] == 1 and stats['launches'] == 2
+
+
+def test_failed_relaunch_keeps_pool_size():
+    """Test a browser whose relaunch fails is launched again on a later lease."""
+    async def scenario(pool, browser_type):
+        async with pool.lease():
+            browser_type.failures = 2
+        # Recycle relaunch fails in the background, then the lease's retry fails
+        with pytest.raises(RuntimeError):
+            await pool.acquire(timeout=1)
+        lease = await pool.acquire(timeout=1)
+        await pool.release(lease)
+        return lease, pool.get_stats(), browser_type.browsers
+    
+    lease, stats, browsers = run_with_pool(scenario, size=1, max_uses=1)
+    
+    assert lease.browser is browsers[1]
+    assert stats['launch_failures'] == 2 and stats['leases'] == 2
+
+
+def test_pool_size_caps_leases():
+    """Test a lease waits while every browser is in use."""
+    async def scenario(pool, browser_type):
+        first = await pool.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.acquire(timeout=0.05)
+        await pool.release(first)
+        second = await pool.acquire(timeout=1)
+        await pool.release(second)
+        return len(browser_type.browsers)
+    
+    assert run_with_pool(scenario, size=1) == 1
+
+
+def test_submitters_share_pool():
+    """Test submitters lease from a shared pool and leave it running."""
+    config = SubmissionConfig(form_cache_path=None)
+    
+    async def scenario(pool, browser_type):
+        async with ApplicationSubmitter(config, browser_pool=pool) as first:
+            async with ApplicationSubmitter(config, browser_pool=pool) as second:
+                assert first.context is not second.context
+                assert first.handlers['generic'].page is first.page
+        assert pool.started
+        return pool.get_stats()
+    
+    stats = run_with_pool(scenario, size=2)
+    
+    assert stats['launches'] == 2 and stats['leases'] == 2
+
+
+def test_pool_from_config(tmp_path):
+    """Test pool settings load from the automation config."""
+    config_path = tmp_path / 'automation.yaml'
+    config_path.write_text('browser_pool:\n  size: 3\n  max_uses: 10\n')
+    
+    pool = BrowserPool.from_config(str(config_path), headless=False)
+    
+    assert (pool.size, pool.max_uses) == (3, 10)
+    assert pool.launch_options['headless'] is False
+
+
+def test_private_pool_uses_config(tmp_path, monkeypatch):
+    """Test a submitter without a shared pool builds its own from the automation config."""
+    (tmp_path / 'config').mkdir()
+    (tmp_path / 'config' / 'automation.yaml').write_text('browser_pool:\n  size: 4\n  max_uses: 7\n')
+    monkeypatch.chdir(tmp_path)
+    
+    async def no_start(pool):
+        raise RuntimeError("no browser in tests")
+    
+    monkeypatch.setattr(BrowserPool, 'start', no_start)
+    submitter = ApplicationSubmitter(SubmissionConfig(form_cache_path=None, headless=True))
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(submitter._setup_browser())
+    
+    pool = submitter.browser_pool
+    assert (pool.size, pool.max_uses) == (1, 7)
+    assert pool.launch_options['headless'] is True
@@ -0,0 +1,102 @@
+"""Unit tests for the columnar job archive."""
+import pytest
+from core.columnar import ColumnarWriter, read_columnar
+from core.export_manager import export_data
+
+JOBS = [
+    {"title": f"Job {i}", "company": "Acme" if i % 2 else "Globex",
+     "location": "Austin, TX", "source": "indeed", "salary_max": 100000 + i,
+     "is_remote": i % 3 == 0}
+    for i in range(25)
+]
+
+
+@pytest.fixture(params=["npz", "parquet"])
+def backend(request):
+    """Run each test against both backends."""
+    if request.param == "parquet":
+        pytest.importorskip("pyarrow")
+    return request.param
+
+
+def test_columnar_round_trip(tmp_path, backend):
+    """Test records survive a write/read cycle across several row groups."""
+    with ColumnarWriter(tmp_path / "jobs", row_group_size=10, backend=backend) as writer:
+        writer.write_many(JOBS)
+    
+    assert writer.row_groups == 3
+    assert writer.path.suffix == f".{backend}"
+    columns = read_columnar(writer.path)
+    assert columns["title"] == [job["title"] for job in JOBS]
+    assert columns["company"] == [job["company"] for job in JOBS]
+    assert columns["salary_max"] == [float(job["salary_max"]) for job in JOBS]
+    assert columns["is_remote"] == [job["is_remote"] for job in JOBS]
+
+
+def test_columnar_column_projection(tmp_path, backend):
+    """Test reading only the requested columns."""
+    with ColumnarWriter(tmp_path / "jobs", backend=backend) as writer:
+        writer.write_many(JOBS)
+    
+    columns = read_columnar(writer.path, columns=["company"])
+    assert list(columns) == ["company"]
+    assert len(columns["company"]) == len(JOBS)
+
+
+def test_columnar_missing_values(tmp_path, backend):
+    """Test None values and keys missing from some records."""
+    records = [{"title": "A", "company": None}, {"title": None, "company": "B", "extra": 1}]
+    with ColumnarWriter(tmp_path / "jobs", columns=["title", "company"], backend=backend) as writer:
+        writer.write_many(records)
+    
+    columns = read_columnar(writer.path)
+    assert columns == {"title": ["A", None], "company": [None, "B"]}
+
+
+def test_columnar_bool_nulls(tmp_path, backend):
+    """Test a missing bool stays None on both backends instead of becoming False."""
+    records = [{"is_remote": True}, {"is_remote": None}, {"is_remote": False}]
+    with ColumnarWriter(tmp_path / "jobs", backend=backend) as writer:
+        writer.write_many(records)
+    
+    assert read_columnar(writer.path)["is_remote"] == [True, None, False]
+
+
+@pytest.mark.parametrize("value", ["no", "100k"])
+def test_columnar_kind_mismatch_raises(tmp_path, value):
+    """Test a later value that does not fit its column is rejected, not coerced."""
+    column = "is_remote" if value == "no" else "salary_max"
+    records = [{column: True if value == "no" else 100000.0}, {column: value}]
+    with pytest.raises(ValueError, match=column):
+        with ColumnarWriter(tmp_path / "jobs", row_group_size=1, backend="npz") as writer:
+            writer.write_many(records)
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_columnar_late_keys_logged(tmp_path, caplog):
+    """Test keys first seen after the first row group are reported when dropped."""
+    records = [{"title": "A"}, {"title": "B", "salary": "90k"}]
+    with caplog.at_level("WARNING", logger="core.columnar"):
+        with ColumnarWriter(tmp_path / "jobs", row_group_size=1, backend="npz") as writer:
+            writer.write_many(records)
+    
+    assert "salary" in caplog.text
+    assert list(read_columnar(writer.path)) == ["title"]
+
+
+def test_columnar_abort(tmp_path):
+    """Test a failed export leaves nothing behind."""
+    with pytest.raises(RuntimeError):
+        with ColumnarWriter(tmp_path / "jobs", backend="npz") as writer:
+            writer.write_many(JOBS)
+            raise RuntimeError("crawl failed")
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_data_parquet(tmp_path):
+    """Test export_data with the columnar format."""
+    output_dir = tmp_path / "output"
+    assert export_data(JOBS, "jobs", "parquet", str(output_dir)) is True
+    assert len(list(output_dir.glob("jobs.*"))) == 1
@@ -0,0 +1,120 @@
+"""Unit tests for job deduplication."""
+import pytest
+from discovery.deduplicator import JobDeduplicator
+from discovery.minhash import MinHashLSH, optimal_bands, shingle
+
+DESCRIPTION = (
+    "We are looking for an experienced Python developer to build scalable backend "
+    "services with Django and PostgreSQL. You will work closely with product and "
+    "design, review code, mentor junior engineers and own features end to end."
+)
+
+
+def make_job(title="Python Developer", company="Acme", location="Austin, TX",
+             description=DESCRIPTION):
+    """Build a job dict for tests"""
+    return {"title": title, "company": company, "location": location,
+            "description": description}
+
+
+def test_exact_duplicates_removed():
+    """Test identical jobs are deduplicated by fingerprint"""
+    dedup = JobDeduplicator(strategy="fingerprint")
+    unique = dedup.deduplicate_batch([make_job(), make_job(), make_job(company="Globex")])
+    assert len(unique) == 2
+
+
+def test_near_duplicate_repost_detected():
+    """Test a cross-board repost with slightly different wording is caught"""
+    dedup = JobDeduplicator(similarity_threshold=0.8)
+    repost = make_job(
+        location="Austin, Texas",
+        description=DESCRIPTION.replace("closely", "directly")
+    )
+    unique = dedup.deduplicate_batch([make_job(), repost])
+    assert len(unique) == 1
+
+
+def test_different_jobs_kept():
+    """Test unrelated jobs are not flagged as duplicates"""
+    dedup = JobDeduplicator()
+    other = make_job(title="Data Analyst", company="Globex",
+                     description="Build dashboards in Tableau and write SQL reports for finance.")
+    assert len(dedup.deduplicate_batch([make_job(), other])) == 2
+
+
+def test_fingerprint_strategy_ignores_near_duplicates():
+    """Test the fingerprint strategy only removes exact matches"""
+    dedup = JobDeduplicator(strategy="fingerprint")
+    repost = make_job(location="Remote")
+    assert len(dedup.deduplicate_batch([make_job(), repost])) == 2
+
+
+def test_from_config(tmp_path):
+    """Test threshold and strategy are read from discovery.yaml"""
+    config = tmp_path / "discovery.yaml"
+    config.write_text("deduplication:\n  strategy: fuzzy\n  similarity_threshold: 0.75\n")
+    dedup = JobDeduplicator.from_config(str(config))
+    assert dedup.similarity_threshold == 0.75
+    assert dedup.index.threshold == 0.75
+    assert JobDeduplicator.from_config(str(tmp_path / "missing.yaml")).strategy == "fingerprint"
+
+
+def test_invalid_strategy():
+    """Test unknown strategies are rejected"""
+    with pytest.raises(ValueError):
+        JobDeduplicator(strategy="levenshtein")
+
+
+def test_minhash_estimate_tracks_jaccard():
+    """Test MinHash similarity estimates are close to the true Jaccard"""
+    index = MinHashLSH(threshold=0.5, num_perm=256)
+    a = shingle(DESCRIPTION)
+    b = shingle(DESCRIPTION.replace("Django", "Flask"))
+    true_jaccard = len(a & b) / len(a | b)
+    estimate = index.estimate_similarity(index.signature(a), index.signature(b))
+    assert abs(estimate - true_jaccard) < 0.1
+
+
+def test_optimal_bands_fit_signature():
+    """Test band/row choice never exceeds the signature length"""
+    bands, rows = optimal_bands(0.9, 128)
+    assert bands * rows <= 128
+    assert bands > 1
+
+
+def test_lsh_index_stays_bounded():
+    """Test the index evicts its oldest documents and their band entries"""
+    index = MinHashLSH(threshold=0.5, num_perm=64, max_size=3)
+    signatures = [index.signature(shingle(f"{DESCRIPTION} Opening number {i}.")) for i in range(10)]
+    for i, signature in enumerate(signatures):
+        index.insert(i, signature)
+    
+    assert len(index) == 3
+    assert all(len(bucket) <= 3 for band in index._buckets for bucket in band.values())
+    assert sum(len(band) for band in index._buckets) <= 3 * index.bands
+    assert 0 not in index.query(signatures[0])
+    assert 9 in index.query(signatures[9])
+
+
+def test_lsh_index_expires_entries(monkeypatch):
+    """Test documents older than the ttl are dropped from the index"""
+    clock = [1000.0]
+    monkeypatch.setattr("discovery.minhash.time.time", lambda: clock[0])
+    index = MinHashLSH(threshold=0.5, num_perm=64, ttl=60)
+    signature = index.signature(shingle(DESCRIPTION))
+    index.insert("old", signature)
+    
+    clock[0] += 61
+    
+    assert index.query(signature) == []
+    assert len(index) == 0
+
+
+def test_deduplicator_index_bounded_by_cache_size():
+    """Test the near-duplicate index is capped like the fingerprint store"""
+    deduplicator = JobDeduplicator(cache_size=5)
+    jobs = [make_job(title=f"Engineer {i}", description=f"Role {i} " + DESCRIPTION[i:]) for i in range(20)]
+    deduplicator.deduplicate_batch(jobs)
+    
+    assert len(deduplicator.index) <= 5
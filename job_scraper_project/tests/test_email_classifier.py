@@ -0,0 +1,79 @@
+"""Unit tests for email classification."""
+import random
+
+import numpy as np
+import pytest
+
+from tracking.classifier import EmailClassification, EmailClassifier, KeywordMatcher
+
+FILLER = (
+    "thank you for your interest in the role we received your application "
+    "and our team will review it carefully other positions naïve café"
+).split()
+
+
+def make_messages(count, seed=0):
+    """Random (subject, body) pairs with keywords sprinkled in"""
+    rng = random.Random(seed)
+    keywords = (
+        EmailClassifier.REJECTION_KEYWORDS
+        + EmailClassifier.INTERVIEW_KEYWORDS
+        + EmailClassifier.OFFER_KEYWORDS
+    )
+    messages = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.randrange(0, 60))]
+        for _ in range(rng.randrange(0, 4)):
+            keyword = rng.choice(keywords)
+            if rng.random() < 0.3:
+                keyword = keyword.upper()
+            words.insert(rng.randrange(len(words) + 1), keyword)
+        body = " ".join(words)
+        messages.append((rng.choice(["Your application", "Next steps", "Re: role", ""]), body))
+    return messages
+
+
+def test_classify_batch_matches_classify():
+    """Test the batch path agrees with per-message classification"""
+    classifier = EmailClassifier()
+    messages = make_messages(500)
+    messages += [
+        ("Job offer", "letter attached"),          # keyword spans subject and body
+        ("", "your job offer letter is ready"),    # overlapping keywords
+        ("", "we rescheduled the call"),           # keyword inside a word
+        ("", ""),
+    ]
+    batch = classifier.classify_batch(messages, chunk_size=64)
+    
+    assert len(batch) == len(messages)
+    for i, (subject, body) in enumerate(messages):
+        expected = classifier.classify(subject, body)
+        assert batch.classification(i) is expected['classification']
+        assert batch.confidences[i] == pytest.approx(expected['confidence'])
+        assert list(batch.scores[i]) == [
+            expected['scores']['rejection'],
+            expected['scores']['interview'],
+            expected['scores']['offer'],
+        ]
+
+
+def test_classify_batch_worker_pool():
+    """Test a process pool returns the in-process result"""
+    classifier = EmailClassifier()
+    messages = make_messages(60, seed=1)
+    pooled = classifier.classify_batch(messages, workers=2, chunk_size=16)
+    local = classifier.classify_batch(messages)
+    np.testing.assert_array_equal(pooled.labels, local.labels)
+    np.testing.assert_array_equal(pooled.scores, local.scores)
+    
+    empty = classifier.classify_batch([])
+    assert len(empty) == 0 and empty.scores.shape == (0, 3)
+
+
+def test_keyword_matcher_short_keywords():
+    """Test keywords shorter than the hashed window are still found"""
+    matcher = KeywordMatcher([["hr", "no"], ["offer"]])
+    counts = matcher.count(["No offer from HR", "nothing", "", "hrs"])
+    np.testing.assert_array_equal(counts, [[2, 1], [1, 0], [0, 0], [1, 0]])
+    batch = EmailClassifier().classify_batch([("", "Congratulations!")])
+    assert batch.classification(0) is EmailClassification.OFFER
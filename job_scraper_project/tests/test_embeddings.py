@@ -0,0 +1,119 @@
+"""Unit tests for cached text embeddings."""
+import numpy as np
+import pytest
+from matching.embeddings import EmbeddingCache, HashingEncoder, TextEmbedder, normalize_text, text_key
+from matching.matcher import JobMatcher, UserProfile
+
+
+class CountingEncoder(HashingEncoder):
+    """Hashing encoder that records every text it encodes"""
+    
+    def __init__(self):
+        super().__init__(dim=64)
+        self.calls = []
+    
+    def encode(self, texts, batch_size=64):
+        self.calls.append(list(texts))
+        return super().encode(texts, batch_size)
+
+
+def make_profile(titles):
+    """Build a UserProfile with the given target titles"""
+    return UserProfile(
+        user_id="u1", target_titles=titles, skills={"Python": "expert"},
+        experience_years=3, location="Austin, TX", remote_preference="any",
+        salary_min=0, salary_max=0, education=[],
+    )
+
+
+def test_normalize_text_expands_abbreviations():
+    """Test abbreviations map to the same normalized text"""
+    assert normalize_text("Sr. Python Dev") == "senior python developer"
+    assert normalize_text("  SENIOR python   Developer ") == "senior python developer"
+
+
+def test_hashing_encoder_similarity():
+    """Test hashed vectors are unit length and rank related titles higher"""
+    encoder = HashingEncoder()
+    vectors = encoder.encode(["python developer", "senior python developer", "registered nurse"])
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+
+def test_embed_encodes_each_text_once():
+    """Test duplicate and previously seen texts are served from the cache"""
+    encoder = CountingEncoder()
+    embedder = TextEmbedder(encoder=encoder, batch_size=2)
+    first = embedder.embed(["Python Developer", "python developer", "Data Analyst", "QA", ""])
+    embedder.embed(["Data Analyst", "Sr. Python Dev"])
+    
+    assert encoder.calls == [["python developer", "data analyst"], ["qa"], ["senior python developer"]]
+    assert np.allclose(first[0], first[1])
+    assert not first[4].any()
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """Test vectors written to the memory-mapped cache are reused after reopening"""
+    titles = [f"Engineer {i}" for i in range(40)]
+    embedder = TextEmbedder(encoder=CountingEncoder(), cache_dir=str(tmp_path))
+    expected = embedder.embed(titles)
+    embedder.close()
+    
+    encoder = CountingEncoder()
+    reopened = TextEmbedder(encoder=encoder, cache_dir=str(tmp_path))
+    assert len(reopened.cache) == 40
+    assert np.array_equal(reopened.embed(titles), expected)
+    assert encoder.calls == []
+
+
+def test_cache_grows_past_initial_capacity(tmp_path):
+    """Test the mapped file is resized when it fills up"""
+    keys = [text_key(f"title {i}") for i in range(5)]
+    vectors = np.arange(5 * 4, dtype=np.float32).reshape(5, 4)
+    cache = EmbeddingCache(str(tmp_path), "test", 4, initial_capacity=2)
+    cache.put_many(keys[:3], vectors[:3])
+    cache.put_many(keys, vectors)
+    cache.close()
+    
+    reopened = EmbeddingCache(str(tmp_path), "test", 4, initial_capacity=2)
+    assert len(reopened) == 5
+    assert np.array_equal(reopened.lookup(keys[::-1]), vectors[::-1])
+
+
+def test_cache_truncates_torn_key(tmp_path):
+    """Test a partial trailing key is dropped so later appends stay aligned"""
+    keys = [text_key(f"title {i}") for i in range(4)]
+    vectors = np.arange(4 * 4, dtype=np.float32).reshape(4, 4)
+    cache = EmbeddingCache(str(tmp_path), "test", 4)
+    cache.put_many(keys[:2], vectors[:2])
+    cache.close()
+    with open(tmp_path / "test-4.keys", 'ab') as f:
+        f.write(keys[2][:7])
+    
+    reopened = EmbeddingCache(str(tmp_path), "test", 4)
+    assert len(reopened) == 2
+    reopened.put_many(keys[2:], vectors[2:])
+    reopened.close()
+    
+    final = EmbeddingCache(str(tmp_path), "test", 4)
+    assert len(final) == 4
+    assert np.array_equal(final.lookup(keys), vectors)
+
+
+def test_unknown_backend_rejected():
+    """Test invalid backend names raise"""
+    with pytest.raises(ValueError):
+        TextEmbedder.from_settings({"backend": "gpu"})
+
+
+def test_title_match_scores():
+    """Test semantic title scoring in the per-job and batch paths"""
+    matcher = JobMatcher()
+    profile = make_profile(["Senior Python Developer"])
+    jobs = [{"title": "Sr. Python Dev"}, {"title": "Python Engineer"}, {"title": "Registered Nurse"}]
+    
+    scores = [matcher._score_title_match(job, profile) for job in jobs]
+    assert scores[0] == pytest.approx(100.0)
+    assert scores[0] > scores[1] > scores[2]
+    assert matcher.score_batch(jobs, profile).breakdown['title_match'] == pytest.approx(scores)
+    assert matcher._score_title_match(jobs[0], make_profile([])) == 75.0
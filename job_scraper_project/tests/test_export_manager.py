@@ -2,8 +2,9 @@
 import pytest
 import json
 import csv
+import gzip
 from pathlib import Path
-from core.export_manager import export_data, _export_json, _export_csv
+from core.export_manager import export_data, _export_json, _export_csv, ExportWriter
 
 
 def test_export_json(tmp_path):
@@ -65,3 +66,53 @@ def test_export_invalid_format(tmp_path):
     data = [{"title": "Job"}]
     with pytest.raises(ValueError):
         export_data(data, "test", "xml", str(tmp_path))
+
+
+def test_export_csv_heterogeneous_records(tmp_path):
+    """Test CSV header covers keys missing from the first record."""
+    data = [{"title": "Job 1"}, {"title": "Job 2", "salary": "$100k"}]
+    file_path = tmp_path / "test.csv"
+    
+    _export_csv(data, file_path)
+    
+    with open(file_path, 'r') as f:
+        rows = list(csv.DictReader(f))
+    assert rows[1]["salary"] == "$100k"
+
+
+def test_export_writer_jsonl(tmp_path):
+    """Test streaming JSON Lines export."""
+    output_dir = tmp_path / "output"
+    with ExportWriter("jobs", "jsonl", str(output_dir)) as writer:
+        writer.write({"title": "Job 1"})
+        writer.write_many({"title": f"Job {i}"} for i in range(2, 4))
+    
+    lines = (output_dir / "jobs.jsonl").read_text().splitlines()
+    assert writer.count == 3
+    assert [json.loads(line)["title"] for line in lines] == ["Job 1", "Job 2", "Job 3"]
+
+
+def test_export_writer_csv_schema_evolution(tmp_path):
+    """Test CSV header is the union of keys and early rows are padded."""
+    output_dir = tmp_path / "output"
+    with ExportWriter("jobs", "csv", str(output_dir), compress=True) as writer:
+        writer.write({"title": "Job 1", "company": "A"})
+        writer.write({"title": "Job 2", "salary": "$100k"})
+    
+    with gzip.open(output_dir / "jobs.csv.gz", "rt", newline="") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+    assert reader.fieldnames == ["title", "company", "salary"]
+    assert rows[0] == {"title": "Job 1", "company": "A", "salary": ""}
+    assert rows[1] == {"title": "Job 2", "company": "", "salary": "$100k"}
+
+
+def test_export_writer_atomic_on_error(tmp_path):
+    """Test a failed export leaves no partial or temp files behind."""
+    output_dir = tmp_path / "output"
+    with pytest.raises(RuntimeError):
+        with ExportWriter("jobs", "csv", str(output_dir)) as writer:
+            writer.write({"title": "Job 1"})
+            raise RuntimeError("crawl failed")
+    
+    assert list(output_dir.iterdir()) == []
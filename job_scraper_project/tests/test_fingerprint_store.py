@@ -0,0 +1,104 @@
+"""Unit tests for fingerprint stores."""
+import time
+from discovery.deduplicator import JobDeduplicator
+from discovery.fingerprint_store import (
+    BloomFilter,
+    MemoryFingerprintStore,
+    SQLiteFingerprintStore,
+    TieredFingerprintStore,
+)
+
+
+def test_memory_store_lru_eviction():
+    """Test the least recently seen fingerprint is evicted"""
+    store = MemoryFingerprintStore(max_size=2)
+    store.add("a")
+    store.add("b")
+    assert "a" in store
+    store.add("c")
+    assert len(store) == 2
+    assert "b" not in store
+    assert "a" in store and "c" in store
+
+
+def test_memory_store_ttl():
+    """Test expired fingerprints are treated as unseen"""
+    store = MemoryFingerprintStore(ttl=0.05)
+    store.add("a")
+    assert "a" in store
+    time.sleep(0.1)
+    assert "a" not in store
+
+
+def test_sqlite_store_persists(tmp_path):
+    """Test fingerprints survive reopening the store"""
+    path = tmp_path / "fingerprints.db"
+    store = SQLiteFingerprintStore(str(path))
+    store.add("a")
+    store.close()
+    
+    reopened = SQLiteFingerprintStore(str(path))
+    assert "a" in reopened
+    assert "b" not in reopened
+    assert list(reopened) == ["a"]
+    reopened.close()
+
+
+def test_bloom_filter_no_false_negatives():
+    """Test every added item is reported and misses stay rare"""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"fp{i}")
+    assert all(f"fp{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other{i}" in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_tiered_store_promotes_and_warms_bloom(tmp_path):
+    """Test history from a previous run is found through all tiers"""
+    path = str(tmp_path / "fingerprints.db")
+    first = SQLiteFingerprintStore(path)
+    first.add("old")
+    first.close()
+    
+    store = TieredFingerprintStore(
+        MemoryFingerprintStore(max_size=10),
+        persistent=SQLiteFingerprintStore(path),
+        bloom=BloomFilter(capacity=100)
+    )
+    assert "old" in store
+    assert "old" in store.memory
+    assert "new" not in store
+    store.close()
+
+
+def test_deduplicator_remembers_across_runs(tmp_path):
+    """Test a persistent store dedupes against a previous run"""
+    path = str(tmp_path / "fingerprints.db")
+    job = {"title": "Python Developer", "company": "Acme", "location": "Austin"}
+    
+    first = JobDeduplicator(store=SQLiteFingerprintStore(path))
+    assert len(first.deduplicate_batch([job])) == 1
+    first.close()
+    
+    second = JobDeduplicator(store=SQLiteFingerprintStore(path))
+    assert second.deduplicate_batch([job]) == []
+    second.close()
+
+
+def test_sqlite_store_prunes_expired_rows(tmp_path):
+    """Test expired rows are deleted on open and every prune_interval additions"""
+    path = str(tmp_path / "fingerprints.db")
+    store = SQLiteFingerprintStore(path, ttl=0.05, prune_interval=3)
+    store.add("a")
+    store.add("b")
+    time.sleep(0.1)
+    store.add("c")
+    assert len(store) == 1
+    store.add("d")
+    time.sleep(0.1)
+    store.close()
+    
+    reopened = SQLiteFingerprintStore(path, ttl=0.05)
+    assert len(reopened) == 0
+    reopened.close()
@@ -1,6 +1,11 @@
 """Unit tests for form mapper."""
+import asyncio
+import re
+
 import pytest
-from automation.models import FormField, FieldType
+from automation.form_cache import FormSignatureCache, form_signature
+from automation.form_mapper import FormMapper
+from automation.models import FormField, FieldType, SubmissionConfig
 
 
 def test_form_field_creation():
@@ -90,3 +95,158 @@ def test_form_field_confidence():
     
     assert field.confidence == 0.95
     assert 0.0 <= field.confidence <= 1.0
+
+
+class SnapshotPage:
+    """Page stand-in answering the snapshot script with fixed rows."""
+    
+    def __init__(self, rows=None, error=None):
+        """Answer with ``rows``, or raise ``error``."""
+        self.rows = rows
+        self.error = error
+        self.evaluations = 0
+    
+    async def evaluate(self, script, arg=None):
+        """Return the canned snapshot rows."""
+        self.evaluations += 1
+        if self.error:
+            raise self.error
+        return self.rows
+    
+    async def query_selector_all(self, selector):
+        """Find no elements."""
+        return []
+
+
+def test_snapshot_builds_fields():
+    """Test fields are built from one snapshot payload."""
+    rows = [
+        [0, 'first_name', 'first', None, True, False, False, None, 'First Name', '#first_name', None],
+        [1, None, 'contact', None, False, False, False, 'a@b.c', 'Contact', '[name="contact"]', None],
+        [3, 'cv', None, None, True, False, False, None, 'Upload CV', '#cv', None],
+        [4, None, None, None, False, False, True, None, None,
+         'form:nth-of-type(1) > select:nth-of-type(1)', ['USA', 'Canada']],
+    ]
+    page = SnapshotPage(rows)
+    fields = asyncio.run(FormMapper(page).detect_all_fields())
+    
+    assert page.evaluations == 1
+    assert [f.field_type for f in fields] == [
+        FieldType.TEXT, FieldType.EMAIL, FieldType.FILE, FieldType.SELECT
+    ]
+    assert [f.detected_purpose for f in fields] == ['first_name', 'email', 'resume', None]
+    assert fields[0].required and fields[3].disabled
+    assert fields[1].current_value == 'a@b.c'
+    assert fields[3].options == ['USA', 'Canada']
+
+
+def test_snapshot_failure_falls_back():
+    """Test per-element detection runs when the snapshot script fails."""
+    page = SnapshotPage(error=RuntimeError("evaluate failed"))
+    assert asyncio.run(FormMapper(page).detect_all_fields()) == []
+    assert page.evaluations == 1
+
+
+def legacy_purpose(text):
+    """Purpose as found by searching each pattern list in turn."""
+    def matches(patterns):
+        return any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
+    if matches(FormMapper.NAME_PATTERNS):
+        return 'first_name' if 'first' in text else 'last_name' if 'last' in text else 'full_name'
+    if matches(FormMapper.EMAIL_PATTERNS):
+        return 'email'
+    if matches(FormMapper.PHONE_PATTERNS):
+        return 'phone'
+    if matches(FormMapper.URL_PATTERNS):
+        for key in ('linkedin', 'github', 'portfolio'):
+            if key in text:
+                return f'{key}_url'
+        return 'website_url'
+    if matches(FormMapper.ADDRESS_PATTERNS):
+        for key, purpose in (('city', 'city'), ('state', 'state'), ('zip', 'zip_code'),
+                             ('postal', 'zip_code'), ('country', 'country')):
+            if key in text:
+                return purpose
+        return 'address'
+    return None
+
+
+@pytest.mark.parametrize('label', [
+    'First Name', 'last name', 'Full name', 'Your name (email us)', 'E-mail', 'Mail address',
+    'Mobile phone', 'Contact number', 'LinkedIn Profile URL', 'GitHub', 'Portfolio website',
+    'Personal website', 'City', 'State / Province', 'Zip code', 'Postal code', 'Country',
+    'Street address', 'Cover letter', 'Username', 'Emailed before?', 'Phone or email',
+    'Website city', '',
+])
+def test_combined_classifier_matches_pattern_lists(label):
+    """Test the combined regex resolves the same purposes as the pattern lists."""
+    field = FormField(selector='#f', field_type=FieldType.TEXT, label=label)
+    assert FormMapper(SnapshotPage())._detect_field_purpose(field) == legacy_purpose(label.lower())
+
+
+FORM_ROWS = [
+    [0, 'first_name', 'first', None, True, False, False, None, 'First Name', '#first_name', None],
+    [1, 'email', 'email', None, True, False, False, None, 'Email', '#email', None],
+    [3, 'resume', None, None, True, False, False, None, 'Resume/CV', '#resume', None],
+]
+
+
+def test_form_cache_reuses_purposes(tmp_path, monkeypatch):
+    """Test a known form layout skips classification and counts hits."""
+    cache = FormSignatureCache(str(tmp_path / 'form_cache.json'))
+    first = asyncio.run(FormMapper(SnapshotPage(FORM_ROWS), cache=cache).detect_all_fields())
+    assert cache.stats['misses'] == 1 and len(cache) == 1
+    
+    # Same template on another job: different values, same structure
+    rows = [row[:7] + ['Ada'] + row[8:] for row in FORM_ROWS]
+    mapper = FormMapper(SnapshotPage(rows), cache=cache)
+    monkeypatch.setattr(mapper, '_detect_field_purpose', lambda field: pytest.fail('classified'))
+    second = asyncio.run(mapper.detect_all_fields())
+    
+    assert [f.detected_purpose for f in second] == [f.detected_purpose for f in first]
+    assert [f.detected_purpose for f in second] == ['first_name', 'email', 'resume']
+    assert second[0].current_value == 'Ada'
+    assert cache.stats == {'hits': 1, 'misses': 1, 'entries': 1, 'hit_rate': 0.5}
+    
+    # A changed layout is a miss
+    asyncio.run(FormMapper(SnapshotPage(FORM_ROWS[:2]), cache=cache).detect_all_fields())
+    assert cache.misses == 2 and len(cache) == 2
+
+
+def test_form_cache_separates_placeholder_only_layouts():
+    """Test unlabeled fields differing only by placeholder get their own purposes."""
+    cache = FormSignatureCache()
+    email_rows = [[0, None, None, 'Email', False, False, False, None, None, 'input', None]]
+    phone_rows = [[0, None, None, 'Phone number', False, False, False, None, None, 'input', None]]
+    
+    email = asyncio.run(FormMapper(SnapshotPage(email_rows), cache=cache).detect_all_fields())
+    phone = asyncio.run(FormMapper(SnapshotPage(phone_rows), cache=cache).detect_all_fields())
+    
+    assert form_signature(email_rows) != form_signature(phone_rows)
+    assert email[0].detected_purpose == 'email'
+    assert phone[0].detected_purpose == 'phone'
+
+
+def test_form_cache_persistence(tmp_path):
+    """Test cached layouts survive a reload and the LRU bound holds."""
+    path = tmp_path / 'cache' / 'form_cache.json'
+    cache = FormSignatureCache(str(path), max_entries=2)
+    for n in range(3):
+        asyncio.run(FormMapper(SnapshotPage(FORM_ROWS[:n + 1]), cache=cache).detect_all_fields())
+    cache.save()
+    
+    reloaded = FormSignatureCache(str(path), max_entries=2)
+    assert len(reloaded) == 2
+    assert reloaded.get(form_signature(FORM_ROWS[:1])) is None
+    assert reloaded.get(form_signature(FORM_ROWS)) == ['first_name', 'email', 'resume']
+
+
+def test_form_cache_settings_from_config(tmp_path):
+    """Test the form_cache section of the automation config drives the submission config."""
+    config = tmp_path / 'automation.yaml'
+    config.write_text('form_cache:\n  path: "cache/forms.json"\n  max_entries: 5\n')
+    loaded = SubmissionConfig.from_config(str(config))
+    assert (loaded.form_cache_path, loaded.form_cache_size) == ('cache/forms.json', 5)
+    
+    config.write_text('form_cache:\n  enabled: false\n')
+    assert SubmissionConfig.from_config(str(config)).form_cache_path is None
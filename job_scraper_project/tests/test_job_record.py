@@ -0,0 +1,109 @@
+"""Unit tests for the normalized job record."""
+import csv
+
+import pytest
+
+from adapters.linkedin import LinkedInScraper
+from core.export_manager import ExportWriter
+from core.job_record import EXPORT_FIELDS, JobRecord, as_job_record
+from discovery.deduplicator import JobDeduplicator
+from matching.deal_breakers import DealBreakerChecker, ProfileIndex
+from matching.matcher import JobMatcher, UserProfile
+
+JOBS = [
+    {"title": "Python Developer", "company": "Acme", "location": "Austin, TX",
+     "description": "5+ years of Python and AWS", "salary": "$80,000 - $120,000"},
+    {"title": "Backend Engineer", "company": "Globex", "location": "Remote",
+     "description": "Java and SQL, 2 years", "salary_max": 150000, "is_remote": True},
+    {"title": "Data Analyst", "company": "Evil Corp", "location": "New York, NY",
+     "description": "SQL reporting"},
+    {"title": "Junior Developer", "company": "Startup", "location": "Boston, MA",
+     "url": "https://example.com/junior", "salary": "50k-60k"},
+]
+
+
+def test_from_dict_normalizes_fields():
+    """Test adapter keys, salary text and remote flag are resolved at ingest"""
+    record = JobRecord.from_dict({
+        "title": "Remote Backend Engineer", "company": "  LinkedIn ",
+        "location": "San Francisco, CA", "link": "https://example.com/1",
+        "salary": "$100,000 - $150,000", "skills": ["Python"],
+    }, source="linkedin")
+    
+    assert record.application_url == "https://example.com/1"
+    assert (record.salary_min, record.salary_max) == (100000.0, 150000.0)
+    assert record.is_remote
+    assert record.company_key == "linkedin"
+    assert record.location_key == "san francisco  ca"
+    assert record.source == "linkedin"
+    assert record.extra == {"skills": ["Python"]}
+    assert record.get("skills") == ["Python"]
+    assert record.get("missing", "n/a") == "n/a"
+
+
+def test_salary_bounds():
+    """Test explicit bounds win over text and one bound fills the other"""
+    assert JobRecord.from_dict({"salary_max": 90000, "salary": "50k"}).salary_min == 90000.0
+    unknown = JobRecord.from_dict({"title": "A", "salary": "Competitive"})
+    assert unknown.salary_min is None and unknown.salary_max is None
+    # String bounds are parsed instead of aborting ingest
+    text = JobRecord.from_dict({"salary_min": "100k", "salary_max": "$120,000 - $140,000"})
+    assert (text.salary_min, text.salary_max) == (100000.0, 140000.0)
+    assert JobRecord.from_dict({"salary_min": "negotiable"}).salary_min is None
+
+
+def test_fingerprint_matches_dict_fingerprint():
+    """Test records and dicts of one job share a fingerprint"""
+    dedup = JobDeduplicator()
+    for job in JOBS:
+        assert JobRecord.from_dict(job).fingerprint == dedup.generate_fingerprint(job)
+
+
+def test_deduplicate_records():
+    """Test deduplication of records, including a renamed-key repost"""
+    jobs = [dict(job, link=f"https://example.com/{i}") for i, job in enumerate(JOBS)]
+    records = [JobRecord.from_dict(job) for job in jobs + jobs[:2]]
+    unique = JobDeduplicator().deduplicate_batch(records)
+    assert [r.title for r in unique] == [job["title"] for job in JOBS]
+
+
+def test_records_score_like_dicts():
+    """Test matching and deal-breakers give the same results for records"""
+    matcher = JobMatcher()
+    checker = DealBreakerChecker()
+    profile = UserProfile(
+        user_id="u1", target_titles=["Python Developer"], skills={"Python": "expert"},
+        experience_years=3, location="Austin, TX", remote_preference="any",
+        salary_min=90000, salary_max=140000, education=[],
+        blacklisted_companies=["evil corp"], minimum_salary=100000,
+    )
+    index = ProfileIndex.from_profile(profile)
+    records = [as_job_record(job) for job in JOBS]
+    
+    from_dicts = matcher.score_batch(JOBS, profile)
+    from_records = matcher.score_batch(records, profile)
+    assert list(from_records.overall_scores) == pytest.approx(list(from_dicts.overall_scores))
+    for job, record in zip(JOBS, records):
+        assert checker.has_dealbreaker(record, index) == checker.has_dealbreaker(job, index)
+        assert (matcher.calculate_match_score(record, profile).overall_score ==
+                pytest.approx(matcher.calculate_match_score(job, profile).overall_score))
+
+
+def test_export_fixed_schema(tmp_path):
+    """Test records export with the EXPORT_FIELDS columns whatever their keys"""
+    records = [JobRecord.from_dict(job) for job in JOBS]
+    with ExportWriter("jobs", "csv", str(tmp_path / "output")) as writer:
+        writer.write_many(records)
+    
+    with open(writer.path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(EXPORT_FIELDS)
+    assert len(rows) == len(JOBS) + 1
+
+
+def test_scraper_iter_records():
+    """Test adapters yield records tagged with their source"""
+    records = list(LinkedInScraper().iter_records())
+    assert records[0].source == "linkedin"
+    assert records[0].application_url.startswith("https://www.linkedin.com/")
+    assert records[0].salary_max == 150000.0
@@ -0,0 +1,155 @@
+"""Unit tests for local mail sources and the email monitor."""
+import asyncio
+import mailbox
+import os
+from email.message import EmailMessage
+
+from tracking import mail_source
+from tracking.classifier import EmailClassification
+from tracking.email_monitor import EmailMonitor
+from tracking.mail_source import MaildirSource, MboxSource, MessagePrefilter
+
+
+def make_message(sender, subject, body, message_id=None):
+    """Build a simple email"""
+    message = EmailMessage()
+    message['From'] = sender
+    message['Subject'] = subject
+    message['Message-ID'] = message_id or f"<{abs(hash((sender, subject, body)))}@test>"
+    message.set_content(body)
+    return message
+
+
+REJECTION = make_message(
+    "Acme Recruiting <no-reply@acme.greenhouse.io>", "Your application to Acme",
+    "Unfortunately we are not moving forward with your application."
+)
+INTERVIEW = make_message(
+    "jane@startup.com", "Interview for Backend Engineer role",
+    "We'd like to schedule a phone screen next week."
+)
+NEWSLETTER = make_message("news@shop.com", "Weekly deals", "Unfortunately sale ends soon")
+
+
+def test_prefilter():
+    """Test sender domains (including subdomains) and subject keywords"""
+    prefilter = MessagePrefilter()
+    assert prefilter.accepts("no-reply@acme.greenhouse.io", "Hello")
+    assert prefilter.accepts("jane@startup.com", "Interview next week")
+    assert not prefilter.accepts("news@shop.com", "Weekly deals")
+    assert not MessagePrefilter(subject_keywords=[]).accepts("jane@startup.com", "Interview")
+
+
+def test_maildir_incremental(tmp_path):
+    """Test polls only return new messages, across restarts and flag renames"""
+    box = mailbox.Maildir(str(tmp_path / "Maildir"))
+    state = str(tmp_path / "state.json")
+    first_key = box.add(REJECTION)
+    box.add(NEWSLETTER)
+    
+    source = MaildirSource(box._path, state_path=state)
+    messages = list(source.messages())
+    assert sorted(m.subject for m in messages) == ["Weekly deals", "Your application to Acme"]
+    source.commit(m.position for m in messages)
+    assert list(source.messages()) == []
+    
+    # A mail client reading the message moves it to cur/ with flags
+    mail = box[first_key]
+    mail.set_subdir("cur")
+    mail.add_flag("S")
+    box[first_key] = mail
+    box.add(INTERVIEW)
+    
+    reopened = MaildirSource(box._path, state_path=state)
+    assert [m.subject for m in reopened.messages()] == ["Interview for Backend Engineer role"]
+
+
+def test_maildir_late_delivery_within_grace(tmp_path):
+    """Test a file delivered late with an older mtime is still picked up once"""
+    box = mailbox.Maildir(str(tmp_path / "Maildir"))
+    box.add(REJECTION)
+    source = MaildirSource(box._path, grace=60)
+    source.commit(m.position for m in source.messages())
+    
+    path = os.path.join(box._path, "new", box.add(INTERVIEW))
+    mtime = os.stat(path).st_mtime - 30
+    os.utime(path, (mtime, mtime))
+    
+    messages = list(source.messages())
+    assert [m.subject for m in messages] == ["Interview for Backend Engineer role"]
+    source.commit(m.position for m in messages)
+    assert list(source.messages()) == []
+
+
+def test_mbox_incremental_and_lazy_bodies(tmp_path):
+    """Test mbox polls resume at the offset and bodies load on demand"""
+    path = tmp_path / "inbox.mbox"
+    box = mailbox.mbox(str(path))
+    box.add(REJECTION)
+    box.add(NEWSLETTER)
+    box.flush()
+    
+    source = MboxSource(str(path), state_path=str(tmp_path / "state.json"))
+    messages = list(source.messages())
+    assert [m.subject for m in messages] == ["Your application to Acme", "Weekly deals"]
+    source.commit(m.position for m in messages)
+    
+    box.add(INTERVIEW)
+    box.flush()
+    source = MboxSource(str(path), state_path=str(tmp_path / "state.json"))
+    for message in source.messages():
+        assert message.sender == "jane@startup.com"
+        assert "phone screen" in message.body
+        source.commit([message.position])
+    assert list(source.messages()) == []
+    
+    # A rewritten (smaller) mailbox is read from the start
+    box.remove(next(iter(box.keys())))
+    box.flush()
+    box.close()
+    assert len(list(source.messages())) == 2
+
+
+def test_mbox_holds_back_partial_message(tmp_path):
+    """Test a message still being appended is not consumed"""
+    path = tmp_path / "inbox.mbox"
+    complete = b"From a@b Mon Jan  1 00:00:00 2024\nSubject: one\n\nbody\n"
+    path.write_bytes(complete + b"\nFrom c@d Mon Jan  1 00:00:00 2024\nSubject: two\n\nbo")
+    source = MboxSource(str(path))
+    assert [m.subject for m in source.messages()] == ["one"]
+
+
+def test_monitor_poll_classifies_prefiltered_messages(tmp_path, monkeypatch):
+    """Test only prefilter-passing messages have bodies read and get classified"""
+    box = mailbox.Maildir(str(tmp_path / "Maildir"))
+    for message in (REJECTION, NEWSLETTER, INTERVIEW):
+        box.add(message)
+    source = MaildirSource(box._path, state_path=str(tmp_path / "state.json"))
+    
+    read = []
+    message_text = mail_source.message_text
+    
+    def counting_message_text(data):
+        read.append(data)
+        return message_text(data)
+    monkeypatch.setattr(mail_source, "message_text", counting_message_text)
+    monitor = EmailMonitor(source=source, batch_size=1)
+    
+    results = asyncio.run(monitor.check_for_responses("me@example.com"))
+    by_subject = {r['subject']: r for r in results}
+    assert set(by_subject) == {"Your application to Acme", "Interview for Backend Engineer role"}
+    assert by_subject["Your application to Acme"]['classification'] is EmailClassification.REJECTION
+    interview = by_subject["Interview for Backend Engineer role"]
+    assert interview['classification'] is EmailClassification.INTERVIEW
+    assert len(read) == 2
+    
+    assert monitor.poll() == []
+    assert EmailMonitor(source=MaildirSource(box._path, str(tmp_path / "state.json"))).poll() == []
+
+
+def test_classify_email():
+    """Test single-message classification through the monitor"""
+    result = asyncio.run(EmailMonitor().classify_email(
+        {'id': 'm1', 'subject': 'Offer', 'body': 'We are pleased to offer you the role'}
+    ))
+    assert result == {'type': 'offer', 'confidence': 0.3, 'email_id': 'm1'}
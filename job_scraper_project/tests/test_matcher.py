@@ -0,0 +1,169 @@
+"""Unit tests for job matching."""
+import math
+import random
+import pytest
+from matching.features import JobFeatures, parse_experience_years, parse_salary
+from matching.deal_breakers import DealBreakerChecker, ProfileIndex
+from matching.matcher import JobMatcher, UserProfile
+
+JOBS = [
+    {"title": "Python Developer", "company": "Indeed Corp", "location": "Austin, TX",
+     "description": "5+ years of Python, Docker and AWS", "salary": "$80,000 - $120,000"},
+    {"title": "Backend Engineer", "company": "LinkedIn", "location": "Remote",
+     "description": "Java and SQL, 2 years", "salary_max": 150000, "is_remote": True},
+    {"title": "Data Analyst", "company": "Evil Corp", "location": "New York, NY",
+     "description": "SQL reporting"},
+    {"title": "Junior Developer", "company": "Startup", "location": "Boston, MA",
+     "description": "Git", "salary": "50k-60k"},
+]
+
+
+def make_profile(**overrides):
+    """Build a UserProfile for tests"""
+    fields = dict(
+        user_id="u1", target_titles=["Python Developer"],
+        skills={"Python": "expert", "Docker": "advanced", "SQL": "intermediate"},
+        experience_years=3, location="Austin, TX", remote_preference="any",
+        salary_min=90000, salary_max=140000, education=["BSc"],
+        blacklisted_companies=["Evil Corp"],
+    )
+    fields.update(overrides)
+    return UserProfile(**fields)
+
+
+def test_parse_salary():
+    """Test free-text salary parsing"""
+    assert parse_salary("$80,000 - $120,000") == (80000.0, 120000.0)
+    assert parse_salary("90k-110K") == (90000.0, 110000.0)
+    assert all(math.isnan(v) for v in parse_salary("Competitive"))
+
+
+def test_parse_experience_years():
+    """Test required-experience parsing"""
+    assert parse_experience_years("3-5 years of experience") == 3.0
+    assert math.isnan(parse_experience_years("No experience needed"))
+
+
+@pytest.mark.parametrize("profile_overrides", [
+    {},
+    {"remote_preference": "remote_only"},
+    {"remote_preference": "on_site", "minimum_salary": 100000},
+    {"only_remote": True},
+])
+def test_batch_matches_per_job_scores(profile_overrides):
+    """Test score_batch agrees with calculate_match_score job by job"""
+    matcher = JobMatcher()
+    profile = make_profile(**profile_overrides)
+    batch = matcher.score_batch(JOBS, profile)
+    
+    assert len(batch) == len(JOBS)
+    for i, job in enumerate(JOBS):
+        single = matcher.calculate_match_score(job, profile)
+        assert batch[i].is_dealbreaker == single.is_dealbreaker
+        assert batch[i].overall_score == pytest.approx(single.overall_score)
+        for name, score in single.breakdown.items():
+            assert batch[i].breakdown[name] == pytest.approx(score)
+
+
+def test_batch_blacklist_and_top():
+    """Test blacklisted jobs are excluded from the ranking"""
+    matcher = JobMatcher()
+    batch = matcher.score_batch(JOBS, make_profile())
+    
+    assert batch.is_dealbreaker.tolist() == [False, False, True, False]
+    top = batch.top(2)
+    assert len(top) == 2
+    assert 2 not in top
+    assert batch.overall_scores[top[0]] >= batch.overall_scores[top[1]]
+
+
+def test_batch_reuses_features():
+    """Test pre-parsed features can be scored against several profiles"""
+    matcher = JobMatcher()
+    features = JobFeatures.from_jobs(JOBS)
+    first = matcher.score_batch(features, make_profile())
+    second = matcher.score_batch(features, make_profile(skills={"Java": "expert", "SQL": "expert"}))
+    assert first.breakdown['skills_match'][1] < second.breakdown['skills_match'][1]
+
+
+def test_batch_empty():
+    """Test scoring an empty batch"""
+    batch = JobMatcher().score_batch([], make_profile())
+    assert len(batch) == 0
+    assert len(batch.top(5)) == 0
+
+
+def test_profile_index_normalizes_blacklist():
+    """Test the compiled blacklist is lowercased and stripped once"""
+    index = ProfileIndex.from_profile(make_profile(blacklisted_companies=[" Evil Corp "]))
+    assert index.blacklisted_companies == frozenset({"evil corp"})
+    assert DealBreakerChecker().has_dealbreaker(JOBS[2], index) is True
+
+
+def test_prefilter_reports_rule_counts():
+    """Test each deal-breaker rule reports how many jobs it removed"""
+    profile = make_profile(only_remote=True, minimum_salary=100000)
+    result = DealBreakerChecker().prefilter(JobFeatures.from_jobs(JOBS), profile)
+    
+    assert result.passed.tolist() == [False, True, False, False]
+    assert result.eliminated == {'location': 3, 'salary': 1, 'company_blacklist': 1}
+    assert result.total_eliminated == 3
+
+
+def test_batch_exposes_prefilter_counts():
+    """Test score_batch surfaces prefilter counts and zeroes rejected rows"""
+    batch = JobMatcher().score_batch(JOBS, make_profile())
+    assert batch.prefilter_counts['company_blacklist'] == 1
+    assert batch.overall_scores[2] == 0
+    assert batch.breakdown['skills_match'][2] == 0
+
+
+def make_pool(count, seed=7):
+    """Generate a job pool with overlapping titles and skills"""
+    rng = random.Random(seed)
+    titles = ["Python Developer", "Senior Python Developer", "Data Analyst", "Java Engineer", "Nurse"]
+    skills = ["python", "java", "sql", "docker", "aws", "git", "react", "go"]
+    return [
+        {"title": rng.choice(titles), "company": f"Company {i % 13}",
+         "location": rng.choice(["Austin, TX", "Remote", "Boston, MA"]),
+         "skills": rng.sample(skills, rng.randrange(0, 4)),
+         "salary_max": rng.choice([None, 70000, 130000]),
+         "experience_years": rng.choice([None, 1, 5])}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("title_search", [True, False])
+@pytest.mark.parametrize("profile_overrides", [
+    {},
+    {"target_titles": ["Data Analyst"], "skills": {"SQL": "expert"}},
+    {"skills": {}, "target_titles": []},
+    {"only_remote": True, "blacklisted_companies": ["Company 3"]},
+])
+def test_top_k_matches_brute_force(title_search, profile_overrides):
+    """Test indexed top-K retrieval returns the brute-force best scores"""
+    jobs = make_pool(500)
+    matcher = JobMatcher()
+    matcher.index_jobs(jobs, title_search=title_search)
+    profile = make_profile(**profile_overrides)
+    
+    batch = matcher.score_batch(jobs, profile)
+    for k in (1, 10, 600):
+        expected = batch.overall_scores[batch.top(k)]
+        result = matcher.top_k(profile, k=k, chunk_size=16)
+        assert [score.overall_score for _, score in result] == pytest.approx(expected.tolist())
+        for job, score in result:
+            assert score.overall_score == pytest.approx(batch.overall_scores[job])
+
+
+def test_top_k_threshold_and_errors():
+    """Test the score threshold and the missing-index error"""
+    jobs = make_pool(200)
+    matcher = JobMatcher()
+    with pytest.raises(ValueError):
+        matcher.top_k(make_profile(), k=5)
+    
+    index = matcher.index_jobs(jobs)
+    result = matcher.top_k(make_profile(), k=50, threshold=80.0, index=index)
+    assert result and all(score.overall_score >= 80.0 for _, score in result)
+    assert matcher.top_k(make_profile(), k=0) == []
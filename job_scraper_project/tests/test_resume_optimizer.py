@@ -0,0 +1,80 @@
+"""Unit tests for incremental resume optimization."""
+import pytest
+from optimization.ats_scorer import ATSScorer
+from optimization.keyword_extractor import KeywordExtractor
+from optimization.resume_document import ResumeDocument
+from optimization.resume_optimizer import ResumeOptimizer
+
+RESUME = """Jane Doe
+jane@example.com
+SUMMARY
+Backend developer.
+Experience:
+- Built billing services in Java
+- Ran SQL reporting
+EDUCATION
+BSc Computer Science
+SKILLS
+Java, SQL"""
+
+JOB = "Python developer with Django, Kubernetes, Docker and SQL"
+
+
+@pytest.fixture
+def optimizer():
+    """Optimizer without a persisted keyword table"""
+    return ResumeOptimizer(ATSScorer(keyword_extractor=KeywordExtractor(df_path=None)))
+
+
+def full_score(optimizer, text):
+    """Score text from scratch"""
+    optimizer.ats_scorer._analysis_cache.clear()
+    return optimizer.ats_scorer.score_resume(text, JOB)
+
+
+def test_document_round_trip():
+    """Test sections are split at headings and the text is preserved"""
+    document = ResumeDocument.from_text(RESUME)
+    assert [s.name for s in document.sections] == ["", "summary", "experience", "education", "skills"]
+    assert document.sections[2].lines == ["- Built billing services in Java", "- Ran SQL reporting"]
+    assert document.text == RESUME
+    assert ResumeDocument.from_text("").text == ""
+
+
+def test_incremental_score_matches_full_rescore(optimizer):
+    """Test every edit leaves the incremental score equal to a full rescore"""
+    session = optimizer.start_session(RESUME, JOB)
+    assert session.score() == full_score(optimizer, RESUME)
+    
+    session.set_line(2, 0, "- Built billing services in Python and Django on k8s")
+    assert session.score() == full_score(optimizer, session.document.text)
+    assert "kubernetes" not in session.missing_keywords()
+    
+    session.add_skills(["Docker"])
+    assert session.score() == full_score(optimizer, session.document.text)
+    
+    session.remove_section(3)
+    after = session.score()
+    assert after == full_score(optimizer, session.document.text)
+    assert after['breakdown']['sections'] == 60.0
+    assert session.word_count == len(session.document.text.split())
+
+
+def test_optimize_for_job_adds_missing_skills(optimizer):
+    """Test optimization appends job skills until the target coverage"""
+    optimized = optimizer.optimize_for_job(RESUME, JOB, target_density=0.5)
+    
+    assert optimized.startswith(RESUME)
+    assert optimized.splitlines()[-1].startswith("Java, SQL, ")
+    assert optimizer.start_session(optimized, JOB).coverage >= 0.5
+    assert optimizer.optimize_for_job(optimized, JOB, target_density=0.5) == optimized
+
+
+def test_insert_keywords_naturally(optimizer):
+    """Test only absent keywords are inserted, creating a skills section if needed"""
+    updated = optimizer.insert_keywords_naturally(RESUME, ["SQL", "Kubernetes", "kubernetes"])
+    assert updated.endswith("Java, SQL, Kubernetes")
+    
+    bare = optimizer.insert_keywords_naturally("Jane Doe\nDeveloper", ["Go", "k8s"])
+    assert bare == "Jane Doe\nDeveloper\nSKILLS\nGo, k8s"
+    assert optimizer.insert_keywords_naturally(RESUME, ["java"]) == RESUME
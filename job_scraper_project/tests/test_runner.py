@@ -0,0 +1,76 @@
+"""Unit tests for the concurrent adapter runner."""
+import time
+from adapters.base_scraper import BaseScraper
+from core.config import Config, SiteConfig
+from core.runner import HostThrottle, run_adapters
+
+
+class SlowScraper(BaseScraper):
+    """Scraper that sleeps to simulate network latency."""
+    
+    def start_url(self) -> str:
+        return "https://slow.example.com/jobs"
+    
+    def extract_fields(self):
+        time.sleep(0.2)
+        return [{"title": "Slow Job", "company": "Slow Corp"}]
+
+
+class OtherSlowScraper(SlowScraper):
+    """Second slow scraper on a different host."""
+    
+    def start_url(self) -> str:
+        return "https://other.example.com/jobs"
+
+
+class BrokenScraper(BaseScraper):
+    """Scraper that always fails."""
+    
+    def start_url(self) -> str:
+        return "https://broken.example.com"
+    
+    def extract_fields(self):
+        raise Exception("Mock failure")
+
+
+def test_run_adapters_in_parallel():
+    """Test adapters overlap instead of running back to back."""
+    start = time.perf_counter()
+    results = run_adapters({'slow': SlowScraper, 'other': OtherSlowScraper}, max_workers=2)
+    elapsed = time.perf_counter() - start
+    
+    assert [r.name for r in results] == ['slow', 'other']
+    assert all(r.success for r in results)
+    assert all(r.duration >= 0.2 for r in results)
+    assert elapsed < 0.35
+
+
+def test_run_adapters_isolates_failures():
+    """Test one failing adapter does not affect the others."""
+    results = run_adapters({'broken': BrokenScraper, 'slow': SlowScraper}, max_workers=2)
+    
+    assert results[0].success is False
+    assert "Mock failure" in results[0].error
+    assert results[0].jobs == []
+    assert results[1].success is True
+    assert len(results[1].jobs) == 1
+
+
+def test_run_adapters_uses_site_crawl_delay():
+    """Test the site's crawl_delay is applied to its adapter."""
+    config = Config(config_path="nonexistent.yaml")
+    config.site_configs['slow'] = SiteConfig(base_url="https://slow.example.com", crawl_delay=0.3)
+    throttle = HostThrottle()
+    throttle.wait("slow.example.com", 0.3)
+    
+    results = run_adapters({'slow': SlowScraper}, config=config, throttle=throttle)
+    
+    assert results[0].duration >= 0.5
+
+
+def test_host_throttle_spaces_same_host():
+    """Test requests to one host are spaced while other hosts are not."""
+    throttle = HostThrottle()
+    assert throttle.wait("a.example.com", 0.1) == 0
+    assert throttle.wait("b.example.com", 0.1) == 0
+    assert throttle.wait("a.example.com", 0.1) > 0.05
@@ -0,0 +1,66 @@
+"""Unit tests for the Aho-Corasick skill matcher."""
+from optimization.keyword_extractor import KeywordExtractor
+from optimization.skill_matcher import DEFAULT_SKILLS, SkillMatcher, load_taxonomy, normalize
+
+
+def test_matches_respect_word_boundaries():
+    """Test skills only match as whole words or phrases"""
+    matcher = SkillMatcher({"java": [], "javascript": ["js"], "c++": [], "react": []})
+    assert matcher.extract("JavaScript and reactive Java") == ["javascript", "java"]
+    assert matcher.extract("C++17 is not c++, but C++ is") == ["c++"]
+    assert matcher.extract("reactjs, java_8") == []
+
+
+def test_aliases_and_phrases():
+    """Test aliases map to canonical names and phrases span whitespace"""
+    matcher = SkillMatcher({"kubernetes": ["k8s"], "machine learning": ["ml"], "learning": []})
+    text = "Ships models on K8s.\nMachine\n  learning at scale, learning fast"
+    assert matcher.extract(text) == ["kubernetes", "machine learning", "learning"]
+    assert matcher.extract("ML and ml") == ["machine learning"]
+    
+    spans = matcher.find_longest(normalize("machine learning and learning"))
+    assert [canonical for _, _, canonical in spans] == ["machine learning", "learning"]
+
+
+def test_extract_skips_aliases_inside_longer_mentions():
+    """Test extract reports leftmost-longest mentions only"""
+    matcher = SkillMatcher({"javascript": ["js"], "node.js": ["nodejs"], "artificial intelligence": ["ai"]})
+    assert matcher.extract("Backend in Node.js") == ["node.js"]
+    assert matcher.extract("Send CVs to ai@company.com") == []
+    assert matcher.extract("Node.js, JS and AI.") == ["node.js", "javascript", "artificial intelligence"]
+
+
+def test_overlapping_patterns():
+    """Test patterns sharing prefixes and suffixes are all found"""
+    matcher = SkillMatcher({"data": [], "data analysis": [], "analysis": [], "sis": []})
+    found = sorted(matcher.finditer("data analysis"))
+    assert found == [(0, 4, "data"), (0, 13, "data analysis"), (5, 13, "analysis")]
+
+
+def test_load_taxonomy_falls_back_to_defaults(tmp_path):
+    """Test a missing taxonomy file yields the built-in skills"""
+    assert load_taxonomy(str(tmp_path / "missing.yaml")) == DEFAULT_SKILLS
+    
+    path = tmp_path / "skills.yaml"
+    path.write_text("skills:\n  devops:\n    kubernetes: [k8s]\n    docker:\n")
+    assert load_taxonomy(str(path)) == {"kubernetes": ["k8s"], "docker": []}
+
+
+def test_keyword_extractor_uses_taxonomy():
+    """Test extraction, density and missing keywords share the compiled matcher"""
+    extractor = KeywordExtractor()
+    skills = extractor.extract_skills("5+ years of Python, Docker and AWS; k8s a plus")
+    assert skills == ["python", "docker", "aws", "kubernetes"]
+    
+    resume = "Python developer, Python and k8s"
+    assert extractor.calculate_keyword_density(resume, ["python", "Kubernetes"]) == 0.6
+    assert extractor.calculate_keyword_density("", ["python"]) == 0.0
+    assert extractor.get_missing_keywords("Expert in JavaScript and k8s", ["Java", "Kubernetes"]) == ["Java"]
+
+
+def test_missing_keywords_with_skill_and_alias():
+    """Test a mention counts toward every keyword sharing the surface form"""
+    extractor = KeywordExtractor(df_path=None)
+    keywords = ["Python", "Kubernetes", "Docker", "k8s"]
+    assert extractor.get_missing_keywords("I know python and k8s", keywords) == ["Docker"]
+    assert extractor.get_missing_keywords("Kubernetes only", keywords) == ["Python", "Docker"]
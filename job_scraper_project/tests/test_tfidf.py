@@ -0,0 +1,97 @@
+"""Unit tests for the incremental TF-IDF model."""
+import math
+import numpy as np
+from main import update_keyword_statistics
+from optimization.keyword_extractor import KeywordExtractor
+from optimization.tfidf import DocumentFrequencyTable, KeywordScorer, document_terms, score_documents
+
+CORPUS = [
+    "Python developer building Django services",
+    "Java developer with Spring experience",
+    "Data analyst using Python and SQL",
+    "Frontend developer with React",
+]
+
+
+def test_document_terms_skip_stop_words():
+    """Test tokens drop stop words and bigrams stop at punctuation"""
+    assert document_terms("The Python developer, with Node.js back-end!") == [
+        "python", "developer", "node.js", "back", "end",
+        "python developer", "node.js back", "back end"
+    ]
+    assert document_terms("Python python, python") == ["python"] * 3
+
+
+def test_table_counts_each_document_once():
+    """Test document frequencies ignore repeats inside a document"""
+    table = DocumentFrequencyTable()
+    table.add_documents(CORPUS + ["python python python"])
+    
+    df = table.document_frequencies
+    assert table.num_docs == 5
+    assert df[table.vocabulary["python"]] == 3
+    assert df[table.vocabulary["developer"]] == 3
+    assert table.idf()[table.vocabulary["react"]] == np.float32(math.log(6 / 2) + 1)
+
+
+def test_save_load_and_merge(tmp_path):
+    """Test the table round-trips through disk and merges with another"""
+    table = DocumentFrequencyTable()
+    table.add_documents(CORPUS[:2])
+    path = table.save(str(tmp_path / "df.npz"))
+    
+    loaded = DocumentFrequencyTable.load(str(path))
+    assert loaded.vocabulary == table.vocabulary
+    assert np.array_equal(loaded.document_frequencies, table.document_frequencies)
+    
+    other = DocumentFrequencyTable()
+    other.add_documents(CORPUS[2:])
+    loaded.merge(other)
+    
+    expected = DocumentFrequencyTable()
+    expected.add_documents(CORPUS)
+    assert loaded.num_docs == 4
+    for term, term_id in expected.vocabulary.items():
+        assert loaded.document_frequencies[loaded.vocabulary[term]] == expected.document_frequencies[term_id]
+    assert len(DocumentFrequencyTable.load(str(tmp_path / "missing.npz"))) == 0
+
+
+def test_rare_terms_rank_above_common_ones():
+    """Test keywords are weighted by corpus IDF"""
+    table = DocumentFrequencyTable()
+    table.add_documents(CORPUS)
+    scorer = KeywordScorer.from_table(table)
+    
+    keywords = dict(scorer.top_keywords("Python developer with Kubernetes", max_keywords=10))
+    assert keywords["kubernetes"] == 1.0
+    assert keywords["python"] > keywords["developer"]
+    assert scorer.top_keywords("", 5) == []
+
+
+def test_batch_matches_single_with_process_pool():
+    """Test the process pool returns the in-process results in order"""
+    extractor = KeywordExtractor(df_path=None)
+    extractor.update_document_frequencies(CORPUS)
+    texts = [f"{doc} and Kubernetes {i}" for i, doc in enumerate(CORPUS * 5)]
+    
+    batch = extractor.extract_keywords_batch(texts, max_keywords=5, workers=2, chunk_size=3)
+    assert batch == [extractor.extract_keywords(text, max_keywords=5) for text in texts]
+    assert score_documents(extractor._get_scorer(), [], 5, workers=2, chunk_size=1) == []
+
+
+def test_update_persists_table(tmp_path):
+    """Test new descriptions are saved and picked up by a new extractor"""
+    path = str(tmp_path / "df.npz")
+    assert KeywordExtractor(df_path=path).update_document_frequencies(CORPUS) == 4
+    assert KeywordExtractor(df_path=path).df_table.num_docs == 4
+
+
+def test_scrape_updates_keyword_statistics(tmp_path):
+    """Test a scrape run counts its descriptions into the persisted table"""
+    path = str(tmp_path / "keyword_df.npz")
+    jobs = [{"description": text} for text in CORPUS] + [{"title": "No description"}]
+    
+    assert update_keyword_statistics(jobs, df_path=path) == 4
+    assert update_keyword_statistics(jobs[:1], df_path=path) == 1
+    assert DocumentFrequencyTable.load(path).num_docs == 5
+    assert update_keyword_statistics([], df_path=path) == 0
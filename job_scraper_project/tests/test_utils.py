@@ -1,7 +1,7 @@
 """Unit tests for utility functions."""
 import pytest
 import time
-from core.utils import retry
+from core.utils import atomic_write, retry
 
 
 def test_retry_success():
@@ -86,3 +86,18 @@ def test_retry_backoff():
     if len(call_times) >= 2:
         delay1 = call_times[1] - call_times[0]
         assert delay1 >= 0.09  # Allow small margin
+
+
+def test_atomic_write_replaces_only_on_success(tmp_path):
+    """Test atomic_write leaves the old file in place when the block raises."""
+    path = tmp_path / "nested" / "state.json"
+    with atomic_write(path, encoding="utf-8") as f:
+        f.write("old")
+    
+    with pytest.raises(RuntimeError):
+        with atomic_write(path, encoding="utf-8") as f:
+            f.write("new")
+            raise RuntimeError("interrupted")
+    
+    assert path.read_text(encoding="utf-8") == "old"
+    assert [p.name for p in path.parent.iterdir()] == ["state.json"]
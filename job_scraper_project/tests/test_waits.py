@@ -0,0 +1,182 @@
+"""Unit tests for event-driven page waits."""
+import asyncio
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from automation.models import SubmissionConfig
+from automation.navigation import FormNavigator
+from automation.redirect_handler import RedirectHandler
+from automation.waits import ARM_CHANGE_SCRIPT, PageWaiter
+
+
+class FakeButton:
+    """Button stand-in recording clicks."""
+    
+    def __init__(self, page):
+        """Click through to ``page``."""
+        self.page = page
+    
+    async def is_visible(self):
+        """Always visible."""
+        return True
+    
+    async def text_content(self):
+        """Button label."""
+        return 'Next'
+    
+    async def click(self):
+        """Record the click."""
+        self.page.calls.append(('click',))
+
+
+class WaitPage:
+    """Page stand-in recording waits; ``timeout_on`` names waits that time out."""
+    
+    def __init__(self, url='https://boards.example.com/apply', redirect_to=None, timeout_on=()):
+        """Start at ``url``; a URL wait sees ``redirect_to`` if given."""
+        self.url = url
+        self.redirect_to = redirect_to
+        self.timeout_on = set(timeout_on)
+        self.body_text = 'Apply now'
+        self.calls = []
+    
+    def _maybe_timeout(self, name):
+        """Raise like Playwright when ``name`` should time out."""
+        if name in self.timeout_on:
+            raise PlaywrightTimeoutError(f"{name} timed out")
+    
+    async def evaluate(self, script, arg=None):
+        """Record scripts run in the page; the body text script sees ``body_text``."""
+        self.calls.append(('evaluate', script))
+        return self.body_text
+    
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        """Record the wait and its timeout."""
+        self.calls.append(('wait_for_function', timeout))
+        self.last_arg = arg
+        self._maybe_timeout('wait_for_function')
+    
+    async def wait_for_load_state(self, state='load', timeout=None):
+        """Record the load state waited for."""
+        self.calls.append(('wait_for_load_state', state, timeout))
+        self._maybe_timeout(state)
+    
+    async def wait_for_url(self, predicate, wait_until=None, timeout=None):
+        """Apply the redirect if the predicate accepts it."""
+        self.calls.append(('wait_for_url', timeout))
+        if self.redirect_to and predicate(self.redirect_to):
+            self.url = self.redirect_to
+            return
+        raise PlaywrightTimeoutError("URL did not change")
+    
+    async def query_selector(self, selector):
+        """Every selector finds a button."""
+        return FakeButton(self)
+    
+    def locator(self, selector):
+        """No step text on the page."""
+        return self
+    
+    async def count(self):
+        """Locator count."""
+        return 0
+
+
+def test_step_waits_for_page_change_with_config_timeouts():
+    """Test a step arms the change watcher, clicks, then waits with configured timeouts."""
+    page = WaitPage()
+    waiter = PageWaiter(page, SubmissionConfig(step_timeout=4, network_idle_timeout=1.5))
+    
+    assert asyncio.run(waiter.step(FakeButton(page).click, budget=2.0))
+    
+    assert page.calls[0] == ('evaluate', ARM_CHANGE_SCRIPT)
+    assert page.calls[1] == ('click',)
+    assert ('wait_for_function', 4000) in page.calls
+    assert ('wait_for_load_state', 'networkidle', 1500.0) in page.calls
+    stats = waiter.get_stats()['step']
+    assert stats['count'] == 1 and stats['timeouts'] == 0
+    assert stats['budget'] == 2.0
+    assert 1.9 < waiter.total_saved() <= 2.0
+
+
+def test_waits_return_false_on_timeout():
+    """Test timeouts are counted instead of raised."""
+    page = WaitPage(timeout_on={'wait_for_function', 'networkidle'})
+    waiter = PageWaiter(page)
+    
+    assert not asyncio.run(waiter.step(FakeButton(page).click, budget=2.0))
+    assert not asyncio.run(waiter.for_confirmation(budget=3.0))
+    assert not asyncio.run(waiter.load('networkidle', timeout=5))
+    assert ('wait_for_load_state', 'networkidle', 5000) in page.calls
+    assert {kind: stats['timeouts'] for kind, stats in waiter.get_stats().items()} == {
+        'step': 1, 'confirmation': 1, 'load': 1
+    }
+
+
+def test_confirmation_waits_for_page_to_change_after_submit():
+    """Test the confirmation wait compares against the page armed before submit."""
+    page = WaitPage()
+    waiter = PageWaiter(page)
+    
+    asyncio.run(waiter.arm_confirmation())
+    assert asyncio.run(waiter.for_confirmation(budget=3.0, selector='.done'))
+    assert page.last_arg[2:] == ['.done', ['https://boards.example.com/apply', 'Apply now']]
+    
+    # The snapshot is used once; an unarmed wait has no baseline
+    asyncio.run(waiter.for_confirmation())
+    assert page.last_arg[3] is None
+
+
+def test_go_next_advances_after_step():
+    """Test the navigator waits on the page instead of sleeping."""
+    page = WaitPage()
+    navigator = FormNavigator(page)
+    navigator.state.total_steps = 3
+    navigator.state.can_go_next = True
+    
+    assert asyncio.run(navigator.go_next())
+    assert page.calls[:2] == [('evaluate', ARM_CHANGE_SCRIPT), ('click',)]
+    assert navigator.state.current_step == 1
+    assert navigator.waiter.get_stats()['step']['budget'] == 2.0
+
+
+@pytest.mark.parametrize('redirect_to, expected', [
+    ('https://company.greenhouse.io/apply', 'company.greenhouse.io'),
+    (None, None),
+])
+def test_detect_redirect(redirect_to, expected):
+    """Test redirect detection returns as soon as the domain changes."""
+    page = WaitPage(redirect_to=redirect_to)
+    handler = RedirectHandler(page, PageWaiter(page, SubmissionConfig(redirect_timeout=3)))
+    
+    info = asyncio.run(handler.detect_redirect('https://boards.example.com/apply'))
+    
+    assert ('wait_for_url', 3000) in page.calls
+    assert (info or {}).get('redirected_domain') == expected
+    # Budget is the fixed 2 s sleep, or the whole timeout when nothing happens
+    assert handler.waiter.get_stats()['redirect']['budget'] == (2.0 if redirect_to else 3)
+
+
+def test_submission_config_from_yaml(tmp_path):
+    """Test wait timeouts and renamed keys load from the automation config."""
+    config_path = tmp_path / 'automation.yaml'
+    config_path.write_text(
+        'submission:\n'
+        '  retry_delay_seconds: 7\n'
+        '  step_timeout: 4\n'
+        '  network_idle_timeout: 0.5\n'
+        '  form_fill_timeout: 60\n'
+    )
+    config = SubmissionConfig.from_config(str(config_path))
+    
+    assert config.retry_delay == 7
+    assert config.step_timeout == 4
+    assert config.network_idle_timeout == 0.5
+    assert config.upload_timeout == SubmissionConfig().upload_timeout
+    assert SubmissionConfig.from_config(str(tmp_path / 'missing.yaml')) == SubmissionConfig()
+    
+    # Entry point options override the file
+    overridden = SubmissionConfig.from_config(str(config_path), headless=True, step_timeout=8)
+    assert overridden.headless and overridden.step_timeout == 8
+    assert overridden.retry_delay == 7
@@ -2,9 +2,13 @@
 Email Classifier - Classifies job application response emails
 """
 
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 class EmailClassification(Enum):
     """Email classification types"""
@@ -15,6 +19,200 @@ class EmailClassification(Enum):
     UNKNOWN = "unknown"
 
 
+# Keyword prefixes are compared as little-endian 8-byte windows, hashed
+# multiplicatively into the lookup table
+_WINDOW = 8
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_HASH_BITS = 16
+
+
+def _hash_window(window: int) -> int:
+    """Lookup-table slot of a window"""
+    return ((window * _HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> (64 - _HASH_BITS)
+
+
+class KeywordMatcher:
+    """
+    Compiled substring matcher for several keyword families at once.
+    
+    Counts, per text, how many distinct keywords of each family occur as
+    substrings - the same as ``sum(kw in text for kw in family)`` - for a
+    whole batch of texts in one pass. The lowercased batch is joined into
+    a single UTF-8 buffer and every 8-byte window is hashed into a table
+    marking the first eight bytes of each keyword, using numpy over the
+    whole buffer. The few positions that hit the table are then compared
+    with each keyword's remaining bytes, again vectorized. Keywords shorter
+    than eight bytes are found with plain substring search.
+    
+    Example:
+        >>> matcher = KeywordMatcher([['unfortunately'], ['interview', 'schedule']])
+        >>> matcher.count(["We'd like to schedule an interview"])
+        array([[0, 2]], dtype=uint16)
+    """
+    
+    def __init__(self, families: Sequence[Sequence[str]]):
+        """
+        Compile the matcher
+        
+        Args:
+            families: Keyword lists (matched case-insensitively)
+        """
+        self.keywords: List[bytes] = []
+        self.family_of: List[int] = []
+        for family_id, family in enumerate(families):
+            for keyword in family:
+                self.keywords.append(keyword.lower().encode('utf-8'))
+                self.family_of.append(family_id)
+        self.num_families = len(families)
+        
+        # Keyword id -> family one-hot, to turn keyword hits into family counts
+        self._families = np.zeros((len(self.keywords), self.num_families), dtype=np.uint16)
+        self._families[np.arange(len(self.keywords)), self.family_of] = 1
+        
+        # (keyword id, first window, all bytes) of keywords at least one window long
+        self._long: List[Tuple[int, np.uint64, np.ndarray]] = []
+        self._short: List[Tuple[int, bytes]] = []
+        self._table = np.zeros(1 << _HASH_BITS, dtype=bool)
+        for keyword_id, keyword in enumerate(self.keywords):
+            if len(keyword) < _WINDOW:
+                self._short.append((keyword_id, keyword))
+                continue
+            prefix = int.from_bytes(keyword[:_WINDOW], 'little')
+            self._long.append(
+                (keyword_id, np.uint64(prefix), np.frombuffer(keyword, dtype=np.uint8))
+            )
+            self._table[_hash_window(prefix)] = True
+    
+    def count(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Distinct keywords of each family found in each text
+        
+        Args:
+            texts: Texts to scan
+            
+        Returns:
+            uint16 array of shape (len(texts), number of families)
+        """
+        hits = np.zeros((len(texts), len(self.keywords)), dtype=bool)
+        if not len(texts) or not self.keywords:
+            return hits.astype(np.uint16) @ self._families
+        
+        encoded = [text.lower().encode('utf-8') for text in texts]
+        # NUL separators keep matches inside one text
+        buffer = b'\0'.join(encoded) + b'\0'
+        ends = np.cumsum(np.fromiter(
+            (len(data) + 1 for data in encoded), dtype=np.int64, count=len(encoded)
+        ))
+        
+        found_at: List[np.ndarray] = []
+        found_ids: List[np.ndarray] = []
+        if self._long:
+            data = np.frombuffer(buffer, dtype=np.uint8)
+            positions, windows = self._candidates(buffer)
+            for keyword_id, prefix, pattern in self._long:
+                at = positions[windows == prefix]
+                if len(at) and len(pattern) > _WINDOW:
+                    at = at[at + len(pattern) <= len(data)]
+                    rest = data[at[:, None] + np.arange(_WINDOW, len(pattern))]
+                    at = at[(rest == pattern[_WINDOW:]).all(axis=1)]
+                found_at.append(at)
+                found_ids.append(np.full(len(at), keyword_id))
+        for keyword_id, keyword in self._short:
+            at = []
+            position = buffer.find(keyword)
+            while position >= 0:
+                at.append(position)
+                position = buffer.find(keyword, position + 1)
+            found_at.append(np.array(at, dtype=np.int64))
+            found_ids.append(np.full(len(at), keyword_id))
+        
+        if found_at:
+            text_ids = np.searchsorted(ends, np.concatenate(found_at), side='right')
+            hits[text_ids, np.concatenate(found_ids)] = True
+        return hits.astype(np.uint16) @ self._families
+    
+    def _candidates(self, buffer: bytes) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions whose window hashes onto a keyword prefix, and the windows"""
+        positions = []
+        windows = []
+        multiplier = np.uint64(_HASH_MULTIPLIER)
+        shift = np.uint64(64 - _HASH_BITS)
+        # One strided view per alignment covers every window without copying
+        for offset in range(_WINDOW):
+            count = (len(buffer) - offset) // _WINDOW
+            view = np.frombuffer(buffer, dtype='<u8', count=count, offset=offset)
+            slots = view * multiplier
+            np.right_shift(slots, shift, out=slots)
+            found = np.flatnonzero(self._table[slots])
+            positions.append(offset + _WINDOW * found)
+            windows.append(view[found])
+        return np.concatenate(positions), np.concatenate(windows)
+
+
+@dataclass
+class BatchClassification:
+    """
+    Classifications of a batch of emails as parallel arrays.
+    
+    Attributes:
+        labels: Index into LABELS per email (uint8)
+        confidences: Confidence per email (float32)
+        scores: Distinct rejection/interview/offer keywords per email,
+            shape (n, 3) (uint16)
+    """
+    labels: np.ndarray
+    confidences: np.ndarray
+    scores: np.ndarray
+    
+    # Label codes, in the tie-break order used by EmailClassifier.classify
+    LABELS = (
+        EmailClassification.UNKNOWN,
+        EmailClassification.REJECTION,
+        EmailClassification.INTERVIEW,
+        EmailClassification.OFFER,
+    )
+    
+    def __len__(self) -> int:
+        """Number of classified emails"""
+        return len(self.labels)
+    
+    def classification(self, index: int) -> EmailClassification:
+        """Classification of one email"""
+        return self.LABELS[self.labels[index]]
+    
+    @classmethod
+    def concatenate(cls, parts: Sequence["BatchClassification"]) -> "BatchClassification":
+        """Join classifications of consecutive chunks"""
+        return cls(
+            labels=np.concatenate([part.labels for part in parts]),
+            confidences=np.concatenate([part.confidences for part in parts]),
+            scores=np.concatenate([part.scores for part in parts])
+        )
+
+
+# Matcher installed in each worker process by the pool initializer
+_worker_matcher: Optional[KeywordMatcher] = None
+
+
+def _init_worker(matcher: KeywordMatcher) -> None:
+    """Install the compiled matcher in a worker process"""
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _classify_chunk(texts: List[str]) -> BatchClassification:
+    """Classify a chunk of emails in a worker process"""
+    return _classify_scores(_worker_matcher.count(texts))
+
+
+def _classify_scores(scores: np.ndarray) -> BatchClassification:
+    """Labels and confidences from per-family keyword counts"""
+    best = scores.max(axis=1) if len(scores) else np.zeros(0, dtype=np.uint16)
+    labels = np.where(best > 0, scores.argmax(axis=1) + 1, 0).astype(np.uint8)
+    confidences = np.minimum(best * 0.3, 0.95).astype(np.float32)
+    return BatchClassification(labels=labels, confidences=confidences, scores=scores)
+
+
 class EmailClassifier:
     """
     Classifies job application response emails using keyword matching
@@ -40,6 +238,12 @@ class EmailClassifier:
         'accept this position', 'joining our team'
     ]
     
+    def __init__(self):
+        """Initialize classifier and compile its keyword matcher"""
+        self.matcher = KeywordMatcher(
+            (self.REJECTION_KEYWORDS, self.INTERVIEW_KEYWORDS, self.OFFER_KEYWORDS)
+        )
+    
     def classify(
         self,
         email_subject: str,
@@ -97,6 +301,42 @@ class EmailClassifier:
             }
         }
     
+    def classify_batch(
+        self,
+        messages: Sequence[Tuple[str, str]],
+        workers: Optional[int] = 1,
+        chunk_size: int = 2000
+    ) -> BatchClassification:
+        """
+        Classify many emails at once (e.g. a mailbox backfill)
+        
+        Gives the same classifications as :meth:`classify`, returned as
+        arrays instead of one dict per email. Batches larger than one chunk
+        can be split across a process pool; the compiled matcher is sent to
+        each worker once by the pool initializer.
+        
+        Args:
+            messages: (subject, body) pairs
+            workers: Worker processes (1 to stay in-process, None for one per CPU)
+            chunk_size: Emails scanned per pass
+            
+        Returns:
+            BatchClassification in input order
+        """
+        texts = [f"{subject} {body}" for subject, body in messages]
+        matcher = self.matcher
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        if not chunks:
+            return _classify_scores(np.zeros((0, matcher.num_families), dtype=np.uint16))
+        if workers == 1 or len(chunks) == 1:
+            parts = [_classify_scores(matcher.count(chunk)) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(matcher,)
+            ) as pool:
+                parts = list(pool.map(_classify_chunk, chunks))
+        return BatchClassification.concatenate(parts)
+    
     def _count_keywords(self, text: str, keywords: list) -> int:
         """Count how many keywords appear in text"""
         return sum(1 for keyword in keywords if keyword in text)
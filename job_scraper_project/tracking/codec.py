@@ -0,0 +1,283 @@
+"""
+Application Codec - Columnar binary format for bulk application load/store
+"""
+
+import logging
+import struct
+from datetime import datetime, timedelta
+from itertools import starmap
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.utils import atomic_write
+from tracking.models import Application, ApplicationStatus, ResponseType
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"APPC"
+VERSION = 1
+
+# Column kinds, in Application field order. "dict" columns are strings
+# with few distinct values, stored once plus a uint32 code per record.
+LAYOUT: Tuple[Tuple[str, str], ...] = (
+    ('id', 'str'),
+    ('user_id', 'dict'),
+    ('job_id', 'str'),
+    ('job_title', 'dict'),
+    ('company', 'dict'),
+    ('application_url', 'str'),
+    ('submitted_at', 'datetime'),
+    ('resume_version', 'dict'),
+    ('cover_letter_version', 'dict'),
+    ('match_score', 'float'),
+    ('status', 'status'),
+    ('status_updated_at', 'datetime'),
+    ('response_received', 'bool'),
+    ('response_at', 'datetime'),
+    ('response_type', 'response_type'),
+    ('response_email_id', 'str'),
+    ('interview_requested', 'bool'),
+    ('interview_date', 'datetime'),
+    ('interview_type', 'dict'),
+    ('confirmation_screenshot', 'str'),
+    ('confirmation_number', 'str'),
+    ('notes', 'str'),
+)
+
+_HEADER = struct.Struct('<4sHQ')
+_LENGTH = struct.Struct('<Q')
+
+_STATUSES = tuple(ApplicationStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+# Code 0 is "no response type"
+_RESPONSE_TYPES = (None,) + tuple(ResponseType)
+_RESPONSE_CODES = {kind: code for code, kind in enumerate(_RESPONSE_TYPES)}
+
+# Timestamps are microseconds since the epoch; NaT (int64 minimum) is None
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NAT = np.iinfo(np.int64).min
+
+
+def _pack_strings(values: Sequence[Optional[str]]) -> List[bytes]:
+    """
+    Buffers of a string column: null bitmap, character offsets, UTF-8 text
+    
+    Offsets count characters rather than bytes, so the reader decodes the
+    text once and slices it.
+    """
+    lengths = np.fromiter(
+        (len(value) if value is not None else -1 for value in values),
+        dtype=np.int64, count=len(values)
+    )
+    valid = lengths >= 0
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(np.maximum(lengths, 0), out=offsets[1:])
+    text = ''.join([value for value in values if value is not None])
+    return [np.packbits(valid).tobytes(), offsets.tobytes(), text.encode('utf-8')]
+
+
+def _unpack_strings(buffers: List[memoryview], count: int) -> List[Optional[str]]:
+    """Decode the buffers written by :func:`_pack_strings`"""
+    valid_bits, offset_bytes, blob = buffers
+    text = str(blob, 'utf-8')
+    offsets = np.frombuffer(offset_bytes, dtype=np.int64).tolist()
+    values: List[Optional[str]] = [text[a:b] for a, b in zip(offsets, offsets[1:])]
+    valid = np.unpackbits(np.frombuffer(valid_bits, dtype=np.uint8), count=count)
+    for i in np.flatnonzero(valid == 0).tolist():
+        values[i] = None
+    return values
+
+
+def _pack_column(kind: str, values: Sequence[Any]) -> List[bytes]:
+    """Buffers of one column"""
+    if kind == 'str':
+        return _pack_strings(values)
+    if kind == 'dict':
+        index: Dict[Optional[str], int] = {}
+        codes = np.fromiter(
+            (index.setdefault(value, len(index)) for value in values),
+            dtype=np.uint32, count=len(values)
+        )
+        return _pack_strings(list(index)) + [codes.tobytes()]
+    if kind == 'datetime':
+        try:
+            stamps = np.fromiter(
+                (_NAT if value is None else (value - _EPOCH) // _MICROSECOND for value in values),
+                dtype=np.int64, count=len(values)
+            )
+        except TypeError as e:
+            # Aware datetimes cannot be stored without their offset
+            raise ValueError("Only naive datetimes can be packed") from e
+        return [stamps.tobytes()]
+    if kind == 'float':
+        return [np.array(values, dtype=np.float64).tobytes()]
+    if kind == 'bool':
+        return [np.array(values, dtype=np.bool_).tobytes()]
+    if kind == 'status':
+        return [bytes(_STATUS_CODES[value] for value in values)]
+    if kind == 'response_type':
+        return [bytes(_RESPONSE_CODES[value] for value in values)]
+    raise ValueError(f"Unknown column kind: {kind}")
+
+
+def _buffer_count(kind: str) -> int:
+    """Number of buffers a column of this kind is stored as"""
+    return {'str': 3, 'dict': 4}.get(kind, 1)
+
+
+def _unpack_column(kind: str, buffers: List[memoryview], count: int) -> List[Any]:
+    """Decode one column to Python values"""
+    if kind == 'str':
+        return _unpack_strings(buffers, count)
+    if kind == 'dict':
+        codes = np.frombuffer(buffers[3], dtype=np.uint32)
+        distinct = _unpack_strings(buffers[:3], len(buffers[1]) // 8 - 1)
+        table = np.empty(len(distinct), dtype=object)
+        table[:] = distinct
+        return table[codes].tolist()
+    if kind == 'datetime':
+        return np.frombuffer(buffers[0], dtype='datetime64[us]').tolist()
+    if kind == 'float':
+        return np.frombuffer(buffers[0], dtype=np.float64).tolist()
+    if kind == 'bool':
+        return np.frombuffer(buffers[0], dtype=np.bool_).tolist()
+    if kind == 'status':
+        return [_STATUSES[code] for code in bytes(buffers[0])]
+    if kind == 'response_type':
+        return [_RESPONSE_TYPES[code] for code in bytes(buffers[0])]
+    raise ValueError(f"Unknown column kind: {kind}")
+
+
+def pack_applications(applications: Sequence[Application]) -> bytes:
+    """
+    Serialize applications column by column
+    
+    Each column is one or more length-prefixed buffers: packed enum codes,
+    numpy arrays of timestamps (microseconds, NaT for None), scores and
+    flags, and offset-indexed UTF-8 text for strings. Low-cardinality
+    strings (user, company, resume version...) are stored once per
+    distinct value.
+    
+    Args:
+        applications: Applications to pack
+        
+    Returns:
+        Packed bytes
+        
+    Raises:
+        ValueError: If a datetime carries a timezone
+    """
+    parts = [_HEADER.pack(MAGIC, VERSION, len(applications))]
+    for name, kind in LAYOUT:
+        values = [getattr(application, name) for application in applications]
+        for buffer in _pack_column(kind, values):
+            parts.append(_LENGTH.pack(len(buffer)))
+            parts.append(buffer)
+    return b''.join(parts)
+
+
+def _read_columns(
+    data: bytes,
+    columns: Optional[Sequence[str]] = None
+) -> Dict[str, List[Any]]:
+    """Decoded columns (all, or only ``columns``)"""
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise ValueError("Truncated application data")
+    magic, version, count = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not packed application data")
+    if version != VERSION:
+        raise ValueError(f"Unsupported application data version: {version}")
+    
+    wanted = set(columns) if columns is not None else None
+    decoded: Dict[str, List[Any]] = {}
+    position = _HEADER.size
+    for name, kind in LAYOUT:
+        buffers = []
+        for _ in range(_buffer_count(kind)):
+            if position + _LENGTH.size > len(view):
+                raise ValueError("Truncated application data")
+            (length,) = _LENGTH.unpack_from(view, position)
+            position += _LENGTH.size
+            if position + length > len(view):
+                raise ValueError("Truncated application data")
+            buffers.append(view[position:position + length])
+            position += length
+        if wanted is None or name in wanted:
+            decoded[name] = _unpack_column(kind, buffers, count)
+    return decoded
+
+
+def unpack_applications(data: bytes) -> List[Application]:
+    """
+    Deserialize applications written by :func:`pack_applications`
+    
+    Args:
+        data: Packed bytes
+        
+    Returns:
+        Applications in packed order
+        
+    Raises:
+        ValueError: If the data is truncated or not in this format
+    """
+    return list(starmap(Application, zip(*_read_columns(data).values())))
+
+
+def unpack_columns(data: bytes, columns: Optional[Sequence[str]] = None) -> Dict[str, List[Any]]:
+    """
+    Decode columns without building Application objects
+    
+    Args:
+        data: Packed bytes
+        columns: Field names to decode (all if None); others are skipped
+        
+    Returns:
+        Field name -> values in packed order
+        
+    Raises:
+        ValueError: If the data is truncated or not in this format
+    """
+    unknown = set(columns or ()) - {name for name, _ in LAYOUT}
+    if unknown:
+        raise ValueError(f"Unknown columns: {sorted(unknown)}")
+    return _read_columns(data, columns)
+
+
+def save_applications(applications: Sequence[Application], path: str) -> Path:
+    """
+    Write packed applications atomically
+    
+    Args:
+        applications: Applications to store
+        path: Target file
+        
+    Returns:
+        Path written
+    """
+    target = Path(path)
+    data = pack_applications(applications)
+    with atomic_write(target, 'wb') as f:
+        f.write(data)
+    logger.info(f"Saved {len(applications)} applications ({len(data)} bytes) to {target}")
+    return target
+
+
+def load_applications(path: str) -> List[Application]:
+    """
+    Load applications saved by :func:`save_applications`
+    
+    Args:
+        path: Packed file
+        
+    Returns:
+        Applications (empty if the file does not exist)
+    """
+    source = Path(path)
+    if not source.exists():
+        return []
+    return unpack_applications(source.read_bytes())
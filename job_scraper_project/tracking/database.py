@@ -2,17 +2,400 @@
 Application Database - Storage and retrieval for applications
 """
 
-from typing import List, Optional
-from tracking.models import Application, ApplicationStatus
-from datetime import datetime
+import json
+import logging
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import yaml
+
+from tracking.models import Application, ApplicationEvent, ApplicationStatus, ResponseType
+
+logger = logging.getLogger(__name__)
+
+# Column order shared by inserts and row decoding
+COLUMNS = (
+    'id', 'user_id', 'job_id', 'job_title', 'company', 'application_url',
+    'submitted_at', 'resume_version', 'cover_letter_version', 'match_score',
+    'status', 'status_updated_at', 'response_received', 'response_at',
+    'response_type', 'response_email_id', 'interview_requested', 'interview_date',
+    'interview_type', 'confirmation_screenshot', 'confirmation_number', 'notes',
+)
+
+# Derived columns stored alongside COLUMNS to key the summary tables
+DERIVED_COLUMNS = ('platform', 'submitted_week')
+
+_APPLICATIONS_TABLE = """CREATE TABLE IF NOT EXISTS applications (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    application_url TEXT NOT NULL,
+    submitted_at TEXT NOT NULL,
+    resume_version TEXT NOT NULL,
+    cover_letter_version TEXT,
+    match_score REAL NOT NULL,
+    status TEXT NOT NULL,
+    status_updated_at TEXT NOT NULL,
+    response_received INTEGER NOT NULL DEFAULT 0,
+    response_at TEXT,
+    response_type TEXT,
+    response_email_id TEXT,
+    interview_requested INTEGER NOT NULL DEFAULT 0,
+    interview_date TEXT,
+    interview_type TEXT,
+    confirmation_screenshot TEXT,
+    confirmation_number TEXT,
+    notes TEXT,
+    platform TEXT NOT NULL DEFAULT 'unknown',
+    submitted_week TEXT NOT NULL DEFAULT ''
+)"""
+
+_SCHEMA = (
+    # Status pages and per-status counts for a user: the (user, status)
+    # prefix is an equality seek and the rest of the key is the page order,
+    # so a page is one index range scan
+    """CREATE INDEX IF NOT EXISTS idx_applications_user_status_submitted
+        ON applications (user_id, status, submitted_at, id)""",
+    """CREATE INDEX IF NOT EXISTS idx_applications_user_submitted
+        ON applications (user_id, submitted_at, id)""",
+    """CREATE INDEX IF NOT EXISTS idx_applications_status_submitted
+        ON applications (status, submitted_at, id)""",
+    
+    # Append-only journal of lifecycle events
+    """CREATE TABLE IF NOT EXISTS application_events (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        id TEXT NOT NULL UNIQUE,
+        application_id TEXT NOT NULL REFERENCES applications (id),
+        event_type TEXT NOT NULL,
+        event_timestamp TEXT NOT NULL,
+        event_data TEXT NOT NULL
+    )""",
+    """CREATE INDEX IF NOT EXISTS idx_application_events_application
+        ON application_events (application_id, seq)""",
+    """CREATE TRIGGER IF NOT EXISTS trg_application_events_no_update
+        BEFORE UPDATE ON application_events
+        BEGIN SELECT RAISE(ABORT, 'application_events is append-only'); END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_application_events_no_delete
+        BEFORE DELETE ON application_events
+        BEGIN SELECT RAISE(ABORT, 'application_events is append-only'); END""",
+    
+    # Materialized summaries, maintained by the triggers below inside the
+    # transaction that changes the application
+    """CREATE TABLE IF NOT EXISTS status_counts (
+        user_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        platform TEXT NOT NULL,
+        week TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (user_id, status, platform, week)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS response_funnel (
+        user_id TEXT NOT NULL,
+        platform TEXT NOT NULL,
+        week TEXT NOT NULL,
+        applications INTEGER NOT NULL,
+        responses INTEGER NOT NULL,
+        interviews INTEGER NOT NULL,
+        offers INTEGER NOT NULL,
+        rejections INTEGER NOT NULL,
+        PRIMARY KEY (user_id, platform, week)
+    ) WITHOUT ROWID""",
+    """CREATE TRIGGER IF NOT EXISTS trg_applications_insert_summaries
+        AFTER INSERT ON applications
+        BEGIN
+            INSERT INTO status_counts
+                VALUES (NEW.user_id, NEW.status, NEW.platform, NEW.submitted_week, 1)
+                ON CONFLICT (user_id, status, platform, week) DO UPDATE SET count = count + 1;
+            INSERT INTO response_funnel VALUES (
+                NEW.user_id, NEW.platform, NEW.submitted_week, 1, NEW.response_received,
+                NEW.response_type IS 'interview', NEW.response_type IS 'offer',
+                NEW.response_type IS 'rejection'
+            ) ON CONFLICT (user_id, platform, week) DO UPDATE SET
+                applications = applications + 1,
+                responses = responses + excluded.responses,
+                interviews = interviews + excluded.interviews,
+                offers = offers + excluded.offers,
+                rejections = rejections + excluded.rejections;
+        END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_applications_status_summaries
+        AFTER UPDATE OF status ON applications
+        WHEN OLD.status IS NOT NEW.status
+        BEGIN
+            UPDATE status_counts SET count = count - 1
+                WHERE user_id = OLD.user_id AND status = OLD.status
+                AND platform = OLD.platform AND week = OLD.submitted_week;
+            INSERT INTO status_counts
+                VALUES (NEW.user_id, NEW.status, NEW.platform, NEW.submitted_week, 1)
+                ON CONFLICT (user_id, status, platform, week) DO UPDATE SET count = count + 1;
+        END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_applications_response_summaries
+        AFTER UPDATE OF response_received, response_type ON applications
+        BEGIN
+            UPDATE response_funnel SET
+                responses = responses + NEW.response_received - OLD.response_received,
+                interviews = interviews
+                    + (NEW.response_type IS 'interview') - (OLD.response_type IS 'interview'),
+                offers = offers + (NEW.response_type IS 'offer') - (OLD.response_type IS 'offer'),
+                rejections = rejections
+                    + (NEW.response_type IS 'rejection') - (OLD.response_type IS 'rejection')
+                WHERE user_id = NEW.user_id AND platform = NEW.platform
+                AND week = NEW.submitted_week;
+        END""",
+)
+
+_REBUILD_SUMMARIES = (
+    "DELETE FROM status_counts",
+    "DELETE FROM response_funnel",
+    """INSERT INTO status_counts
+        SELECT user_id, status, platform, submitted_week, COUNT(*) FROM applications
+        GROUP BY user_id, status, platform, submitted_week""",
+    """INSERT INTO response_funnel
+        SELECT user_id, platform, submitted_week, COUNT(*), SUM(response_received),
+            SUM(response_type IS 'interview'), SUM(response_type IS 'offer'),
+            SUM(response_type IS 'rejection')
+        FROM applications GROUP BY user_id, platform, submitted_week""",
+)
+
+# Statements are constant strings so sqlite3's statement cache reuses the
+# compiled form; only the bound parameters change between calls
+_INSERT = (
+    f"INSERT INTO applications ({', '.join(COLUMNS + DERIVED_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in COLUMNS + DERIVED_COLUMNS)})"
+)
+_SELECT = f"SELECT {', '.join(COLUMNS)} FROM applications"
+_GET = f"{_SELECT} WHERE id = ?"
+_USER_PAGE = (
+    f"{_SELECT} WHERE user_id = ? "
+    "ORDER BY submitted_at DESC, id DESC LIMIT ?"
+)
+_USER_PAGE_AFTER = (
+    f"{_SELECT} WHERE user_id = ? AND (submitted_at, id) < (?, ?) "
+    "ORDER BY submitted_at DESC, id DESC LIMIT ?"
+)
+_USER_STATUS_PAGE = (
+    f"{_SELECT} WHERE user_id = ? AND status = ? "
+    "ORDER BY submitted_at DESC, id DESC LIMIT ?"
+)
+_USER_STATUS_PAGE_AFTER = (
+    f"{_SELECT} WHERE user_id = ? AND status = ? AND (submitted_at, id) < (?, ?) "
+    "ORDER BY submitted_at DESC, id DESC LIMIT ?"
+)
+_BY_STATUS = f"{_SELECT} WHERE status = ? ORDER BY submitted_at DESC, id DESC"
+_STATUS = "SELECT status FROM applications WHERE id = ?"
+_INSERT_EVENT = (
+    "INSERT INTO application_events "
+    "(id, application_id, event_type, event_timestamp, event_data) VALUES (?, ?, ?, ?, ?)"
+)
+_EVENTS = (
+    "SELECT id, application_id, event_type, event_timestamp, event_data "
+    "FROM application_events WHERE application_id = ? ORDER BY seq"
+)
+_COUNT_BY_STATUS = (
+    "SELECT status, SUM(count) FROM status_counts "
+    "WHERE user_id = :user_id AND (:platform IS NULL OR platform = :platform) "
+    "AND (:week IS NULL OR week = :week) "
+    "GROUP BY status HAVING SUM(count) > 0"
+)
+_WEEKLY_COUNTS = (
+    "SELECT week, status, SUM(count) FROM status_counts WHERE user_id = ? "
+    "GROUP BY week, status HAVING SUM(count) > 0 ORDER BY week"
+)
+_FUNNEL = (
+    "SELECT COALESCE(SUM(applications), 0), COALESCE(SUM(responses), 0), "
+    "COALESCE(SUM(interviews), 0), COALESCE(SUM(offers), 0), COALESCE(SUM(rejections), 0) "
+    "FROM response_funnel "
+    "WHERE user_id = :user_id AND (:platform IS NULL OR platform = :platform) "
+    "AND (:week IS NULL OR week = :week)"
+)
+_UPDATE_STATUS = "UPDATE applications SET status = ?, status_updated_at = ? WHERE id = ?"
+_RECORD_RESPONSE = (
+    "UPDATE applications SET response_received = 1, response_at = ?, response_type = ?, "
+    "response_email_id = COALESCE(?, response_email_id), "
+    "interview_requested = interview_requested OR ? WHERE id = ?"
+)
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Encode a datetime as sortable ISO-8601 text"""
+    return value.isoformat() if value is not None else None
+
+
+def _datetime(value: Optional[str]) -> Optional[datetime]:
+    """Decode an ISO-8601 column"""
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def _to_row(application: Application) -> Tuple[Any, ...]:
+    """Column values of an application, in COLUMNS order"""
+    return (
+        application.id,
+        application.user_id,
+        application.job_id,
+        application.job_title,
+        application.company,
+        application.application_url,
+        _timestamp(application.submitted_at),
+        application.resume_version,
+        application.cover_letter_version,
+        application.match_score,
+        application.status.value,
+        _timestamp(application.status_updated_at),
+        int(application.response_received),
+        _timestamp(application.response_at),
+        application.response_type.value if application.response_type else None,
+        application.response_email_id,
+        int(application.interview_requested),
+        _timestamp(application.interview_date),
+        application.interview_type,
+        application.confirmation_screenshot,
+        application.confirmation_number,
+        application.notes,
+    )
+
+
+def _from_row(row: Sequence[Any]) -> Application:
+    """Build an application from a row in COLUMNS order"""
+    return Application(
+        id=row[0],
+        user_id=row[1],
+        job_id=row[2],
+        job_title=row[3],
+        company=row[4],
+        application_url=row[5],
+        submitted_at=_datetime(row[6]),
+        resume_version=row[7],
+        cover_letter_version=row[8],
+        match_score=row[9],
+        status=ApplicationStatus(row[10]),
+        status_updated_at=_datetime(row[11]),
+        response_received=bool(row[12]),
+        response_at=_datetime(row[13]),
+        response_type=ResponseType(row[14]) if row[14] else None,
+        response_email_id=row[15],
+        interview_requested=bool(row[16]),
+        interview_date=_datetime(row[17]),
+        interview_type=row[18],
+        confirmation_screenshot=row[19],
+        confirmation_number=row[20],
+        notes=row[21],
+    )
+
+
+# Second-level labels under which the registrable name is one label further left
+_SECOND_LEVEL_LABELS = frozenset({'co', 'com', 'ac', 'gov', 'net', 'org'})
+
+
+def platform_of(url: str) -> str:
+    """
+    Platform key of an application URL, used to group summaries
+    
+    Args:
+        url: Application URL, e.g. ``https://boards.greenhouse.io/acme/jobs/1``
+        
+    Returns:
+        Registrable domain name without its suffix (e.g. "greenhouse"),
+        or "unknown"
+    """
+    labels = [label for label in (urlparse(url or '').hostname or '').split('.') if label]
+    if len(labels) >= 3 and labels[-2] in _SECOND_LEVEL_LABELS:
+        return labels[-3]
+    if len(labels) >= 2:
+        return labels[-2]
+    return labels[0] if labels else 'unknown'
+
+
+def week_of(value: datetime) -> str:
+    """ISO date of the Monday starting the week of ``value``"""
+    return (value.date() - timedelta(days=value.weekday())).isoformat()
+
+
+def _insert_row(application: Application) -> Tuple[Any, ...]:
+    """Column values of an application followed by its derived columns"""
+    return _to_row(application) + (
+        platform_of(application.application_url), week_of(application.submitted_at)
+    )
+
+
+def _event_row(event: ApplicationEvent) -> Tuple[Any, ...]:
+    """Column values of an event"""
+    return (
+        event.id,
+        event.application_id,
+        event.event_type,
+        _timestamp(event.event_timestamp),
+        json.dumps(event.event_data, default=str),
+    )
+
+
+def _new_event(
+    application_id: str,
+    event_type: str,
+    timestamp: datetime,
+    data: Dict[str, Any]
+) -> ApplicationEvent:
+    """Create an event with a generated ID"""
+    return ApplicationEvent(
+        id=uuid.uuid4().hex,
+        application_id=application_id,
+        event_type=event_type,
+        event_timestamp=timestamp,
+        event_data=data
+    )
+
+
+def sqlite_path(connection_string: str) -> str:
+    """
+    Database file of a ``sqlite://`` connection string
+    
+    Args:
+        connection_string: e.g. ``sqlite:///data/applications.db`` (relative),
+            ``sqlite:////var/lib/app.db`` (absolute) or ``sqlite://`` (in memory)
+            
+    Returns:
+        File path, or ``:memory:``
+        
+    Raises:
+        ValueError: If the connection string is not a SQLite URL
+    """
+    prefix = "sqlite://"
+    if not connection_string.startswith(prefix):
+        raise ValueError(
+            f"Unsupported database {connection_string!r}: only sqlite:// URLs are supported"
+        )
+    path = connection_string[len(prefix):]
+    if path in ('', '/', '/:memory:'):
+        return ':memory:'
+    return path[1:] if path.startswith('/') else path
 
 
 class ApplicationDatabase:
     """
     Database interface for storing and retrieving applications.
     
-    This class abstracts the database operations for application tracking.
-    Can be implemented with SQLAlchemy for production or simple storage for MVP.
+    Backed by SQLite in WAL mode, so the dashboard can read while the
+    submitter writes. Listings are ordered newest first and paginated by
+    keyset: pass the last application of a page as ``after`` to get the
+    next one, which seeks straight to it in the index instead of skipping
+    ``OFFSET`` rows, so deep pages cost the same as the first.
+    
+    Every change is also appended to an ``application_events`` journal
+    (which rejects updates and deletes), and triggers keep per user,
+    platform and submission week summaries - current status counts and the
+    response funnel - up to date in the same transaction. Dashboard reads
+    such as :meth:`count_by_status` and :meth:`get_funnel` sum a handful of
+    summary rows instead of aggregating the applications table.
+    
+    Example:
+        >>> db = ApplicationDatabase.from_config()
+        >>> page = db.get_user_applications("u1", ApplicationStatus.SUBMITTED, limit=50)
+        >>> next_page = db.get_user_applications(
+        ...     "u1", ApplicationStatus.SUBMITTED, limit=50, after=page[-1])
     """
     
     def __init__(self, connection_string: Optional[str] = None):
@@ -20,10 +403,86 @@ class ApplicationDatabase:
         Initialize database connection
         
         Args:
-            connection_string: Database connection string (e.g., SQLite, PostgreSQL)
+            connection_string: Database connection string (``sqlite:///path``;
+                ``sqlite://`` for an in-memory database)
+                
+        Raises:
+            ValueError: If the connection string is not a SQLite URL
         """
         self.connection_string = connection_string or "sqlite:///applications.db"
-        # TODO: Initialize SQLAlchemy engine and session
+        self.path = sqlite_path(self.connection_string)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(self.path, cached_statements=64)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        # 64 MiB page cache keeps the index B-trees hot during bulk loads
+        self._conn.execute("PRAGMA cache_size=-65536")
+        with self._conn:
+            self._conn.execute(_APPLICATIONS_TABLE)
+            self._add_derived_columns()
+            has_summaries = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'status_counts'"
+            ).fetchone() is not None
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            if not has_summaries:
+                self._rebuild_summaries()
+    
+    def _add_derived_columns(self) -> None:
+        """Add and backfill the derived columns of databases created without them"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(applications)")}
+        if 'platform' in columns:
+            return
+        self._conn.execute(
+            "ALTER TABLE applications ADD COLUMN platform TEXT NOT NULL DEFAULT 'unknown'"
+        )
+        self._conn.execute(
+            "ALTER TABLE applications ADD COLUMN submitted_week TEXT NOT NULL DEFAULT ''"
+        )
+        rows = self._conn.execute(
+            "SELECT id, application_url, submitted_at FROM applications"
+        ).fetchall()
+        self._conn.executemany(
+            "UPDATE applications SET platform = ?, submitted_week = ? WHERE id = ?",
+            ((platform_of(url), week_of(_datetime(submitted)), app_id)
+             for app_id, url, submitted in rows)
+        )
+        logger.info(f"Added platform and week columns to {len(rows)} applications")
+    
+    def _rebuild_summaries(self) -> None:
+        """Recompute the summary tables from the applications table"""
+        for statement in _REBUILD_SUMMARIES:
+            self._conn.execute(statement)
+    
+    def rebuild_summaries(self) -> None:
+        """Recompute the summary tables from scratch (e.g. after manual edits)"""
+        with self._conn:
+            self._rebuild_summaries()
+    
+    @classmethod
+    def from_config(cls, config_path: str = "config/tracking.yaml") -> "ApplicationDatabase":
+        """
+        Open the database named in the ``database`` config section
+        
+        Args:
+            config_path: Path to tracking configuration file
+            
+        Returns:
+            Database (default location if the file is missing)
+        """
+        path = Path(config_path)
+        settings: Dict[str, Any] = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = (yaml.safe_load(f) or {}).get('database', {}) or {}
+        return cls(settings.get('connection_string'))
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
     
     def create_application(self, application: Application) -> Application:
         """
@@ -35,8 +494,39 @@ class ApplicationDatabase:
         Returns:
             Created application with generated ID
         """
-        # TODO: Implement database insert
-        return application
+        return self.create_applications([application])[0]
+    
+    def create_applications(self, applications: Iterable[Application]) -> List[Application]:
+        """
+        Create many application records in one transaction
+        
+        A "submitted" event is journaled for each one.
+        
+        Args:
+            applications: Application objects to store (those without an
+                ``id`` get a generated one)
+                
+        Returns:
+            Created applications
+            
+        Raises:
+            sqlite3.IntegrityError: If an ID already exists (nothing is stored)
+        """
+        created = []
+        for application in applications:
+            if not application.id:
+                application.id = uuid.uuid4().hex
+            created.append(application)
+        with self._conn:
+            self._conn.executemany(_INSERT, map(_insert_row, created))
+            self._conn.executemany(_INSERT_EVENT, (
+                _event_row(_new_event(
+                    application.id, 'submitted', application.submitted_at,
+                    {'status': application.status.value, 'job_id': application.job_id}
+                ))
+                for application in created
+            ))
+        return created
     
     def get_application(self, application_id: str) -> Optional[Application]:
         """
@@ -48,14 +538,15 @@ class ApplicationDatabase:
         Returns:
             Application object or None if not found
         """
-        # TODO: Implement database query
-        return None
+        row = self._conn.execute(_GET, (application_id,)).fetchone()
+        return _from_row(row) if row is not None else None
     
     def get_user_applications(
         self,
         user_id: str,
         status: Optional[ApplicationStatus] = None,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Application] = None
     ) -> List[Application]:
         """
         Get all applications for a user
@@ -64,12 +555,161 @@ class ApplicationDatabase:
             user_id: User ID
             status: Optional status filter
             limit: Maximum number of results
+            after: Last application of the previous page (None for the first page)
+            
+        Returns:
+            List of applications, newest first
+        """
+        if status is None:
+            if after is None:
+                cursor = self._conn.execute(_USER_PAGE, (user_id, limit))
+            else:
+                cursor = self._conn.execute(_USER_PAGE_AFTER, (
+                    user_id, _timestamp(after.submitted_at), after.id, limit
+                ))
+        elif after is None:
+            cursor = self._conn.execute(_USER_STATUS_PAGE, (user_id, status.value, limit))
+        else:
+            cursor = self._conn.execute(_USER_STATUS_PAGE_AFTER, (
+                user_id, status.value, _timestamp(after.submitted_at), after.id, limit
+            ))
+        return [_from_row(row) for row in cursor]
+    
+    def iter_user_applications(
+        self,
+        user_id: str,
+        status: Optional[ApplicationStatus] = None,
+        page_size: int = 500
+    ) -> Iterator[Application]:
+        """
+        Iterate over all of a user's applications page by page
+        
+        Args:
+            user_id: User ID
+            status: Optional status filter
+            page_size: Applications fetched per query
+            
+        Yields:
+            Applications, newest first
+        """
+        after = None
+        while True:
+            page = self.get_user_applications(user_id, status, limit=page_size, after=after)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = page[-1]
+    
+    def count_by_status(
+        self,
+        user_id: str,
+        platform: Optional[str] = None,
+        week: Optional[str] = None
+    ) -> Dict[ApplicationStatus, int]:
+        """
+        Number of a user's applications per current status
+        
+        Args:
+            user_id: User ID
+            platform: Optional platform filter (see :func:`platform_of`)
+            week: Optional submission week filter (see :func:`week_of`)
+            
+        Returns:
+            Status -> count (statuses without applications are omitted)
+        """
+        cursor = self._conn.execute(
+            _COUNT_BY_STATUS, {'user_id': user_id, 'platform': platform, 'week': week}
+        )
+        return {ApplicationStatus(status): count for status, count in cursor}
+    
+    def weekly_counts(self, user_id: str) -> Dict[str, Dict[ApplicationStatus, int]]:
+        """
+        A user's application counts per submission week and current status
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Week (Monday's ISO date) -> status -> count, oldest week first
+        """
+        weeks: Dict[str, Dict[ApplicationStatus, int]] = {}
+        for week, status, count in self._conn.execute(_WEEKLY_COUNTS, (user_id,)):
+            weeks.setdefault(week, {})[ApplicationStatus(status)] = count
+        return weeks
+    
+    def get_funnel(
+        self,
+        user_id: str,
+        platform: Optional[str] = None,
+        week: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Response funnel of a user's applications
+        
+        Args:
+            user_id: User ID
+            platform: Optional platform filter (see :func:`platform_of`)
+            week: Optional submission week filter (see :func:`week_of`)
+            
+        Returns:
+            Counts of applications, responses, interviews, offers and
+            rejections, plus response/interview/offer rates (0-1)
+        """
+        applications, responses, interviews, offers, rejections = self._conn.execute(
+            _FUNNEL, {'user_id': user_id, 'platform': platform, 'week': week}
+        ).fetchone()
+        total = applications or 1
+        return {
+            'applications': applications,
+            'responses': responses,
+            'interviews': interviews,
+            'offers': offers,
+            'rejections': rejections,
+            'response_rate': responses / total,
+            'interview_rate': interviews / total,
+            'offer_rate': offers / total,
+        }
+    
+    def record_event(self, event: ApplicationEvent) -> ApplicationEvent:
+        """
+        Append an event to the journal
+        
+        Args:
+            event: Event to store (an empty ``id`` gets a generated one)
             
         Returns:
-            List of applications
+            Stored event
+            
+        Raises:
+            sqlite3.IntegrityError: If the application does not exist
         """
-        # TODO: Implement database query with filters
-        return []
+        if not event.id:
+            event.id = uuid.uuid4().hex
+        with self._conn:
+            self._conn.execute(_INSERT_EVENT, _event_row(event))
+        return event
+    
+    def get_events(self, application_id: str) -> List[ApplicationEvent]:
+        """
+        Journal of an application
+        
+        Args:
+            application_id: Application ID
+            
+        Returns:
+            Events in the order they were recorded
+        """
+        return [
+            ApplicationEvent(
+                id=event_id,
+                application_id=app_id,
+                event_type=event_type,
+                event_timestamp=_datetime(timestamp),
+                event_data=json.loads(data)
+            )
+            for event_id, app_id, event_type, timestamp, data
+            in self._conn.execute(_EVENTS, (application_id,))
+        ]
     
     def update_application_status(
         self,
@@ -88,7 +728,18 @@ class ApplicationDatabase:
         Returns:
             True if updated successfully
         """
-        # TODO: Implement database update
+        timestamp = timestamp or datetime.now()
+        with self._conn:
+            row = self._conn.execute(_STATUS, (application_id,)).fetchone()
+            if row is None:
+                return False
+            self._conn.execute(_UPDATE_STATUS, (
+                status.value, _timestamp(timestamp), application_id
+            ))
+            self._conn.execute(_INSERT_EVENT, _event_row(_new_event(
+                application_id, 'status_changed', timestamp,
+                {'from': row[0], 'to': status.value}
+            )))
         return True
     
     def record_response(
@@ -109,8 +760,25 @@ class ApplicationDatabase:
             
         Returns:
             True if recorded successfully
+            
+        Raises:
+            ValueError: If response_type is not a ResponseType value
         """
-        # TODO: Implement response recording
+        response = ResponseType(response_type)
+        with self._conn:
+            cursor = self._conn.execute(_RECORD_RESPONSE, (
+                _timestamp(response_at),
+                response.value,
+                email_id,
+                int(response is ResponseType.INTERVIEW),
+                application_id
+            ))
+            if cursor.rowcount == 0:
+                return False
+            self._conn.execute(_INSERT_EVENT, _event_row(_new_event(
+                application_id, 'response_received', response_at,
+                {'response_type': response.value, 'email_id': email_id}
+            )))
         return True
     
     def get_applications_by_status(
@@ -126,7 +794,8 @@ class ApplicationDatabase:
             user_id: Optional user ID filter
             
         Returns:
-            List of applications matching criteria
+            List of applications matching criteria, newest first
         """
-        # TODO: Implement filtered query
-        return []
+        if user_id is not None:
+            return list(self.iter_user_applications(user_id, status))
+        return [_from_row(row) for row in self._conn.execute(_BY_STATUS, (status.value,))]
@@ -2,8 +2,23 @@
 Email Monitor - Monitors email for job application responses
 """
 
-from typing import List, Dict, Any
-from datetime import datetime
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import yaml
+
+from tracking.classifier import EmailClassifier
+from tracking.mail_source import (
+    MailMessage,
+    MailSource,
+    MaildirSource,
+    MboxSource,
+    MessagePrefilter,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class EmailMonitor:
@@ -11,19 +26,135 @@ class EmailMonitor:
     Monitors email inbox for job application responses.
     
     Integrates with Gmail API (and other email providers) to detect
-    and classify responses to job applications.
+    and classify responses to job applications. Messages come from a
+    :class:`MailSource`; local Maildir and mbox sources stand in for the
+    provider APIs. Each poll reads only messages after the source's
+    high-water mark, skips bodies of messages the sender/subject prefilter
+    rejects, and classifies the rest in batches.
+    
+    Example:
+        >>> monitor = EmailMonitor(source=MaildirSource("~/Maildir", "data/mail_state.json"))
+        >>> responses = monitor.poll()
     """
     
-    def __init__(self, credentials_path: str = None):
+    def __init__(
+        self,
+        credentials_path: str = None,
+        source: Optional[MailSource] = None,
+        classifier: Optional[EmailClassifier] = None,
+        prefilter: Optional[MessagePrefilter] = None,
+        batch_size: int = 500
+    ):
         """
         Initialize email monitor
         
         Args:
             credentials_path: Path to email API credentials
+            source: Message source to poll
+            classifier: Email classifier (a default one if None)
+            prefilter: Sender/subject prefilter (default rules if None)
+            batch_size: Messages classified per batch
         """
         self.credentials_path = credentials_path
+        self.source = source
+        self.classifier = classifier or EmailClassifier()
+        self.prefilter = prefilter or MessagePrefilter()
+        self.batch_size = batch_size
         # TODO: Initialize Gmail API client
     
+    @classmethod
+    def from_config(cls, config_path: str = "config/tracking.yaml") -> "EmailMonitor":
+        """
+        Create a monitor from the ``email_monitoring`` config section
+        
+        Args:
+            config_path: Path to tracking configuration file
+            
+        Returns:
+            Configured monitor (no local source if none is configured)
+            
+        Raises:
+            ValueError: If the mailbox format is not maildir or mbox
+        """
+        path = Path(config_path)
+        settings: Dict[str, Any] = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = (yaml.safe_load(f) or {}).get('email_monitoring', {}) or {}
+        
+        source = None
+        mailbox = settings.get('mailbox') or {}
+        if mailbox.get('path'):
+            kind = mailbox.get('format', 'maildir')
+            if kind == 'maildir':
+                source = MaildirSource(mailbox['path'], mailbox.get('state_path'))
+            elif kind == 'mbox':
+                source = MboxSource(mailbox['path'], mailbox.get('state_path'))
+            else:
+                raise ValueError(f"Unsupported mailbox format: {kind}")
+        
+        rules = settings.get('prefilter') or {}
+        prefilter = MessagePrefilter(**{
+            key: rules[key] for key in ('sender_domains', 'subject_keywords') if key in rules
+        })
+        return cls(
+            credentials_path=(settings.get('gmail') or {}).get('credentials_path'),
+            source=source,
+            prefilter=prefilter,
+            batch_size=settings.get('batch_size', 500)
+        )
+    
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Process messages that arrived since the last poll
+        
+        The source's mark is committed after each classified batch, so an
+        interrupted poll resumes after the last completed batch.
+        
+        Returns:
+            Prefilter-passing messages with their classification, oldest first
+        """
+        if self.source is None:
+            return []
+        
+        results: List[Dict[str, Any]] = []
+        batch: List[Tuple[MailMessage, str]] = []
+        positions = []
+        scanned = 0
+        for message in self.source.messages():
+            scanned += 1
+            positions.append(message.position)
+            if self.prefilter.accepts(message.sender, message.subject):
+                batch.append((message, message.body))
+            if len(batch) >= self.batch_size:
+                results.extend(self._classify(batch))
+                self.source.commit(positions)
+                batch, positions = [], []
+        if batch:
+            results.extend(self._classify(batch))
+        if positions:
+            self.source.commit(positions)
+        logger.info(f"Scanned {scanned} new messages, {len(results)} passed the prefilter")
+        return results
+    
+    def _classify(self, batch: List[Tuple[MailMessage, str]]) -> List[Dict[str, Any]]:
+        """Classify a batch of messages and build response records"""
+        classified = self.classifier.classify_batch(
+            [(message.subject, body) for message, body in batch]
+        )
+        return [
+            {
+                'id': message.message_id,
+                'sender': message.sender,
+                'subject': message.subject,
+                'date': message.date,
+                'body': body,
+                'classification': classified.classification(i),
+                'confidence': float(classified.confidences[i]),
+            }
+            for i, (message, body) in enumerate(batch)
+        ]
+    
     async def check_for_responses(self, user_email: str) -> List[Dict[str, Any]]:
         """
         Check email for new job application responses
@@ -34,12 +165,11 @@ class EmailMonitor:
         Returns:
             List of email messages related to job applications
         """
-        # TODO: Implement Gmail API integration
-        # - Connect to Gmail
-        # - Search for job-related emails
-        # - Filter by sender/subject patterns
-        # - Return unread messages
-        return []
+        # TODO: Add a Gmail API source alongside the local ones
+        if self.source is None:
+            logger.warning(f"No mail source configured for {user_email}")
+            return []
+        return await asyncio.to_thread(self.poll)
     
     async def classify_email(self, email_message: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -51,14 +181,15 @@ class EmailMonitor:
         Returns:
             Classification result with type and confidence
         """
-        # TODO: Implement email classification
-        # - Extract email body and subject
-        # - Check for keywords
-        # - Use LLM for complex cases
-        # - Return classification
+        # TODO: Use LLM for complex cases
+        result = self.classifier.classify(
+            email_message.get('subject', ''),
+            email_message.get('body', ''),
+            email_message.get('sender', '')
+        )
         return {
-            'type': 'unknown',
-            'confidence': 0.0,
+            'type': result['classification'].value,
+            'confidence': result['confidence'],
             'email_id': email_message.get('id')
         }
     
@@ -0,0 +1,411 @@
+"""
+Mail Sources - Incremental message streams from local Maildir and mbox files
+"""
+
+import html
+import json
+import logging
+import mmap
+import os
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from email import message_from_bytes, policy
+from email.header import decode_header, make_header
+from email.message import Message
+from email.parser import BytesHeaderParser
+from email.utils import parseaddr, parsedate_to_datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+from core.utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Senders of applicant-tracking and job-board mail
+DEFAULT_SENDER_DOMAINS = (
+    'greenhouse.io', 'lever.co', 'workday.com', 'myworkday.com', 'myworkdayjobs.com',
+    'icims.com', 'smartrecruiters.com', 'jobvite.com', 'ashbyhq.com', 'bamboohr.com',
+    'recruitee.com', 'workable.com', 'taleo.net', 'successfactors.com', 'linkedin.com',
+    'indeed.com', 'glassdoor.com',
+)
+
+DEFAULT_SUBJECT_KEYWORDS = (
+    'application', 'applying', 'applied', 'interview', 'candidacy', 'candidate',
+    'position', 'role', 'opportunity', 'offer', 'next steps', 'recruit', 'hiring',
+)
+
+_HEADER_PARSER = BytesHeaderParser()
+# One header field with its folded continuation lines
+_FIELD_RE = r"^{name}:[ \t]*(.*(?:\r?\n[ \t].*)*)"
+_FROM_RE = re.compile(_FIELD_RE.format(name="from").encode(), re.IGNORECASE | re.MULTILINE)
+_SUBJECT_RE = re.compile(_FIELD_RE.format(name="subject").encode(), re.IGNORECASE | re.MULTILINE)
+_ANGLE_ADDR_RE = re.compile(r"<([^<>]+)>")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _decode(value: Optional[str]) -> str:
+    """Decode RFC 2047 encoded words in a header value"""
+    if not value:
+        return ''
+    if '=?' not in value:
+        return value
+    try:
+        return str(make_header(decode_header(value)))
+    except (ValueError, LookupError):
+        return value
+
+
+def _field(pattern: re.Pattern, header_bytes: bytes) -> str:
+    """Unfolded value of one header field, read straight from the raw block"""
+    match = pattern.search(header_bytes)
+    if match is None:
+        return ''
+    value = match.group(1).decode('utf-8', errors='replace')
+    return ' '.join(value.split())
+
+
+def _address(value: str) -> str:
+    """Lowercased address of a From header value"""
+    match = _ANGLE_ADDR_RE.search(value)
+    if match is not None:
+        return match.group(1).strip().lower()
+    if ' ' not in value and '@' in value:
+        return value.lower()
+    return parseaddr(value)[1].lower()
+
+
+def _header_block(data: bytes) -> bytes:
+    """Header section of a raw message (up to the first blank line)"""
+    for separator in (b"\n\n", b"\r\n\r\n"):
+        end = data.find(separator)
+        if end >= 0:
+            return data[:end + len(separator)]
+    return data
+
+
+def message_text(data: bytes) -> str:
+    """
+    Readable text of a raw message
+    
+    Args:
+        data: Full message bytes
+        
+    Returns:
+        The plain-text part, or the HTML part with tags stripped
+    """
+    message = message_from_bytes(data, policy=policy.default)
+    try:
+        part = message.get_body(preferencelist=('plain', 'html'))
+        if part is None:
+            return ''
+        content = part.get_content()
+    except (LookupError, KeyError, ValueError):
+        payload = message.get_payload(decode=True) or b''
+        return payload.decode('utf-8', errors='replace') if isinstance(payload, bytes) else ''
+    if part.get_content_subtype() == 'html':
+        content = _SPACE_RE.sub(' ', html.unescape(_TAG_RE.sub(' ', content))).strip()
+    return content
+
+
+class MailMessage:
+    """
+    A message from a mail source.
+    
+    Only the raw header block is read while listing. ``sender`` and
+    ``subject`` are pulled straight from it, the full header parse happens
+    on first access to ``headers``, and the body is read and decoded only
+    when ``body`` is requested, so messages rejected on sender or subject
+    never have their bodies touched. Bodies are readable while the source
+    is being iterated.
+    """
+    
+    def __init__(
+        self,
+        key: str,
+        header_bytes: bytes,
+        read_message: Callable[[], bytes],
+        position: Any
+    ):
+        """
+        Initialize message
+        
+        Args:
+            key: Source-specific unique key
+            header_bytes: Raw header block
+            read_message: Returns the full raw message
+            position: Source mark just past this message (see MailSource.commit)
+        """
+        self.key = key
+        self.header_bytes = header_bytes
+        self.position = position
+        self._read_message = read_message
+    
+    @cached_property
+    def headers(self) -> Message:
+        """Parsed headers"""
+        return _HEADER_PARSER.parsebytes(self.header_bytes)
+    
+    @cached_property
+    def sender(self) -> str:
+        """Lowercased sender address"""
+        return _address(_decode(_field(_FROM_RE, self.header_bytes)))
+    
+    @cached_property
+    def subject(self) -> str:
+        """Decoded subject line"""
+        return _decode(_field(_SUBJECT_RE, self.header_bytes))
+    
+    @property
+    def message_id(self) -> str:
+        """Message-ID header (the source key if missing)"""
+        return (self.headers.get('Message-ID') or '').strip() or self.key
+    
+    @property
+    def date(self) -> Optional[datetime]:
+        """Date header, if present and valid"""
+        value = self.headers.get('Date')
+        if not value:
+            return None
+        try:
+            return parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    
+    @cached_property
+    def body(self) -> str:
+        """Message text (read on first access)"""
+        return message_text(self._read_message())
+
+
+@dataclass
+class MessagePrefilter:
+    """
+    Cheap sender/subject test deciding which messages are worth classifying.
+    
+    A message passes if its sender's domain (or a parent domain) is a known
+    recruiting sender, or its subject contains a job-related keyword.
+    """
+    sender_domains: Sequence[str] = DEFAULT_SENDER_DOMAINS
+    subject_keywords: Sequence[str] = DEFAULT_SUBJECT_KEYWORDS
+    
+    def __post_init__(self):
+        """Normalize rules for matching"""
+        self._domains = frozenset(domain.lower().lstrip('@') for domain in self.sender_domains)
+        self._keywords = tuple(keyword.lower() for keyword in self.subject_keywords)
+    
+    def accepts(self, sender: str, subject: str) -> bool:
+        """
+        Check a message's sender and subject
+        
+        Args:
+            sender: Sender address
+            subject: Subject line
+            
+        Returns:
+            True if the message may be a job application response
+        """
+        domain = sender.rpartition('@')[2].lower()
+        labels = domain.split('.')
+        if any('.'.join(labels[i:]) in self._domains for i in range(len(labels) - 1)):
+            return True
+        subject = subject.lower()
+        return any(keyword in subject for keyword in self._keywords)
+
+
+class MailSource(ABC):
+    """
+    Incremental stream of messages with a persistent high-water mark.
+    
+    :meth:`messages` yields only messages after the committed mark, oldest
+    first. Callers pass the positions of messages they have finished with
+    to :meth:`commit`, which advances the mark and saves it to
+    ``state_path`` so the next poll (or the next run) resumes after them.
+    """
+    
+    def __init__(self, state_path: Optional[str] = None):
+        """
+        Initialize source
+        
+        Args:
+            state_path: JSON file holding the mark (None to keep it in memory)
+        """
+        self.state_path = Path(state_path) if state_path else None
+        self.state: Dict[str, Any] = {}
+        if self.state_path is not None and self.state_path.exists():
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+    
+    @abstractmethod
+    def messages(self) -> Iterator[MailMessage]:
+        """Yield messages after the committed mark, oldest first"""
+    
+    @abstractmethod
+    def commit(self, positions: Iterable[Any]) -> None:
+        """Advance the mark past the given message positions and save it"""
+    
+    def _save_state(self) -> None:
+        """Write the state file atomically"""
+        if self.state_path is None:
+            return
+        with atomic_write(self.state_path, encoding='utf-8') as f:
+            json.dump(self.state, f)
+
+
+class MaildirSource(MailSource):
+    """
+    Messages delivered to a Maildir (``new/`` and ``cur/``).
+    
+    The mark is the newest modification time processed. Because delivery
+    can finish out of order, files up to ``grace`` seconds older than the
+    mark are still listed, and the keys processed in that window are
+    remembered so they are not yielded twice. Keys are the unique part of
+    the file name, so a mail client moving a message to ``cur/`` or
+    changing its flags does not make it new again.
+    """
+    
+    def __init__(self, path: str, state_path: Optional[str] = None, grace: float = 60.0):
+        """
+        Initialize source
+        
+        Args:
+            path: Maildir directory
+            state_path: JSON file holding the mark
+            grace: Seconds of out-of-order delivery tolerated
+        """
+        super().__init__(state_path)
+        self.path = Path(path)
+        self.grace_ns = int(grace * 1e9)
+        self.state.setdefault('mtime_ns', 0)
+        self.state.setdefault('recent', {})
+    
+    def messages(self) -> Iterator[MailMessage]:
+        """Yield messages delivered after the mark, oldest first"""
+        floor = self.state['mtime_ns'] - self.grace_ns
+        recent = self.state['recent']
+        pending = []
+        for folder in ('new', 'cur'):
+            directory = self.path / folder
+            if not directory.is_dir():
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.is_file():
+                        continue
+                    mtime_ns = entry.stat().st_mtime_ns
+                    key = entry.name.split(':', 1)[0]
+                    if mtime_ns <= floor or key in recent:
+                        continue
+                    pending.append((mtime_ns, key, entry.path))
+        pending.sort()
+        
+        for mtime_ns, key, path in pending:
+            try:
+                header_bytes = self._read_headers(path)
+            except FileNotFoundError:
+                # Moved or deleted since listing; it will be listed again
+                continue
+            yield MailMessage(key, header_bytes, self._reader(path, key), (mtime_ns, key))
+    
+    def _read_headers(self, path: str) -> bytes:
+        """Read a message file up to the end of its header block"""
+        data = b''
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(8192)
+                data += chunk
+                if not chunk or b"\n\n" in data or b"\r\n\r\n" in data:
+                    return _header_block(data)
+    
+    def _reader(self, path: str, key: str) -> Callable[[], bytes]:
+        """Loader of a message's full content, following flag renames"""
+        def read() -> bytes:
+            try:
+                return Path(path).read_bytes()
+            except FileNotFoundError:
+                for folder in ('cur', 'new'):
+                    for candidate in (self.path / folder).glob(f"{key}*"):
+                        return candidate.read_bytes()
+                raise
+        return read
+    
+    def commit(self, positions: Iterable[Any]) -> None:
+        """Advance the mark past processed messages and save it"""
+        recent = self.state['recent']
+        for mtime_ns, key in positions:
+            recent[key] = mtime_ns
+            self.state['mtime_ns'] = max(self.state['mtime_ns'], mtime_ns)
+        floor = self.state['mtime_ns'] - self.grace_ns
+        self.state['recent'] = {key: m for key, m in recent.items() if m > floor}
+        self._save_state()
+
+
+class MboxSource(MailSource):
+    """
+    Messages appended to an mbox file.
+    
+    The mark is a byte offset: each poll maps the file and scans only the
+    bytes after it, finding message boundaries with ``find`` on the mapped
+    file, so skipped bodies are never decoded or copied. A message at the
+    end of the file counts as complete once the file ends with a newline.
+    If the file shrinks or is replaced, reading restarts from the beginning.
+    """
+    
+    def __init__(self, path: str, state_path: Optional[str] = None):
+        """
+        Initialize source
+        
+        Args:
+            path: mbox file
+            state_path: JSON file holding the mark
+        """
+        super().__init__(state_path)
+        self.path = Path(path)
+        self.state.setdefault('offset', 0)
+        self.state.setdefault('inode', None)
+    
+    def messages(self) -> Iterator[MailMessage]:
+        """Yield messages appended after the mark, oldest first"""
+        if not self.path.exists():
+            return
+        stat = self.path.stat()
+        if stat.st_ino != self.state['inode'] or stat.st_size < self.state['offset']:
+            if self.state['inode'] is not None:
+                logger.info(f"{self.path} was replaced or truncated, reading from the start")
+            self.state.update(offset=0, inode=stat.st_ino)
+        start = self.state['offset']
+        if stat.st_size <= start:
+            return
+        
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data)
+            if not data[size - 1:size] == b"\n":
+                # Last line still being written; stop before that message
+                size = data.rfind(b"\nFrom ", start) + 1
+            while start < size:
+                end = data.find(b"\nFrom ", start + 1, size)
+                end = size if end < 0 else end + 1
+                # Skip the "From " envelope line
+                headers_start = data.find(b"\n", start, end) + 1 or end
+                header_end = data.find(b"\n\n", headers_start, end)
+                header_end = end if header_end < 0 else header_end + 2
+                yield MailMessage(
+                    key=str(start),
+                    header_bytes=data[headers_start:header_end],
+                    read_message=self._reader(data, headers_start, end),
+                    position=end
+                )
+                start = end
+    
+    @staticmethod
+    def _reader(data: mmap.mmap, start: int, end: int) -> Callable[[], bytes]:
+        """Loader of one message's bytes from the mapped file"""
+        return lambda: data[start:end]
+    
+    def commit(self, positions: Iterable[Any]) -> None:
+        """Advance the offset past processed messages and save it"""
+        self.state['offset'] = max([self.state['offset'], *positions])
+        self._save_state()
@@ -27,13 +27,15 @@ class ResponseType(Enum):
     UPDATE = "update"
 
 
-@dataclass
+@dataclass(slots=True)
 class Application:
     """
     Represents a job application.
     
     Tracks the complete lifecycle of an application from submission
-    through final outcome.
+    through final outcome. Slotted, so a million loaded applications carry
+    no per-instance ``__dict__``; see :mod:`tracking.codec` for bulk
+    load/store.
     """
     id: str
     user_id: str
@@ -98,7 +100,7 @@ class Application:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationEvent:
     """
     Represents an event in an application's lifecycle.